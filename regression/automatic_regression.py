@@ -47,6 +47,31 @@ modules = [
     'scripts/B737/mission_B737.py',
     'scripts/battery/battery.py',
     'scripts/battery_propeller/battery_propeller.py',
+    'scripts/benchmarks/data_attribute_access.py',
+    'scripts/benchmarks/pack_unpack_array.py',
+    'scripts/benchmarks/units_conversion.py',
+    'scripts/benchmarks/import_time.py',
+    'scripts/benchmarks/config_memory.py',
+    'scripts/benchmarks/contiguous_conditions.py',
+    'scripts/benchmarks/merge_states.py',
+    'scripts/benchmarks/binary_archive.py',
+    'scripts/benchmarks/sparse_jacobian.py',
+    'scripts/benchmarks/warm_start.py',
+    'scripts/benchmarks/mission_cases.py',
+    'scripts/benchmarks/nexus_pool.py',
+    'scripts/benchmarks/process_profile.py',
+    'scripts/benchmarks/discretization_cache.py',
+    'scripts/benchmarks/control_point_refinement.py',
+    'scripts/benchmarks/process_compile.py',
+    'scripts/benchmarks/segment_memo.py',
+    'scripts/benchmarks/trapezoidal_discretization.py',
+    'scripts/benchmarks/mission_streaming.py',
+    'scripts/benchmarks/conditions_keep_list.py',
+    'scripts/benchmarks/vlm_influence_cache.py',
+    'scripts/benchmarks/induced_velocity_tiles.py',
+    'scripts/benchmarks/vlm_threads.py',
+    'scripts/benchmarks/vlm_training_cache.py',
+    'scripts/benchmarks/adaptive_training_grid.py',
     'scripts/cmalpha/cmalpha.py',
     'scripts/cnbeta/cnbeta.py',
     'scripts/concorde/concorde.py',
@@ -0,0 +1,159 @@
+# adaptive_training_grid.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+""" checks that the vortex lattice trained on a grid refined to a tolerance
+    samples fewer points than the whole grid, with surrogates within the
+    tolerance of those of the whole grid, that the whole grid is sampled
+    without a tolerance, that surrogates are built from training data given on
+    the grid without its samples and that the refined grid is kept by the
+    training cache, and reports the VLM solves saved and the time of the training
+"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Core import Units, Data
+from SUAVE.Analyses.Aerodynamics import Vortex_Lattice, Training_Cache
+from SUAVE.Methods.Aerodynamics.Common.Fidelity_Zero.Lift import influence_cache
+from SUAVE.Methods.Utilities.adaptive_grid_sampling import adaptive_grid_sampling
+
+import numpy as np
+import tempfile
+import shutil
+import time
+import sys
+
+sys.path.append('../Vehicles')
+from Boeing_737 import vehicle_setup
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    check_sampling()
+
+    # a fine grid, with more mach numbers near the speed of sound
+    angle_of_attack = np.atleast_2d(np.hstack([np.linspace(-5.,15.,21),[30.,45.,60.,75.]])).T * Units.deg
+    Mach            = np.atleast_2d(np.hstack([np.linspace(0.,0.95,20),np.linspace(1.05,3.5,25)])).T
+    size            = len(angle_of_attack)*len(Mach)
+    tolerance       = 1e-2
+
+    whole   = train(angle_of_attack,Mach,None)
+    refined = train(angle_of_attack,Mach,tolerance)
+    print('%-8s : %8.3f s, %4d VLM solves' % ('whole',whole.time,whole.analysis.training.number_of_samples))
+    print('%-8s : %8.3f s, %4d VLM solves, %4d saved' % ('refined',refined.time,refined.analysis.training.number_of_samples,
+                                                          refined.analysis.training.samples_saved))
+
+    # the whole grid without a tolerance, a part of it with one
+    assert whole.analysis.training.number_of_samples == size and whole.analysis.training.samples_saved == 0
+    assert refined.analysis.training.number_of_samples + refined.analysis.training.samples_saved == size
+    assert refined.analysis.training.number_of_samples < size/2
+
+    # the samples are those of the whole grid
+    training = refined.analysis.training
+    rows     = np.isin(angle_of_attack[:,0],training.sampled_angle_of_attack[:,0])
+    sub      = np.isin(Mach[Mach < 1.],training.sampled_Mach[:,0])
+    sup      = np.isin(Mach[Mach >= 1.],training.sampled_Mach[:,0])
+    assert np.allclose(training.lift_coefficient_sub,whole.analysis.training.lift_coefficient_sub[rows][:,sub],rtol=1e-10,atol=1e-12)
+    assert np.allclose(training.drag_coefficient_sup,whole.analysis.training.drag_coefficient_sup[rows][:,sup],rtol=1e-10,atol=1e-12)
+    for wing in training.wing_lift_coefficient_sub.keys():
+        assert np.allclose(training.wing_lift_coefficient_sub[wing],whole.analysis.training.wing_lift_coefficient_sub[wing][rows][:,sub],
+                           rtol=1e-10,atol=1e-12)
+
+    # and the surrogates are within the tolerance, between the samples too
+    AoA = np.linspace(-5.,15.,41) * Units.deg
+    for name,machs in [('sub',np.linspace(0.,0.95,39)),('sup',np.linspace(1.05,3.5,50))]:
+        for coefficient in ['lift_coefficient_','drag_coefficient_']:
+            reference = whole.analysis.surrogates[coefficient+name](AoA,machs)
+            estimate  = refined.analysis.surrogates[coefficient+name](AoA,machs)
+            error     = np.max(np.abs(estimate - reference))/np.ptp(reference)
+            print('%-22s : %8.2e' % (coefficient+name,error))
+            assert error < tolerance
+
+    # training data given on the whole grid, without the points sampled
+    check_given_training(whole.analysis)
+
+    # the refined grid is kept by the training cache
+    directory = tempfile.mkdtemp()
+    try:
+        cache = Training_Cache(directory = directory)
+        train(angle_of_attack,Mach,tolerance,cache)
+        found = train(angle_of_attack,Mach,tolerance,cache)
+        assert cache.hits == 1 and cache.misses == 1
+        assert np.array_equal(found.analysis.training.sampled_Mach,training.sampled_Mach)
+        assert np.array_equal(found.analysis.training.lift_coefficient_sup,training.lift_coefficient_sup)
+    finally:
+        shutil.rmtree(directory,ignore_errors=True)
+
+    return
+
+# ----------------------------------------------------------------------
+#   Checks
+# ----------------------------------------------------------------------
+
+def check_sampling():
+
+    # a smooth function is sampled coarsely, a kink is refined around it
+    x = np.linspace(0.,1.,33)
+    y = np.linspace(0.,1.,33)
+    def sample(x,y):
+        return np.atleast_2d(np.sin(x) + y**2 + np.abs(y - 0.7)).T
+
+    results = adaptive_grid_sampling(x,y,sample,1e-3)
+    sampled = y[results.y_indices]
+    assert results.number_of_samples == len(results.x_indices)*len(results.y_indices)
+    assert len(results.x_indices) == (len(x)+1)//2 and len(results.y_indices) > len(results.x_indices)
+    assert np.sum(np.abs(sampled - 0.7) < 0.1) > np.sum(np.abs(sampled - 0.2) < 0.1)
+    X, Y = np.meshgrid(x[results.x_indices],sampled,indexing='ij')
+    assert np.allclose(results.values[:,:,0],np.sin(X) + Y**2 + np.abs(Y - 0.7))
+
+    # the groups are apart, and the fixed points always sampled
+    results = adaptive_grid_sampling(x,y,sample,1e-3,[np.arange(22),np.arange(22,33)],[21,22])
+    assert 21 in results.y_indices and 22 in results.y_indices
+
+    return
+
+def check_given_training(analysis):
+
+    # the surrogates don't change when the points sampled aren't given
+    AoA       = np.linspace(-5.,15.,41) * Units.deg
+    Mach      = np.linspace(0.,0.95,39)
+    reference = analysis.surrogates.lift_coefficient_sub(AoA,Mach)
+
+    analysis.training.sampled_angle_of_attack = None
+    analysis.training.sampled_Mach            = None
+    analysis.build_surrogate()
+
+    assert np.array_equal(analysis.surrogates.lift_coefficient_sub(AoA,Mach),reference)
+
+    return
+
+# ----------------------------------------------------------------------
+#   Helper Functions
+# ----------------------------------------------------------------------
+
+def train(angle_of_attack,Mach,tolerance,cache=None):
+
+    influence_cache.clear_influence_cache()
+
+    vortex_lattice = Vortex_Lattice()
+    vortex_lattice.geometry                    = vehicle_setup()
+    vortex_lattice.training_cache              = cache
+    vortex_lattice.training.angle_of_attack    = angle_of_attack
+    vortex_lattice.training.Mach               = Mach
+    vortex_lattice.settings.training_tolerance = tolerance
+
+    tic = time.time()
+    vortex_lattice.initialize(True,None,None,False,0.,0.05,30,False)
+    elapsed = time.time() - tic
+
+    return Data(analysis = vortex_lattice, time = elapsed)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,165 @@
+# binary_archive.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+""" checks that the binary archive round trips SUAVE data structures and
+    compares its size and speed with the JSON archive for the results of the
+    B737 mission
+"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Core import Units, Data, DataOrdered
+from SUAVE.Input_Output.SUAVE import archive, load, archive_binary, load_binary
+
+import numpy as np
+import shutil
+import time
+import sys
+import os
+
+sys.path.append('../Vehicles')
+sys.path.append('../B737')
+import mission_B737
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    check_types()
+
+    configs, analyses = mission_B737.full_setup()
+    mission_B737.simple_sizing(configs, analyses)
+    configs.finalize()
+    analyses.finalize()
+    results = analyses.missions.base.evaluate()
+
+    # long mission results, like the ones with noise spectra
+    for segment in results.segments:
+        segment.conditions.noise_spectrum = np.ones((segment.state.numerics.number_control_points,24,100))
+
+    check_results(results)
+
+    timings = time_archives(results)
+    for key,value in timings.items():
+        print('%-8s : save %8.3f s, load %8.3f s, %8.2f MB' % (key,value.save,value.load,value.size))
+
+    # the arrays are stored in binary and mapped instead of parsed
+    assert timings.binary.size < timings.json.size
+    assert timings.binary.load < timings.json.load
+
+    shutil.rmtree('results_binary')
+    os.remove('results.json')
+
+    return
+
+# ----------------------------------------------------------------------
+#   Checks
+# ----------------------------------------------------------------------
+
+def check_types():
+
+    data = Data()
+    data.conditions = SUAVE.Analyses.Mission.Segments.Conditions.Conditions()
+    data.conditions.x = np.linspace(0.,1.,5)[:,None]
+    data.conditions.y = data.conditions.x
+    data.ordered      = DataOrdered(b = 1, a = [1.,'two',None])
+    data.wings        = SUAVE.Components.Wings.Wing.Container()
+    data.wings.append(SUAVE.Components.Wings.Main_Wing())
+    data.scalar       = np.float64(2.5)
+    data.integers     = np.arange(4,dtype=np.int32)
+    data.pair         = (1,np.ones(2))
+    data.flag         = True
+    data.function     = np.sin
+
+    archive_binary(data,'types_binary')
+    loaded = load_binary('types_binary')
+
+    # the classes come back
+    assert type(loaded) is Data
+    assert type(loaded.conditions) is SUAVE.Analyses.Mission.Segments.Conditions.Conditions
+    assert type(loaded.ordered) is DataOrdered
+    assert list(loaded.ordered.keys()) == ['b','a']
+    assert type(loaded.wings) is SUAVE.Components.Wings.Wing.Container
+    assert type(loaded.wings.main_wing) is SUAVE.Components.Wings.Main_Wing
+    assert list(loaded.wings.main_wing.keys()) == list(data.wings.main_wing.keys())
+
+    # and so do the values
+    assert np.all(loaded.conditions.x == data.conditions.x)
+    assert loaded.conditions.y is loaded.conditions.x
+    assert loaded.ordered.a == [1.,'two',None]
+    assert type(loaded.scalar) is np.float64 and loaded.scalar == 2.5
+    assert loaded.integers.dtype == np.int32
+    assert type(loaded.pair) is tuple and np.all(loaded.pair[1] == 1.)
+    assert loaded.flag is True
+    assert loaded.function is None
+
+    # the arrays are mapped, read only
+    assert isinstance(loaded.conditions.x,np.memmap)
+    try:
+        loaded.conditions.x[0] = 1.
+    except ValueError:
+        pass
+    else:
+        raise AssertionError('mapped array was changed')
+
+    # or read into memory
+    loaded = load_binary('types_binary',mmap_mode=None)
+    assert not isinstance(loaded.conditions.x,np.memmap)
+    loaded.conditions.x[0] = 1.
+
+    shutil.rmtree('types_binary')
+
+    return
+
+def check_results(results):
+
+    archive_binary(results,'results_binary')
+    loaded = load_binary('results_binary')
+
+    for i,segment in enumerate(results.segments):
+        conditions = loaded.segments[i].conditions
+        assert type(loaded.segments[i]) is type(segment)
+        assert np.all(conditions.frames.inertial.position_vector == segment.conditions.frames.inertial.position_vector)
+        assert np.all(conditions.noise_spectrum == 1.)
+
+    return
+
+# ----------------------------------------------------------------------
+#   Timing
+# ----------------------------------------------------------------------
+
+def time_archives(results,n_repeats = 3):
+
+    timings = Data()
+    formats = [('json'  , archive       , load       , 'results.json'  ),
+               ('binary', archive_binary, load_binary, 'results_binary')]
+
+    for name,save_method,load_method,filename in formats:
+        tic = time.time()
+        save_method(results,filename)
+        save = time.time() - tic
+
+        best = np.inf
+        for i in range(n_repeats):
+            tic = time.time()
+            load_method(filename)
+            best = min(best,time.time()-tic)
+
+        if os.path.isdir(filename):
+            size = sum(os.path.getsize(os.path.join(filename,f)) for f in os.listdir(filename))
+        else:
+            size = os.path.getsize(filename)
+
+        timings[name] = Data(save = save, load = best, size = size/1e6)
+
+    return timings
+
+if __name__ == '__main__':
+    main()
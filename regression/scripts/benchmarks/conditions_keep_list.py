@@ -0,0 +1,92 @@
+# conditions_keep_list.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+""" checks that the B737 mission with a keep list keeps those conditions of
+    its segments, in full, releases the rest of their states once it is
+    finalized, burns the fuel of the mission without one and can be evaluated
+    again, and reports the bytes of the states before and after
+"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Core import Units, Data
+from SUAVE.Methods.Missions.Segments.Common.Release import release_report, state_bytes
+
+import numpy as np
+import sys
+
+sys.path.append('../Vehicles')
+sys.path.append('../B737')
+import mission_B737
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    reference = setup_mission()
+    reference.evaluate()
+
+    # the mission keeps a few conditions, the cruise all of its weights
+    mission = setup_mission()
+    mission.keep = ['frames.inertial.time','frames.inertial.position_vector','weights.total_mass']
+    mission.segments.cruise.keep = ['frames.inertial','weights']
+    mission.evaluate()
+
+    print(release_report(mission))
+    assert fuel_burn(mission) == fuel_burn(reference)
+
+    for tag,segment in mission.segments.items():
+        N          = segment.state.numerics.number_control_points
+        conditions = segment.state.conditions
+        footprint  = segment.state.footprint
+
+        # what is kept is whole, the rest is a row
+        assert conditions.frames.inertial.time.shape[0] == N
+        assert conditions.weights.total_mass.shape[0] == N
+        assert conditions.freestream.velocity.shape[0] == 1
+        for residual in segment.state.residuals.values():
+            if isinstance(residual,np.ndarray):
+                assert residual.shape[0] == 1
+        assert footprint.after == state_bytes(segment.state)
+        assert footprint.after < footprint.before/5.
+
+        if tag == 'cruise':
+            assert conditions.frames.inertial.velocity_vector.shape[0] == N
+            assert conditions.weights.vehicle_mass_rate.shape[0] == N
+        else:
+            assert conditions.frames.inertial.velocity_vector.shape[0] == 1
+
+    # and it is solved again from the released states
+    mission.evaluate()
+    assert np.abs(fuel_burn(mission)/fuel_burn(reference) - 1.) < 1e-6
+
+    return
+
+# ----------------------------------------------------------------------
+#   Helper Functions
+# ----------------------------------------------------------------------
+
+def setup_mission():
+
+    configs, analyses = mission_B737.full_setup()
+    mission_B737.simple_sizing(configs, analyses)
+    configs.finalize()
+    analyses.finalize()
+
+    return analyses.missions.base
+
+def fuel_burn(mission):
+
+    segments = list(mission.segments.values())
+
+    return segments[0].state.conditions.weights.total_mass[0,0] - segments[-1].state.conditions.weights.total_mass[-1,0]
+
+if __name__ == '__main__':
+    main()
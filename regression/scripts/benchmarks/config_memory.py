@@ -0,0 +1,164 @@
+# config_memory.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+""" checks that configs are copies of their base that share only its read
+    only arrays, and compares the memory and time it takes to build the configs
+    of the B737 and Tiltwing vehicles against deep copies
+"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Core import Units, Data, diff
+
+import numpy as np
+from copy import deepcopy
+import tracemalloc
+import time
+import sys
+
+sys.path.append('../Vehicles')
+sys.path.append('../Vehicles/Propellers')
+import Boeing_737
+import Tiltwing
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    check_sharing()
+    check_configs()
+
+    for name,module in [('B737',Boeing_737),('Tiltwing',Tiltwing)]:
+        vehicle = module.vehicle_setup()
+
+        # something big and read only, like the tables loaded from a binary archive
+        vehicle.wings.main_wing.airfoil_polars = np.ones((20,200))
+        vehicle.wings.main_wing.airfoil_polars.flags.writeable = False
+
+        results = time_configs(vehicle,module.configs_setup)
+        for key,value in results.items():
+            print('%-14s %-12s : %8.3f MB %8.3f s' % (name,key,value.memory,value.time))
+
+        assert results.shared.memory < results.deepcopy.memory
+
+    return
+
+# ----------------------------------------------------------------------
+#   Checks
+# ----------------------------------------------------------------------
+
+def check_sharing():
+
+    vehicle = Boeing_737.vehicle_setup()
+    wing    = vehicle.wings.main_wing
+    wing.twists_table = np.linspace(0.,1.,2000)
+    wing.chords_table = np.ones(2000)
+    wing.chords_table.flags.writeable = False
+
+    config = SUAVE.Components.Configs.Config(vehicle)
+    cwing  = config.wings.main_wing
+
+    # the tree and the arrays are copied, the read only arrays are shared
+    assert cwing is not wing
+    assert not np.shares_memory(cwing.twists_table,wing.twists_table)
+    assert cwing.chords_table is wing.chords_table
+
+    # the copies are changed in place on their own, either way
+    cwing.twists_table[0] = 1.
+    cwing.mass_properties.center_of_gravity[0][0] = 1.
+    assert wing.twists_table[0] == 0.
+    assert wing.mass_properties.center_of_gravity[0][0] != 1.
+    wing.twists_table[-1] = 5.
+    assert cwing.twists_table[-1] == 1.
+
+    # replacing values only changes the config
+    cwing.spans.projected = 1.
+    cwing.chords_table    = np.zeros(2000)
+    assert wing.spans.projected != 1.
+    assert wing.chords_table[0] == 1.
+
+    # a read only view of a writeable array is copied
+    view = np.ones(2000)
+    wing.thickness_table = view[:]
+    wing.thickness_table.flags.writeable = False
+    config = SUAVE.Components.Configs.Config(vehicle)
+    view[0] = 2.
+    assert config.wings.main_wing.thickness_table[0] == 1.
+
+    # and so are the arrays of objects, with what they hold
+    wing.tables = np.array([Data(values = np.ones(3))],dtype=object)
+    config = SUAVE.Components.Configs.Config(vehicle)
+    config.wings.main_wing.tables[0].values[0] = 2.
+    assert wing.tables[0].values[0] == 1.
+
+    return
+
+def check_configs():
+
+    vehicle = Boeing_737.vehicle_setup()
+    configs = Boeing_737.configs_setup(vehicle)
+
+    # the diffs only hold what the configs changed
+    takeoff = configs.takeoff
+    assert takeoff._diff.wings.main_wing.control_surfaces.flap.deflection == 20. * Units.deg
+    assert not 'fuselages' in takeoff._diff
+
+    # the base changes reach the configs
+    vehicle.mass_properties.max_takeoff = 80000.
+    configs.finalize()
+    assert takeoff.mass_properties.max_takeoff == 80000.
+    assert takeoff.wings.main_wing.control_surfaces.flap.deflection == 20. * Units.deg
+    assert configs.landing.landing_gear.gear_condition == 'down'
+    assert list(diff(configs.cruise,configs.base).keys()) == ['tag']
+
+    return
+
+# ----------------------------------------------------------------------
+#   Timing
+# ----------------------------------------------------------------------
+
+def time_configs(vehicle,configs_setup):
+
+    results = Data()
+
+    # the configs, which share the data of the vehicle
+    results.shared = measure(lambda: configs_setup(vehicle))
+
+    # the configs built from deep copies, as they used to be
+    diffed_data = sys.modules['SUAVE.Core.Diffed_Data']
+    shared_copy = diffed_data.shared_copy
+    diffed_data.shared_copy = lambda A,memo=None,skip=(): deepcopy(A)
+    try:
+        results.deepcopy = measure(lambda: configs_setup(vehicle))
+    finally:
+        diffed_data.shared_copy = shared_copy
+
+    return results
+
+def measure(function, n_repeats = 3):
+
+    # memory held by the result
+    tracemalloc.start()
+    keep   = function()
+    memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del keep
+
+    # time, without tracing
+    best = np.inf
+    for i in range(n_repeats):
+        tic  = time.time()
+        function()
+        best = min(best,time.time()-tic)
+
+    return Data(memory = memory/1e6, time = best)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,179 @@
+# contiguous_conditions.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+""" checks that segment states kept in one contiguous array expand, pack,
+    merge and solve like the states kept leaf by leaf, and times the merge
+    of the B737 mission
+"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Core import Units, Data
+
+import numpy as np
+from copy import deepcopy
+import time
+import sys
+
+sys.path.append('../Vehicles')
+sys.path.append('../B737')
+import mission_B737
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    check_expand()
+    check_pack()
+
+    legacy     = run_mission(compact = False)
+    contiguous = run_mission(compact = True)
+    check_results(legacy,contiguous)
+
+    timings = time_merge(legacy,contiguous)
+    for key,value in timings.items():
+        print('%-20s : %8.4f s' % (key,value))
+
+    return
+
+# ----------------------------------------------------------------------
+#   Checks
+# ----------------------------------------------------------------------
+
+def check_expand():
+
+    segment = SUAVE.Analyses.Mission.Segments.Climb.Constant_Speed_Constant_Rate()
+    segment.state.conditions.frames.inertial.time = np.array([[1.],[2.],[3.]])
+    legacy  = deepcopy(segment.state)
+    state   = segment.state
+    state.compact()
+
+    # the fields are views into one column major array
+    buffer = state.conditions._buffer
+    assert buffer.array.flags['F_CONTIGUOUS']
+    assert np.shares_memory(state.conditions.freestream.velocity,buffer.array)
+
+    # expanding repeats the rows like np.resize
+    legacy.expand_rows(8)
+    state.expand_rows(8)
+    assert state.conditions._buffer.array.shape[0] == 8
+    assert compare(legacy,state) == 0
+    assert np.shares_memory(state.conditions.freestream.velocity,state.conditions._buffer.array)
+
+    # replaced fields go back into the array
+    state.conditions.freestream.velocity = 3. * np.ones((8,1))
+    state.expand_rows(10)
+    assert np.all(state.conditions.freestream.velocity == 3.)
+    assert np.shares_memory(state.conditions.freestream.velocity,state.conditions._buffer.array)
+
+    # new fields rebuild the array
+    state.conditions.freestream.new_field = np.ones((10,2))
+    state.expand_rows(4)
+    assert state.conditions.freestream.new_field.shape == (4,2)
+    assert np.shares_memory(state.conditions.freestream.new_field,state.conditions._buffer.array)
+
+    # copies don't share the array of the original
+    copy = deepcopy(state)
+    copy.expand_rows(6)
+    assert state.conditions.freestream.velocity.shape == (4,1)
+    assert copy.conditions.freestream.velocity.shape  == (6,1)
+
+    return
+
+def check_pack():
+
+    segment = SUAVE.Analyses.Mission.Segments.Climb.Constant_Speed_Constant_Rate()
+    state   = segment.state
+    state.unknowns.other = np.ones((1,2))
+    state.compact()
+    state.expand_rows(16)
+
+    unknowns = state.unknowns
+    unknowns.throttle[:,0] = np.linspace(0.,1.,16)
+    unknowns.other        *= 2.
+
+    # packing is one copy of the array, in the order of Data.pack_array
+    x = unknowns.pack_array()
+    assert unknowns._buffer.complete
+    assert np.all(x == Data.pack_array(unknowns))
+    assert not np.shares_memory(x,unknowns._buffer.array)
+
+    # and so is unpacking
+    unknowns.unpack_array(x[::-1].copy())
+    assert np.all(unknowns.other[:,1] == np.linspace(0.,1.,16)[::-1])
+    assert np.shares_memory(unknowns.throttle,unknowns._buffer.array)
+
+    return
+
+def run_mission(compact):
+
+    configs, analyses = mission_B737.full_setup()
+    mission_B737.simple_sizing(configs, analyses)
+    configs.finalize()
+    analyses.finalize()
+
+    mission = analyses.missions.base
+    if compact:
+        for segment in mission.segments.values():
+            segment.state.compact()
+
+    mission.evaluate()
+
+    return mission
+
+def check_results(legacy,contiguous):
+
+    # the same mission
+    for tag in legacy.segments.keys():
+        assert compare(legacy.segments[tag].state,contiguous.segments[tag].state) == 0
+
+    # the same merged results, in one array
+    merged = contiguous.merged()
+    assert compare(legacy.merged(),merged) == 0
+    assert merged.conditions._buffer.array.shape[0] == sum(s.state.numerics.number_control_points for s in legacy.segments)
+    assert np.shares_memory(merged.conditions.weights.total_mass,merged.conditions._buffer.array)
+
+    return
+
+def compare(A,B):
+    """ counts the values of A that B doesn't have """
+    bad = 0
+    for k,a in A.items():
+        if not k in B:
+            bad += 1
+            continue
+        b = B[k]
+        if isinstance(a,dict):
+            bad += compare(a,b)
+        elif isinstance(a,np.ndarray):
+            bad += not (a.shape == b.shape and np.array_equal(a,b))
+        elif type(a) != type(b):
+            bad += 1
+    return bad
+
+# ----------------------------------------------------------------------
+#   Timing
+# ----------------------------------------------------------------------
+
+def time_merge(legacy,contiguous,n_repeats = 5):
+
+    timings = Data()
+    for name,mission in [('merge_separate',legacy),('merge_contiguous',contiguous)]:
+        best = np.inf
+        for i in range(n_repeats):
+            tic = time.time()
+            mission.merged()
+            best = min(best,time.time()-tic)
+        timings[name] = best
+
+    return timings
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,126 @@
+# control_point_refinement.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+""" checks that the B737 mission solved from a few control points, refining
+    the segments that need it, burns the fuel of the mission solved with 16
+    points in every segment, that only Chebyshev points are refined, and
+    compares the evaluations and time they take
+"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Core import Units, Data
+from SUAVE.Methods.Missions.Segments.refine_control_points import discretization_error, interpolate_rows, refinement_report, \
+     check_refinement
+from SUAVE.Methods.Utilities.Chebyshev import chebyshev_data, trapezoidal_data
+
+import numpy as np
+import time
+import sys
+
+sys.path.append('../Vehicles')
+sys.path.append('../B737')
+import mission_B737
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    check_interpolation()
+    check_discretization()
+
+    fixed    = run_mission(16)
+    coarse   = run_mission(6)
+    adaptive = run_mission(6,adaptive=True)
+
+    print(refinement_report(adaptive.mission))
+    for key,value in [('fixed',fixed),('coarse',coarse),('adaptive',adaptive)]:
+        print('%-10s : %6d evaluations %8.3f s, fuel burn error %8.2e' % (key,value.evaluations,value.time,value.fuel_burn/fixed.fuel_burn-1.))
+
+    # the segments that needed it were refined, and only those
+    points = [segment.state.numerics.number_control_points for segment in adaptive.mission.segments.values()]
+    assert max(points) == 11 and min(points) == 6
+    for segment in adaptive.mission.segments.values():
+        history = segment.state.numerics.refinement.history
+        assert history[-1].error <= segment.state.numerics.refinement.tolerance
+        assert segment.state.numerics.evaluations == sum(record.evaluations for record in history)
+
+    # closer to the fixed mission than the coarse one, for fewer evaluations
+    assert np.abs(adaptive.fuel_burn/fixed.fuel_burn - 1.) < np.abs(coarse.fuel_burn/fixed.fuel_burn - 1.)
+    assert np.abs(adaptive.fuel_burn/fixed.fuel_burn - 1.) < 1e-6
+    assert adaptive.evaluations < fixed.evaluations
+
+    return
+
+# ----------------------------------------------------------------------
+#   Checks
+# ----------------------------------------------------------------------
+
+def check_interpolation():
+
+    # a polynomial of the degree of the points is found again at the new points
+    x,D,I  = chebyshev_data(6)
+    x_new  = chebyshev_data(11)[0]
+    old    = Data(values = np.array([x**5,1.-x]).T)
+    new    = Data(values = np.zeros((11,2)))
+    interpolate_rows(old,new,x,x_new)
+    assert np.max(np.abs(new.values - np.array([x_new**5,1.-x_new]).T)) < 1e-12
+
+    # the nested cosine spaced points are kept
+    assert np.max(np.abs(x_new[::2] - x)) < 1e-14
+
+    return
+
+def check_discretization():
+
+    # the error estimate and the nested points need the Chebyshev points
+    segment = SUAVE.Analyses.Mission.Segments.Cruise.Constant_Speed_Constant_Altitude()
+    segment.state.numerics.refinement.adaptive = True
+    check_refinement(segment)
+
+    for name,value in [('discretization_method',trapezoidal_data),('number_of_cases',2)]:
+        numerics = segment.state.numerics
+        default  = numerics[name]
+        numerics[name] = value
+        try:
+            check_refinement(segment)
+        except ValueError:
+            pass
+        else:
+            raise AssertionError('refined with %s = %s' % (name,value))
+        numerics[name] = default
+
+    return
+
+def run_mission(number_control_points,adaptive=False):
+
+    configs, analyses = mission_B737.full_setup()
+    mission_B737.simple_sizing(configs, analyses)
+    configs.finalize()
+    analyses.finalize()
+    mission = analyses.missions.base
+
+    for segment in mission.segments.values():
+        segment.state.numerics.number_control_points = number_control_points
+        segment.state.numerics.refinement.adaptive   = adaptive
+
+    tic = time.time()
+    results = mission.evaluate()
+    elapsed = time.time() - tic
+
+    mass = results.segments[0].conditions.weights.total_mass[0,0] - results.segments[-1].conditions.weights.total_mass[-1,0]
+
+    return Data(mission     = mission,
+                fuel_burn   = mass,
+                time        = elapsed,
+                evaluations = sum(segment.state.numerics.evaluations for segment in mission.segments.values()))
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,190 @@
+# data_attribute_access.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+""" checks the attribute resolution rules of Data, DataOrdered and Container
+    and times attribute access on a mission state tree
+"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Core import Data, DataOrdered, Container
+from SUAVE.Analyses.Mission.Segments.Conditions import State, Aerodynamics
+
+import numpy as np
+import time
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    check_data()
+    check_data_ordered()
+    check_container()
+
+    timings = time_state_access()
+    for key,value in timings.items():
+        print('%-20s : %8.3f M access/s' % (key,value))
+
+    return
+
+# ----------------------------------------------------------------------
+#   Semantics
+# ----------------------------------------------------------------------
+
+def check_data():
+
+    d = Data()
+    d.a = 1.
+    d['b'] = Data()
+    d.b.c = np.ones(3)
+
+    # keys and attributes are the same thing
+    assert d['a'] == 1.
+    assert 'a' in d.keys()
+    assert np.all(d['b']['c'] == 1.)
+
+    # methods still resolve through the class
+    assert callable(d.pack_array)
+    assert d.deep_get('b.c').shape == (3,)
+
+    # keys shadow methods of the same name
+    d['values'] = 5.
+    assert d.values == 5.
+    del d['values']
+    assert callable(d.values)
+
+    # class variables are set on the instance, not as keys
+    state = State()
+    state.expand_rows(4)
+    assert state._size == 4
+    assert not '_size' in state.keys()
+    assert state.conditions._size == 4
+    assert state.numerics._size == 1
+
+    # missing attributes still raise the right error
+    try:
+        d.missing
+    except AttributeError:
+        pass
+    else:
+        raise AssertionError('missing attribute did not raise')
+
+    # deletion
+    del d.a
+    assert not 'a' in d
+    try:
+        del d.a
+    except KeyError:
+        pass
+    else:
+        raise AssertionError('missing key did not raise')
+
+    # update recurses into data and replaces everything else
+    d.b.e = 2.
+    d.update(Data(b=Data(c=np.zeros(2)),f=3.))
+    assert d.b.e == 2.
+    assert np.all(d.b.c == 0.)
+    assert d.f == 3.
+
+    return
+
+def check_data_ordered():
+
+    d = DataOrdered()
+    d.x = 1.
+    d.y = DataOrdered()
+    d.y.z = 2.
+    d.w = 3.
+
+    assert d.keys() == ['x','y','w']
+    assert d[0] == 1.
+    assert d['y'].z == 2.
+
+    # reassignment keeps the order
+    d.x = 4.
+    assert d.keys() == ['x','y','w']
+
+    d.update(DataOrdered(y=DataOrdered(q=5.),v=6.))
+    assert d.keys() == ['x','y','w','v']
+    assert d.y.keys() == ['z','q']
+
+    del d.w
+    assert d.keys() == ['x','y','v']
+
+    return
+
+def check_container():
+
+    c = Container()
+    a = Data()
+    a.tag = 'first'
+    c.append(a)
+    b = Data()
+    b.tag = 'first'
+    c.append(b)
+
+    assert len(c) == 2
+    assert c.first is a
+    assert callable(c.append)
+
+    return
+
+# ----------------------------------------------------------------------
+#   Timing
+# ----------------------------------------------------------------------
+
+def time_state_access(n_loops = 10000, n_repeats = 5):
+
+    state = State()
+    state.conditions.update(Aerodynamics())
+    state.expand_rows(16)
+    conditions = state.conditions
+    velocity   = conditions.freestream.velocity
+
+    # nested leaf reads, like the mission iterate loop does
+    def leaf_reads():
+        for i in range(n_loops):
+            conditions.freestream.velocity
+            conditions.freestream.density
+            conditions.frames.inertial.velocity_vector
+            conditions.aerodynamics.angle_of_attack
+            conditions.weights.total_mass
+
+    # leaf writes
+    def leaf_writes():
+        for i in range(n_loops):
+            conditions.freestream.velocity           = velocity
+            conditions.freestream.density            = velocity
+            conditions.aerodynamics.lift_coefficient = velocity
+            conditions.propulsion.throttle           = velocity
+            conditions.weights.total_mass            = velocity
+
+    # method lookups
+    def method_lookups():
+        for i in range(n_loops):
+            conditions.ones_row
+            conditions.expand_rows
+            state.pack_array
+            state.unknowns.unpack_array
+            conditions.items
+
+    timings = Data()
+    for function in [leaf_reads,leaf_writes,method_lookups]:
+        best = np.inf
+        for i in range(n_repeats):
+            tic = time.time()
+            function()
+            best = min(best,time.time()-tic)
+        timings[function.__name__] = 5*n_loops/best/1e6
+
+    return timings
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,128 @@
+# discretization_cache.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+""" checks that the segments of the B737 mission share the read-only operators
+    of cached_discretization(), that the operators scaled by the time of each
+    segment are the ones of chebyshev_data(), and compares the time it takes
+    to set up the operators of a mission with and without the cache
+"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Core import Units, Data
+from SUAVE.Methods.Utilities.Chebyshev import chebyshev_data, linear_data, cached_discretization, clear_discretization_cache
+from SUAVE.Methods.Utilities.Chebyshev.discretization_cache import statistics
+from SUAVE.Methods.Missions.Segments.Common.Numerics import initialize_differentials_dimensionless, update_differentials_time
+
+import numpy as np
+import time
+import sys
+
+sys.path.append('../Vehicles')
+sys.path.append('../B737')
+import mission_B737
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    check_cache()
+
+    configs, analyses = mission_B737.full_setup()
+    mission_B737.simple_sizing(configs, analyses)
+    configs.finalize()
+    analyses.finalize()
+    mission = analyses.missions.base
+
+    clear_discretization_cache()
+    mission.evaluate()
+
+    # one set of operators for all the segments with the same number of points
+    first = Data()
+    for segment in mission.segments.values():
+        numerics = segment.state.numerics
+        N        = str(numerics.number_control_points)
+        if N not in first:
+            first[N] = numerics.dimensionless.differentiate
+        assert numerics.dimensionless.differentiate is first[N]
+        assert not numerics.dimensionless.integrate.flags.writeable
+
+        # the operators of the last iteration, scaled by the time of the segment
+        time = segment.state.conditions.frames.inertial.time
+        T    = time[-1] - time[0]
+        x,D,I = chebyshev_data(numerics.number_control_points)
+        assert np.all(numerics.time.differentiate == D / T)
+        assert np.all(numerics.time.integrate == I * T)
+        assert np.all(numerics.time.control_points[:,0] == x * T)
+
+    assert statistics.misses == len(first)
+    assert statistics.hits   == len(mission.segments) - len(first)
+
+    # the time to set up the operators of the segments of a mission, many times
+    n_repeats = 200
+    cached    = time_setup(mission,n_repeats)
+    uncached  = time_setup(mission,n_repeats,cache=False)
+
+    print('%-10s : %8.4f s' % ('uncached',uncached))
+    print('%-10s : %8.4f s' % ('cached',cached))
+
+    assert cached < uncached
+
+    return
+
+# ----------------------------------------------------------------------
+#   Checks
+# ----------------------------------------------------------------------
+
+def check_cache():
+
+    clear_discretization_cache()
+
+    # the operators of the method, read-only
+    x,D,I = cached_discretization(chebyshev_data,8)
+    x0,D0,I0 = chebyshev_data(8)
+    assert np.all(x == x0) and np.all(D == D0) and np.all(I == I0)
+    assert not D.flags.writeable
+    try:
+        D[0,0] = 1.
+        raise AssertionError('the cached operators can be changed')
+    except ValueError:
+        pass
+
+    # found again, the options the method doesn't name don't matter
+    assert cached_discretization(chebyshev_data,8,dict(tolerance_solution=1e-8))[1] is D
+    assert statistics.hits == 1 and statistics.misses == 1
+
+    # but the method, the number of points and the named options do
+    assert cached_discretization(linear_data,8)[1] is not D
+    assert cached_discretization(chebyshev_data,9)[1] is not D
+    assert cached_discretization(chebyshev_data,8,dict(integration=False))[2] is None
+    assert statistics.misses == 4
+
+    clear_discretization_cache()
+    assert statistics.misses == 0
+
+    return
+
+def time_setup(mission,n_repeats,cache=True):
+
+    tic = time.time()
+    for i in range(n_repeats):
+        for segment in mission.segments.values():
+            # without the cache every segment computes its operators again
+            if not cache:
+                clear_discretization_cache()
+            initialize_differentials_dimensionless(segment)
+            update_differentials_time(segment)
+
+    return time.time() - tic
+
+if __name__ == '__main__':
+    main()
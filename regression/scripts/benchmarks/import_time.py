@@ -0,0 +1,101 @@
+# import_time.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+""" checks that SUAVE imports its subpackages lazily and times the import
+    of SUAVE in fresh interpreters
+"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+from SUAVE.Core import Data
+
+import numpy as np
+import subprocess
+import sys
+import time
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    check_lazy_import()
+    check_vehicle()
+
+    timings = time_imports()
+    for key,value in timings.items():
+        print('%-20s : %8.3f s' % (key,value))
+
+    return
+
+# ----------------------------------------------------------------------
+#   Checks
+# ----------------------------------------------------------------------
+
+def run(code):
+    """ runs code in a fresh interpreter and returns what it prints """
+    return subprocess.check_output([sys.executable,'-c',code]).decode().strip()
+
+def check_lazy_import():
+
+    # nothing is imported up front
+    out = run("import SUAVE, sys; print(sorted(m for m in sys.modules if m.startswith('SUAVE.')))")
+    assert out == '[]', out
+
+    # a mission setup does not need the plotting or machine learning packages
+    out = run("import SUAVE, sys; SUAVE.Analyses.Mission.Sequential_Segments(); SUAVE.Vehicle(); "
+              "print('sklearn' in sys.modules, 'matplotlib' in sys.modules)")
+    assert out == 'False False', out
+
+    # every subpackage still resolves
+    out = run("import SUAVE; print(all(hasattr(SUAVE,p) for p in SUAVE._packages))")
+    assert out == 'True', out
+
+    return
+
+def check_vehicle():
+
+    # the Vehicle class wins over the module of the same name, in any import order
+    out = run("from SUAVE.Components.Configs import Config; import SUAVE; print(isinstance(SUAVE.Vehicle,type))")
+    assert out == 'True', out
+
+    out = run("import SUAVE; v = SUAVE.Vehicle(); print(type(v).__name__)")
+    assert out == 'Vehicle', out
+
+    # the vehicle module first, then the configs built on it
+    out = run("from SUAVE.Vehicle import Vehicle; from SUAVE.Components.Configs import Config; "
+              "print(Vehicle.__name__, issubclass(Config,Vehicle))")
+    assert out == 'Vehicle True', out
+
+    return
+
+# ----------------------------------------------------------------------
+#   Timing
+# ----------------------------------------------------------------------
+
+def time_imports(n_repeats = 3):
+
+    cases = [
+        ('import_suave'  , "import SUAVE"),
+        ('mission_setup' , "import SUAVE; SUAVE.Analyses.Mission.Sequential_Segments(); SUAVE.Vehicle()"),
+        ('everything'    , "import SUAVE; [getattr(SUAVE,p) for p in SUAVE._packages]"),
+    ]
+
+    timings = Data()
+    for name,code in cases:
+        best = np.inf
+        for i in range(n_repeats):
+            tic = time.time()
+            run(code)
+            best = min(best,time.time()-tic)
+        timings[name] = best
+
+    return timings
+
+if __name__ == '__main__':
+    main()
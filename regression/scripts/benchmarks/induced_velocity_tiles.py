@@ -0,0 +1,93 @@
+# induced_velocity_tiles.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+""" checks that compute_wing_induced_velocity in tiles of control points gives
+    the induced velocities of all the control points at once, for subsonic and
+    supersonic mach numbers with sonic vortices, and checks that the peak memory
+    of its temporaries stays within a memory budget, for subsonic mach numbers
+    only and for subsonic and supersonic ones
+"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Core import Units, Data
+from SUAVE.Methods.Aerodynamics.Common.Fidelity_Zero.Lift import generate_wing_vortex_distribution, compute_wing_induced_velocity
+
+import numpy as np
+import tracemalloc
+import time
+import sys
+
+sys.path.append('../Vehicles')
+import Boeing_737
+import Concorde
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    mach = np.array([[0.1,0.3,0.5,0.8,1.2,1.5,2.0,2.5]]).T
+
+    # the same velocities in tiles, down to one control point
+    for vehicle_setup,model_fuselage in [(Boeing_737.vehicle_setup,False),(Boeing_737.vehicle_setup,True),(Concorde.vehicle_setup,False)]:
+        VD, n_sw, n_cw = vortex_distribution(vehicle_setup,10,4,model_fuselage)
+        results = compute_wing_induced_velocity(VD,n_sw,n_cw,mach)
+        for budget in [2**20,1]:
+            tiled = compute_wing_induced_velocity(VD,n_sw,n_cw,mach,budget)
+            for result,tile in zip(results,tiled):
+                assert np.array_equal(result,tile)
+        assert np.any(results[3] == 0) # with sonic vortices
+
+    # the peak memory of the temporaries of a fine lattice
+    VD, n_sw, n_cw = vortex_distribution(Boeing_737.vehicle_setup,30,10,False)
+    for name,machs in [('subsonic',mach[mach[:,0] < 1.]),('mixed',mach)]:
+        reference = measure(VD,n_sw,n_cw,machs,None)
+        print('%s, %d control points, %d mach numbers, the velocities take %8.1f MB' % (name,VD.n_cp,len(machs),reference.output/1e6))
+        print('%-14s : peak %8.1f MB, %8.3f s' % ('no budget',reference.peak/1e6,reference.time))
+        for budget in [2**28,2**26,2**24]:
+            tiled = measure(VD,n_sw,n_cw,machs,budget)
+            print('%-14s : peak %8.1f MB, %8.3f s' % ('%d MB budget' % (budget/2**20),tiled.peak/1e6,tiled.time))
+            assert tiled.peak <= budget
+            assert tiled.output == reference.output
+
+    return
+
+# ----------------------------------------------------------------------
+#   Helper Functions
+# ----------------------------------------------------------------------
+
+def vortex_distribution(vehicle_setup,n_sw,n_cw,model_fuselage):
+
+    settings = Data()
+    settings.number_spanwise_vortices  = n_sw
+    settings.number_chordwise_vortices = n_cw
+    settings.spanwise_cosine_spacing   = True
+    settings.model_fuselage            = model_fuselage
+
+    VD = generate_wing_vortex_distribution(vehicle_setup(),settings)
+
+    return VD, n_sw, n_cw
+
+def measure(VD,n_sw,n_cw,mach,budget):
+
+    # the peak memory, but for the velocities that are returned
+    tracemalloc.start()
+    tic     = time.time()
+    results = compute_wing_induced_velocity(VD,n_sw,n_cw,mach,budget)
+    elapsed = time.time() - tic
+    peak    = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    output = results[0].nbytes
+
+    return Data(peak = peak - output, output = output, time = elapsed)
+
+if __name__ == '__main__':
+    main()
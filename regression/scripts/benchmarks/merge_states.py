@@ -0,0 +1,145 @@
+# merge_states.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+""" checks that merging the states of the segments of a mission all at once
+    gives the same results as merging them one at a time, and times both
+    for missions with more and more segments
+"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Core import Data
+from SUAVE.Analyses.Mission.Segments.Conditions import State
+from SUAVE.Analyses.Mission.Segments.Segment import append_array
+
+import numpy as np
+import time
+import sys
+
+sys.path.append('../Vehicles')
+sys.path.append('../B737')
+import mission_B737
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    configs, analyses = mission_B737.full_setup()
+    mission_B737.simple_sizing(configs, analyses)
+    configs.finalize()
+    analyses.finalize()
+
+    mission = analyses.missions.base
+    mission.evaluate()
+
+    check_merge(mission)
+
+    timings = time_merge(mission)
+    for key,value in timings.items():
+        print('%-24s : %8.4f s' % (key,value))
+
+    # stacking each value once scales with the number of segments
+    assert timings.segments_64 / timings.legacy_64 < 0.5
+
+    return
+
+# ----------------------------------------------------------------------
+#   Checks
+# ----------------------------------------------------------------------
+
+def check_merge(mission):
+
+    # a mission
+    assert compare(legacy_merged(mission),mission.merged()) == 0
+
+    # a state container, with a key only some segments have
+    container = State.Container()
+    for tag,segment in mission.segments.items():
+        container.segments[tag] = segment.state
+    mission.segments[1].state.conditions.frames.extra = Data(value = np.ones((1,1)))
+    mission.segments[2].state.conditions.extra        = np.zeros((3,1))
+    assert compare(legacy_merged(container,new_keys=False),container.merged()) == 0
+    assert compare(legacy_merged(mission),mission.merged()) == 0
+    del mission.segments[1].state.conditions.frames.extra
+    del mission.segments[2].state.conditions.extra
+
+    # one segment
+    single = SUAVE.Analyses.Mission.Sequential_Segments()
+    single.append_segment(mission.segments[0])
+    assert compare(legacy_merged(single),single.merged()) == 0
+
+    return
+
+def legacy_merged(segment,new_keys=True):
+    """ merges the segments one at a time, as Segment.merged() used to """
+
+    state_out = State()
+    segments  = segment.segments.values()
+
+    for i,sub_seg in enumerate(segments):
+        sub_state = sub_seg if isinstance(sub_seg,State) else sub_seg.state
+        for key in ['unknowns','conditions','residuals']:
+            if i == 0:
+                state_out[key].update(sub_state[key])
+            else:
+                state_out[key] = state_out[key].do_recursive(append_array,sub_state[key])
+                if new_keys:
+                    existing_keys = list(state_out[key].keys())
+                    new           = list(sub_state[key].keys())
+                    for update_key in np.setdiff1d(new,existing_keys).tolist():
+                        state_out[key][update_key] = sub_state[key][update_key]
+
+    return state_out
+
+def compare(A,B):
+    """ counts the values of A that B doesn't have """
+    bad = len(set(A.keys()) ^ set(B.keys()))
+    for k,a in A.items():
+        if not k in B:
+            continue
+        b = B[k]
+        if isinstance(a,dict):
+            bad += compare(a,b)
+        elif isinstance(a,np.ndarray):
+            bad += not (a.shape == b.shape and np.array_equal(a,b))
+        elif type(a) != type(b) or not a == b:
+            bad += 1
+    return bad
+
+# ----------------------------------------------------------------------
+#   Timing
+# ----------------------------------------------------------------------
+
+def time_merge(mission,n_repeats = 3):
+
+    states  = [segment.state for segment in mission.segments.values()]
+    timings = Data()
+
+    for n_segments in [8,16,32,64]:
+
+        # a mission with many segments
+        container = SUAVE.Analyses.Mission.Sequential_Segments()
+        for i in range(n_segments):
+            segment = SUAVE.Analyses.Mission.Segments.Segment()
+            segment.state = states[i % len(states)]
+            container.segments['segment_%d' % i] = segment
+
+        for name,merge in [('legacy',legacy_merged),('segments',SUAVE.Analyses.Mission.Segments.Segment.merged)]:
+            best = np.inf
+            for i in range(n_repeats):
+                tic = time.time()
+                merge(container)
+                best = min(best,time.time()-tic)
+            timings['%s_%d' % (name,n_segments)] = best
+
+    return timings
+
+if __name__ == '__main__':
+    main()
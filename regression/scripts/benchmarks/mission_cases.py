@@ -0,0 +1,151 @@
+# mission_cases.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+""" checks that evaluating the B737 mission for several takeoff weights stacked
+    along the control points, as payload_range does, or through a warm start
+    store, gives the results of evaluating them from the same guesses each, and
+    compares the evaluations and time they take
+"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Core import Units, Data
+from SUAVE.Analyses.Mission.Segments.Warm_Start import Warm_Start
+
+import numpy as np
+from copy import deepcopy
+import time
+import sys
+
+sys.path.append('../Vehicles')
+sys.path.append('../B737')
+import mission_B737
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    configs, analyses = mission_B737.full_setup()
+    mission_B737.simple_sizing(configs, analyses)
+    configs.finalize()
+    analyses.finalize()
+    mission = analyses.missions.base
+
+    vehicle = mission.segments[0].analyses.weights.vehicle
+    takeoff = vehicle.mass_properties.takeoff
+    cases   = takeoff*np.linspace(1.,0.9,8)
+
+    guesses = Data()
+    for segment in mission.segments:
+        guesses[segment.tag] = deepcopy(segment.state.unknowns)
+
+    serial  = run_serial(mission,cases,guesses)
+    batch   = run_batch(mission,cases,guesses)
+    sparse  = run_batch(mission,cases,guesses,'sparse')
+    stacked = run_stacked(mission,cases,guesses)
+
+    # the same results
+    for i in range(len(cases)):
+        for other in [batch,sparse,stacked]:
+            assert np.abs(other.fuel_burn[i]/serial.fuel_burn[i] - 1.) < 1e-6
+
+    # the segments let go of the store with the mission
+    mission.evaluate()
+    assert mission.segments.cruise.warm_start is None
+
+    for key,value in [('serial',serial),('warm_start',batch),('warm_sparse',sparse),('stacked',stacked)]:
+        print('%-14s : %6d evaluations %8.3f s' % (key,value.evaluations,value.time))
+
+    # each evaluation of the stacked mission covers all the cases
+    assert batch.evaluations < serial.evaluations
+    assert stacked.evaluations < serial.evaluations
+    
+    # the segments are back to one case
+    assert mission.segments.cruise.state.numerics.number_of_cases == 1
+
+    vehicle.mass_properties.takeoff = takeoff
+
+    return
+
+# ----------------------------------------------------------------------
+#   Cases
+# ----------------------------------------------------------------------
+
+def set_takeoff_weight(mission,weight):
+    mission.segments[0].analyses.weights.vehicle.mass_properties.takeoff = weight
+
+def fuel_burn(weight,results):
+    return weight - results.segments[-1].conditions.weights.total_mass[-1,0]
+
+def reset(mission,guesses,solver_jacobian='none'):
+    for segment in mission.segments:
+        segment.state.unknowns = deepcopy(guesses[segment.tag])
+        segment.state.numerics.solver_jacobian = solver_jacobian
+
+def count_evaluations(mission):
+    return sum(segment.state.numerics.evaluations for segment in mission.segments)
+
+def run_serial(mission,cases,guesses):
+
+    reset(mission,guesses)
+    out = Data(fuel_burn = [], evaluations = 0)
+
+    tic = time.time()
+    for weight in cases:
+        set_takeoff_weight(mission,weight)
+        out.fuel_burn.append(fuel_burn(weight,mission.evaluate()))
+        out.evaluations += count_evaluations(mission)
+    out.time = time.time() - tic
+
+    return out
+
+def run_batch(mission,cases,guesses,solver_jacobian='none'):
+
+    reset(mission,guesses,solver_jacobian)
+    out = Data(fuel_burn = [], evaluations = 0)
+
+    # each case starts from the unknowns the case before converged with
+    tic = time.time()
+    mission.warm_start = Warm_Start()
+    for weight in cases:
+        set_takeoff_weight(mission,weight)
+        results = mission.evaluate()
+        assert results.segments[-1].state.numerics.converged
+        out.fuel_burn.append(fuel_burn(weight,results))
+        out.evaluations += count_evaluations(mission)
+    mission.warm_start = None
+    out.time = time.time() - tic
+
+    reset(mission,guesses)
+
+    return out
+
+def run_stacked(mission,cases,guesses):
+
+    reset(mission,guesses)
+    out = Data(fuel_burn = [], evaluations = 0)
+
+    # all the cases at once, one takeoff weight for each
+    tic = time.time()
+    set_takeoff_weight(mission,cases)
+    results = mission.evaluate_cases(len(cases))
+    for weight,result in zip(cases,results):
+        assert result.converged
+        out.fuel_burn.append(fuel_burn(weight,result))
+    out.evaluations += count_evaluations(mission)
+    out.time = time.time() - tic
+
+    set_takeoff_weight(mission,cases[-1])
+    reset(mission,guesses)
+
+    return out
+
+if __name__ == '__main__':
+    main()
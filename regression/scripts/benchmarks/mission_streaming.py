@@ -0,0 +1,128 @@
+# mission_streaming.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+""" checks that the B737 mission evaluated segment by segment yields each
+    segment solved, before the next one is, and burns the fuel of the mission
+    evaluated at once, and that the stream of the mission can drop conditions
+    or keep them on disk, comparing the memory the conditions take
+"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Core import Units, Data
+from SUAVE.Methods.Missions.Segments.Common.Stream import spill_conditions, drop_conditions
+
+import numpy as np
+import tempfile
+import shutil
+import sys
+
+sys.path.append('../Vehicles')
+sys.path.append('../B737')
+import mission_B737
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    reference = setup_mission()
+    reference.evaluate()
+    reference_fuel = fuel_burn(reference)
+
+    # one segment at a time, the next one isn't solved yet
+    mission  = setup_mission()
+    segments = list(mission.segments.values())
+    tags     = []
+    for segment in mission.evaluate_segments():
+        index = len(tags)
+        tags.append(segment.tag)
+        assert segment is segments[index]
+        assert segment.state.numerics.converged
+        assert segment.state.numerics.evaluations > 0
+        if index + 1 < len(segments):
+            assert segments[index+1].state.numerics.evaluations == 0
+    assert tags == list(mission.segments.keys())
+    assert fuel_burn(mission) == reference_fuel
+
+    # the steps of the stream see every segment, in mission.evaluate() too
+    mission  = setup_mission()
+    streamed = []
+    def count(segment):
+        streamed.append(segment.tag)
+    mission.stream.count = count
+    mission.stream.drop  = drop_conditions(['aerodynamics.drag_breakdown','no.such.path'])
+    mission.evaluate()
+    assert streamed == tags
+    for segment in mission.segments.values():
+        assert 'drag_breakdown' not in segment.state.conditions.aerodynamics
+    assert np.abs(fuel_burn(mission)/reference_fuel - 1.) < 1e-12
+
+    # the conditions of the segments solved so far on disk
+    dirname = tempfile.mkdtemp()
+    try:
+        mission = setup_mission()
+        mission.stream.spill = spill_conditions(dirname)
+        for segment in mission.evaluate_segments():
+            pass
+        assert np.abs(fuel_burn(mission)/reference_fuel - 1.) < 1e-12
+        for segment in mission.segments.values():
+            assert isinstance(segment.state.conditions.weights.total_mass,np.memmap)
+            assert segment.conditions is segment.state.conditions
+
+        print('%-10s : %10d bytes' % ('in memory',conditions_memory(reference)))
+        print('%-10s : %10d bytes' % ('spilled',conditions_memory(mission)))
+        assert conditions_memory(mission) < conditions_memory(reference)/len(tags)
+    finally:
+        shutil.rmtree(dirname)
+
+    return
+
+# ----------------------------------------------------------------------
+#   Helper Functions
+# ----------------------------------------------------------------------
+
+def setup_mission():
+
+    configs, analyses = mission_B737.full_setup()
+    mission_B737.simple_sizing(configs, analyses)
+    configs.finalize()
+    analyses.finalize()
+
+    return analyses.missions.base
+
+def fuel_burn(mission):
+
+    segments = list(mission.segments.values())
+
+    return segments[0].state.conditions.weights.total_mass[0,0] - segments[-1].state.conditions.weights.total_mass[-1,0]
+
+def conditions_memory(mission):
+
+    # the bytes of the arrays of the conditions held in memory, not mapped from disk
+    total = 0
+    for segment in mission.segments.values():
+        for array in arrays_of(segment.state.conditions):
+            if not isinstance(array,np.memmap):
+                total += array.nbytes
+    return total
+
+def arrays_of(data):
+
+    if isinstance(data,dict):
+        arrays = []
+        for value in data.values():
+            arrays.extend(arrays_of(value))
+        return arrays
+    if isinstance(data,np.ndarray):
+        return [data]
+    return []
+
+if __name__ == '__main__':
+    main()
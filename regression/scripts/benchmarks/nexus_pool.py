@@ -0,0 +1,112 @@
+# nexus_pool.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+""" checks that the Nexus_Pool evaluates the regional jet optimization problem
+    like the nexus does one input at a time, in the order of the inputs, and
+    that it reports the inputs that raise or kill their worker
+"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Core import Units, Data
+from SUAVE.Optimization import Nexus_Pool, line_plot
+
+import numpy as np
+import time
+import sys
+import os
+
+sys.path.append('../Vehicles')
+sys.path.append('../Regional_Jet_Optimization')
+import Optimize2
+
+import matplotlib
+matplotlib.use('Agg')
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    inputs = np.array([[1.,1.],[0.95,1.05],[1.05,0.95],[1.1,1.1]])
+
+    # one at a time
+    problem = Optimize2.setup()
+    tic = time.time()
+    objective   = np.array([problem.objective(x)[0] for x in inputs])
+    constraints = np.array([problem.all_constraints(x) for x in inputs])
+    serial_time = time.time() - tic
+
+    # all at once
+    with Nexus_Pool(Optimize2.setup(),processes=2) as pool:
+        tic = time.time()
+        results = pool.evaluate(inputs,outputs=['summary.base_mission_fuelburn'])
+        pool_time = time.time() - tic
+
+        assert not np.any(results.failed)
+        assert np.all(np.abs(results.objective/objective - 1.) < 1e-6)
+        assert np.all(np.abs(results.constraints/constraints - 1.) < 1e-6)
+        assert np.all(np.abs(np.array(results.outputs).reshape(-1)/objective/problem.optimization_problem.objective[0][1] - 1.) < 1e-6)
+
+        # a sweep, as line_plot does it
+        sweep = line_plot(problem,3,plot_obj=0,plot_const=0)
+        pooled_sweep = line_plot(problem,3,plot_obj=0,plot_const=0,pool=pool)
+        assert np.all(np.abs(pooled_sweep.objective/sweep.objective - 1.) < 1e-6)
+        assert np.all(np.abs(pooled_sweep.constraint_val/sweep.constraint_val - 1.) < 1e-6)
+
+    check_failures(inputs)
+
+    print('%-10s : %8.3f s' % ('serial',serial_time))
+    print('%-10s : %8.3f s' % ('pool',pool_time))
+
+    return
+
+# ----------------------------------------------------------------------
+#   Failures
+# ----------------------------------------------------------------------
+
+def wing_area(nexus):
+    return nexus.optimization_problem.inputs[0,1]
+
+def raise_for_large_wings(nexus):
+    if wing_area(nexus) > 112.:
+        raise ValueError('the wing is too large')
+    return nexus
+
+def exit_for_small_wings(nexus):
+    if wing_area(nexus) < 92.:
+        os._exit(1)
+    return nexus
+
+def check_failures(inputs):
+
+    problem = Optimize2.setup()
+    problem.procedure.raise_for_large_wings = raise_for_large_wings
+    problem.procedure.exit_for_small_wings  = exit_for_small_wings
+
+    # a wing too large raises, a wing too small kills the worker
+    inputs = np.vstack([inputs,[[1.15,1.],[0.9,1.]]])
+
+    with Nexus_Pool(problem,processes=2,max_retries=1) as pool:
+        results = pool.evaluate(inputs)
+
+        assert list(results.failed) == [False,False,False,False,True,True]
+        assert 'the wing is too large' in results.errors[4]
+        assert 'died' in results.errors[5]
+        assert results.errors[0] is None
+        assert np.isnan(results.objective[4]) and np.isnan(results.objective[5])
+
+        # the pool starts again after a worker died
+        results = pool.evaluate(inputs[:1])
+        assert not results.failed[0]
+
+    return
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,172 @@
+# pack_unpack_array.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+""" checks the cached pack/unpack layout of Data and times it against
+    rebuilding the layout on every call
+"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Core import Data
+from SUAVE.Analyses.Mission.Segments.Conditions import Unknowns, Residuals
+
+import numpy as np
+import pickle
+import copy
+import time
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    check_layout()
+    check_invalidation()
+    check_copies()
+
+    timings = time_pack_unpack()
+    for key,value in timings.items():
+        print('%-20s : %8.2f us/call' % (key,value))
+
+    return
+
+# ----------------------------------------------------------------------
+#   Checks
+# ----------------------------------------------------------------------
+
+def check_layout():
+
+    u = Unknowns()
+    u.throttle   = np.ones((4,1)) * 0.5
+    u.body_angle = np.ones((4,1)) * 3.
+    u.nested     = Data()
+    u.nested.x   = np.arange(6.).reshape(3,2)
+    u.nested.s   = 2.
+    u.nested.i   = 3
+    u.z          = np.arange(3.)
+    u.name       = 'skipped'
+
+    # same order as the recursive walk, 2d arrays in column major order
+    M = u.pack_array()
+    truth = np.hstack([[0.5]*4,[3.]*4,[0.,2.,4.,1.,3.,5.],[2.,3.],[0.,1.,2.]])
+    assert np.all(M == truth)
+    assert M.dtype == np.float64
+
+    # unpacking writes every leaf in place and keeps the shapes
+    throttle = u.throttle
+    M = np.arange(M.size) * 1.5
+    u.unpack_array(M)
+    assert throttle is u.throttle
+    assert u.throttle.shape  == (4,1)
+    assert u.nested.x.shape  == (3,2)
+    assert u.nested.x[0,1]   == 16.5
+    assert u.nested.s        == 21.
+    assert np.all(u.pack_array() == M)
+
+    # and again with the cached layout
+    u.unpack_array(M * 2.)
+    assert throttle is u.throttle
+    assert np.all(throttle[:,0] == M[:4] * 2.)
+
+    # the unpacked arrays are not views of the input
+    M[:] = -1.
+    assert np.all(throttle[:,0] >= 0.)
+
+    # empty data
+    assert Data().pack_array().size == 0
+
+    return
+
+def check_invalidation():
+
+    r = Residuals()
+    r.forces = np.zeros((4,2))
+    assert r.pack_array().size == 8
+
+    # new leaves
+    r.moments = np.ones((4,1))
+    assert r.pack_array().size == 12
+
+    # replaced leaves with a new shape
+    r.forces = np.zeros((6,2))
+    assert r.pack_array().size == 16
+
+    # replaced nodes
+    r.extra   = Data()
+    r.extra.a = np.ones(2)
+    assert r.pack_array().size == 18
+    r.extra   = Data()
+    assert r.pack_array().size == 16
+
+    # removed leaves
+    del r.moments
+    assert r.pack_array().size == 12
+
+    # unpacking follows the rebuilt layout
+    r.unpack_array(np.arange(12.))
+    assert r.forces[5,1] == 11.
+
+    return
+
+def check_copies():
+
+    u = Unknowns()
+    u.throttle = np.ones((4,1)) * 0.5
+    u.nested   = Data()
+    u.nested.x = np.arange(6.).reshape(3,2)
+    M = u.pack_array()
+    u.unpack_array(M)
+
+    # copies build a layout of their own, and unpack into their own leaves
+    for c in [copy.deepcopy(u),pickle.loads(pickle.dumps(u))]:
+        assert c._pack_plan is None
+        c.unpack_array(M + 1.)
+        assert np.all(c.pack_array() == M + 1.)
+        assert np.all(c.throttle[:,0] == M[:4] + 1.)
+        assert np.all(u.pack_array() == M)
+
+    return
+
+# ----------------------------------------------------------------------
+#   Timing
+# ----------------------------------------------------------------------
+
+def time_pack_unpack(n_loops = 2000):
+
+    # a segment sized set of unknowns and residuals
+    n_cp = 16
+    u = Unknowns()
+    r = Residuals()
+    r.forces = np.zeros((n_cp,2))
+    for key in ['throttle','body_angle','velocity','wind_angle','altitude']:
+        u[key] = np.ones((n_cp,1))
+
+    M = u.pack_array()
+
+    timings = Data()
+
+    tic = time.time()
+    for i in range(n_loops):
+        u.unpack_array(M)
+        r.pack_array()
+    timings.cached = (time.time()-tic)/n_loops*1e6
+
+    # force the layout to be rebuilt every time
+    tic = time.time()
+    for i in range(n_loops):
+        u._pack_plan = None
+        r._pack_plan = None
+        u.unpack_array(M)
+        r.pack_array()
+    timings.rebuilt = (time.time()-tic)/n_loops*1e6
+
+    return timings
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,118 @@
+# process_compile.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+""" checks that the compiled steps of the iterate process of the B737 segments
+    find the residuals the nested processes find, that editing a process drops
+    its compiled steps, and compares the time of an iteration both ways
+"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Core import Units, Data
+from SUAVE.Analyses import Process
+
+import numpy as np
+import time
+import sys
+
+sys.path.append('../Vehicles')
+sys.path.append('../B737')
+import mission_B737
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    configs, analyses = mission_B737.full_setup()
+    mission_B737.simple_sizing(configs, analyses)
+    configs.finalize()
+    analyses.finalize()
+    mission = analyses.missions.base
+    mission.evaluate()
+
+    # the same residuals, at unknowns away from the solution
+    for segment in mission.segments.values():
+        state    = segment.state
+        unknowns = state.unknowns.pack_array()
+        state.unknowns.unpack_array(unknowns*1.01)
+
+        segment.process.iterate(segment)
+        nested = state.residuals.pack_array()
+        segment.process.iterate.evaluate_compiled(segment)
+        compiled = state.residuals.pack_array()
+        assert np.all(nested == compiled)
+
+        state.unknowns.unpack_array(unknowns)
+
+    check_edits(mission.segments.cruise)
+
+    # the time of an iteration
+    segment  = mission.segments.cruise
+    n_calls  = 200
+    tic = time.time()
+    for i in range(n_calls):
+        segment.process.iterate(segment)
+    nested_time = time.time() - tic
+    tic = time.time()
+    for i in range(n_calls):
+        segment.process.iterate.evaluate_compiled(segment)
+    compiled_time = time.time() - tic
+
+    steps = segment.process.iterate.compile()
+    print('%d steps' % len(steps))
+    print('%-10s : %8.4f s' % ('nested',nested_time))
+    print('%-10s : %8.4f s' % ('compiled',compiled_time))
+
+    return
+
+# ----------------------------------------------------------------------
+#   Checks
+# ----------------------------------------------------------------------
+
+def check_edits(segment):
+
+    iterate = segment.process.iterate
+    steps   = iterate.compile()
+    assert iterate.compile() is steps
+
+    # a step added to a nested process is found
+    counter = Data(calls = 0)
+    def count(segment):
+        counter.calls += 1
+    iterate.conditions.count = count
+    assert iterate.compile() is not steps
+    iterate.evaluate_compiled(segment)
+    assert counter.calls == 1
+
+    # and forgotten when it is removed
+    del iterate.conditions.count
+    assert len(iterate.compile()) == len(steps)
+    iterate.evaluate_compiled(segment)
+    assert counter.calls == 1
+
+    # building or editing other processes keeps it
+    steps = iterate.compile()
+    other = Process()
+    other.step = count
+    assert other._version == 1 and len(other) == 1
+    other.compile()
+    assert len(other) == 1
+    segment.process.finalize.count = count
+    del segment.process.finalize.count
+    assert iterate.compile() is steps
+
+    # or when asked to
+    Process.invalidate()
+    assert iterate.compile() is not steps
+
+    return
+
+if __name__ == '__main__':
+    main()
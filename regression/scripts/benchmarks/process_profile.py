@@ -0,0 +1,110 @@
+# process_profile.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+""" checks that a Process_Profile records the steps of the B737 mission by
+    their path, adding up the iterations of the solver, without changing the
+    results, and prints where the mission spends its time
+"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Core import Units, Data
+from SUAVE.Analyses import Process, Process_Profile
+
+import numpy as np
+import time
+import sys
+
+sys.path.append('../Vehicles')
+sys.path.append('../B737')
+import mission_B737
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    mission = setup_mission()
+    tic = time.time()
+    results = mission.evaluate()
+    plain_time = time.time() - tic
+
+    mission = setup_mission()
+    tic = time.time()
+    with Process_Profile() as profile:
+        profiled = mission.evaluate()
+    profile_time = time.time() - tic
+
+    # the profile is only enabled inside the with
+    assert Process.profile is None
+
+    # the same mission
+    for tag,segment in results.segments.items():
+        mass  = segment.conditions.weights.total_mass
+        other = profiled.segments[tag].conditions.weights.total_mass
+        assert np.max(np.abs(other/mass - 1.)) < 1e-12
+
+    # the steps are found by their path, and the iterations are added up
+    steps = profile.steps()
+    root  = steps[mission.tag]
+    assert root.calls == 1
+    for tag,segment in mission.segments.items():
+        path  = '.'.join([mission.tag,'converge',tag,'converge','converge_root','iterate'])
+        assert steps[path].calls == segment.state.numerics.evaluations
+        assert steps[path + '.conditions.aerodynamics'].calls == segment.state.numerics.evaluations
+
+    # the time of each step is split between the steps inside it
+    self_time = sum(step.self_time for step in steps.values())
+    assert np.abs(self_time/root.time - 1.) < 1e-6
+
+    # one line per step in the folded stacks
+    folded = profile.folded().split('\n')
+    assert len(folded) == len(steps)
+    assert folded[0].split(' ')[0] == mission.tag + ';initialize'
+
+    check_memory(mission)
+
+    print(profile.table(sort='self_time',limit=15))
+    print('%-10s : %8.3f s' % ('plain',plain_time))
+    print('%-10s : %8.3f s' % ('profiled',profile_time))
+
+    return
+
+# ----------------------------------------------------------------------
+#   Checks
+# ----------------------------------------------------------------------
+
+def setup_mission():
+
+    configs, analyses = mission_B737.full_setup()
+    mission_B737.simple_sizing(configs, analyses)
+    configs.finalize()
+    analyses.finalize()
+
+    return analyses.missions.base
+
+def check_memory(mission):
+
+    profile = Process_Profile()
+    profile.memory = True
+    with profile:
+        mission.segments.cruise.evaluate()
+
+    steps = profile.steps()
+    assert list(steps.keys())[0] == 'cruise.initialize.expand_state'
+    assert steps['cruise'].memory >= steps['cruise.converge'].memory >= 0
+
+    # the profile can be reset and enabled again
+    profile.reset()
+    assert len(profile.steps()) == 0
+
+    return
+
+if __name__ == '__main__':
+    main()
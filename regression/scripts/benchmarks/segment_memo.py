@@ -0,0 +1,199 @@
+# segment_memo.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+""" checks that the B737 mission evaluated again with a memo takes the
+    converged segments from it, that changing the cruise solves the cruise and
+    the segments after it again, and burns the fuel of a mission solved
+    without the memo, that partials, closures and sets are told apart by their
+    contents and that a segment that can't be hashed is solved without the
+    memo, and that the memo keeps no more than its size
+"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Core import Units, Data
+from SUAVE.Analyses.Mission.Segments import Segment_Memo
+
+from functools import partial
+import numpy as np
+import threading
+import time
+import sys
+
+sys.path.append('../Vehicles')
+sys.path.append('../B737')
+import mission_B737
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    mission  = setup_mission()
+    memo     = Segment_Memo()
+    mission.memo = memo
+    segments = list(mission.segments.keys())
+    n        = len(segments)
+
+    # the first evaluation solves every segment
+    tic = time.time()
+    first = mission.evaluate()
+    first_time = time.time() - tic
+    assert memo.hits == 0 and memo.misses == n
+    assert len(memo.segments) == n
+
+    # the second one solves none
+    tic = time.time()
+    second = mission.evaluate()
+    second_time = time.time() - tic
+    assert memo.hits == n and memo.misses == n
+    assert fuel_burn(second) == fuel_burn(first)
+    for segment in mission.segments.values():
+        assert segment.state.numerics.evaluations == 0
+
+    # a longer cruise, the climbs before it are found
+    mission.segments.cruise.distance *= 1.05
+    changed = mission.evaluate()
+    index   = segments.index('cruise')
+    assert memo.hits == n + index and memo.misses == 2*n - index
+
+    # and it burns the fuel of a mission solved from scratch
+    fresh = setup_mission()
+    fresh.segments.cruise.distance *= 1.05
+    reference = fresh.evaluate()
+    error = fuel_burn(changed)/fuel_burn(reference) - 1.
+    assert np.abs(error) < 1e-6
+
+    print('%-10s : %8.3f s' % ('solved',first_time))
+    print('%-10s : %8.3f s' % ('memo',second_time))
+    print('hit rate %.2f, %d evaluations saved, fuel burn error %8.2e' % (memo.hit_rate(),memo.saved_evaluations,error))
+    print('%-10s : %8.3f s, %d keys' % ('keys',memo.key_time,memo.hits + memo.misses))
+
+    check_key(mission,memo)
+    check_size(mission,memo,n)
+    check_inherit(mission,memo,n)
+
+    return
+
+# ----------------------------------------------------------------------
+#   Checks
+# ----------------------------------------------------------------------
+
+def check_key(mission,memo):
+
+    segments = list(mission.segments.values())
+
+    # the analyses are hashed once for the segments sharing them
+    tic = time.time()
+    keys = [memo.key(segment) for segment in segments]
+    apart = time.time() - tic
+    analyses_keys = {}
+    tic = time.time()
+    assert [memo.key(segment,analyses_keys) for segment in segments] == keys
+    shared = time.time() - tic
+    assert len(analyses_keys) < len(segments)
+    print('%-10s : %8.4f s per key, %8.4f s with the analyses hashed once' % ('key',apart/len(segments),shared/len(segments)))
+
+    # a step of the process changed is another key
+    cruise     = mission.segments.cruise
+    conditions = cruise.process.iterate.conditions
+    tag        = list(conditions.keys())[0]
+    step       = conditions[tag]
+    def changed(segment):
+        step(segment)
+    conditions[tag] = changed
+    assert memo.key(cruise) != keys[segments.index(cruise)]
+    conditions[tag] = step
+    assert memo.key(cruise) == keys[segments.index(cruise)]
+
+    # and so is a partial with other arguments, a closure over other values or a set of other items
+    def closure(value):
+        def function(segment):
+            return value
+        return function
+    for one,other in [(partial(step,k=1),partial(step,k=2)),(closure(1.),closure(2.)),({1,2},{3})]:
+        cruise.option = one
+        key = memo.key(cruise)
+        cruise.option = other
+        assert memo.key(cruise) != key
+
+    # one that can't be hashed has no key, and is solved without the memo
+    cruise.option = threading.Lock()
+    assert memo.key(cruise) is None
+    hits, misses = memo.hits, memo.misses
+    mission.evaluate()
+    assert cruise.state.numerics.evaluations > 0
+    assert memo.hits + memo.misses == hits + misses + len(segments) - 1
+    del cruise.option
+    assert memo.key(cruise) == keys[segments.index(cruise)]
+
+    return
+
+def check_size(mission,memo,n):
+
+    # the oldest segments go first
+    memo.reset()
+    memo.max_size = 3
+    mission.evaluate()
+    assert len(memo.segments) == 3
+    assert memo.evictions == n - 3
+
+    # so the last segments are found, and the first ones aren't
+    mission.evaluate()
+    assert memo.hits == 0
+
+    memo.reset()
+    assert len(memo.segments) == 0 and memo.hit_rate() == 0.
+
+    return
+
+def check_inherit(mission,memo,n):
+
+    # the segments follow the memo of the mission once it is changed
+    other = Segment_Memo()
+    mission.memo = other
+    memo.reset()
+    mission.evaluate()
+    assert other.misses == n and memo.misses == 0
+    for segment in mission.segments.values():
+        assert segment.memo is other
+
+    # or taken off
+    mission.memo = None
+    mission.evaluate()
+    assert other.misses == n and other.hits == 0
+    for segment in mission.segments.values():
+        assert segment.memo is None
+
+    # a memo of a segment's own is kept
+    mission.memo = other
+    mission.segments.cruise.memo = memo
+    mission.evaluate()
+    assert mission.segments.cruise.memo is memo and memo.misses == 1
+    mission.memo = None
+    mission.evaluate()
+    assert mission.segments.cruise.memo is memo and memo.hits + memo.misses == 2
+
+    return
+
+def setup_mission():
+
+    configs, analyses = mission_B737.full_setup()
+    mission_B737.simple_sizing(configs, analyses)
+    configs.finalize()
+    analyses.finalize()
+
+    return analyses.missions.base
+
+def fuel_burn(results):
+
+    return results.segments[0].conditions.weights.total_mass[0,0] - results.segments[-1].conditions.weights.total_mass[-1,0]
+
+if __name__ == '__main__':
+    main()
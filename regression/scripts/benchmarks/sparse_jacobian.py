@@ -0,0 +1,103 @@
+# sparse_jacobian.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+""" checks that the segments solved with the sparse finite difference
+    jacobian converge to the same results, and compares the number of
+    iterations and time of the B737 mission with the dense jacobian of fsolve
+"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Core import Units, Data
+from SUAVE.Methods.Missions.Segments.converge_root import color_columns
+
+import numpy as np
+import time
+import sys
+
+sys.path.append('../Vehicles')
+sys.path.append('../B737')
+import mission_B737
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    check_colors()
+
+    dense  = run_mission('none')
+    sparse = run_mission('sparse')
+
+    # the same mission
+    for tag,segment in dense.mission.segments.items():
+        other = sparse.mission.segments[tag]
+        assert other.state.numerics.converged
+        error = np.max(np.abs(other.state.conditions.weights.total_mass/segment.state.conditions.weights.total_mass - 1.))
+        assert error < 1e-6
+
+        colors = other.state.numerics.jacobian_colors
+        print('%-14s : %3d unknowns, %3d groups' % (tag,len(colors),np.max(colors)+1))
+
+    # again, from the converged unknowns, with the sparsity found by the first run
+    dense_again  = run_mission('none',dense.mission)
+    sparse_again = run_mission('sparse',sparse.mission)
+
+    for key,value in [('dense',dense),('sparse',sparse),('dense_again',dense_again),('sparse_again',sparse_again)]:
+        print('%-14s : %6d iterations %8.3f s' % (key,value.iterations,value.time))
+
+    assert sparse_again.iterations < dense_again.iterations
+
+    return
+
+# ----------------------------------------------------------------------
+#   Checks
+# ----------------------------------------------------------------------
+
+def check_colors():
+
+    # unknowns that only change the residuals at their own control point
+    sparsity = np.kron(np.ones((2,2)),np.eye(16)) > 0.
+    colors   = color_columns(sparsity)
+    assert np.max(colors) == 1
+
+    # no two columns of a group share a row
+    for color in range(np.max(colors)+1):
+        assert np.all(np.sum(sparsity[:,colors==color],axis=1) <= 1)
+
+    # a dense row groups nothing
+    sparsity[0,:] = True
+    assert np.max(color_columns(sparsity)) == 31
+
+    return
+
+def run_mission(solver_jacobian,mission=None):
+
+    if mission is None:
+        configs, analyses = mission_B737.full_setup()
+        mission_B737.simple_sizing(configs, analyses)
+        configs.finalize()
+        analyses.finalize()
+        mission = analyses.missions.base
+
+    # count the iterations of the segments
+    counter = Data(iterations = 0)
+    def count(segment):
+        counter.iterations += 1
+    for segment in mission.segments:
+        segment.state.numerics.solver_jacobian = solver_jacobian
+        segment.process.iterate.count = count
+
+    tic = time.time()
+    mission.evaluate()
+
+    return Data(mission = mission, iterations = counter.iterations, time = time.time() - tic)
+
+if __name__ == '__main__':
+    main()
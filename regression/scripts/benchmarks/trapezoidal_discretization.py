@@ -0,0 +1,150 @@
+# trapezoidal_discretization.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+""" checks that the operators of trapezoidal_data are second order, that the
+    derivative is banded and the integral a cumulative sum, compares the time
+    of their products with the dense chebyshev ones for many points, and solves
+    the B737 mission with them
+"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Core import Units, Data
+from SUAVE.Methods.Utilities.Chebyshev import chebyshev_data, trapezoidal_data, Trapezoidal_Integral
+
+import numpy as np
+import scipy.sparse
+import time
+import sys
+
+sys.path.append('../Vehicles')
+sys.path.append('../B737')
+import mission_B737
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    check_operators()
+    compare_products(1000)
+
+    # the mission, with the chebyshev operators and with more trapezoidal points
+    reference = run_mission(None,16)
+    coarse    = run_mission(trapezoidal_data,16)
+    fine      = run_mission(trapezoidal_data,32)
+
+    coarse_error = coarse.fuel_burn/reference.fuel_burn - 1.
+    fine_error   = fine.fuel_burn/reference.fuel_burn - 1.
+    print('%-12s : %6d evaluations %8.3f s' % ('chebyshev 16',reference.evaluations,reference.time))
+    print('%-12s : %6d evaluations %8.3f s, fuel burn error %8.2e' % ('trapezoid 16',coarse.evaluations,coarse.time,coarse_error))
+    print('%-12s : %6d evaluations %8.3f s, fuel burn error %8.2e' % ('trapezoid 32',fine.evaluations,fine.time,fine_error))
+
+    # the error falls with the square of the spacing
+    assert fine.converged and coarse.converged
+    assert np.abs(coarse_error) < 1e-4
+    assert np.abs(fine_error) < np.abs(coarse_error)/3.
+
+    # and the scaled operators stay sparse
+    numerics = fine.mission.segments.cruise.state.numerics
+    t        = numerics.time.control_points
+    assert scipy.sparse.issparse(numerics.time.differentiate)
+    assert isinstance(numerics.time.integrate,Trapezoidal_Integral)
+    assert np.max(np.abs(numerics.time.integrate.dot(np.ones_like(t)) - (t - t[0]))) < 1e-9*t[-1,0]
+
+    return
+
+# ----------------------------------------------------------------------
+#   Checks
+# ----------------------------------------------------------------------
+
+def check_operators():
+
+    # second order derivatives and integrals of a smooth function
+    errors = []
+    for N in [21,41]:
+        x,D,I = trapezoidal_data(N)
+        f     = np.sin(3.*x)[:,None]
+        d_err = np.max(np.abs(D.dot(f) - 3.*np.cos(3.*x)[:,None]))
+        i_err = np.max(np.abs(I.dot(f) - (1.-np.cos(3.*x))[:,None]/3.))
+        errors.append([d_err,i_err])
+    ratio = np.array(errors[0])/np.array(errors[1])
+    assert np.all(ratio > 3.5) and np.all(ratio < 4.5)
+
+    # exact for straight lines, in 1-d vectors too
+    x,D,I = trapezoidal_data(9)
+    assert np.max(np.abs(D.dot(2.*x+1.) - 2.)) < 1e-12
+    assert np.max(np.abs(I.dot(2.*x+1.) - (x**2+x))) < 1e-12
+
+    # D is banded, the dense operators are the same
+    rows,columns = D.nonzero()
+    assert np.max(np.abs(rows - columns)) == 2
+    assert D.nnz == 2*9 + 2
+    x_dense,D_dense,I_dense = trapezoidal_data(9,sparse=False)
+    assert isinstance(D_dense,np.ndarray)
+    assert np.all(D_dense == D.toarray()) and np.all(I_dense == I.toarray())
+    assert trapezoidal_data(9,integration=False)[2] is None
+
+    # the cumulative sum is the lower triangular matrix
+    f = np.random.rand(9,3)
+    assert np.allclose(I.dot(f),I_dense.dot(f),rtol=1e-14,atol=1e-14)
+    assert np.allclose(I.dot(f[:,0]),I_dense.dot(f[:,0]),rtol=1e-14,atol=1e-14)
+    assert np.all(I_dense == np.tril(I_dense))
+
+    return
+
+def compare_products(N):
+
+    f = np.random.rand(N,3)
+
+    x,D_dense,I_dense = chebyshev_data(N)
+    x,D,I             = trapezoidal_data(N)
+
+    n_calls = 20
+    print('%d points, nonzeros of D: %d of %d' % (N,D.nnz,N*N))
+    for name,dense,sparse in [('differentiate',D_dense,D),('integrate',I_dense,I)]:
+        tic = time.time()
+        for i in range(n_calls):
+            dense.dot(f)
+        dense_time = time.time() - tic
+        tic = time.time()
+        for i in range(n_calls):
+            sparse.dot(f)
+        sparse_time = time.time() - tic
+        print('%-14s : dense %8.4f s, sparse %8.4f s' % (name,dense_time,sparse_time))
+
+    return
+
+def run_mission(discretization_method,number_control_points):
+
+    configs, analyses = mission_B737.full_setup()
+    mission_B737.simple_sizing(configs, analyses)
+    configs.finalize()
+    analyses.finalize()
+    mission = analyses.missions.base
+
+    for segment in mission.segments.values():
+        if discretization_method is not None:
+            segment.state.numerics.discretization_method = discretization_method
+        segment.state.numerics.number_control_points = number_control_points
+
+    tic = time.time()
+    results = mission.evaluate()
+    elapsed = time.time() - tic
+
+    mass = results.segments[0].conditions.weights.total_mass[0,0] - results.segments[-1].conditions.weights.total_mass[-1,0]
+
+    return Data(mission     = mission,
+                fuel_burn   = mass,
+                time        = elapsed,
+                converged   = all(segment.state.numerics.converged for segment in mission.segments.values()),
+                evaluations = sum(segment.state.numerics.evaluations for segment in mission.segments.values()))
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,141 @@
+# units_conversion.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+""" checks the cached unit conversions against Pint, including from
+    several threads, and times them
+"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Core import Units, Data
+from SUAVE.Plugins.pint import UnitRegistry
+
+import numpy as np
+import threading
+import time
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    check_conversions()
+    check_threads()
+
+    timings = time_conversions()
+    for key,value in timings.items():
+        print('%-20s : %8.3f M conversions/s' % (key,value))
+
+    return
+
+# ----------------------------------------------------------------------
+#   Checks
+# ----------------------------------------------------------------------
+
+def check_conversions():
+
+    pint = UnitRegistry()
+    v    = np.array([3.,4.,6.])
+
+    # ratios match pint
+    for name in ['ft','deg','lbs','knots','nmi','hp','psi','slug','rpm','kelvin','degR']:
+        truth = pint.Quantity(2.5,name).to_base_units().magnitude
+        assert np.abs(2.5 * Units[name] - truth) < 1e-12 * abs(truth)
+        assert np.abs(2.5 * getattr(Units,name) - truth) < 1e-12 * abs(truth)
+
+    # units are plain floats
+    assert type(Units.ft) is float
+    assert type(v * Units.ft) is np.ndarray
+    assert np.all(v * Units.ft == v * 0.3048)
+    assert np.allclose(v * Units.ft / Units.ft, v, rtol=1e-15)
+
+    # combined units
+    assert np.isclose(Units['miles/hour'], Units.miles / Units.hour, rtol=1e-15)
+    assert np.isclose(Units['slug/ft**3'], Units.slug / Units.ft**3 , rtol=1e-15)
+
+    # offset units convert values, not ratios
+    t = np.array([32.,212.]) * Units.degF
+    assert np.allclose(t, [273.15,373.15])
+    assert np.allclose(t / Units.degF, [32.,212.])
+    assert np.isclose(100. * Units.degC, 373.15)
+
+    # units can still be stored
+    d = Data()
+    d.scale = Units.ft
+    assert d.pack_array()[0] == 0.3048
+
+    # missing units
+    try:
+        Units.not_a_unit
+    except Exception:
+        pass
+    else:
+        raise AssertionError('missing unit did not raise')
+
+    return
+
+def check_threads(n_threads = 8, n_loops = 2000):
+
+    values = np.linspace(1.,100.,n_threads)
+    errors = []
+    ft     = Units.ft
+    deg    = Units['deg']
+
+    def convert(value):
+        for i in range(n_loops):
+            if value * Units.ft != value * ft or value / Units.deg != value / deg:
+                errors.append(value)
+                return
+
+    threads = [threading.Thread(target=convert,args=(value,)) for value in values]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert not errors
+
+    return
+
+# ----------------------------------------------------------------------
+#   Timing
+# ----------------------------------------------------------------------
+
+def time_conversions(n_loops = 20000, n_repeats = 5):
+
+    v = np.ones(16)
+
+    def scalars():
+        for i in range(n_loops):
+            3. * Units.ft
+            3. / Units.ft
+
+    def arrays():
+        for i in range(n_loops):
+            v * Units.deg
+            v / Units.deg
+
+    def expressions():
+        for i in range(n_loops):
+            3. * Units['miles/hour']
+            3. / Units['miles/hour']
+
+    timings = Data()
+    for function in [scalars,arrays,expressions]:
+        best = np.inf
+        for i in range(n_repeats):
+            tic = time.time()
+            function()
+            best = min(best,time.time()-tic)
+        timings[function.__name__] = 2*n_loops/best/1e6
+
+    return timings
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,278 @@
+# vlm_influence_cache.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+""" checks that the VLM with the vortex distributions and factored influence
+    matrices found in the cache gives the vortex strengths solved from
+    scratch, that a changed wing isn't found, that the vehicle's copy of a
+    distribution and threads sharing the cache leave it whole, that the factors
+    are only kept within the cache budget and not after the training of a
+    surrogate, and compares the time of the B737 mission without a surrogate
+    with and without the cache
+"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Core import Units, Data
+from SUAVE.Analyses.Aerodynamics import Vortex_Lattice
+from SUAVE.Methods.Aerodynamics.Common.Fidelity_Zero.Lift import VLM, influence_cache
+from SUAVE.Methods.Aerodynamics.Common.Fidelity_Zero.Lift import generate_wing_vortex_distribution, compute_wing_induced_velocity, compute_RHS_matrix
+
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+import time
+import sys
+
+sys.path.append('../Vehicles')
+sys.path.append('../B737')
+import mission_B737
+from Boeing_737 import vehicle_setup
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    check_coefficients()
+    check_sharing()
+    check_budget()
+    check_training()
+
+    # the mission without a surrogate, solving the VLM from scratch and with the cache
+    lattices = influence_cache.limits.lattices
+    influence_cache.limits.lattices = 0
+    uncached = run_mission(None)
+
+    influence_cache.limits.lattices = lattices
+    cached = run_mission(2**30)
+    again  = run_mission(2**30,clear = False)
+
+    print('%-10s : %8.3f s' % ('uncached',uncached.time))
+    print('%-10s : %8.3f s, %d of %d lattices and %d of %d factors found' % ('cached',cached.time,cached.hits,cached.calls,
+                                                                             cached.factor_hits,cached.factor_hits+cached.factor_misses))
+    print('%-10s : %8.3f s, %d of %d lattices and %d of %d factors found' % ('again',again.time,again.hits,again.calls,
+                                                                             again.factor_hits,again.factor_hits+again.factor_misses))
+
+    # the same mission, with one vortex distribution by configuration, factored once by mach number
+    assert uncached.hits == 0 and uncached.factor_hits == 0
+    assert cached.misses == 3
+    assert cached.factor_hits > 10*cached.factor_misses
+    assert again.misses == 0 and again.factor_misses == 0
+    assert np.abs(cached.fuel_burn/uncached.fuel_burn - 1.) < 1e-10
+    assert again.fuel_burn == cached.fuel_burn
+    assert cached.time < uncached.time
+
+    return
+
+# ----------------------------------------------------------------------
+#   Checks
+# ----------------------------------------------------------------------
+
+def check_coefficients():
+
+    influence_cache.clear_influence_cache()
+
+    vehicle  = vehicle_setup()
+    settings = vlm_settings()
+
+    # subsonic and supersonic points, with repeated mach numbers
+    conditions = SUAVE.Analyses.Mission.Segments.Conditions.Aerodynamics()
+    conditions.aerodynamics.angle_of_attack = np.array([[-2.,0.,2.,4.,2.,6.]]).T * Units.deg
+    conditions.freestream.mach_number       = np.array([[0.3,0.3,0.5,0.5,1.5,0.8]]).T
+
+    # the vortex strengths of the factors, and solved from scratch
+    gamma = VLM(conditions,settings,vehicle)[-1]
+    assert np.max(np.abs(gamma - reference_gamma(conditions,settings,vehicle))) < 1e-10*np.max(np.abs(gamma))
+    assert influence_cache.statistics.misses == 1 and influence_cache.statistics.factor_misses == 4
+
+    # the angles of attack change, the factors are found
+    conditions.aerodynamics.angle_of_attack = conditions.aerodynamics.angle_of_attack + 1. * Units.deg
+    results = VLM(conditions,settings,vehicle)
+    CL      = results[0]
+    gamma   = results[-1]
+    untwisted = gamma
+    assert np.max(np.abs(gamma - reference_gamma(conditions,settings,vehicle))) < 1e-10*np.max(np.abs(gamma))
+    assert influence_cache.statistics.hits == 1 and influence_cache.statistics.misses == 1
+    assert influence_cache.statistics.factor_hits == 4 and influence_cache.statistics.factor_misses == 4
+
+    # a twisted wing is another geometry
+    vehicle.wings.main_wing.Segments.tip.twist = vehicle.wings.main_wing.Segments.tip.twist - 1. * Units.deg
+    results = VLM(conditions,settings,vehicle)
+    gamma   = results[-1]
+    assert influence_cache.statistics.misses == 2
+    assert np.max(np.abs(gamma - reference_gamma(conditions,settings,vehicle))) < 1e-10*np.max(np.abs(gamma))
+    assert np.all(results[0] < CL)
+
+    # the first lattice is dropped from the cache and generated again, while its factors are kept
+    lattices = influence_cache.limits.lattices
+    influence_cache.limits.lattices = 1
+    VLM(conditions,settings,vehicle)
+    vehicle.wings.main_wing.Segments.tip.twist = vehicle.wings.main_wing.Segments.tip.twist + 1. * Units.deg
+    results = VLM(conditions,settings,vehicle)
+    influence_cache.limits.lattices = lattices
+    assert influence_cache.statistics.misses == 3
+    assert np.array_equal(results[-1],untwisted)
+
+    return
+
+def check_sharing():
+
+    influence_cache.clear_influence_cache()
+
+    vehicle  = vehicle_setup()
+    settings = vlm_settings()
+
+    # the items set on the vehicle's distribution aren't kept, its arrays are shared
+    lattice = influence_cache.cached_vortex_distribution(vehicle,settings)
+    vehicle.vortex_distribution.Wake = Data()
+    assert 'Wake' not in lattice.vortex_distribution
+    assert vehicle.vortex_distribution.XC is lattice.vortex_distribution.XC
+    assert 'Wake' not in influence_cache.cached_vortex_distribution(vehicle,settings).vortex_distribution
+
+    # threads sharing the cache solve the same vortex strengths
+    conditions = SUAVE.Analyses.Mission.Segments.Conditions.Aerodynamics()
+    conditions.aerodynamics.angle_of_attack = np.array([[-2.,0.,2.,4.,2.,6.]]).T * Units.deg
+    conditions.freestream.mach_number       = np.array([[0.3,0.3,0.5,0.5,1.5,0.8]]).T
+    reference = VLM(conditions,settings,vehicle)[-1]
+
+    influence_cache.clear_influence_cache()
+    vehicles = [vehicle_setup() for n in range(4)]
+    def solve(n):
+        return VLM(conditions,settings,vehicles[n % 4])[-1]
+    pool    = ThreadPoolExecutor(max_workers = 4)
+    results = list(pool.map(solve,range(12)))
+    pool.shutdown()
+
+    statistics = influence_cache.statistics
+    for gamma in results:
+        assert np.array_equal(gamma,reference)
+    assert statistics.hits + statistics.misses == 12
+    assert statistics.factor_hits + statistics.factor_misses == 12*4
+    assert len(influence_cache._lattices) == 1
+
+    return
+
+def check_budget():
+
+    influence_cache.clear_influence_cache()
+
+    vehicle  = vehicle_setup()
+    settings = vlm_settings()
+    conditions = SUAVE.Analyses.Mission.Segments.Conditions.Aerodynamics()
+    conditions.aerodynamics.angle_of_attack = np.array([[-2.,0.,2.,4.,2.,6.]]).T * Units.deg
+    conditions.freestream.mach_number       = np.array([[0.3,0.3,0.5,0.5,1.5,0.8]]).T
+
+    # without a budget no factors are kept
+    settings.influence_cache_budget = None
+    reference = VLM(conditions,settings,vehicle)[-1]
+    assert len(influence_cache._factors) == 0
+
+    # with one, the most recently used that fit in it
+    settings.influence_cache_budget = 1e12
+    VLM(conditions,settings,vehicle)
+    sizes = [entry.nbytes for entry in influence_cache._factors.values()]
+    assert len(sizes) == 4
+
+    settings.influence_cache_budget = sum(sizes[-2:])
+    assert np.array_equal(VLM(conditions,settings,vehicle)[-1],reference)
+    assert len(influence_cache._factors) == 2
+    assert sum([entry.nbytes for entry in influence_cache._factors.values()]) <= settings.influence_cache_budget
+
+    # and those found are still kept by a call without a budget
+    settings.influence_cache_budget = None
+    VLM(conditions,settings,vehicle)
+    assert len(influence_cache._factors) == 2
+
+    return
+
+def check_training():
+
+    influence_cache.clear_influence_cache()
+
+    # the factors of the training are released once the surrogates are built
+    vortex_lattice = Vortex_Lattice()
+    vortex_lattice.geometry = vehicle_setup()
+    vortex_lattice.settings.influence_cache_budget = 2**30
+    vortex_lattice.initialize(True,None,None,False,0.,0.05,30,False)
+    assert influence_cache.statistics.factor_misses == len(vortex_lattice.training.Mach)
+    assert len(influence_cache._factors) == 0 and len(influence_cache._lattices) == 1
+    assert vortex_lattice.settings.influence_cache_budget == 2**30
+
+    return
+
+def reference_gamma(conditions,settings,geometry):
+
+    # the vortex strengths solved from scratch, as the VLM did before the cache
+    VD    = generate_wing_vortex_distribution(geometry,settings)
+    mach  = conditions.freestream.mach_number
+    ones  = np.atleast_2d(np.ones_like(mach))
+    phi   = np.arctan((VD.ZBC - VD.ZAC)/(VD.YBC - VD.YAC))*ones
+    delta = np.arctan((VD.ZC - VD.ZCH)/((VD.XC - VD.XCH)*ones))
+    RHS   = compute_RHS_matrix(settings.number_spanwise_vortices,settings.number_chordwise_vortices,delta,phi,conditions,geometry,
+                               False,0.,0.05,30)[0]
+
+    C_mn, s, CHORD, RFLAG, ZETA = compute_wing_induced_velocity(VD,settings.number_spanwise_vortices,settings.number_chordwise_vortices,mach)
+    A = np.multiply(C_mn[:,:,:,0],np.atleast_3d(np.sin(delta)*np.cos(phi))) \
+      + np.multiply(C_mn[:,:,:,1],np.atleast_3d(np.cos(delta)*np.sin(phi))) \
+      - np.multiply(C_mn[:,:,:,2],np.atleast_3d(np.cos(phi)*np.cos(delta)))
+
+    return np.linalg.solve(A,RHS*RFLAG)
+
+def vlm_settings():
+
+    settings = Data()
+    settings.number_spanwise_vortices        = 15
+    settings.number_chordwise_vortices       = 5
+    settings.spanwise_cosine_spacing         = True
+    settings.model_fuselage                  = False
+    settings.leading_edge_suction_multiplier = 1.0
+    settings.propeller_wake_model            = False
+    settings.initial_timestep_offset         = 0.
+    settings.wake_development_time           = 0.05
+    settings.number_of_wake_timesteps        = 30
+    settings.influence_cache_budget          = 2**30
+
+    return settings
+
+def run_mission(budget,clear = True):
+
+    if clear:
+        influence_cache.clear_influence_cache()
+    statistics = Data(influence_cache.statistics)
+
+    configs, analyses = mission_B737.full_setup()
+    mission_B737.simple_sizing(configs, analyses)
+    configs.finalize()
+    for config in analyses.configs.values():
+        config.aerodynamics.settings.use_surrogate = False
+        config.aerodynamics.process.compute.lift.inviscid_wings.settings.influence_cache_budget = budget
+    analyses.finalize()
+    mission = analyses.missions.base
+
+    for segment in mission.segments.values():
+        segment.state.numerics.number_control_points = 4
+
+    tic = time.time()
+    results = mission.evaluate()
+    elapsed = time.time() - tic
+
+    mass   = results.segments[0].conditions.weights.total_mass[0,0] - results.segments[-1].conditions.weights.total_mass[-1,0]
+    counts = Data()
+    for name in statistics.keys():
+        counts[name] = influence_cache.statistics[name] - statistics[name]
+
+    return Data(fuel_burn     = mass,
+                time          = elapsed,
+                calls         = counts.hits + counts.misses,
+                hits          = counts.hits,
+                misses        = counts.misses,
+                factor_hits   = counts.factor_hits,
+                factor_misses = counts.factor_misses)
+
+if __name__ == '__main__':
+    main()
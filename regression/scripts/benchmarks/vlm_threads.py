@@ -0,0 +1,105 @@
+# vlm_threads.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+""" checks that the VLM with its mach numbers shared by threads gives the
+    training data of the vortex lattice and the B737 mission without a
+    surrogate of the VLM in one thread, and compares their times
+"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Core import Units, Data
+from SUAVE.Analyses.Aerodynamics import Vortex_Lattice
+from SUAVE.Methods.Aerodynamics.Common.Fidelity_Zero.Lift import influence_cache
+
+import numpy as np
+import time
+import os
+import sys
+
+sys.path.append('../Vehicles')
+sys.path.append('../B737')
+import mission_B737
+from Boeing_737 import vehicle_setup
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    print('%d cpus' % (os.cpu_count() or 1))
+
+    # the training data, each mach number factored in a thread
+    serial   = sample_training(1)
+    threaded = sample_training(4)
+    print('%-22s : %8.3f s, %8.3f s with 4 threads' % ('sample training',serial.time,threaded.time))
+    for name in ['lift_coefficient_sub','lift_coefficient_sup','drag_coefficient_sub','drag_coefficient_sup']:
+        assert np.array_equal(serial.training[name],threaded.training[name])
+    for wing in serial.training.wing_lift_coefficient_sub.keys():
+        assert np.array_equal(serial.training.wing_lift_coefficient_sub[wing],threaded.training.wing_lift_coefficient_sub[wing])
+        assert np.array_equal(serial.training.wing_drag_coefficient_sup[wing],threaded.training.wing_drag_coefficient_sup[wing])
+
+    # with every cpu and a budget of memory to share
+    every = sample_training(None,2**24)
+    assert np.array_equal(serial.training.lift_coefficient_sub,every.training.lift_coefficient_sub)
+
+    # the mission without a surrogate
+    serial   = run_mission(1)
+    threaded = run_mission(4)
+    print('%-22s : %8.3f s, %8.3f s with 4 threads' % ('mission, no surrogate',serial.time,threaded.time))
+    assert threaded.fuel_burn == serial.fuel_burn
+
+    return
+
+# ----------------------------------------------------------------------
+#   Helper Functions
+# ----------------------------------------------------------------------
+
+def sample_training(threads,memory_budget=2**28):
+
+    influence_cache.clear_influence_cache()
+
+    vortex_lattice = Vortex_Lattice()
+    vortex_lattice.geometry = vehicle_setup()
+    vortex_lattice.initialize(False,None,None,False,0.,0.05,30,False)
+    vortex_lattice.settings.number_of_threads = threads
+    vortex_lattice.settings.memory_budget     = memory_budget
+
+    tic = time.time()
+    vortex_lattice.sample_training()
+    elapsed = time.time() - tic
+
+    return Data(training = vortex_lattice.training, time = elapsed)
+
+def run_mission(threads):
+
+    influence_cache.clear_influence_cache()
+
+    configs, analyses = mission_B737.full_setup()
+    mission_B737.simple_sizing(configs, analyses)
+    configs.finalize()
+    for config in analyses.configs.values():
+        config.aerodynamics.settings.use_surrogate = False
+        config.aerodynamics.process.compute.lift.inviscid_wings.settings.number_of_threads = threads
+    analyses.finalize()
+    mission = analyses.missions.base
+
+    for segment in mission.segments.values():
+        segment.state.numerics.number_control_points = 4
+
+    tic = time.time()
+    results = mission.evaluate()
+    elapsed = time.time() - tic
+
+    mass = results.segments[0].conditions.weights.total_mass[0,0] - results.segments[-1].conditions.weights.total_mass[-1,0]
+
+    return Data(fuel_burn = mass, time = elapsed)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,174 @@
+# vlm_training_cache.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+""" checks that the training data of the vortex lattice found in the cache on
+    disk is the data sampled from scratch, that a changed wing or training grid
+    isn't found, that the least recently used entries are removed beyond the
+    size limit and that processes saving and loading the same entries at once
+    only ever find whole entries, and compares the time of the training with
+    and without the cache
+"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Core import Units, Data
+from SUAVE.Analyses.Aerodynamics import Vortex_Lattice, Fidelity_Zero, Training_Cache
+
+import multiprocessing
+import numpy as np
+import tempfile
+import shutil
+import time
+import sys
+
+sys.path.append('../Vehicles')
+from Boeing_737 import vehicle_setup
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    directory = tempfile.mkdtemp()
+    try:
+        check_cache(directory)
+    finally:
+        shutil.rmtree(directory,ignore_errors=True)
+
+    return
+
+# ----------------------------------------------------------------------
+#   Checks
+# ----------------------------------------------------------------------
+
+def check_cache(directory):
+
+    vehicle = vehicle_setup()
+
+    # sampled once, then found by another cache on the same directory
+    cache   = Training_Cache(directory = directory)
+    sampled = train(vehicle,cache)
+    assert cache.hits == 0 and cache.misses == 1
+    assert len(cache.entries()) == 1
+
+    other = Training_Cache(directory = directory)
+    found = train(vehicle,other)
+    assert other.hits == 1 and other.misses == 0
+    print('%-10s : %8.3f s' % ('sampled',sampled.time))
+    print('%-10s : %8.3f s' % ('found',found.time))
+    assert found.time < sampled.time
+    check_training(sampled.analysis,found.analysis)
+
+    # and the surrogates built on it are the same
+    conditions = SUAVE.Analyses.Mission.Segments.Conditions.Aerodynamics()
+    conditions.aerodynamics.angle_of_attack = np.array([[-1.,2.,4.,3.]]).T * Units.deg
+    conditions.freestream.mach_number       = np.array([[0.3,0.6,0.8,1.6]]).T
+    state = Data(conditions = conditions)
+    sampled.analysis.evaluate(state,sampled.analysis.settings,vehicle)
+    lift = np.copy(conditions.aerodynamics.lift_coefficient)
+    found.analysis.evaluate(state,found.analysis.settings,vehicle)
+    assert np.array_equal(conditions.aerodynamics.lift_coefficient,lift)
+
+    # the threads of the VLM don't change the training data
+    threaded = train(vehicle,other,threads = 4)
+    assert other.hits == 2 and other.misses == 0
+
+    # a twisted wing and another training grid are other entries
+    twisted = vehicle_setup()
+    twisted.wings.main_wing.Segments.tip.twist = twisted.wings.main_wing.Segments.tip.twist - 1. * Units.deg
+    train(twisted,other)
+    assert other.hits == 2 and other.misses == 1
+    coarse = train(vehicle,other,angle_of_attack = np.array([[-5.,0.,5.,10.,15.]]).T * Units.deg)
+    assert other.hits == 2 and other.misses == 2
+    assert np.shape(coarse.analysis.training.lift_coefficient_sub)[0] == 5
+    assert len(other.entries()) == 3
+
+    # an analysis with the cache in its settings
+    fidelity_zero = Fidelity_Zero()
+    fidelity_zero.geometry = vehicle_setup()
+    fidelity_zero.settings.training_cache = other
+    fidelity_zero.initialize()
+    fidelity_zero.initialize()
+    assert other.hits == 3 and other.misses == 3
+    assert len(other.entries()) == 4
+
+    # beyond the size limit, the least recently used entries are removed
+    entries = other.entries()
+    other.max_size = entries[-1].size + entries[0].size
+    twisted.wings.main_wing.Segments.tip.twist = twisted.wings.main_wing.Segments.tip.twist - 1. * Units.deg
+    newest = train(twisted,other)
+    kept   = [entry.key for entry in other.entries()]
+    assert entries[0].key == other.key(sampled.analysis)
+    assert kept == [entries[-1].key,other.key(newest.analysis)]
+
+    # processes saving and loading the same entries at once
+    other.max_size = 2**30
+    pool     = multiprocessing.Pool(4)
+    analysis = Data(geometry = vehicle, settings = found.analysis.settings, training = found.analysis.training)
+    results  = pool.map(save_and_load,[(directory,analysis,n) for n in range(8)])
+    pool.close()
+    pool.join()
+    for result in results:
+        check_training(sampled.analysis,result)
+    assert len(other.entries()) == 4
+
+    other.clear()
+    assert len(other.entries()) == 0 and other.hits == 0
+
+    return
+
+def check_training(reference,analysis):
+
+    training = analysis.training
+    for name in ['lift_coefficient_sub','lift_coefficient_sup','drag_coefficient_sub','drag_coefficient_sup']:
+        assert np.array_equal(reference.training[name],training[name])
+    for name in ['wing_lift_coefficient_sub','wing_lift_coefficient_sup','wing_drag_coefficient_sub','wing_drag_coefficient_sup']:
+        assert list(reference.training[name].keys()) == list(training[name].keys())
+        for wing in reference.training[name].keys():
+            assert np.array_equal(reference.training[name][wing],training[name][wing])
+
+    return
+
+# ----------------------------------------------------------------------
+#   Helper Functions
+# ----------------------------------------------------------------------
+
+def train(vehicle,cache,threads=1,angle_of_attack=None):
+
+    vortex_lattice = Vortex_Lattice()
+    vortex_lattice.geometry       = vehicle
+    vortex_lattice.training_cache = cache
+    vortex_lattice.settings.number_of_threads = threads
+    if angle_of_attack is not None:
+        vortex_lattice.training.angle_of_attack = angle_of_attack
+
+    tic = time.time()
+    vortex_lattice.initialize(True,None,None,False,0.,0.05,30,False)
+    elapsed = time.time() - tic
+
+    return Data(analysis = vortex_lattice, time = elapsed)
+
+def save_and_load(inputs):
+
+    directory, analysis, n = inputs
+
+    # every process saves the entry and another one, then loads the first
+    cache = Training_Cache(directory = directory)
+    for repeat in range(5):
+        cache.save(analysis)
+        assert cache.load(analysis)
+    analysis.settings.leading_edge_suction_multiplier = 1. + (n % 2)
+    cache.save(analysis)
+    analysis.settings.leading_edge_suction_multiplier = 1.
+    assert cache.load(analysis)
+
+    return Data(training = analysis.training)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,125 @@
+# warm_start.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+""" checks that missions started from the unknowns kept by a warm start store
+    converge to the same results, and counts the evaluations it saves when the
+    B737 mission is flown again and again at different takeoff weights
+"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Core import Units, Data
+from SUAVE.Analyses.Mission.Segments import Warm_Start
+
+import numpy as np
+from copy import deepcopy
+import time
+import sys
+
+sys.path.append('../Vehicles')
+sys.path.append('../B737')
+import mission_B737
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    configs, analyses = mission_B737.full_setup()
+    mission_B737.simple_sizing(configs, analyses)
+    configs.finalize()
+    analyses.finalize()
+    mission = analyses.missions.base
+
+    check_keys(mission)
+
+    cold        = run_cases(mission)
+    warm        = run_cases(mission,Warm_Start())
+    warm_sparse = run_cases(mission,Warm_Start(),'sparse')
+
+    # the same missions
+    for burn,other in zip(cold.fuel_burn,warm.fuel_burn):
+        assert np.abs(other/burn - 1.) < 1e-6
+    for burn,other in zip(cold.fuel_burn,warm_sparse.fuel_burn):
+        assert np.abs(other/burn - 1.) < 1e-6
+
+    for key,value in [('cold',cold),('warm',warm),('warm_sparse',warm_sparse)]:
+        print('%-12s : %6d evaluations %8.3f s' % (key,value.evaluations,value.time))
+    for key,value in [('warm',warm),('warm_sparse',warm_sparse)]:
+        store = value.store
+        print('%-12s : %3d hits %3d misses, %6d evaluations saved' % (key,store.hits,store.misses,store.saved_evaluations))
+
+    assert warm.evaluations < cold.evaluations
+    assert warm.store.saved_evaluations > 0
+    assert warm.store.evaluations == warm.evaluations
+
+    return
+
+# ----------------------------------------------------------------------
+#   Checks
+# ----------------------------------------------------------------------
+
+def check_keys(mission):
+
+    store   = Warm_Start()
+    segment = mission.segments.cruise
+    assert store.key(segment) == 'cruise_%d' % segment.state.numerics.number_control_points
+
+    # nothing kept yet
+    assert store.apply(segment) is None
+    assert store.misses == 1
+
+    return
+
+# ----------------------------------------------------------------------
+#   Cases
+# ----------------------------------------------------------------------
+
+def run_cases(mission,store=None,solver_jacobian='none'):
+
+    # the first guesses, as a mission that was just set up has them
+    guesses = Data()
+    for segment in mission.segments:
+        guesses[segment.tag] = deepcopy(segment.state.unknowns)
+        segment.state.numerics.solver_jacobian = solver_jacobian
+
+    vehicle = mission.segments[0].analyses.weights.vehicle
+    takeoff = vehicle.mass_properties.takeoff
+
+    mission.warm_start = store
+    results = Data(fuel_burn = [], evaluations = 0, store = store)
+
+    tic = time.time()
+    for scale in [1.,0.99,0.98,0.97]:
+        vehicle.mass_properties.takeoff = scale*takeoff
+
+        # start over, like a mission set up again in an optimization
+        for segment in mission.segments:
+            segment.state.unknowns           = deepcopy(guesses[segment.tag])
+            segment.state.numerics.jacobian  = None
+            segment.warm_start               = None
+
+        mission.evaluate()
+
+        mass = mission.segments[-1].state.conditions.weights.total_mass
+        results.fuel_burn.append(scale*takeoff - mass[-1,0])
+        results.evaluations += sum(segment.state.numerics.evaluations for segment in mission.segments)
+    results.time = time.time() - tic
+
+    # leave the mission as it was
+    vehicle.mass_properties.takeoff = takeoff
+    mission.warm_start = None
+    for segment in mission.segments:
+        segment.state.unknowns = guesses[segment.tag]
+        segment.state.numerics.solver_jacobian = 'none'
+
+    return results
+
+if __name__ == '__main__':
+    main()
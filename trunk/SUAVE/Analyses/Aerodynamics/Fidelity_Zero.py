@@ -6,6 +6,7 @@
 #           Apr 2019, T. MacDonald
 #           Apr 2020, M. Clarke
 #           Sep 2020, M. Clarke 
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -76,6 +77,8 @@ class Fidelity_Zero(Markup):
         settings.use_surrogate                      = True
         settings.propeller_wake_model               = False 
         settings.model_fuselage                     = False
+        settings.training_cache                     = None # a Training_Cache keeps the training data of the VLM on disk
+        settings.training_tolerance                 = None # relative error the training grid of the VLM is refined to, None for the whole grid
 
         # build the evaluation process
         compute = self.process.compute
@@ -129,6 +132,8 @@ class Fidelity_Zero(Markup):
 
         Properties Used:
         self.geometry
+        self.settings.training_cache
+        self.settings.training_tolerance
         """                  
         super(Fidelity_Zero, self).initialize()
         
@@ -142,6 +147,8 @@ class Fidelity_Zero(Markup):
         mf                        = self.settings.model_fuselage
 
         self.process.compute.lift.inviscid_wings.geometry = self.geometry 
+        self.process.compute.lift.inviscid_wings.training_cache = self.settings.training_cache
+        self.process.compute.lift.inviscid_wings.settings.training_tolerance = self.settings.training_tolerance
         self.process.compute.lift.inviscid_wings.initialize(use_surrogate,n_sw,n_cw,propeller_wake_model,ito,wdt,nwts,mf )
                                                             
     finalize = initialize                                          
\ No newline at end of file
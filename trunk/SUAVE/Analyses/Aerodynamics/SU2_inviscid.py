@@ -17,16 +17,10 @@ from SUAVE.Core import Data, Units
 from .Aerodynamics import Aerodynamics
 from SUAVE.Input_Output.SU2.call_SU2_CFD import call_SU2_CFD
 from SUAVE.Input_Output.SU2.write_SU2_cfg import write_SU2_cfg
-from sklearn.gaussian_process.kernels import ExpSineSquared
 
 # Package imports
 import numpy as np
 import time
-import matplotlib.pyplot as plt  
-import sklearn
-from sklearn import gaussian_process
-from sklearn import neighbors
-from sklearn import svm
 
 # ----------------------------------------------------------------------
 #  Class
@@ -269,6 +263,8 @@ class SU2_inviscid(Aerodynamics):
         
               
         # Gaussian Process New
+        from sklearn import gaussian_process
+        from sklearn.gaussian_process.kernels import ExpSineSquared
         gp_kernel_ES = ExpSineSquared(length_scale=1.0, periodicity=1.0, length_scale_bounds=(1e-5,1e5), periodicity_bounds=(1e-5,1e5))
         regr_cl = gaussian_process.GaussianProcessRegressor(kernel=gp_kernel_ES)
         regr_cd = gaussian_process.GaussianProcessRegressor(kernel=gp_kernel_ES)
@@ -305,6 +301,7 @@ class SU2_inviscid(Aerodynamics):
                 CL_sur[ii,jj] = cl_surrogate.predict([np.array([AoA_mesh[ii,jj],mach_mesh[ii,jj]])])
                 CD_sur[ii,jj] = cd_surrogate.predict([np.array([AoA_mesh[ii,jj],mach_mesh[ii,jj]])])  #sklearn fix        
 
+        import matplotlib.pyplot as plt
         fig = plt.figure('Coefficient of Lift Surrogate Plot')    
         plt_handle = plt.contourf(AoA_mesh/Units.deg,mach_mesh,CL_sur,levels=None)
         #plt.clabel(plt_handle, inline=1, fontsize=10)
@@ -5,6 +5,7 @@
 # Modified: Nov 2016, T. MacDonald
 #           Apr 2019, T. MacDonald
 #           Apr 2020, M. Clarke
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -79,6 +80,8 @@ class Supersonic_Zero(Markup):
         settings.use_surrogate                      = True 
         settings.propeller_wake_model               = False
         settings.model_fuselage                     = False
+        settings.training_cache                     = None # a Training_Cache keeps the training data of the VLM on disk
+        settings.training_tolerance                 = None # relative error the training grid of the VLM is refined to, None for the whole grid
         
         # this multiplier is used to determine the volume wave drag at the peak Mach number
         # by multiplying the volume wave drag at the end drag rise Mach number
@@ -144,6 +147,8 @@ class Supersonic_Zero(Markup):
 
         Properties Used:
         self.geometry
+        self.settings.training_cache
+        self.settings.training_tolerance
         """            
         super(Supersonic_Zero, self).initialize()
         
@@ -157,6 +162,8 @@ class Supersonic_Zero(Markup):
         mf                        = self.settings.model_fuselage
 
         self.process.compute.lift.inviscid_wings.geometry = self.geometry 
+        self.process.compute.lift.inviscid_wings.training_cache = self.settings.training_cache
+        self.process.compute.lift.inviscid_wings.settings.training_tolerance = self.settings.training_tolerance
         self.process.compute.lift.inviscid_wings.initialize(use_surrogate,n_sw,n_cw,propeller_wake_model,ito,wdt,nwts,mf)
                 
     finalize = initialize        
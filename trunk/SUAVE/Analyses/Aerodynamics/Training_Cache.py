@@ -0,0 +1,357 @@
+## @ingroup Analyses-Aerodynamics
+# Training_Cache.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+from SUAVE.Core import Data, fingerprint, fingerprint_ignore
+from SUAVE.Input_Output.SUAVE import archive_binary, load_binary
+
+import hashlib
+import tempfile
+import shutil
+import uuid
+import os
+
+# bumped when the training data or its key change, so older entries aren't found
+_version = 3
+
+# the tables of the training data that are kept
+_tables  = ['lift_coefficient_sub','lift_coefficient_sup','drag_coefficient_sub','drag_coefficient_sup',
+            'wing_lift_coefficient_sub','wing_lift_coefficient_sup','wing_drag_coefficient_sub','wing_drag_coefficient_sup',
+            'sampled_angle_of_attack','sampled_Mach']
+
+# ----------------------------------------------------------------------
+#  Training Cache
+# ----------------------------------------------------------------------
+
+## @ingroup Analyses-Aerodynamics
+class Training_Cache(Data):
+    """ Keeps the training data of a vortex lattice on disk, found by a hash of
+        the geometry it sees, its settings and its training grid, so the VLM
+        isn't sampled again for a vehicle it already trained on, in this
+        process or in another. Counts the training data found and not found.
+
+        Assumptions:
+        The training data only depends on the reference area, the wings and the
+        fuselages of the vehicle, and on the propulsors when the propeller wake
+        is modeled. Files, like airfoil coordinates, are known by their names.
+        Each entry is written in a directory of its own and renamed into place,
+        so processes sharing a cache never read a partial entry. The least
+        recently used entries are removed once the cache is larger than its
+        size limit.
+
+        Source:
+        None
+    """
+
+    def __defaults__(self):
+        """This sets the default values.
+
+            Assumptions:
+            None
+
+            Source:
+            N/A
+
+            Inputs:
+            None
+
+            Outputs:
+            None
+
+            Properties Used:
+            None
+        """
+
+        self.tag       = 'training_cache'
+        self.directory = os.path.join(tempfile.gettempdir(),'SUAVE_training_cache')
+        self.max_size  = 2**30 # bytes, None for no limit
+        self.hits      = 0
+        self.misses    = 0
+
+    def load(self,analysis):
+        """ Sets the training data of a vortex lattice to the one kept for its
+            geometry, settings and training grid.
+
+            Assumptions:
+            An entry that can't be read, because it was removed while it was
+            read, is not found, nor is one without a key.
+
+            Source:
+            N/A
+
+            Inputs:
+            analysis.geometry                     [Data]
+            analysis.settings                     [Data]
+            analysis.training                     [Data]
+
+            Outputs:
+            found                                 [boolean]
+            analysis.training                     [Data]
+
+            Properties Used:
+            self.directory
+        """
+
+        key = self.key(analysis)
+        if key is None:
+            self.misses += 1
+            return False
+        entry = os.path.join(self.directory,key)
+
+        try:
+            data = load_binary(entry,None)
+            for name in _tables:
+                analysis.training[name] = data[name]
+            os.utime(entry,None)
+        except (OSError,ValueError,KeyError):
+            self.misses += 1
+            return False
+
+        self.hits += 1
+
+        return True
+
+    def save(self,analysis):
+        """ Keeps the training data of a vortex lattice, and removes the least
+            recently used entries beyond the size limit.
+
+            Assumptions:
+            When another process saved the same entry first, that one is kept.
+            Training data without a key isn't kept.
+
+            Source:
+            N/A
+
+            Inputs:
+            analysis.geometry                     [Data]
+            analysis.settings                     [Data]
+            analysis.training                     [Data]
+
+            Outputs:
+            None
+
+            Properties Used:
+            self.directory
+            self.max_size
+        """
+
+        key = self.key(analysis)
+        if key is None:
+            return
+
+        if not os.path.isdir(self.directory):
+            os.makedirs(self.directory,exist_ok=True)
+
+        data = Data()
+        for name in _tables:
+            data[name] = analysis.training[name]
+
+        # written aside, then renamed into place in one step
+        entry     = os.path.join(self.directory,key)
+        temporary = os.path.join(self.directory,'.%s.%s' % (os.path.basename(entry),uuid.uuid4().hex))
+        archive_binary(data,temporary)
+        try:
+            os.rename(temporary,entry)
+        except OSError:
+            shutil.rmtree(temporary,ignore_errors=True)
+
+        self.evict()
+
+    def evict(self):
+        """ Removes the least recently used entries until the cache is within
+            its size limit, always keeping the most recent entry.
+
+            Assumptions:
+            None
+
+            Source:
+            N/A
+
+            Inputs:
+            None
+
+            Outputs:
+            None
+
+            Properties Used:
+            self.directory
+            self.max_size
+        """
+
+        if self.max_size is None:
+            return
+
+        entries = self.entries()
+        size    = sum([entry.size for entry in entries])
+        for entry in entries[:-1]:
+            if size <= self.max_size:
+                break
+            if self.remove(entry):
+                size -= entry.size
+
+    def remove(self,entry):
+        """ Removes an entry of the cache, unless another process did first
+
+            Assumptions:
+            The entry is renamed before it is removed, so it is either found
+            whole or not at all.
+
+            Source:
+            N/A
+
+            Inputs:
+            entry                                 [Data], see entries()
+
+            Outputs:
+            removed                               [boolean]
+
+            Properties Used:
+            self.directory
+        """
+
+        removed = os.path.join(self.directory,'.%s.%s.removed' % (entry.key,uuid.uuid4().hex))
+        try:
+            os.rename(entry.path,removed)
+        except OSError:
+            return False
+        shutil.rmtree(removed,ignore_errors=True)
+
+        return True
+
+    def entries(self):
+        """ The entries of the cache, least recently used first
+
+            Assumptions:
+            Entries being written or removed are not listed.
+
+            Source:
+            N/A
+
+            Inputs:
+            None
+
+            Outputs:
+            entries                               [list of Data], with key, path, size [bytes] and time [s]
+
+            Properties Used:
+            self.directory
+        """
+
+        if not os.path.isdir(self.directory):
+            return []
+
+        entries = []
+        for key in os.listdir(self.directory):
+            path = os.path.join(self.directory,key)
+            if key.startswith('.') or not os.path.isdir(path):
+                continue
+            try:
+                size = 0
+                for name in os.listdir(path):
+                    size += os.path.getsize(os.path.join(path,name))
+                time = os.path.getmtime(path)
+            except OSError:
+                continue
+            entries.append(Data(key = key, path = path, size = size, time = time))
+
+        entries.sort(key = lambda entry: entry.time)
+
+        return entries
+
+    def key(self,analysis):
+        """ Names the training data of a vortex lattice in the cache by a hash
+            of the geometry it sees, its settings and its training grid
+
+            Assumptions:
+            The items in fingerprint_ignore, like the settings that only change
+            how fast the VLM runs, are left out. There is no key when a value
+            can't be fingerprinted.
+
+            Source:
+            N/A
+
+            Inputs:
+            analysis.geometry                     [Data]
+            analysis.settings                     [Data]
+            analysis.training.angle_of_attack     [radians]
+            analysis.training.Mach                [Unitless]
+
+            Outputs:
+            key                                   [string], or None
+
+            Properties Used:
+            None
+        """
+
+        geometry = analysis.geometry
+        settings = analysis.settings
+
+        digest = hashlib.sha1()
+        seen   = {}
+        digest.update(('training_cache_%d' % _version).encode())
+        try:
+            fingerprint(settings,digest,seen,fingerprint_ignore)
+            fingerprint(analysis.training.angle_of_attack,digest,seen,fingerprint_ignore)
+            fingerprint(analysis.training.Mach,digest,seen,fingerprint_ignore)
+            fingerprint(geometry.reference_area,digest,seen,fingerprint_ignore)
+            fingerprint(geometry.wings,digest,seen,fingerprint_ignore)
+            fingerprint(geometry.fuselages,digest,seen,fingerprint_ignore)
+            if settings.get('propeller_wake_model',False):
+                for name in ['propulsors','networks']:
+                    if name in geometry:
+                        fingerprint(geometry[name],digest,seen,fingerprint_ignore)
+        except TypeError:
+            return None
+
+        return digest.hexdigest()
+
+    def clear(self):
+        """ Removes every entry of the cache and resets the counters
+
+            Assumptions:
+            None
+
+            Source:
+            N/A
+
+            Inputs:
+            None
+
+            Outputs:
+            None
+
+            Properties Used:
+            self.directory
+        """
+
+        for entry in self.entries():
+            self.remove(entry)
+        self.reset()
+
+    def reset(self):
+        """ Resets the counters
+
+            Assumptions:
+            None
+
+            Source:
+            N/A
+
+            Inputs:
+            None
+
+            Outputs:
+            None
+
+            Properties Used:
+            None
+        """
+
+        self.hits   = 0
+        self.misses = 0
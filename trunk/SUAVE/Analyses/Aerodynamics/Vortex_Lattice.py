@@ -11,6 +11,7 @@
 #           Jun 2020, E. Botero
 #           Sep 2020, M. Clarke 
 #           May 2021, E. Botero
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -23,6 +24,8 @@ from SUAVE.Core import Data
 from SUAVE.Core import Units
  
 from SUAVE.Methods.Aerodynamics.Common.Fidelity_Zero.Lift.VLM import VLM
+from SUAVE.Methods.Aerodynamics.Common.Fidelity_Zero.Lift.influence_cache import release_influence
+from SUAVE.Methods.Utilities.adaptive_grid_sampling import adaptive_grid_sampling
 
 # local imports
 from .Aerodynamics import Aerodynamics
@@ -76,6 +79,10 @@ class Vortex_Lattice(Aerodynamics):
         self.settings.initial_timestep_offset         = 0
         self.settings.wake_development_time           = 0.05
         self.settings.number_of_wake_timesteps        = 30
+        self.settings.memory_budget                   = 2**28 # bytes of the temporaries of the induced velocities
+        self.settings.influence_cache_budget          = None  # bytes of the factored influence matrices kept between evaluations, None keeps none
+        self.settings.number_of_threads               = 1     # for the mach numbers of the VLM, None for every cpu
+        self.settings.training_tolerance              = None  # relative error the training grid is refined to, None for the whole grid
 
         # conditions table, used for surrogate model training
         self.training                                = Data()
@@ -92,6 +99,13 @@ class Vortex_Lattice(Aerodynamics):
         self.training.drag_coefficient_sup           = None
         self.training.wing_drag_coefficient_sub      = None
         self.training.wing_drag_coefficient_sup      = None
+        self.training.sampled_angle_of_attack        = None
+        self.training.sampled_Mach                   = None
+        self.training.number_of_samples              = None
+        self.training.samples_saved                  = None
+
+        # a Training_Cache keeps the training data on disk, it is sampled every time without one
+        self.training_cache                          = None
         
         # blending function 
         self.hsub_min                                = 0.85
@@ -138,7 +152,8 @@ class Vortex_Lattice(Aerodynamics):
         None
 
         Properties Used:
-        None
+        self.training_cache
+        self.settings.influence_cache_budget
         """                      
         # Unpack:
         settings = self.settings      
@@ -158,8 +173,19 @@ class Vortex_Lattice(Aerodynamics):
         
         # If we are using the surrogate
         if use_surrogate == True: 
-            # sample training data
-            self.sample_training()
+            # sample training data, unless the cache kept it
+            cache = self.training_cache
+            if cache is None or not cache.load(self):
+                # the factors are kept while the grid is sampled, and released once the surrogates don't need them
+                budget = settings.get('influence_cache_budget',None)
+                settings.influence_cache_budget = np.inf
+                try:
+                    self.sample_training()
+                finally:
+                    settings.influence_cache_budget = budget
+                    release_influence(self.geometry,settings)
+                if cache is not None:
+                    cache.save(self)
                         
             # build surrogate
             self.build_surrogate()        
@@ -379,16 +405,27 @@ class Vortex_Lattice(Aerodynamics):
           drag_coefficient            [-]          
 
           wing_drag_coefficient       [-] (wing specific)
+          sampled_angle_of_attack     [radians]
+          sampled_Mach                [-]
+          number_of_samples           [-]
+          samples_saved               [-]
 
         Properties Used:
         self.geometry.wings.*.tag
         self.settings                 (passed to calculate vortex lattice)
+        self.settings.training_tolerance
         self.training.angle_of_attack [radians]
         """
         # unpack
         geometry      = self.geometry
         settings      = self.settings
         training      = self.training
+        
+        # a grid refined to a tolerance
+        if settings.get('training_tolerance',None) is not None:
+            self.refine_training()
+            return
+        
         AoA           = training.angle_of_attack 
         Mach          = training.Mach
         lenAoA        = len(AoA)
@@ -466,6 +503,105 @@ class Vortex_Lattice(Aerodynamics):
         training.drag_coefficient_sup         = CDi_sup
         training.wing_drag_coefficient_sub    = CDi_w_sub        
         training.wing_drag_coefficient_sup    = CDi_w_sup
+        training.sampled_angle_of_attack      = AoA
+        training.sampled_Mach                 = Mach
+        training.number_of_samples            = lenAoA*lenM
+        training.samples_saved                = 0
+        
+        return
+    
+    def refine_training(self):
+        """Runs the vortex lattice on the part of the training grid the
+        surrogates need to meet a tolerance, refining a coarser grid where
+        leaving a sample out of the splines misses it.
+
+        Assumptions:
+        The tolerance applies to the total lift and induced drag coefficients,
+        relative to their ranges. The last subsonic and first two supersonic
+        mach numbers of the grid are always sampled for the transonic surrogates.
+
+        Source:
+        N/A
+
+        Inputs:
+        see properties used
+
+        Outputs:
+        self.training.
+          lift_coefficient            [-] 
+          wing_lift_coefficient       [-] (wing specific)
+          drag_coefficient            [-]          
+          wing_drag_coefficient       [-] (wing specific)
+          sampled_angle_of_attack     [radians]
+          sampled_Mach                [-]
+          number_of_samples           [-]
+          samples_saved               [-]
+
+        Properties Used:
+        self.geometry.wings.*.tag
+        self.settings                 (passed to calculate vortex lattice)
+        self.settings.training_tolerance
+        self.training.angle_of_attack [radians]
+        self.training.Mach            [-]
+        """
+        # unpack
+        geometry  = self.geometry
+        settings  = self.settings
+        training  = self.training
+        AoA       = training.angle_of_attack[:,0]
+        Mach      = training.Mach[:,0]
+        wings     = list(geometry.wings.keys())
+        n_wings   = len(wings)
+        
+        # the lift and drag, then those of each wing, at some points of the grid
+        def sample(AoAs,Machs):
+            konditions                              = Data()
+            konditions.aerodynamics                 = Data()
+            konditions.freestream                   = Data()
+            konditions.aerodynamics.angle_of_attack = np.atleast_2d(AoAs).T
+            konditions.freestream.mach_number       = np.atleast_2d(Machs).T
+            konditions.freestream.velocity          = np.zeros_like(konditions.freestream.mach_number)
+            
+            total_lift, total_drag, wing_lifts, wing_drags, _, _, _, _ = calculate_VLM(konditions,settings,geometry)
+            
+            return np.hstack([total_lift,total_drag] + [wing_lifts[wing] for wing in wings] + [wing_drags[wing] for wing in wings])
+        
+        # the subsonic and supersonic surrogates are apart, and joined by the transonic ones
+        sub    = np.where(Mach < 1.)[0]
+        sup    = np.where(Mach >= 1.)[0]
+        fixed  = list(sub[-1:]) + list(sup[:2])
+        
+        results = adaptive_grid_sampling(AoA,Mach,sample,settings.training_tolerance,[sub,sup],fixed,[0,1])
+        values  = results.values
+        
+        # split into the tables of the sampled grid
+        sampled_Mach = Mach[results.y_indices]
+        sub_columns  = sampled_Mach < 1.
+        sup_columns  = sampled_Mach >= 1.
+        
+        CL_w_sub  = Data()
+        CL_w_sup  = Data()
+        CDi_w_sub = Data()
+        CDi_w_sup = Data() 
+        for n,wing in enumerate(wings):
+            CL_w_sub[wing]  = values[:,sub_columns,2+n]
+            CL_w_sup[wing]  = values[:,sup_columns,2+n]
+            CDi_w_sub[wing] = values[:,sub_columns,2+n_wings+n]
+            CDi_w_sup[wing] = values[:,sup_columns,2+n_wings+n]
+        
+        # Store training data 
+        training.lift_coefficient_sub         = values[:,sub_columns,0]
+        training.lift_coefficient_sup         = values[:,sup_columns,0]
+        training.wing_lift_coefficient_sub    = CL_w_sub        
+        training.wing_lift_coefficient_sup    = CL_w_sup
+        training.drag_coefficient_sub         = values[:,sub_columns,1]
+        training.drag_coefficient_sup         = values[:,sup_columns,1]
+        training.wing_drag_coefficient_sub    = CDi_w_sub        
+        training.wing_drag_coefficient_sup    = CDi_w_sup
+        training.sampled_angle_of_attack      = np.atleast_2d(AoA[results.x_indices]).T
+        training.sampled_Mach                 = np.atleast_2d(sampled_Mach).T
+        training.number_of_samples            = results.number_of_samples
+        training.samples_saved                = results.samples_saved
         
         return
         
@@ -494,20 +630,27 @@ class Vortex_Lattice(Aerodynamics):
           wing_lift_coefficient       [-] (wing specific)
           drag_coefficient            [-] 
           wing_drag_coefficient       [-] (wing specific)
+          sampled_angle_of_attack     [radians], or angle_of_attack when not set
+          sampled_Mach                [-], or Mach when not set
         """           
 
-        # unpack data
+        # unpack data, on the training grid when the sampled points aren't set
         surrogates     = self.surrogates
         training       = self.training
         geometry       = self.geometry
-        Mach           = training.Mach
-        AoA_data       = training.angle_of_attack[:,0]
+        Mach           = training.sampled_Mach
+        AoA            = training.sampled_angle_of_attack
+        if Mach is None:
+            Mach = training.Mach
+        if AoA is None:
+            AoA  = training.angle_of_attack
+        AoA_data       = AoA[:,0]
         if np.sum(Mach<1.)==0:
             sub_sup_split = 0
         else:
             sub_sup_split = np.where(Mach < 1.0)[0][-1] + 1 
-        mach_data_sub  = training.Mach[0:sub_sup_split,0]
-        mach_data_sup  = training.Mach[sub_sup_split:,0]
+        mach_data_sub  = Mach[0:sub_sup_split,0]
+        mach_data_sup  = Mach[sub_sup_split:,0]
         CL_data_sub    = training.lift_coefficient_sub   
         CL_data_sup    = training.lift_coefficient_sup
         CDi_data_sub   = training.drag_coefficient_sub         
@@ -4,6 +4,7 @@
 # Created:  
 # Modified: Feb 2016, Andrew Wendorff
 #           Apr 2020, M. Clarke
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -38,6 +39,9 @@ class Constant_Throttle_Constant_Speed(Aerodynamic):
         None
     """     
     
+    # its methods solve several cases stacked along the control points, see Segment.evaluate_cases
+    _stacked_cases = True
+    
     def __defaults__(self):
         """ This sets the default solver flow. Anything in here can be modified after initializing a segment.
     
@@ -5,6 +5,7 @@
 # Modified: Feb 2016, A. Wendorff
 #           Jun 2017, E. Botero
 #           Jan 2020, M. Clarke
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -15,6 +16,7 @@ import numpy as np
 
 # SUAVE imports
 from SUAVE.Core                    import Data
+from .Conditions_Buffer            import Conditions_Buffer
 
 # ----------------------------------------------------------------------
 #  Conditions
@@ -35,6 +37,12 @@ class Conditions(Data):
 
     _size = 1
     
+    # the contiguous storage of the fields, see compact()
+    _buffer = None
+    
+    # keys that are not expanded
+    _unexpanded = ()
+    
     def ones_row(self,cols):
         """ returns a row vector of ones with given number of columns 
         
@@ -119,6 +127,12 @@ class Conditions(Data):
         # store
         self._size = rows
         
+        # all the fields at once
+        buffer = self._buffer
+        if buffer is not None and buffer.check(self):
+            buffer.expand(rows)
+            return
+        
         # recursively initialize condition and unknown arrays 
         # to have given row length
         
@@ -127,8 +141,11 @@ class Conditions(Data):
                 rank = v.ndim
             except:
                 rank = 0
+            # don't expand these
+            if k in self._unexpanded:
+                continue
             # recursion
-            if isinstance(v,Conditions):
+            elif isinstance(v,Conditions):
                 v.expand_rows(rows)
             # need arrays here
             elif rank == 2:
@@ -136,7 +153,97 @@ class Conditions(Data):
             #: if type
         #: for each key,value
         
+        # keep the fields together
+        if buffer is not None:
+            self.compact()
+        
         return
+    
+    def compact(self):
+        """ Moves the rank 2 arrays of the conditions into one contiguous column major
+            array and makes the conditions hold views into it. From then on
+            expand_rows(), pack_array(), unpack_array() and merging the states of
+            segments work on the whole array at once.
+        
+            Assumptions:
+            Fields that are replaced are copied back into the array when it is used
+    
+            Source:
+            N/A
+    
+            Inputs:
+            None
+    
+            Outputs:
+            buffer   [Conditions_Buffer()], its array holds a column block per field
+    
+            Properties Used:
+            None
+        """
+        
+        buffer = self._buffer
+        if buffer is not None and buffer.check(self):
+            return buffer
+        
+        self._buffer = None
+        buffer       = Conditions_Buffer(self,self._size)
+        self._buffer = buffer
+        
+        return buffer
+    
+    def pack_array(self,output='vector'):
+        """ Packs the conditions like Data.pack_array(), in one copy if all of the 
+            values are in the contiguous array
+        
+            Assumptions:
+            None
+    
+            Source:
+            N/A
+    
+            Inputs:
+            output   [str] 'vector' or 'array'
+    
+            Outputs:
+            array    [np.array]
+    
+            Properties Used:
+            None
+        """
+        
+        buffer = self._buffer
+        if output == 'vector' and buffer is not None and buffer.complete and buffer.check(self):
+            return buffer.pack()
+        
+        return Data.pack_array(self,output)
+    
+    def unpack_array(self,M):
+        """ Unpacks the conditions like Data.unpack_array(), in one copy if all of the
+            values are in the contiguous array
+        
+            Assumptions:
+            None
+    
+            Source:
+            N/A
+    
+            Inputs:
+            M        [np.array]
+    
+            Outputs:
+            self
+    
+            Properties Used:
+            None
+        """
+        
+        buffer = self._buffer
+        if M.ndim == 1 and buffer is not None and buffer.complete and \
+           M.size == buffer.array.size and buffer.check(self):
+            buffer.unpack(M)
+            return self
+        
+        return Data.unpack_array(self,M)
 
     def compile(self):
         """ This is a call to expand_rows above...
@@ -0,0 +1,364 @@
+## @ingroup Analyses-Mission-Segments-Conditions
+# Conditions_Buffer.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+# python imports
+import numpy as np
+
+# SUAVE imports
+from SUAVE.Core.Arrays import array_type, matrix_type
+
+# ----------------------------------------------------------------------
+#  Conditions Buffer
+# ----------------------------------------------------------------------
+
+## @ingroup Analyses-Mission-Segments-Conditions
+class Conditions_Buffer(object):
+    """ The contiguous storage of a Conditions() tree. Every rank 2 float array
+        with one row per control point is a block of columns of one 2D array,
+        and the tree holds views into that array. Expanding, merging and
+        packing the tree then work on the whole array at once.
+
+        Assumptions:
+        The array is column major, so each field is contiguous in memory and
+        the array flattens in the same order as Data.pack_array().
+        Fields that are replaced in the tree are copied back into the array
+        before it is used. The buffer is rebuilt if the tree changes shape.
+
+        Source:
+        N/A
+    """
+
+    def __init__(self,conditions,rows,array=None):
+        """ Walks the tree like Conditions.expand_rows() and moves the fields into one array
+
+            Assumptions:
+            Arrays that appear twice in the tree share their columns
+
+            Source:
+            N/A
+
+            Inputs:
+            conditions  [Conditions()]
+            rows        [int]
+            array       [np.array] the fields are already views of this array, optional
+
+            Outputs:
+            N/A
+
+            Properties Used:
+            N/A
+        """
+
+        from .Conditions import Conditions
+
+        self.root     = conditions
+        self.rows     = rows
+        self.nodes    = []    # (parent, key, node, number of keys)
+        self.fields   = []    # (node, key, index of the array)
+        self.spans    = []    # (start, stop) of each array
+        self.shared   = set() # arrays that are in more than one field
+        self.loose    = []    # (node, key) rank 2 arrays that stay out of the array
+        self.views    = []
+        self.complete = True  # every packed value of the tree is in the array
+
+        arrays  = []
+        indices = {}
+        layout  = []
+
+        # the walk, in the same order as expand_rows and pack_array
+        def do_layout(parent,key,node,path):
+            self.nodes.append((parent,key,node,len(node)))
+            node._size = rows
+            if node._buffer is not None and node is not conditions:
+                node._buffer = None
+            for k,v in node.items():
+                if not path and k in conditions._unexpanded:
+                    self.complete = self.complete and not _packs(v)
+                    continue
+
+                # recursion
+                if isinstance(v,Conditions):
+                    do_layout(node,k,v,path+(k,))
+
+                # the fields
+                elif type(v) is np.ndarray and v.ndim == 2 and v.shape[0] == rows and v.dtype == np.float64:
+                    index = indices.get(id(v))
+                    if index is None:
+                        index = len(arrays)
+                        indices[id(v)] = index
+                        start = self.spans[-1][1] if self.spans else 0
+                        self.spans.append((start,start+v.shape[1]))
+                        arrays.append(v)
+                    else:
+                        self.shared.add(index)
+                        self.complete = False
+                    self.fields.append((node,k,index))
+                    layout.append((path+(k,),)+self.spans[index])
+
+                # arrays that expand_rows resizes one by one
+                elif isinstance(v,array_type) and v.ndim == 2:
+                    self.loose.append((node,k))
+                    self.complete = False
+
+                elif _packs(v):
+                    self.complete = False
+
+        do_layout(None,None,conditions,())
+
+        self.width  = self.spans[-1][1] if self.spans else 0
+        self.layout = tuple(layout)
+
+        # adopt the array the fields already live in
+        if array is not None and array.shape == (rows,self.width):
+            address = array.ctypes.data
+            if all(v.base is array and v.ctypes.data == address + start*rows*array.itemsize
+                   for v,(start,stop) in zip(arrays,self.spans)):
+                self.array = array
+                self.views = [arrays[index] for node,k,index in self.fields]
+                return
+
+        # the storage
+        self.array = np.empty((rows,self.width),order='F')
+        for v,(start,stop) in zip(arrays,self.spans):
+            self.array[:,start:stop] = v
+
+        self.bind()
+
+    def bind(self):
+        """ Points the fields of the tree at their columns of the array
+
+            Assumptions:
+            N/A
+
+            Source:
+            N/A
+
+            Inputs:
+            N/A
+
+            Outputs:
+            N/A
+
+            Properties Used:
+            N/A
+        """
+
+        array = self.array
+        views = [array[:,start:stop] for start,stop in self.spans]
+
+        self.views = []
+        for node,k,index in self.fields:
+            view = views[index]
+            node[k] = view
+            self.views.append(view)
+
+    def check(self,conditions):
+        """ Checks that the tree still has the layout of the array and copies
+            the fields that were replaced back into the array
+
+            Assumptions:
+            N/A
+
+            Source:
+            N/A
+
+            Inputs:
+            conditions  [Conditions()] the tree that owns this buffer
+
+            Outputs:
+            valid       [bool]
+
+            Properties Used:
+            N/A
+        """
+
+        # copies of the tree don't share the buffer
+        if self.root is not conditions:
+            return False
+        if self.views and self.views[0].base is not self.array:
+            return False
+
+        for parent,key,node,n in self.nodes:
+            if len(node) != n:
+                return False
+            if parent is not None and dict.get(parent,key) is not node:
+                return False
+
+        for (node,k,index),view in zip(self.fields,self.views):
+            v = dict.__getitem__(node,k)
+            if v is view:
+                continue
+            if type(v) is not np.ndarray or v.shape != view.shape:
+                return False
+
+            # columns shared by two fields can't hold two different values
+            if index in self.shared:
+                return False
+
+            view[...] = v
+            node[k]   = view
+
+        return True
+
+    def expand(self,rows):
+        """ Sizes the array and the loose arrays to the given number of rows, like
+            np.resize does for each field
+
+            Assumptions:
+            The buffer has been checked
+
+            Source:
+            N/A
+
+            Inputs:
+            rows   [int]
+
+            Outputs:
+            N/A
+
+            Properties Used:
+            N/A
+        """
+
+        # the rows repeat, as with np.resize
+        array = np.empty((rows,self.width),order='F')
+        np.take(self.array,np.arange(rows),axis=0,out=array,mode='wrap')
+
+        self.array = array
+        self.rows  = rows
+        self.bind()
+
+        for parent,key,node,n in self.nodes:
+            node._size = rows
+
+        for node,k in self.loose:
+            v = node[k]
+            if isinstance(v,array_type) and v.ndim == 2:
+                node[k] = np.resize(v,[rows,v.shape[1]])
+
+    def pack(self):
+        """ Packs the array into a 1D vector, in the same order as Data.pack_array()
+
+            Assumptions:
+            The buffer has been checked and is complete
+
+            Source:
+            N/A
+
+            Inputs:
+            N/A
+
+            Outputs:
+            vector [np.array]
+
+            Properties Used:
+            N/A
+        """
+        return self.array.T.flatten()
+
+    def unpack(self,vector):
+        """ Unpacks a 1D vector from pack() into the array, in place
+
+            Assumptions:
+            The buffer has been checked and is complete
+
+            Source:
+            N/A
+
+            Inputs:
+            vector [np.array]
+
+            Outputs:
+            N/A
+
+            Properties Used:
+            N/A
+        """
+        self.array.T.reshape(-1)[:] = vector
+
+    def columns(self):
+        """ Lists where each field is in the array, for exporting it
+
+            Assumptions:
+            N/A
+
+            Source:
+            N/A
+
+            Inputs:
+            N/A
+
+            Outputs:
+            columns [list] of ('path.to.field', start, stop)
+
+            Properties Used:
+            N/A
+        """
+        return [('.'.join(path),start,stop) for path,start,stop in self.layout]
+
+
+# ----------------------------------------------------------------------
+#  Merge
+# ----------------------------------------------------------------------
+
+## @ingroup Analyses-Mission-Segments-Conditions
+def concatenate_buffers(nodes):
+    """ Stacks the fields of the same node of the states of several segments
+        with one concatenation of their arrays, if they all keep their fields
+        in buffers with the same layout
+
+        Assumptions:
+        N/A
+
+        Source:
+        N/A
+
+        Inputs:
+        nodes     [list of Conditions()]
+
+        Outputs:
+        array     [np.array] the stacked fields, None if the nodes can't be stacked this way
+        views     [dict] the columns of the array for the path of each field
+
+        Properties Used:
+        N/A
+    """
+
+    # the segments that keep their fields together, with the layout they have now
+    if not nodes or any(node._buffer is None for node in nodes):
+        return None, None
+    buffers = [node.compact() for node in nodes]
+    if any(buffer.layout != buffers[0].layout for buffer in buffers):
+        return None, None
+
+    # the fields of all the segments at once
+    rows  = sum(buffer.rows for buffer in buffers)
+    array = np.empty((rows,buffers[0].width),order='F')
+    np.concatenate([buffer.array for buffer in buffers],axis=0,out=array)
+
+    views = {}
+    spans = {}
+    for path,start,stop in buffers[0].layout:
+        view = spans.get((start,stop))
+        if view is None:
+            view = array[:,start:stop]
+            spans[(start,stop)] = view
+        views[path] = view
+
+    return array, views
+
+
+def _packs(v):
+    """ Whether Data.pack_array() packs a value """
+    if isinstance(v,dict):
+        return True
+    if isinstance(v,array_type):
+        return v.ndim <= 2
+    return isinstance(v,(int,float,matrix_type))
@@ -3,6 +3,7 @@
 #
 # Created:  
 # Modified: Feb 2016, Andrew Wendorff
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -10,6 +11,8 @@
 
 from .Conditions import Conditions
 
+from SUAVE.Core import Data
+
 from SUAVE.Methods.Utilities.Chebyshev  import chebyshev_data
 
 import numpy as np
@@ -51,13 +54,28 @@ class Numerics(Conditions):
         
         self.number_control_points = 16
         self.discretization_method = chebyshev_data
+        self.number_of_cases       = 1 # cases solved together, stacked along the control points
         
-        self.solver_jacobian                  = "none"
+        self.solver_jacobian                  = "none" # or "sparse"
+        self.jacobian_sparsity                = None
+        self.jacobian_tolerance               = 1e-3
+        self.jacobian                         = None
+        self.evaluations                      = 0
+        self.jacobian_colors                  = None
         self.tolerance_solution               = 1e-8
         self.converged                        = None
         self.max_evaluations                  = 0.
         self.step_size                        = None
         
+        # solve again with more control points while the discretization error is large,
+        # for chebyshev_data only, see refine_control_points
+        self.refinement = Data()
+        self.refinement.adaptive               = False
+        self.refinement.tolerance              = 1e-4
+        self.refinement.maximum_control_points = 61
+        self.refinement.states                 = ['unknowns','conditions.frames.inertial.velocity_vector','conditions.weights.total_mass']
+        self.refinement.history                = []
+        
         self.dimensionless = Conditions()
         self.dimensionless.control_points = np.empty([0,0])
         self.dimensionless.differentiate  = np.empty([0,0])
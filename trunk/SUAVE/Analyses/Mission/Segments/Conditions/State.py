@@ -4,6 +4,7 @@
 # Created:  
 # Modified: Feb 2016, Andrew Wendorff
 #           Jan 2020, M. Clarke
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -17,10 +18,11 @@ from .Conditions import Conditions
 from .Unknowns   import Unknowns
 from .Residuals  import Residuals
 from .Numerics   import Numerics
+from .Conditions_Buffer import Conditions_Buffer, concatenate_buffers
 
 import SUAVE
 from SUAVE.Core.Arrays import array_type
-from SUAVE.Core import DataOrdered
+from SUAVE.Core import Data, DataOrdered
 
 # ----------------------------------------------------------------------
 #  State
@@ -37,6 +39,8 @@ class State(Conditions):
         None
     """    
     
+    # don't expand initials or numerics
+    _unexpanded = ('initials','numerics')
     
     def __defaults__(self):
         """ This sets the default values.
@@ -64,46 +68,33 @@ class State(Conditions):
         self.numerics   = Numerics()
         self.initials   = Conditions()
         
-    def expand_rows(self,rows):
-        """ Makes a 1-D array the right size. Often used after a mission is initialized to size out the vectors to the
-            right size.
+    def compact(self):
+        """ Keeps the unknowns, conditions and residuals each in one contiguous array,
+            see Conditions.compact()
         
             Assumptions:
-            Doesn't expand initials or numerics
+            Doesn't compact initials or numerics
     
             Source:
             N/A
     
             Inputs:
-            rows   [int]
+            None
     
             Outputs:
             None
     
             Properties Used:
             None
-        """         
+        """
         
-        # store
-        self._size = rows
-        
-        for k,v in self.items(): 
-            try:
-                rank = v.ndim
-            except:
-                rank = 0            
-            # don't expand initials or numerics
-            if k in ('initials','numerics'):
+        for k,v in self.items():
+            if k in self._unexpanded:
                 continue
-            
-            # recursion
             elif isinstance(v,Conditions):
-                v.expand_rows(rows)
-            # need arrays here
-            elif rank == 2:
-                self[k] = np.resize(v,[rows,v.shape[1]])
-            #: if type
-        #: for each key,value        
+                v.compact()
+        
+        return
         
         
 ## @ingroup Analyses-Mission-Segments-Conditions        
@@ -149,12 +140,9 @@ class Container(State):
         
         state_out = State()
         
-        for i,(tag,sub_state) in enumerate(self.segments.items()):
-            for key in ['unknowns','conditions','residuals']:
-                if i == 0:
-                    state_out[key].update(sub_state[key])
-                else:
-                    state_out[key] = state_out[key].do_recursive(append_array,sub_state[key])
+        for key in ['unknowns','conditions','residuals']:
+            nodes = [sub_state[key] for sub_state in self.segments.values()]
+            state_out[key] = merge_conditions(type(state_out[key]),nodes)
             
         return state_out
         
@@ -183,4 +171,77 @@ def append_array(A,B=None):
     if isinstance(A,array_type) and isinstance(B,array_type):
         return np.vstack([A,B])
     else:
-        return None
\ No newline at end of file
+        return None
+
+
+## @ingroup Analyses-Mission-Segments-Conditions
+def merge_conditions(klass,nodes,new_keys=False):
+    """ Merges the same node of the states of several segments, stacking each
+        array of all the segments at once. Nodes that keep their fields in a
+        contiguous array are stacked with one concatenation.
+
+        Assumptions:
+        The result is the same as merging the segments one at a time:
+        values that are not arrays are dropped unless only one segment
+        has them, or they are new keys
+
+        Source:
+        N/A
+
+        Inputs:
+        klass     [class] of the merged nodes
+        nodes     [list of Conditions()]
+        new_keys  [bool] add the keys of the top node that are not in the first segment
+
+        Outputs:
+        merged    [Conditions()]
+
+        Properties Used:
+        None
+    """
+
+    merged = klass()
+    if len(nodes) == 1:
+        merged.update(nodes[0])
+    if len(nodes) < 2:
+        return merged
+
+    # contiguous fields
+    array, views = concatenate_buffers(nodes)
+    if views is None:
+        views = {}
+
+    # gather each value of all the segments, then stack it once
+    def do_merge(out,nodes,path):
+        keys = list(nodes[0].keys())
+        if new_keys and not path:
+            seen = set(keys)
+            for node in nodes[1:]:
+                for k in node.keys():
+                    if not k in seen:
+                        seen.add(k)
+                        keys.append(k)
+
+        for k in keys:
+            values = [node[k] for node in nodes if k in node]
+            view   = views.get(path+(k,))
+            if view is not None:
+                out[k] = view
+            elif len(values) == 1:
+                out[k] = values[0]
+            elif isinstance(values[0],Data):
+                c = klass()
+                out[k] = c
+                do_merge(c,[v for v in values if isinstance(v,Data)],path+(k,))
+            elif all(isinstance(v,array_type) for v in values):
+                out[k] = np.vstack(values)
+            elif new_keys and not path and not k in out:
+                out[k] = values[-1]
+
+    do_merge(merged,nodes,())
+
+    # the merged fields stay in one array
+    if array is not None:
+        merged._buffer = Conditions_Buffer(merged,array.shape[0],array)
+
+    return merged
@@ -6,6 +6,7 @@
 from .Aerodynamics import Aerodynamics
 from .Basic        import Basic
 from .Conditions   import Conditions
+from .Conditions_Buffer import Conditions_Buffer
 from .Numerics     import Numerics
 from .Residuals    import Residuals
 from .State        import State
@@ -3,6 +3,7 @@
 #
 # Created:  
 # Modified: Feb 2016, Andrew Wendorff
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -24,6 +25,9 @@ from SUAVE.Core import Units
 ## @ingroup Analyses-Mission-Segments-Descent
 class Constant_Speed_Constant_Rate(Unknown_Throttle):
     
+    # its methods solve several cases stacked along the control points, see Segment.evaluate_cases
+    _stacked_cases = True
+    
     def __defaults__(self):
         """ This sets the default solver flow. Anything in here can be modified after initializing a segment.
     
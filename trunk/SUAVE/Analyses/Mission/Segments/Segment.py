@@ -3,6 +3,7 @@
 #
 # Created:  
 # Modified: Sep 2016, E. Botero
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -10,8 +11,10 @@
 
 # SUAVE imports
 
+from SUAVE.Core import Data, DataOrdered
 from SUAVE.Analyses import Analysis, Settings, Process
-from .Conditions import State
+from .Conditions import State, Conditions
+from .Conditions.State import merge_conditions
 from SUAVE.Core.Arrays import array_type
 import numpy as np
 
@@ -30,6 +33,14 @@ class Segment(Analysis):
         None
     """    
     
+    # the warm start, memo and keep list last given by the mission containing the segment
+    _inherited = None
+    
+    # whether the methods of the segment solve several cases stacked along the
+    # control points, see evaluate_cases. Subclasses, that change the methods,
+    # don't inherit it.
+    _stacked_cases = False
+    
     def __defaults__(self):
         """This sets the default values.
     
@@ -51,6 +62,15 @@ class Segment(Analysis):
         
         self.settings = Settings()
         
+        # converged unknowns to start from, see Warm_Start
+        self.warm_start = None
+        
+        # converged states to take instead of solving again, see Segment_Memo
+        self.memo = None
+        
+        # the paths of the conditions kept once the mission is finalized, see Common.Release
+        self.keep = None
+        
         self.state = State()
 
         self.analyses = Analysis.Container()
@@ -221,27 +241,173 @@ class Segment(Analysis):
         
         state_out = State()
         
-        for i,(tag,sub_seg) in enumerate(self.segments.items()):
-            sub_state = sub_seg.state
-            for key in ['unknowns','conditions','residuals']:
-                if i == 0:
-                    state_out[key].update(sub_state[key])
-                else:
-
-                    # Update existing items
-                    state_out[key] = state_out[key].do_recursive(append_array,sub_state[key])
-                    
-                    # Check if all the states exist, if not add them
-                    existing_keys = list(state_out[key].keys())
-                    new_keys      = list(sub_state[key].keys())
-                    diff_list     = np.setdiff1d(new_keys,existing_keys).tolist()                    
-                    
-                    # Do an update for the remainder
-                    for update_key in diff_list:
-                        state_out[key][update_key] = sub_state[key][update_key]
+        for key in ['unknowns','conditions','residuals']:
+            nodes = [sub_seg.state[key] for sub_seg in self.segments.values()]
+            
+            # all the segments at once, adding the keys that the first segment doesn't have
+            state_out[key] = merge_conditions(type(state_out[key]),nodes,new_keys=True)
                                         
             
         return state_out
+    
+    def evaluate_cases(self,number_of_cases):
+        """ Solves several cases of the segment, or of the segments of a mission,
+            at once. The cases are stacked along the control points of each
+            segment, so one evaluation of the analyses and residuals covers all
+            of them, and the solver takes a jacobian for all the cases at once.
+    
+            Assumptions:
+            The inputs that differ between the cases are given as arrays of one
+            value per case, like segment.distance or the takeoff mass of the
+            vehicle, see Methods.Missions.Segments.Common.Cases. Only segments
+            whose methods handle stacked cases can be solved this way, without
+            adaptive refinement of the control points.
+    
+            Source:
+            N/A
+    
+            Inputs:
+            number_of_cases  [int]
+    
+            Outputs:
+            results          [list of Data()], one per case:
+                tag          [string]
+                converged    <boolean>
+                conditions   [Conditions()]
+                segments     [DataOrdered()], the results of each segment, for a mission
+    
+            Properties Used:
+            None
+        """
+        
+        leaves = stacked_segments(self)
+        cases  = [leaf.state.numerics.number_of_cases for leaf in leaves]
+        try:
+            for leaf in leaves:
+                leaf.state.numerics.number_of_cases = number_of_cases
+            self.evaluate()
+            results = [case_results(self,case,number_of_cases) for case in range(number_of_cases)]
+        finally:
+            for leaf,K in zip(leaves,cases):
+                leaf.state.numerics.number_of_cases = K
+            
+        return results
+
+    
+    
+# ----------------------------------------------------------------------
+#  Stacked Cases
+# ----------------------------------------------------------------------
+
+## @ingroup Analyses-Mission-Segments
+def stacked_segments(segment):
+    """ The segments without sub segments of a segment or mission, checked
+        to solve stacked cases
+
+        Assumptions:
+        The class of each segment sets _stacked_cases itself
+
+        Source:
+        N/A
+
+        Inputs:
+        segment  [Segment()]
+
+        Outputs:
+        leaves   [list of Segment()]
+
+        Properties Used:
+        None
+    """
+    
+    if not vars(type(segment)).get('_stacked_cases',False):
+        raise ValueError('segment %s of type %s can not solve stacked cases' % (segment.tag,type(segment).__name__))
+    
+    sub_segments = segment.get('segments')
+    if sub_segments:
+        leaves = []
+        for sub_segment in sub_segments.values():
+            leaves.extend(stacked_segments(sub_segment))
+        return leaves
+    
+    if segment.state.numerics.refinement.adaptive:
+        raise ValueError('segment %s can not solve stacked cases with adaptive refinement' % segment.tag)
+    
+    return [segment]
+
+## @ingroup Analyses-Mission-Segments
+def case_results(segment,case,number_of_cases):
+    """ The results of one of the cases solved stacked in a segment or mission
+
+        Assumptions:
+        The arrays of the conditions of a segment have the rows of each case
+        one after the other
+
+        Source:
+        N/A
+
+        Inputs:
+        segment          [Segment()]
+        case             [int]
+        number_of_cases  [int]
+
+        Outputs:
+        results          [Data()]
+
+        Properties Used:
+        None
+    """
+    
+    results = Data()
+    results.tag = segment.tag
+    
+    sub_segments = segment.get('segments')
+    if sub_segments:
+        results.segments = DataOrdered()
+        for tag,sub_segment in sub_segments.items():
+            results.segments[tag] = case_results(sub_segment,case,number_of_cases)
+        nodes = [sub_results.conditions for sub_results in results.segments.values()]
+        results.conditions = merge_conditions(Conditions,nodes,new_keys=True)
+        results.converged  = all([sub_results.converged for sub_results in results.segments.values()])
+    else:
+        n = segment.state.numerics.number_control_points
+        results.conditions = case_conditions(segment.state.conditions,slice(case*n,(case+1)*n),n*number_of_cases)
+        results.converged  = bool(segment.state.numerics.converged)
+        
+    return results
+
+## @ingroup Analyses-Mission-Segments
+def case_conditions(conditions,rows,size):
+    """ The rows of one case of the stacked arrays of some conditions
+
+        Assumptions:
+        Values that aren't stacked are kept as they are
+
+        Source:
+        N/A
+
+        Inputs:
+        conditions  [Conditions()]
+        rows        [slice]
+        size        [int], rows of the stacked arrays
+
+        Outputs:
+        conditions  [Conditions()]
+
+        Properties Used:
+        None
+    """
+    
+    result = Conditions()
+    for key,value in conditions.items():
+        if isinstance(value,Data):
+            result[key] = case_conditions(value,rows,size)
+        elif isinstance(value,array_type) and value.ndim == 2 and len(value) == size:
+            result[key] = value[rows].copy()
+        else:
+            result[key] = value
+    
+    return result
 
     
     
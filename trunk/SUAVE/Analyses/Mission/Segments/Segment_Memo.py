@@ -0,0 +1,352 @@
+## @ingroup Analyses-Mission-Segments
+# Segment_Memo.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+from SUAVE.Core import Data, fingerprint, fingerprint_ignore
+
+import numpy as np
+from copy import deepcopy
+import hashlib
+import time
+
+# ----------------------------------------------------------------------
+#  Segment Memo
+# ----------------------------------------------------------------------
+
+## @ingroup Analyses-Mission-Segments
+class Segment_Memo(Data):
+    """ Keeps the converged states of the segments of a mission by a hash of
+        everything a solve depends on: the inputs of the segment, its process,
+        its numerics, the state it starts from, which is the end of the segment
+        before it, and its analyses, with the vehicle they look at. A segment
+        found in the memo takes the state it converged to instead of being
+        solved again. The least recently used states are dropped past max_size.
+        Counts the time spent on the keys.
+
+        Assumptions:
+        Solving a segment again from the same inputs gives the same state, within
+        the tolerance of the solver, whatever the guess it starts from.
+        The items named in ignore, fingerprint_ignore by default, are written by
+        the analyses in each evaluation or only change how fast they run, and
+        aren't hashed.
+        Processes are hashed by the names and the functions of their steps, not
+        by what the functions do. An analysis that keeps something else, like a
+        surrogate, must be set up again, by finalize, when the vehicle changes.
+        The analyses and the vehicle don't change while a mission is evaluated,
+        so each one is hashed once per evaluation.
+
+        Source:
+        None
+    """
+
+    # the items of a segment that aren't inputs
+    _not_inputs = ('state','conditions','analyses','process','segments','warm_start','memo','keep','converged')
+
+    # the items of the numerics that are inputs
+    _numerics = ('number_control_points','number_of_cases','discretization_method','tolerance_solution',
+                 'max_evaluations','step_size','refinement.adaptive','refinement.tolerance',
+                 'refinement.maximum_control_points','refinement.states')
+
+    def __defaults__(self):
+        """This sets the default values.
+
+            Assumptions:
+            None
+
+            Source:
+            N/A
+
+            Inputs:
+            None
+
+            Outputs:
+            None
+
+            Properties Used:
+            None
+        """
+
+        self.tag               = 'segment_memo'
+        self.max_size          = 64
+        self.ignore            = sorted(fingerprint_ignore)
+        self.segments          = Data()
+        self.hits              = 0
+        self.misses            = 0
+        self.evictions         = 0
+        self.saved_evaluations = 0
+        self.key_time          = 0.
+
+    def restore(self,segment,key):
+        """ Sets the state of a segment to the one it converged to with the same key
+
+            Assumptions:
+            None
+
+            Source:
+            N/A
+
+            Inputs:
+            segment                               [Segment]
+            key                                   [string], from key()
+
+            Outputs:
+            found                                 [boolean]
+            segment.state                         [State], the unknowns, conditions, residuals and numerics
+
+            Properties Used:
+            None
+        """
+
+        entry = self.segments.pop(key,None)
+        if entry is None:
+            self.misses += 1
+            return False
+
+        # the most recently used last
+        self.segments[key] = entry
+
+        state = segment.state
+        for name in ['unknowns','conditions','residuals','numerics']:
+            state[name] = deepcopy(entry[name])
+        if 'conditions' in segment:
+            segment.conditions = state.conditions
+        segment.converged = state.numerics.converged
+
+        self.hits              += 1
+        self.saved_evaluations += state.numerics.evaluations
+        state.numerics.evaluations = 0
+
+        return True
+
+    def save(self,segment,key):
+        """ Keeps the state of a converged segment
+
+            Assumptions:
+            None
+
+            Source:
+            N/A
+
+            Inputs:
+            segment                               [Segment]
+            key                                   [string], from key() before the segment was solved
+
+            Outputs:
+            None
+
+            Properties Used:
+            None
+        """
+
+        state = segment.state
+        if not state.numerics.converged:
+            return
+
+        entry = Data()
+        for name in ['unknowns','conditions','residuals','numerics']:
+            entry[name] = deepcopy(state[name])
+        self.segments.pop(key,None)
+        self.segments[key] = entry
+
+        while len(self.segments) > self.max_size:
+            del self.segments[next(iter(self.segments.keys()))]
+            self.evictions += 1
+
+    def key(self,segment,analyses_keys=None):
+        """ Hashes the inputs of a segment, its process, the numerics, the last
+            point of the segment before it and the analyses
+
+            Assumptions:
+            The analyses found in analyses_keys are the same as when they were
+            hashed. There is no key when a value can't be fingerprinted, and
+            the segment is then solved without the memo.
+
+            Source:
+            N/A
+
+            Inputs:
+            segment                               [Segment]
+            segment.process                       [Process]
+            segment.state.initials                [State], the segment before it
+            segment.analyses                      [Analysis.Container]
+            analyses_keys                         [dict], the hashes of the analyses found so far in
+                                                  this evaluation of the mission, by the ids of the
+                                                  memo and of each analysis, optional
+
+            Outputs:
+            key                                   [string], or None
+            analyses_keys                         [dict]
+
+            Properties Used:
+            None
+        """
+
+        tic    = time.time()
+        digest = hashlib.sha1()
+        seen   = {}
+        ignore = set(self.ignore)
+
+        try:
+            # the inputs of the segment
+            for name,value in segment.items():
+                if name in self._not_inputs:
+                    continue
+                digest.update(name.encode())
+                fingerprint(value,digest,seen,ignore)
+
+            # how it is solved
+            digest.update(b'process')
+            fingerprint(segment.process,digest,seen,ignore)
+            numerics = segment.state.numerics
+            for name in self._numerics:
+                digest.update(name.encode())
+                fingerprint(numerics.deep_get(name),digest,seen,ignore)
+
+            # where it starts
+            initials = segment.state.initials
+            if initials:
+                digest.update(b'initials')
+                fingerprint(last_rows(initials.conditions,numerics.number_of_cases),digest,seen,ignore)
+        except TypeError:
+            self.key_time += time.time() - tic
+            return None
+
+        # the analyses, once for the segments sharing them
+        analyses = segment.analyses
+        found    = (id(self),) + tuple([(tag,id(analysis)) for tag,analysis in analyses.items()])
+        if analyses_keys is None:
+            analyses_keys = {}
+        if found not in analyses_keys:
+            # the analyses are kept with their hash, so their ids aren't taken by others
+            analyses_keys[found] = (self.analyses_key(analyses),list(analyses.values()))
+        analyses_key   = analyses_keys[found][0]
+        self.key_time += time.time() - tic
+        if analyses_key is None:
+            return None
+        digest.update(analyses_key.encode())
+
+        return digest.hexdigest()
+
+    def analyses_key(self,analyses):
+        """ Hashes the analyses of a segment, with their processes and the vehicle
+            they look at
+
+            Assumptions:
+            There is no key when a value can't be fingerprinted.
+
+            Source:
+            N/A
+
+            Inputs:
+            analyses                              [Analysis.Container]
+
+            Outputs:
+            key                                   [string], or None
+
+            Properties Used:
+            None
+        """
+
+        digest = hashlib.sha1()
+        seen   = {}
+        ignore = set(self.ignore)
+
+        try:
+            for tag,analysis in analyses.items():
+                digest.update(tag.encode())
+                fingerprint(analysis,digest,seen,ignore)
+        except TypeError:
+            return None
+
+        return digest.hexdigest()
+
+    def hit_rate(self):
+        """ The fraction of the segments that were found
+
+            Assumptions:
+            None
+
+            Source:
+            N/A
+
+            Inputs:
+            None
+
+            Outputs:
+            hit_rate                              [Unitless]
+
+            Properties Used:
+            None
+        """
+
+        return self.hits / max(self.hits + self.misses,1)
+
+    def reset(self):
+        """ Forgets the segments and resets the counters
+
+            Assumptions:
+            None
+
+            Source:
+            N/A
+
+            Inputs:
+            None
+
+            Outputs:
+            None
+
+            Properties Used:
+            None
+        """
+
+        self.segments          = Data()
+        self.hits              = 0
+        self.misses            = 0
+        self.evictions         = 0
+        self.saved_evaluations = 0
+        self.key_time          = 0.
+
+# ----------------------------------------------------------------------
+#  Helper Functions
+# ----------------------------------------------------------------------
+
+## @ingroup Analyses-Mission-Segments
+def last_rows(conditions,cases=1):
+    """ The last row of each array of some conditions, the end of a segment,
+        for each of the cases stacked in them
+
+        Assumptions:
+        None
+
+        Source:
+        N/A
+
+        Inputs:
+        conditions      [Conditions]
+        cases           [int]
+
+        Outputs:
+        rows            [Data]
+
+        Properties Used:
+        None
+    """
+
+    rows = Data()
+    for key,value in conditions.items():
+        if isinstance(value,Data):
+            rows[key] = last_rows(value,cases)
+        elif isinstance(value,np.ndarray) and value.ndim == 2 and len(value):
+            n = max(len(value) // cases,1)
+            rows[key] = value[n-1::n]
+        else:
+            rows[key] = value
+
+    return rows
@@ -0,0 +1,177 @@
+## @ingroup Analyses-Mission-Segments
+# Warm_Start.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+from SUAVE.Core import Data
+
+import numpy as np
+
+# ----------------------------------------------------------------------
+#  Warm Start
+# ----------------------------------------------------------------------
+
+## @ingroup Analyses-Mission-Segments
+class Warm_Start(Data):
+    """ Keeps the converged unknowns of the segments of a mission, and the last
+        jacobian of the solver when there is one, to start the next solve of the
+        same segments from them. Counts the evaluations of the segments and the
+        ones saved against the first, cold, solve of each segment.
+
+        Assumptions:
+        The segments are found by tag and number of control points, so a store
+        holds the segments of one mission. Only converged solves are kept.
+
+        Source:
+        None
+    """
+
+    def __defaults__(self):
+        """This sets the default values.
+
+            Assumptions:
+            None
+
+            Source:
+            N/A
+
+            Inputs:
+            None
+
+            Outputs:
+            None
+
+            Properties Used:
+            None
+        """
+
+        self.tag               = 'warm_start'
+        self.segments          = Data()
+        self.hits              = 0
+        self.misses            = 0
+        self.evaluations       = 0
+        self.saved_evaluations = 0
+
+    def apply(self,segment):
+        """ Sets the unknowns of a segment to the ones it converged to last time.
+            The entry also holds the jacobian the solver ended with.
+
+            Assumptions:
+            None
+
+            Source:
+            N/A
+
+            Inputs:
+            segment.tag                           [string]
+            segment.state.numerics.number_control_points [Unitless]
+            segment.state.unknowns                [Data]
+
+            Outputs:
+            entry                                 [Data], None when the segment was not kept
+            segment.state.unknowns                [Data]
+
+            Properties Used:
+            None
+        """
+
+        entry = self.segments.get(self.key(segment))
+        state = segment.state
+
+        if entry is None or np.size(entry.unknowns) != np.size(state.unknowns.pack_array()):
+            self.misses += 1
+            return None
+
+        state.unknowns.unpack_array(entry.unknowns.copy())
+        self.hits += 1
+
+        return entry
+
+    def save(self,segment,entry=None):
+        """ Keeps the unknowns a segment converged to, and counts its evaluations.
+
+            Assumptions:
+            None
+
+            Source:
+            N/A
+
+            Inputs:
+            segment.state.unknowns                [Data]
+            segment.state.numerics.converged      [boolean]
+            segment.state.numerics.evaluations    [Unitless]
+            segment.state.numerics.jacobian       [array]
+            entry                                 [Data], from apply()
+
+            Outputs:
+            None
+
+            Properties Used:
+            None
+        """
+
+        numerics = segment.state.numerics
+        self.evaluations += numerics.evaluations
+
+        if entry is None:
+            entry = Data()
+            entry.cold_evaluations = numerics.evaluations
+        else:
+            self.saved_evaluations += entry.cold_evaluations - numerics.evaluations
+
+        if numerics.converged:
+            entry.unknowns = segment.state.unknowns.pack_array()
+            entry.jacobian = numerics.jacobian
+            self.segments[self.key(segment)] = entry
+
+    def key(self,segment):
+        """ Names a segment in the store by its tag and number of control points
+
+            Assumptions:
+            None
+
+            Source:
+            N/A
+
+            Inputs:
+            segment.tag                           [string]
+            segment.state.numerics.number_control_points [Unitless]
+
+            Outputs:
+            key                                   [string]
+
+            Properties Used:
+            None
+        """
+
+        return '%s_%d' % (segment.tag,segment.state.numerics.number_control_points)
+
+    def reset(self):
+        """ Forgets the segments and resets the counters
+
+            Assumptions:
+            None
+
+            Source:
+            N/A
+
+            Inputs:
+            None
+
+            Outputs:
+            None
+
+            Properties Used:
+            None
+        """
+
+        self.segments          = Data()
+        self.hits              = 0
+        self.misses            = 0
+        self.evaluations       = 0
+        self.saved_evaluations = 0
@@ -6,6 +6,8 @@
 from .Segment     import Segment
 from .Simple      import Simple
 from .Aerodynamic import Aerodynamic
+from .Warm_Start  import Warm_Start
+from .Segment_Memo import Segment_Memo
 
 from . import Climb
 from . import Conditions
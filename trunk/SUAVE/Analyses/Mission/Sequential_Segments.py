@@ -4,6 +4,7 @@
 # Created:  
 # Modified: Feb 2016, A. Wendorff
 #           Oct 2017, E. Botero
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -11,6 +12,7 @@
 
 import SUAVE
 from SUAVE.Methods import Missions as Methods
+from SUAVE.Analyses import Process
 from .Mission import Mission
 
 # ----------------------------------------------------------------------
@@ -28,6 +30,9 @@ class Sequential_Segments(Mission):
         None
     """
     
+    # its segments are solved one by one with their cases stacked, see Segment.evaluate_cases
+    _stacked_cases = True
+    
     def __defaults__(self):
         """This sets the default values.
     
@@ -73,5 +78,43 @@ class Sequential_Segments(Mission):
         #   Finalize
         # --------------------------------------------------------------        
         self.process.finalize.sub_segments = Methods.Segments.Common.Sub_Segments.finalize_sub_segments
+        self.process.finalize.release      = Methods.Segments.Common.Release.release_sub_segments
+        
+        # --------------------------------------------------------------
+        #   Stream - run with each segment as soon as it is solved
+        # --------------------------------------------------------------
+        self.stream = Process()
+        
+        return
+    
+    def evaluate_segments(self,state=None):
+        """ Evaluates the mission, yielding each segment as soon as it is solved
+            and finalized, so its results can be used, written or plotted while the
+            next segments are solved. The steps of the stream are run with each
+            segment before it is yielded, like Stream.spill_conditions to keep the
+            conditions of the segments solved so far on disk.
+    
+            Assumptions:
+            The converge step of the process solves the segments one by one, it is
+            replaced by Sub_Segments.solve_sub_segments. The other steps are run as
+            they are, the finalize steps once the last segment is yielded.
+    
+            Source:
+            N/A
+    
+            Inputs:
+            None
+    
+            Outputs:
+            segment   [Segment()], one at a time
+    
+            Properties Used:
+            None
+        """
         
-        return
\ No newline at end of file
+        for tag,step in self.process.items():
+            if tag == 'converge':
+                for segment in Methods.Segments.Common.Sub_Segments.solve_sub_segments(self):
+                    yield segment
+            else:
+                step(self)
\ No newline at end of file
@@ -3,6 +3,7 @@
 #
 # Created:  
 # Modified: Feb 2016, Andrew Wendorff
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -29,6 +30,39 @@ class Process(ContainerOrdered):
     
     verbose = False
     
+    # the Process_Profile recording the steps, when one is enabled
+    profile = None
+    
+    # counts the calls to invalidate(), which drop the compiled steps of all the processes
+    invalidations = 0
+    
+    # counts the edits of this process once it is built
+    _version = None
+    
+    # the compiled list of steps, with the processes it was compiled from and their versions
+    _compiled = None
+    
+    def __init__(self,*args,**kwarg):
+        """Builds the process, then starts counting its edits.
+        
+                Assumptions:
+                None
+        
+                Source:
+                N/A
+        
+                Inputs:
+                None
+        
+                Outputs:
+                None
+        
+                Properties Used:
+                N/A
+            """
+        ContainerOrdered.__init__(self,*args,**kwarg)
+        self._version = 0
+    
     def evaluate(self,*args,**kwarg):
         """This is used to execute the evaluate functions of the analyses
             stored in the container.
@@ -49,6 +83,9 @@ class Process(ContainerOrdered):
                 N/A
             """        
         
+        if self.profile is not None:
+            return self.profile.evaluate(self,*args,**kwarg)
+        
         results = Data()
         
         if self.verbose:
@@ -95,3 +132,185 @@ class Process(ContainerOrdered):
             """                        
         return self.evaluate(*args,**kwarg) 
     
+    def compile(self):
+        """Flattens the tree of processes into a list of the functions of its steps,
+            in the order evaluate() calls them. The list is kept until the process, or one
+            of the processes flattened into it, is edited.
+        
+                Assumptions:
+                Processes nested as steps are flattened, unless their class has its own
+                evaluate. Other steps with an evaluate are called through it.
+        
+                Source:
+                N/A
+        
+                Inputs:
+                None
+        
+                Outputs:
+                steps     [list of functions]
+        
+                Properties Used:
+                N/A
+            """
+        
+        compiled = self._compiled
+        if compiled is not None and compiled[0] == Process.invalidations:
+            for process,version in compiled[1]:
+                if process._version != version:
+                    break
+            else:
+                return compiled[2]
+        
+        steps     = []
+        processes = [(self,self._version)]
+        for tag,step in self.items():
+            if isinstance(step,Process) and type(step).evaluate is Process.evaluate:
+                steps.extend(step.compile())
+                processes.extend(step._compiled[1])
+            elif hasattr(step,'evaluate'):
+                steps.append(step.evaluate)
+            else:
+                steps.append(step)
+                
+        self._compiled = (Process.invalidations,processes,steps)
+        
+        return steps
+    
+    def evaluate_compiled(self,*args,**kwarg):
+        """Calls the compiled steps of the process, without keeping their results.
+            With a profile enabled, or verbose, the process is evaluated as usual.
+        
+                Assumptions:
+                None
+        
+                Source:
+                N/A
+        
+                Inputs:
+                None
+        
+                Outputs:
+                None
+        
+                Properties Used:
+                N/A
+            """
+        
+        if self.profile is not None or self.verbose:
+            self.evaluate(*args,**kwarg)
+            return
+        
+        for step in self.compile():
+            step(*args,**kwarg)
+            
+    @staticmethod
+    def invalidate():
+        """Drops the compiled steps of all processes. Editing a process does this, this
+            is for changes a process can't see, like a new evaluate of an analysis.
+        
+                Assumptions:
+                None
+        
+                Source:
+                N/A
+        
+                Inputs:
+                None
+        
+                Outputs:
+                None
+        
+                Properties Used:
+                N/A
+            """
+        Process.invalidations += 1
+    
+    def __setattr__(self,key,value):
+        """Sets a step, and counts the edit once the process is built.
+        
+                Assumptions:
+                None
+        
+                Source:
+                N/A
+        
+                Inputs:
+                key       [string]
+                value     the step
+        
+                Outputs:
+                None
+        
+                Properties Used:
+                N/A
+            """
+        if not key.startswith('_') and self._version is not None:
+            self._version += 1
+        ContainerOrdered.__setattr__(self,key,value)
+        
+    def __delattr__(self,key):
+        """Removes a step, and counts the edit.
+        
+                Assumptions:
+                None
+        
+                Source:
+                N/A
+        
+                Inputs:
+                key       [string]
+        
+                Outputs:
+                None
+        
+                Properties Used:
+                N/A
+            """
+        if self._version is not None:
+            self._version += 1
+        ContainerOrdered.__delattr__(self,key)
+        
+    def __len__(self):
+        """The number of steps, without the version and the compiled steps kept
+            with them.
+        
+                Assumptions:
+                None
+        
+                Source:
+                N/A
+        
+                Inputs:
+                None
+        
+                Outputs:
+                length    [int]
+        
+                Properties Used:
+                N/A
+            """
+        return len(dict.__getitem__(self,'_map'))
+        
+    def __reduce__(self):
+        """Leaves the compiled steps out of copies and pickles.
+        
+                Assumptions:
+                None
+        
+                Source:
+                N/A
+        
+                Inputs:
+                None
+        
+                Outputs:
+                the reduction of ContainerOrdered
+        
+                Properties Used:
+                N/A
+            """
+        reduction = ContainerOrdered.__reduce__(self)
+        reduction[2].pop('_compiled',None)
+        return reduction
+    
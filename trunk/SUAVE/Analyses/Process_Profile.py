@@ -0,0 +1,515 @@
+## @ingroup Analyses
+# Process_Profile.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+from SUAVE.Core import Data
+from .Process import Process
+
+import threading
+import tracemalloc
+import time
+
+# ----------------------------------------------------------------------
+#  Process Profile
+# ----------------------------------------------------------------------
+
+## @ingroup Analyses
+class Process_Profile(Data):
+    """ Records the time, number of calls and, optionally, the peak memory of
+        every step of the processes evaluated while it is enabled, by the path
+        of the step in the tree of processes, like
+        'base.converge.sequential_segments.cruise.converge.converge_root.iterate.conditions.aerodynamics'.
+        The calls of a step are added up, so the iterations of the solver end up
+        in one entry.
+
+        with Process_Profile() as profile:
+            mission.evaluate()
+        print(profile.table())
+
+        Assumptions:
+        A process called from inside a step, rather than as a step of its parent,
+        is named after the object it is evaluated on, the tag of a segment or a
+        mission, or the path of the process in it, like 'iterate'. A process that
+        can't be named that way adds its steps to the step that called it.
+        Only the thread that enabled the profile is recorded.
+        The peak memory of a step is the most memory allocated by python while it
+        runs, above the memory at its start. Before python 3.9 tracemalloc can't
+        reset its peak, and the memory allocated by the step that is still held
+        at its end is recorded instead.
+
+        Source:
+        None
+    """
+
+    # kept out of the data, the state of the profile while it runs
+    _stack    = None
+    _records  = None
+    _names    = None
+    _thread   = None
+    _previous = None
+    _tracing  = False
+
+    def __defaults__(self):
+        """This sets the default values.
+
+            Assumptions:
+            None
+
+            Source:
+            N/A
+
+            Inputs:
+            None
+
+            Outputs:
+            None
+
+            Properties Used:
+            None
+        """
+
+        self.tag    = 'process_profile'
+        self.memory = False
+
+        self._stack    = []
+        self._records  = {}
+        self._names    = {}
+
+    def enable(self):
+        """ Starts recording the processes evaluated on this thread
+
+            Assumptions:
+            None
+
+            Source:
+            N/A
+
+            Inputs:
+            None
+
+            Outputs:
+            None
+
+            Properties Used:
+            self.memory
+        """
+
+        self._previous = Process.profile
+        self._thread   = threading.get_ident()
+        if self.memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._tracing = True
+        Process.profile = self
+
+    def disable(self):
+        """ Stops recording, and puts back the profile that was enabled before
+
+            Assumptions:
+            None
+
+            Source:
+            N/A
+
+            Inputs:
+            None
+
+            Outputs:
+            None
+
+            Properties Used:
+            None
+        """
+
+        Process.profile = self._previous
+        self._previous  = None
+        if self._tracing:
+            tracemalloc.stop()
+            self._tracing = False
+
+    def reset(self):
+        """ Forgets everything recorded
+
+            Assumptions:
+            None
+
+            Source:
+            N/A
+
+            Inputs:
+            None
+
+            Outputs:
+            None
+
+            Properties Used:
+            None
+        """
+
+        self._stack   = []
+        self._records = {}
+        self._names   = {}
+
+    def __enter__(self):
+        self.enable()
+        return self
+
+    def __exit__(self,*args):
+        self.disable()
+
+    def evaluate(self,process,*args,**kwarg):
+        """ Evaluates the steps of a process like Process.evaluate(), recording
+            each of them
+
+            Assumptions:
+            None
+
+            Source:
+            N/A
+
+            Inputs:
+            process   [Process]
+
+            Outputs:
+            results   [Data], the results of the steps
+
+            Properties Used:
+            None
+        """
+
+        # another thread, not recorded
+        if threading.get_ident() != self._thread:
+            results = Data()
+            for tag,step in process.items():
+                results[tag] = evaluate_step(step,args,kwarg)
+            return results
+
+        name = self.name(process,args)
+        if name is not None:
+            self.start(name,process)
+
+        try:
+            results = Data()
+            for tag,step in process.items():
+                self.start(tag,step)
+                try:
+                    result = evaluate_step(step,args,kwarg)
+                finally:
+                    self.stop()
+                results[tag] = result
+        finally:
+            if name is not None:
+                self.stop()
+
+        return results
+
+    def name(self,process,args):
+        """ Finds the name of a process in the path of the steps. A process run as
+            a step of the one above it is already named by its tag.
+
+            Assumptions:
+            None
+
+            Source:
+            N/A
+
+            Inputs:
+            process   [Process]
+            args      [list], the arguments of the process, the first one is searched
+
+            Outputs:
+            name      [string], None when the process isn't named
+
+            Properties Used:
+            None
+        """
+
+        stack = self._stack
+        if stack and stack[-1][1] is process:
+            return None
+
+        key = (id(process),id(args[0]) if args else None)
+        if key in self._names:
+            return self._names[key][-1]
+
+        name = None
+        if args:
+            owner = args[0]
+            top   = getattr(owner,'process',None) if isinstance(owner,Data) else None
+            if top is process:
+                name = getattr(owner,'tag',None) or 'process'
+            elif isinstance(top,Process):
+                name = find_process(top,process)
+
+        # keep the objects, so their ids aren't reused
+        self._names[key] = (process,args[0] if args else None,name)
+
+        return name
+
+    def start(self,tag,step):
+        """ Starts the record of a step
+
+            Assumptions:
+            None
+
+            Source:
+            N/A
+
+            Inputs:
+            tag       [string]
+            step      [Process, function or Analysis]
+
+            Outputs:
+            None
+
+            Properties Used:
+            self.memory
+        """
+
+        stack = self._stack
+        path  = stack[-1][0] + (tag,) if stack else (tag,)
+        used  = 0
+        if self.memory:
+            used = tracemalloc.get_traced_memory()[0]
+            if hasattr(tracemalloc,'reset_peak'):
+                tracemalloc.reset_peak()
+
+        # path, step, start time, time of the steps inside, memory at the start, peak of the steps inside
+        stack.append([path,step,time.perf_counter(),0.,used,0])
+
+    def stop(self):
+        """ Ends the record of the last step started, and adds it to the ones
+            of the same path
+
+            Assumptions:
+            None
+
+            Source:
+            N/A
+
+            Inputs:
+            None
+
+            Outputs:
+            None
+
+            Properties Used:
+            self.memory
+        """
+
+        end   = time.perf_counter()
+        stack = self._stack
+        path, step, start, inside, used, inside_peak = stack.pop()
+        elapsed = end - start
+
+        memory = 0
+        if self.memory:
+            current, peak = tracemalloc.get_traced_memory()
+            if hasattr(tracemalloc,'reset_peak'):
+                peak   = max(peak,inside_peak)
+                memory = peak - used
+            else:
+                memory = current - used
+                peak   = current
+            if stack:
+                stack[-1][5] = max(stack[-1][5],peak)
+
+        if stack:
+            stack[-1][3] += elapsed
+
+        record = self._records.get(path)
+        if record is None:
+            self._records[path] = [1,elapsed,elapsed-inside,memory]
+        else:
+            record[0] += 1
+            record[1] += elapsed
+            record[2] += elapsed - inside
+            record[3]  = max(record[3],memory)
+
+    def steps(self):
+        """ The records of the steps, in the order they were first called
+
+            Assumptions:
+            None
+
+            Source:
+            N/A
+
+            Inputs:
+            None
+
+            Outputs:
+            steps[path].calls       [Unitless]
+            steps[path].time        [s], with the steps inside
+            steps[path].self_time   [s], without the steps inside
+            steps[path].memory      [bytes], the peak memory
+
+            Properties Used:
+            None
+        """
+
+        steps = Data()
+        for path,record in self._records.items():
+            steps['.'.join(path)] = Data(calls     = record[0],
+                                         time      = record[1],
+                                         self_time = record[2],
+                                         memory    = record[3])
+        return steps
+
+    def table(self,sort='time',limit=None):
+        """ The records of the steps as a table, the slowest first
+
+            Assumptions:
+            None
+
+            Source:
+            N/A
+
+            Inputs:
+            sort      [string], 'time', 'self_time', 'calls' or 'memory'
+            limit     [int], the number of rows, all of them by default
+
+            Outputs:
+            table     [string]
+
+            Properties Used:
+            None
+        """
+
+        steps = self.steps()
+        paths = sorted(steps.keys(),key=lambda path: -steps[path][sort])[:limit]
+
+        total = sum(record[1] for path,record in self._records.items() if len(path) == 1) or 1.
+        width = max([len(path) for path in paths] + [4])
+
+        lines = ['%-*s %10s %10s %10s %7s %10s' % (width,'step','calls','time [s]','self [s]','%','peak [MB]')]
+        for path in paths:
+            step = steps[path]
+            lines.append('%-*s %10d %10.4f %10.4f %7.2f %10.3f' % (width,path,step.calls,step.time,step.self_time,
+                                                                    100.*step.time/total,step.memory/2.**20))
+
+        return '\n'.join(lines)
+
+    def folded(self):
+        """ The records of the steps as folded stacks, one line of
+            'step;step;step microseconds' per path with the time of the step
+            without the steps inside, as flame graph tools read them
+
+            Assumptions:
+            None
+
+            Source:
+            Brendan Gregg, FlameGraph, flamegraph.pl
+
+            Inputs:
+            None
+
+            Outputs:
+            folded    [string]
+
+            Properties Used:
+            None
+        """
+
+        lines = []
+        for path,record in self._records.items():
+            lines.append('%s %d' % (';'.join(path),int(round(record[2]*1e6))))
+
+        return '\n'.join(lines)
+
+    def save(self,filename,format='table'):
+        """ Writes the table or the folded stacks to a file
+
+            Assumptions:
+            None
+
+            Source:
+            N/A
+
+            Inputs:
+            filename  [string]
+            format    [string], 'table' or 'folded'
+
+            Outputs:
+            None
+
+            Properties Used:
+            None
+        """
+
+        if format == 'table':
+            text = self.table()
+        elif format == 'folded':
+            text = self.folded()
+        else:
+            raise ValueError("format must be 'table' or 'folded'")
+
+        with open(filename,'w') as output:
+            output.write(text + '\n')
+
+# ----------------------------------------------------------------------
+#  Helper Functions
+# ----------------------------------------------------------------------
+
+## @ingroup Analyses
+def evaluate_step(step,args,kwarg):
+    """ Evaluates one step of a process, as Process.evaluate() does
+
+        Assumptions:
+        None
+
+        Source:
+        N/A
+
+        Inputs:
+        step      [Process, function or Analysis]
+        args      [list]
+        kwarg     [dict]
+
+        Outputs:
+        result    the result of the step
+
+        Properties Used:
+        None
+    """
+
+    if hasattr(step,'evaluate'):
+        return step.evaluate(*args,**kwarg)
+    return step(*args,**kwarg)
+
+## @ingroup Analyses
+def find_process(top,process,path=()):
+    """ Finds the path of a process among the ones nested in another
+
+        Assumptions:
+        None
+
+        Source:
+        N/A
+
+        Inputs:
+        top       [Process]
+        process   [Process]
+
+        Outputs:
+        name      [string], the keys to the process joined by '.', None when it isn't there
+
+        Properties Used:
+        None
+    """
+
+    for tag,step in top.items():
+        if not isinstance(step,Process):
+            continue
+        if step is process:
+            return '.'.join(path + (tag,))
+        name = find_process(step,process,path + (tag,))
+        if name is not None:
+            return name
+
+    return None
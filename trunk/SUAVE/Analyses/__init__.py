@@ -6,6 +6,7 @@
 from .Analysis  import Analysis
 from .Sizing    import Sizing
 from .Process   import Process
+from .Process_Profile import Process_Profile
 from .Settings  import Settings
 from .Vehicle   import Vehicle
 
@@ -123,7 +123,7 @@ class Solar_Logic(Energy_Component):
         
         # Integrate the plevel over time to assess the energy consumption
         # or energy storage
-        e = np.dot(I,plevel)
+        e = I.dot(plevel)
         
         # Send or take power out of the battery, Pack up
         self.outputs.current         = (plevel/volts)
@@ -3,6 +3,7 @@
 # 
 # Created:  Aug 2014, E. Botero
 # Modified: Feb 2016, T. MacDonald
+#           Oct 2026, SUAVE Team
 
 # ------------------------------------------------------------
 #  Imports
@@ -24,6 +25,10 @@ class Energy_Component(Physical_Component):
     Source:
     N/A
     """      
+
+    # found in each evaluation, so left out of fingerprints
+    _fingerprint_ignore = ('inputs','outputs')
+
     def __defaults__(self):
         """This sets the default inputs and outputs data structure.
 
@@ -11,11 +11,6 @@
 import numpy as np
 from copy import deepcopy
 
-from sklearn import gaussian_process
-from sklearn.gaussian_process.kernels import Matern
-from sklearn import neighbors
-from sklearn import svm, linear_model
-
 # SUAVE imports
 from SUAVE.Core import Data, Units
 from SUAVE.Components.Energy.Networks import Propulsor_Surrogate
@@ -190,6 +185,8 @@ class PyCycle(Propulsor_Surrogate):
        
         # Pick the type of process
         if self.surrogate_type  == 'gaussian':
+            from sklearn import gaussian_process
+            from sklearn.gaussian_process.kernels import Matern
             gp_kernel = Matern()
             regr_sfc = gaussian_process.GaussianProcessRegressor(kernel=gp_kernel)
             regr_thr = gaussian_process.GaussianProcessRegressor(kernel=gp_kernel)      
@@ -197,18 +194,21 @@ class PyCycle(Propulsor_Surrogate):
             sfc_surrogate = regr_sfc.fit(xy, sfc)  
            
         elif self.surrogate_type  == 'knn':
+            from sklearn import neighbors
             regr_sfc = neighbors.KNeighborsRegressor(n_neighbors=1,weights='distance')
             regr_thr = neighbors.KNeighborsRegressor(n_neighbors=1,weights='distance')
             sfc_surrogate = regr_sfc.fit(xy, sfc)
             thr_surrogate = regr_thr.fit(xy, thr)  
    
         elif self.surrogate_type  == 'svr':
+            from sklearn import svm
             regr_thr = svm.SVR(C=500.)
             regr_sfc = svm.SVR(C=500.)
             sfc_surrogate  = regr_sfc.fit(xy, sfc)
             thr_surrogate  = regr_thr.fit(xy, thr)    
            
         elif self.surrogate_type == 'linear':
+            from sklearn import linear_model
             regr_thr = linear_model.LinearRegression()
             regr_sfc = linear_model.LinearRegression()          
             sfc_surrogate  = regr_sfc.fit(xy, sfc)
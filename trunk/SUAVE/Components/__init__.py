@@ -17,6 +17,72 @@ from . import Fuselages
 from . import Payloads
 from . import Energy
 from . import Systems
-from . import Configs
 from . import Landing_Gear
-from . import Costs
\ No newline at end of file
+from . import Costs
+
+# ----------------------------------------------------------------------
+#  Lazy Configs
+# ----------------------------------------------------------------------
+
+import sys
+from importlib import import_module
+from types import ModuleType
+
+class _Lazy_Components(ModuleType):
+    """ The Components module. The configs subclass the vehicle, which is
+        built from the components, so they are imported on first access,
+        whether the vehicle or the components are imported first.
+
+        Assumptions:
+        N/A
+
+        Source:
+        N/A
+    """
+
+    def __getattr__(self,name):
+        """ Imports the configs on first access
+
+            Assumptions:
+            N/A
+
+            Source:
+            N/A
+
+            Inputs:
+            name   [str]
+
+            Outputs:
+            module
+
+            Properties Used:
+            N/A
+        """
+
+        if name == 'Configs':
+            return import_module('.Configs', self.__name__)
+
+        raise AttributeError("module '%s' has no attribute '%s'" % (self.__name__,name))
+
+    def __dir__(self):
+        """ Lists the configs along with the loaded attributes
+
+            Assumptions:
+            N/A
+
+            Source:
+            N/A
+
+            Inputs:
+            N/A
+
+            Outputs:
+            names  [list]
+
+            Properties Used:
+            N/A
+        """
+
+        return sorted(set(ModuleType.__dir__(self)) | set(['Configs']))
+
+sys.modules[__name__].__class__ = _Lazy_Components
@@ -4,6 +4,7 @@
 # Created:  Jun 2016, E. Botero
 # Modified: Jan 2020, M. Clarke
 #           May 2020, E. Botero
+#           Oct 2026, SUAVE Team
 
 
 # ----------------------------------------------------------------------
@@ -17,9 +18,44 @@ chars = string.punctuation + string.whitespace
 t_table = str.maketrans( chars          + string.ascii_uppercase , 
                             '_'*len(chars) + string.ascii_lowercase )
 
-dictgetitem = dict.__getitem__
+from .Pack_Plan import Pack_Plan
+
+dictgetitem  = dict.__getitem__
+dictget      = dict.get
 objgetattrib = object.__getattribute__
 
+# sentinel for dictionary misses
+_missing = object()
+
+# attribute names resolvable through each class, built on first use
+_class_attribute_table = {}
+
+def _class_attributes(klass):
+    """ Returns the set of attribute names (methods, class variables, etc.)
+        that an instance of klass can resolve through its class hierarchy.
+        This lets attribute lookups be routed without raising exceptions.
+
+        Assumptions:
+        Class attributes added after the first lookup are not seen
+
+        Source:
+        N/A
+
+        Inputs:
+        klass      [class]
+
+        Outputs:
+        attributes [frozenset]
+
+        Properties Used:
+        N/A
+    """
+    attributes = _class_attribute_table.get(klass)
+    if attributes is None:
+        attributes = frozenset(dir(klass))
+        _class_attribute_table[klass] = attributes
+    return attributes
+
 # ----------------------------------------------------------------------
 #   Data
 # ----------------------------------------------------------------------        
@@ -37,11 +73,14 @@ class Data(dict):
         N/A
     """
     
+    # cached layout for pack_array and unpack_array
+    _pack_plan = None
+    
     def __getattribute__(self, k):
         """ Retrieves an attribute set by a key k
     
             Assumptions:
-            Does a try if it is a dict, but if that fails treats it as an object
+            Checks the dict first, if k is not there it treats it as an object
     
             Source:
             N/A
@@ -55,16 +94,16 @@ class Data(dict):
             Properties Used:
             N/A
             """         
-        try:
-            return dictgetitem(self,k)
-        except:
+        v = dictget(self,k,_missing)
+        if v is _missing:
             return objgetattrib(self,k)
+        return v
 
     def __setattr__(self, k, v):
         """ An override of the standard __setattr_ in Python.
             
             Assumptions:
-            This one tries to treat k as an object, if that fails it treats it as a key.
+            This one treats k as an object if it is a class or instance attribute, otherwise it treats it as a key.
     
             Source:
             N/A
@@ -79,18 +118,39 @@ class Data(dict):
             Properties Used:
             N/A    
         """
-        try:
-            objgetattrib(self, k)
-        except:
-            self[k] = v
-        else:          
+        if k in _class_attributes(type(self)) or k in objgetattrib(self,'__dict__'):
             object.__setattr__(self, k, v) 
+        else:
+            self[k] = v
+            
+    def __getstate__(self):
+        """ The state of the data copied and pickled with it, without the cached
+            layout of pack_array and unpack_array, which refers to this data's nodes
+    
+            Assumptions:
+            N/A
+    
+            Source:
+            N/A
+    
+            Inputs:
+            N/A
+    
+            Outputs:
+            state    [dict]
+    
+            Properties Used:
+            N/A    
+        """
+        state = dict(objgetattrib(self,'__dict__'))
+        state.pop('_pack_plan',None)
+        return state
             
     def __delattr__(self, k):
         """ An override of the standard __delattr_ in Python. This deletes whatever is called by k
             
             Assumptions:
-            This one tries to treat k as an object, if that fails it treats it as a key.
+            This one treats k as an object if it is a class or instance attribute, otherwise it treats it as a key.
     
             Source:
             N/A
@@ -104,12 +164,10 @@ class Data(dict):
             Properties Used:
             N/A    
         """        
-        try:
-            objgetattrib(self, k)
-        except:
-            del self[k]
-        else:
+        if k in _class_attributes(type(self)) or k in objgetattrib(self,'__dict__'):
             object.__delattr__(self, k)
+        else:
+            del self[k]
     
     def __defaults__(self):
         """ A stub for all classes that come later
@@ -428,9 +486,15 @@ class Data(dict):
             # recurse only if self's value is a Dict()
             if k.startswith('_'):
                 continue
+            
+            # only values that can update themselves are recursed into
+            a = dictget(self,k,_missing)
+            if a is _missing or not hasattr(a,'update'):
+                self[k] = v
+                continue
         
             try:
-                self[k].update(v)
+                a.update(v)
             except:
                 self[k] = v
         return         
@@ -570,6 +634,7 @@ class Data(dict):
                 will only pack int, float, np.array and np.matrix (max rank 2)
                 if using output = 'matrix', all data values must have 
                 same length (if 1D) or number of rows (if 2D), otherwise is skipped
+                vector output uses a cached Pack_Plan() of the data
     
             Source:
             N/A
@@ -595,6 +660,19 @@ class Data(dict):
         if not output in ('vector','array'): raise Exception('output type must be "vector" or "array"')        
         vector = output == 'vector'
         
+        # use the precompiled layout when possible
+        if vector:
+            plan = self._pack_plan
+            if plan is not None:
+                M = plan.pack()
+                if M is not None:
+                    return M
+            plan = Pack_Plan(self)
+            self._pack_plan = plan
+            M = plan.pack()
+            if M is not None:
+                return M
+        
         # list to pre-dump array elements
         M = []
         
@@ -658,7 +736,7 @@ class Data(dict):
             of the contained values are the same as the data from which the array was packed
     
             Assumptions:
-            N/A
+            1d vectors use a cached Pack_Plan() of the data
     
             Source:
             N/A
@@ -681,6 +759,16 @@ class Data(dict):
         # check input type
         vector = M.ndim  == 1
         
+        # use the precompiled layout when possible
+        if vector:
+            plan = self._pack_plan
+            if plan is not None and plan.unpack(M):
+                return self
+            plan = Pack_Plan(self)
+            self._pack_plan = plan
+            if plan.unpack(M):
+                return self
+        
         # valid types for output
         valid_types = ( int, float,
                         array_type,
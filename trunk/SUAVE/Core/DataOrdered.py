@@ -5,6 +5,7 @@
 # Modified: Sep 2016, E. Botero
 #           May 2020, E. Botero
 #           Jul 2020, E. Botero 
+#           Oct 2026, SUAVE Team
 
 
    
@@ -23,6 +24,8 @@ t_table = str.maketrans( chars          + string.ascii_uppercase ,
 from warnings import warn
 import numpy as np
 
+from .Data import _class_attributes, _missing
+
 # ----------------------------------------------------------------------
 #   Property Class
 # ----------------------------------------------------------------------   
@@ -539,9 +542,15 @@ class DataOrdered(OrderedDict):
             # recurse only if self's value is a Dict()
             if k.startswith('_'):
                 continue
+            
+            # only values that can update themselves are recursed into
+            a = getattr(self,k,_missing)
+            if a is _missing or not hasattr(a,'update'):
+                self[k] = v
+                continue
         
             try:
-                self[k].update(v)
+                a.update(v)
             except:
                 self[k] = v
         return 
@@ -682,8 +691,7 @@ class DataOrdered(OrderedDict):
         """        
         # Setting a new item creates a new link which goes at the end of the linked
         # list, and the inherited dictionary is updated with the new key/value pair.
-        if not hasattr(self,key) and not hasattr(self.__class__,key):
-        #if not self.has_key(key) and not hasattr(self.__class__,key):
+        if not key in self.__dict__ and not key in _class_attributes(self.__class__):
             root = dict.__getitem__(self,'_root')
             last = root[0]
             map  = dict.__getitem__(self,'_map')
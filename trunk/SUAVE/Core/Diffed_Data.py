@@ -4,15 +4,16 @@
 # Created:  Feb 2015, T. Lukacyzk
 # Modified: Feb 2016, T. MacDonald
 #           Jun 2016, E. Botero
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
 # ----------------------------------------------------------------------
 
-from copy import deepcopy
 from .Container import Container as ContainerBase
 from .Data import Data
-from .DataOrdered import DataOrdered
+from .DataOrdered import DataOrdered, _reconstructor
+from copy import deepcopy
 import numpy as np
 
 # ----------------------------------------------------------------------
@@ -25,7 +26,8 @@ class Diffed_Data(Data):
         This is useful for creating a new configuration of a vehicle.
 
         Assumptions:
-        N/A
+        The base is copied as with deepcopy, but for the read only arrays of the
+        base, which are shared with it
 
         Source:
         N/A
@@ -55,10 +57,10 @@ class Diffed_Data(Data):
         self._diff  = Data()
         
     def __init__(self,base=None):
-        """ Initializes the new Diffed_Data() class through a deepcopy
+        """ Initializes the new Diffed_Data() class through a shared_copy()
     
             Assumptions:
-            N/A
+            The _base and _diff of a Diffed_Data() base are not copied
     
             Source:
             N/A
@@ -74,7 +76,7 @@ class Diffed_Data(Data):
         """  
         if base is None: base = Data()
         self._base = base
-        this = deepcopy(base) # deepcopy is needed here to build configs - Feb 2016, T. MacDonald
+        this = shared_copy(base,skip=['_base','_diff'])
         Data.__init__(self,this)
         
     def store_diff(self):
@@ -304,6 +306,34 @@ def diff(A,B):
         N/A    
     """      
 
+    result = _diff(A,B)
+    
+    if result is None:
+        result = type(A)()
+        result.clear()
+    
+    return result
+
+def _diff(A,B):
+    """ Finds the differences of A from B, building the result only when one is found
+
+        Assumptions:
+        N/A
+
+        Source:
+        N/A
+
+        Inputs:
+        A
+        B
+
+        Outputs:
+        Result, None if there are no differences
+
+        Properties Used:
+        N/A    
+    """      
+
     keys = set([])
     keys.update( A.keys() )
     keys.update( B.keys() )
@@ -312,29 +342,191 @@ def diff(A,B):
         keys.remove('_base')
         keys.remove('_diff')
 
-    result = type(A)()
-    result.clear()
+    result = None
+    
+    A_get = A.get
+    B_get = B.get
 
     for key in keys:
-        va = A.get(key,None)
-        vb = B.get(key,None)
+        va = A_get(key,None)
+        vb = B_get(key,None)
+        
+        # shared with the base, nothing to compare
+        if va is vb or shares_array(va,vb):
+            continue
+        
         if isinstance(va,Data) and isinstance(vb,Data):
-            sub_diff = diff(va,vb)
-            if sub_diff:
-                result[key] = sub_diff
+            value = _diff(va,vb)
+            if value is None:
+                continue
 
         elif isinstance(va,Data) or isinstance(vb,Data):
-            result[key] = va
+            value = va
             
         elif isinstance(va,DataOrdered) and isinstance(vb,DataOrdered):
-            sub_diff = diff(va,vb)
-            if sub_diff:
-                result[key] = sub_diff
+            value = _diff(va,vb)
+            if value is None:
+                continue
 
         elif isinstance(va,DataOrdered) or isinstance(vb,DataOrdered):
-            result[key] = va        
+            value = va        
+
+        elif type(va) in _immutable_types and type(va) is type(vb):
+            if va == vb:
+                continue
+            value = va
+
+        elif np.all(va == vb):
+            continue
+        
+        else:
+            value = va
+        
+        if result is None:
+            result = type(A)()
+            result.clear()
+            
+        result[key] = value
+
+    return result
+
+# ------------------------------------------------------------
+#  Copying Functions
+# ------------------------------------------------------------
 
-        elif not np.all(va == vb):
-            result[key] = va
+# values that can only be replaced, never changed in place
+_immutable_types = frozenset([float,int,bool,str,complex,type(None),np.float64,np.int64,np.bool_])
+
+def shared_copy(A,memo=None,skip=()):
+    """ Copies A as deepcopy does, but shares the arrays of A that can't be
+        changed in place, like the memory mapped arrays of load_binary, instead
+        of copying them. The references between the copied nodes are kept.
+
+        Assumptions:
+        An array made read only is not made writeable again
+
+        Source:
+        N/A
+
+        Inputs:
+        A     
+        memo  [dict] of copies made so far, by id
+        skip  [list] of keys of A not to copy
+
+        Outputs:
+        Result
 
-    return result    
\ No newline at end of file
+        Properties Used:
+        N/A    
+    """  
+    
+    if type(A) in _immutable_types:
+        return A
+    
+    if memo is None: memo = {}
+    
+    key = id(A)
+    if key in memo:
+        return memo[key]
+    
+    if isinstance(A,DataOrdered):
+        _, (klass,items), state = A.__reduce__()
+        items  = [(k,shared_copy(v,memo)) for k,v in items if not k in skip]
+        result = _reconstructor(klass,items)
+        memo[key] = result
+        for k,v in state.items():
+            result.__dict__[k] = shared_copy(v,memo)
+        
+    elif isinstance(A,Data):
+        # no defaults, the keys are all copied
+        result = dict.__new__(type(A))
+        memo[key] = result
+        for k,v in vars(A).items():
+            if k != '_pack_plan':
+                result.__dict__[k] = shared_copy(v,memo)
+        for k,v in A.items():
+            if not k in skip:
+                dict.__setitem__(result,k,shared_copy(v,memo))
+            
+    elif type(A) is list:
+        result = []
+        memo[key] = result
+        result.extend([shared_copy(v,memo) for v in A])
+        
+    elif type(A) is dict:
+        result = {}
+        memo[key] = result
+        for k,v in A.items():
+            result[k] = shared_copy(v,memo)
+            
+    elif type(A) is tuple:
+        result = tuple([shared_copy(v,memo) for v in A])
+        memo[key] = result
+        
+    elif isinstance(A,np.ndarray) and read_only(A):
+        result = A
+        memo[key] = result
+        
+    else:
+        result = deepcopy(A,memo)
+    
+    return result
+
+def read_only(A):
+    """ Checks if an array can't be changed in place, through itself or
+        through any array or buffer whose memory it views
+
+        Assumptions:
+        N/A
+
+        Source:
+        N/A
+
+        Inputs:
+        A     [np.ndarray]
+
+        Outputs:
+        Result   [bool]
+
+        Properties Used:
+        N/A    
+    """  
+    
+    while isinstance(A,np.ndarray):
+        if A.flags.writeable:
+            return False
+        A = A.base
+        
+    if A is None:
+        return True
+    
+    try:
+        return memoryview(A).readonly
+    except TypeError:
+        return False
+
+def shares_array(va,vb):
+    """ Checks if two values are arrays that view the same memory in the same way
+
+        Assumptions:
+        N/A
+
+        Source:
+        N/A
+
+        Inputs:
+        va
+        vb
+
+        Outputs:
+        Result   [bool]
+
+        Properties Used:
+        N/A    
+    """  
+    
+    if not isinstance(va,np.ndarray) or not isinstance(vb,np.ndarray):
+        return False
+    
+    return va.__array_interface__['data'][0] == vb.__array_interface__['data'][0] \
+           and va.shape == vb.shape and va.strides == vb.strides and va.dtype == vb.dtype
\ No newline at end of file
@@ -0,0 +1,261 @@
+## @ingroup Core
+# Pack_Plan.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import numpy as np
+
+from .Arrays import array_type, matrix_type
+
+# entry kinds
+SKIP   = 0
+NODE   = 1
+SCALAR = 2
+ARRAY  = 3
+
+# ----------------------------------------------------------------------
+#   Pack Plan
+# ----------------------------------------------------------------------
+
+## @ingroup Core
+class Pack_Plan(object):
+    """ A precompiled layout of the numeric leaves in a Data() tree, used by
+        Data.pack_array() and Data.unpack_array() in 'vector' mode.
+
+        The plan records every node and leaf of the tree once, along with the
+        slice each leaf occupies in the packed vector. Packing then fills one
+        preallocated vector and unpacking writes each slice into its leaf in
+        place, without walking the tree again.
+
+        Assumptions:
+        The plan is checked against the tree before every use and is rebuilt
+        if any key, node, type, shape or dtype has changed. The plan refers to
+        the nodes of the tree it was built for, so it is not copied or pickled
+        with the data.
+
+        Source:
+        N/A
+    """
+
+    def __init__(self,data):
+        """ Walks the data in the same order as the recursive packing and records the layout
+
+            Assumptions:
+            Only int, float and np.array of rank 2 or less are packed, as in Data.pack_array()
+
+            Source:
+            N/A
+
+            Inputs:
+            data   [Data()]
+
+            Outputs:
+            N/A
+
+            Properties Used:
+            N/A
+        """
+
+        self.nodes   = []    # (node, number of keys)
+        self.entries = []    # (parent, key, kind, type or node, shape, dtype, start, stop)
+        self.valid   = True
+        self.size    = 0
+
+        dtypes = []
+
+        # the walk, in the same order as the recursive packing
+        def do_plan(node):
+            self.nodes.append((node,len(node)))
+            for k,v in node.items():
+
+                # recursion!
+                if isinstance(v,dict):
+                    self.entries.append((node,k,NODE,v,None,None,0,0))
+                    do_plan(v)
+                    continue
+
+                t = type(v)
+
+                # skip things that don't pack
+                if not isinstance(v,(int,float,array_type)):
+                    self.entries.append((node,k,SKIP,t,None,None,0,0))
+                    continue
+
+                # matrices and 0-d arrays are left to the recursive packing
+                if isinstance(v,matrix_type) or (isinstance(v,array_type) and v.ndim == 0):
+                    self.valid = False
+                    continue
+
+                # too big
+                if isinstance(v,array_type) and v.ndim > 2:
+                    self.entries.append((node,k,SKIP,t,v.shape,None,0,0))
+                    continue
+
+                if isinstance(v,array_type):
+                    kind  = ARRAY
+                    shape = v.shape
+                    dtype = v.dtype
+                    n     = v.size
+                else:
+                    kind  = SCALAR
+                    shape = ()
+                    dtype = np.result_type(t)
+                    n     = 1
+
+                start = self.size
+                self.size += n
+                self.entries.append((node,k,kind,t,shape,dtype,start,self.size))
+                dtypes.append(dtype)
+
+        do_plan(data)
+
+        self.dtype = np.result_type(*dtypes) if dtypes else np.dtype(float)
+
+    def pack(self):
+        """ Packs the leaves of the tree into a new 1D vector, checking the layout on the way
+
+            Assumptions:
+            N/A
+
+            Source:
+            N/A
+
+            Inputs:
+            N/A
+
+            Outputs:
+            vector [np.array], None if the tree no longer has this layout
+
+            Properties Used:
+            N/A
+        """
+
+        if not self.valid or not self.check_nodes():
+            return None
+
+        vector = np.empty(self.size,dtype=self.dtype)
+
+        try:
+            for parent,k,kind,t,shape,dtype,start,stop in self.entries:
+                v = parent[k]
+                if kind == ARRAY:
+                    if type(v) is not t or v.shape != shape or v.dtype != dtype:
+                        return None
+                    vector[start:stop] = v.ravel(order='F')
+                elif kind == SCALAR:
+                    if type(v) is not t:
+                        return None
+                    vector[start] = v
+                elif not self.check_entry(v,kind,t,shape):
+                    return None
+        except KeyError:
+            return None
+
+        return vector
+
+    def unpack(self,M):
+        """ Unpacks a 1D vector into the tree, checking the layout on the way. The arrays
+            of the tree are written in place, as by the recursive unpacking.
+
+            Assumptions:
+            N/A
+
+            Source:
+            N/A
+
+            Inputs:
+            M      [np.array]
+
+            Outputs:
+            success [bool], False if M or the tree do not match this layout
+
+            Properties Used:
+            N/A
+        """
+
+        if not self.valid or M.shape != (self.size,):
+            return False
+
+        if not self.check_nodes():
+            return False
+
+        try:
+            for i,(parent,k,kind,t,shape,dtype,start,stop) in enumerate(self.entries):
+                v = parent[k]
+                if kind == ARRAY:
+                    if type(v) is not t or v.shape != shape or v.dtype != dtype:
+                        return False
+                    v[...] = np.reshape(M[start:stop],shape,order='F')
+                elif kind == SCALAR:
+                    if type(v) is not t:
+                        return False
+                    v = M[start]
+                    parent[k] = v
+                    if type(v) is not t:
+                        self.entries[i] = (parent,k,kind,type(v),shape,dtype,start,stop)
+                elif not self.check_entry(v,kind,t,shape):
+                    return False
+        except KeyError:
+            return False
+
+        return True
+
+    def check_nodes(self):
+        """ Checks that no keys were added or removed in any node of the tree
+
+            Assumptions:
+            N/A
+
+            Source:
+            N/A
+
+            Inputs:
+            N/A
+
+            Outputs:
+            valid  [bool]
+
+            Properties Used:
+            N/A
+        """
+
+        for node,n in self.nodes:
+            if len(node) != n:
+                return False
+
+        return True
+
+    def check_entry(self,v,kind,t,shape):
+        """ Checks that a node or a skipped value is still what the plan was built for
+
+            Assumptions:
+            N/A
+
+            Source:
+            N/A
+
+            Inputs:
+            v      [value in the tree]
+            kind   [int]
+            t      [node or type]
+            shape  [tuple]
+
+            Outputs:
+            valid  [bool]
+
+            Properties Used:
+            N/A
+        """
+
+        if kind == NODE:
+            return v is t
+
+        if type(v) is not t:
+            return False
+
+        return shape is None or v.shape == shape
@@ -3,9 +3,10 @@
 #
 # Created:  Feb 2014, T. Lukacyzk
 # Modified: Feb 2016, T. MacDonald
+#           Oct 2026, SUAVE Team
 
 """ Implements base unit conversion style programming
-    by monkey patching Pint
+    with conversion factors precomputed from Pint
 """
 
 
@@ -14,119 +15,288 @@
 # ------------------------------------------------------------
 
 from SUAVE.Plugins.pint import UnitRegistry
-from SUAVE.Plugins.pint.quantity import _Quantity
 
-Units = UnitRegistry()
+import threading
 
 
 # ------------------------------------------------------------
-#   Monkey Patching
+#   Unit Registry
 # ------------------------------------------------------------
- 
-# multiplication covnverts in to base unit
+
 ## @ingroup Core
-def __rmul__(self,other):
-    """ Override the basic python multiplication for Units
+class Unit_Registry(object):
+    """ SUAVE.Core.Units
+        Unit conversion toolbox
+        Works by converting values in to and out of the base unit
 
-        Assumptions:
-        N/A
+        Important Note and Warning -
+            This does not enforce unit consistency!!!
+            Unit consistency is the responsibility of the user
 
-        Source:
-        N/A
+        Usage:
+          from SUAVE.Core import Units
+          a = 4. * Units.mm  # convert in to base unit
+          b = a  / Units.mm  # convert out of base unit
+          c = 2. * Units['miles/hour']
+
+        Comments:
+          Retreving an attribute of Units (ie Units.mm) returns
+          the conversion ratio to the base unit as a float.  So in
+          the above example Units.mm = 0.001, which is the conversion
+          ratio to meters.  Thus the * (multiplication) operation
+          converts from the current units to the base units and
+          / (division) operation converts from the base units to the
+          desired units.
+
+          The ratio of each unit is looked up in Pint once and cached,
+          so conversions never modify shared state and are safe to
+          use from several threads. Units with an offset (degF, degC)
+          return an Offset_Unit, which supports * and / only.
+
+        Base Units:
+          mass        : kilogram
+          length      : meters
+          time        : seconds
+          temperature : Kelvin
+          angle       : radian
+          current     : Ampere
+          luminsoity  : candela
+
+
+        Based on the Pint package, included in SUAVE.Plugins
+        https://pint.readthedocs.org/en/latest/
+    """
+
+    def __init__(self):
+        """ Creates the underlying Pint registry and the conversion caches
+
+            Assumptions:
+            N/A
+
+            Source:
+            N/A
+
+            Inputs:
+            N/A
+
+            Outputs:
+            N/A
+
+            Properties Used:
+            N/A
+        """
+        self._registry    = UnitRegistry()
+        self._expressions = {}
+        self._lock        = threading.Lock()
+
+    def __getattr__(self,name):
+        """ Returns the conversion ratio of a unit name, i.e. Units.ft. This is only
+            called the first time a unit is used, after which the ratio is an attribute.
+
+            Assumptions:
+            Public methods of the Pint registry are passed through
+
+            Source:
+            N/A
+
+            Inputs:
+            name   [str]
+
+            Outputs:
+            ratio  [float] or [Offset_Unit]
+
+            Properties Used:
+            N/A
+        """
+
+        # keep copy, pickle and friends from asking pint for units
+        if name.startswith('_'):
+            raise AttributeError(name)
+
+        registry = self.__dict__['_registry']
+        if hasattr(type(registry),name) or name in vars(registry):
+            return getattr(registry,name)
+
+        with self._lock:
+            unit = self.__dict__.get(name)
+            if unit is None:
+                unit = self._build(registry.Quantity(1.,name))
+                self.__dict__[name] = unit
+
+        return unit
+
+    def __getitem__(self,expression):
+        """ Returns the conversion ratio of a unit expression, i.e. Units['miles/hour']
+
+            Assumptions:
+            N/A
+
+            Source:
+            N/A
+
+            Inputs:
+            expression [str]
+
+            Outputs:
+            ratio      [float] or [Offset_Unit]
+
+            Properties Used:
+            N/A
+        """
+
+        unit = self._expressions.get(expression)
+        if unit is not None:
+            return unit
+
+        with self._lock:
+            unit = self._expressions.get(expression)
+            if unit is None:
+                unit = self._build(self._registry.parse_expression(expression))
+                self._expressions[expression] = unit
+
+        return unit
+
+    def _build(self,quantity):
+        """ Computes the conversion ratio of a Pint quantity to the base units
+
+            Assumptions:
+            Units whose conversion has no offset are treated as a ratio
+
+            Source:
+            N/A
+
+            Inputs:
+            quantity [pint Quantity]
+
+            Outputs:
+            ratio    [float] or [Offset_Unit]
+
+            Properties Used:
+            N/A
+        """
 
-        Inputs:
-        Other
+        registry     = self._registry
+        units        = quantity._units
+        factor, base = registry.get_base_units(units)
 
-        Outputs:
-        Converted into Base Units!
+        if factor is None:
+            # temperatures, only a ratio if there is no offset
+            if registry.convert(0.,units,base) != 0.:
+                return Offset_Unit(registry,units,base)
+            factor = registry.convert(1.,units,base)
 
-        Properties Used:
-        N/A    
-    """      
-    if isinstance(other,_Quantity):
-        return _Quantity.__rmul__(self,other)
-    else:
-        self._magnitude = other
-        self.ito_base_units()
-        return self.magnitude
+        return float(quantity.magnitude * factor)
+
+
+# ------------------------------------------------------------
+#   Offset Units
+# ------------------------------------------------------------
 
-# division converts out of base unit
 ## @ingroup Core
-def __rdiv__(self,other):
-    """ Override the basic python division for Units
+class Offset_Unit(object):
+    """ A unit whose conversion to the base unit has an offset, like degF.
+        Multiplication converts in to the base unit and division converts
+        out of it, like for every other unit.
 
         Assumptions:
         N/A
 
         Source:
         N/A
+    """
 
-        Inputs:
-        Other
-
-        Outputs:
-        Converted from Base Units!
-
-        Properties Used:
-        N/A    
-    """       
-    if isinstance(other,_Quantity):
-        return _Quantity.__truediv__(self,other)
-    else:
-        units = str(self._units)
-        self.ito_base_units()
-        self._magnitude = other
-        self.ito(units)
-        return self.magnitude
-
-# yay monkey patching!
-Units.Quantity.__mul__      = __rmul__
-Units.Quantity.__rmul__     = __rmul__
-Units.Quantity.__div__      = __rdiv__
-Units.Quantity.__truediv__  = __rdiv__
-Units.Quantity.__rdiv__     = __rdiv__
-Units.Quantity.__rtruediv__ = __rdiv__
-Units.Quantity.__getattr__  = getattr
-Units.Quantity.__array_prepare__ = None
-Units.Quantity.__array_wrap__    = None
-
-# doc string
-Units.__doc__ = \
-""" SUAVE.Attributes.Units()
-    Unit conversion toolbox
-    Works by converting values in to and out of the base unit
-    
-    Important Note and Warning - 
-        This does not enforce unit consistency!!!
-        Unit consistency is the responsibility of the user
-    
-    Usage:
-      from SUAVE.Core import Units
-      a = 4. * Units.mm  # convert in to base unit
-      b = a  / Units.mm  # convert out of base unit
-      
-    Comments:
-      Retreving an attribute of Units (ie Units.mm) returns 
-      the conversion ratio to the base unit.  So in the above
-      example Units.mm = 0.001, which is the conversion ratio
-      to meters.  Thus the * (multiplication) operation converts 
-      from the current units to the base units and / (division) 
-      operation converts from the base units to the desired units.
-     
-    Base Units:
-      mass        : kilogram
-      length      : meters
-      time        : seconds
-      temperature : Kelvin
-      angle       : radian
-      current     : Ampere
-      luminsoity  : candela
-      
-    
-    Based on the Pint package, included in SUAVE.Plugins
-    https://pint.readthedocs.org/en/latest/
-    
-"""
+    # keep numpy from broadcasting over this object, use the operators below
+    __array_ufunc__ = None
+
+    def __init__(self,registry,units,base):
+        """ Stores the units to convert between
+
+            Assumptions:
+            N/A
+
+            Source:
+            N/A
+
+            Inputs:
+            registry [pint UnitRegistry]
+            units    [pint UnitsContainer]
+            base     [pint UnitsContainer]
+
+            Outputs:
+            N/A
+
+            Properties Used:
+            N/A
+        """
+        self._registry = registry
+        self._units    = units
+        self._base     = base
+
+    def __rmul__(self,other):
+        """ Converts a value in to the base unit
+
+            Assumptions:
+            N/A
+
+            Source:
+            N/A
+
+            Inputs:
+            other  [float] or [np.array]
+
+            Outputs:
+            Converted into Base Units!
+
+            Properties Used:
+            N/A
+        """
+        return self._registry.convert(other,self._units,self._base)
+
+    __mul__ = __rmul__
+
+    def __rtruediv__(self,other):
+        """ Converts a value out of the base unit
+
+            Assumptions:
+            N/A
+
+            Source:
+            N/A
+
+            Inputs:
+            other  [float] or [np.array]
+
+            Outputs:
+            Converted from Base Units!
+
+            Properties Used:
+            N/A
+        """
+        return self._registry.convert(other,self._base,self._units)
+
+    def __repr__(self):
+        """ Shows the unit
+
+            Assumptions:
+            N/A
+
+            Source:
+            N/A
+
+            Inputs:
+            N/A
+
+            Outputs:
+            string
+
+            Properties Used:
+            N/A
+        """
+        return '<Offset_Unit %s>' % self._units
+
+
+# the registry
+Units = Unit_Registry()
 
 
 # ------------------------------------------------------------
@@ -134,35 +304,35 @@ Units.__doc__ = \
 # ------------------------------------------------------------
 
 if __name__ == '__main__':
-    
+
     import numpy as np
-    
+
     x = Units['miles/hour']
     y = Units.miles / Units.hour
     print(x)
     print(y)
-    
+
     x = Units['slug/ft**3']
     y = Units.slug / Units.ft**3
     print(x)
-    print(y)    
-    
+    print(y)
+
     a = 4. * Units.kilogram
     b = 5. * Units.gram
     v = np.array([3.,4.,6.]) * Units['miles/hour']
     t = 100 * Units.degF
-    
+
     print(a)
     print(b)
     print(v)
     print(t)
-    
+
     a = a / Units.g
     b = b / Units.g
     v = v / Units['miles/hour']
     t = t / Units.degF
-    
+
     print(a)
     print(b)
     print(v)
-    print(t)
\ No newline at end of file
+    print(t)
@@ -5,8 +5,10 @@ from .Arrays import *
 
 from .Data             import Data
 from .DataOrdered      import DataOrdered
-from .Diffed_Data      import Diffed_Data, diff
+from .Diffed_Data      import Diffed_Data, diff, shared_copy
 from .Container        import Container
 from .ContainerOrdered import ContainerOrdered
 
-from .Units import Units
\ No newline at end of file
+from .Units import Units
+
+from .fingerprint import fingerprint, fingerprint_ignore
\ No newline at end of file
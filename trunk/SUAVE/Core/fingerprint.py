@@ -0,0 +1,157 @@
+## @ingroup Core
+# fingerprint.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+import numpy as np
+import hashlib
+import types
+from functools import partial
+
+# the items the analyses write onto the vehicle in each evaluation, like the lift
+# curve slopes and the extended tails of the stability analysis and the vortex
+# distribution of the VLM, and the settings that only change how fast the VLM
+# runs, so they never tell a vehicle or an analysis apart
+fingerprint_ignore = frozenset(['CL_alpha','ep_alpha','extended','vortex_distribution',
+                                'number_of_threads','memory_budget','influence_cache_budget'])
+
+# ----------------------------------------------------------------------
+#  Fingerprint
+# ----------------------------------------------------------------------
+
+## @ingroup Core
+def fingerprint(value,digest,seen,ignore=fingerprint_ignore):
+    """ Adds a value to a hash: arrays by their bytes, Data by their items, sets
+        by their sorted items, functions by their names with their defaults and
+        the values they close over, partials by their function and arguments,
+        and other objects by their attributes, or by how they pickle when they
+        have none
+
+        Assumptions:
+        An object found twice is hashed the second time by the order it was first found in.
+        A class can name the items of its own that change in each evaluation, like the
+        inputs and outputs of the energy components, in _fingerprint_ignore, and they
+        aren't hashed.
+        A value that can't be told apart from others of its type by any of these,
+        raises a TypeError, so the key isn't used rather than shared by different values.
+
+        Source:
+        None
+
+        Inputs:
+        value
+        digest          [hashlib hash]
+        seen            [dict], the objects hashed so far, by id, with the order they were found in
+        ignore          [set], the keys of the items that aren't hashed, fingerprint_ignore by default
+
+        Outputs:
+        None
+
+        Properties Used:
+        None
+    """
+
+    if value is None or isinstance(value,(bool,int,float,complex,np.generic,range,slice)):
+        digest.update(repr(value).encode())
+
+    elif isinstance(value,str):
+        digest.update(value.encode())
+
+    elif isinstance(value,(bytes,bytearray)):
+        digest.update(type(value).__name__.encode())
+        digest.update(bytes(value))
+
+    elif isinstance(value,np.ndarray):
+        digest.update(('%s%s' % (value.dtype,value.shape)).encode())
+        if value.dtype == object:
+            for item in value.flat:
+                fingerprint(item,digest,seen,ignore)
+        else:
+            digest.update(np.ascontiguousarray(value).tobytes())
+
+    elif id(value) in seen:
+        digest.update(('ref%d' % seen[id(value)][0]).encode())
+
+    elif isinstance(value,dict):
+        seen[id(value)] = (len(seen),value)
+        digest.update(type(value).__name__.encode())
+        own = getattr(type(value),'_fingerprint_ignore',())
+        for key,item in value.items():
+            if key in ignore or key in own:
+                continue
+            digest.update(str(key).encode())
+            fingerprint(item,digest,seen,ignore)
+
+    elif isinstance(value,(list,tuple)):
+        seen[id(value)] = (len(seen),value)
+        digest.update(type(value).__name__.encode())
+        for item in value:
+            fingerprint(item,digest,seen,ignore)
+
+    elif isinstance(value,(set,frozenset)):
+        seen[id(value)] = (len(seen),value)
+        digest.update(type(value).__name__.encode())
+        # the same items in any order, each hashed on its own
+        items = []
+        for item in value:
+            item_digest = hashlib.sha1()
+            fingerprint(item,item_digest,dict(seen),ignore)
+            items.append(item_digest.digest())
+        for item in sorted(items):
+            digest.update(item)
+
+    elif isinstance(value,partial):
+        seen[id(value)] = (len(seen),value)
+        digest.update(b'partial')
+        fingerprint(value.func,digest,seen,ignore)
+        fingerprint(value.args,digest,seen,ignore)
+        fingerprint(dict(sorted(value.keywords.items())),digest,seen,ignore)
+
+    elif isinstance(value,types.FunctionType):
+        seen[id(value)] = (len(seen),value)
+        digest.update(('%s.%s' % (value.__module__,value.__qualname__)).encode())
+        fingerprint(value.__defaults__,digest,seen,ignore)
+        fingerprint(value.__kwdefaults__,digest,seen,ignore)
+        for cell in value.__closure__ or ():
+            try:
+                contents = cell.cell_contents
+            except ValueError:
+                # a variable closed over before it is assigned
+                contents = None
+            fingerprint(contents,digest,seen,ignore)
+
+    elif isinstance(value,types.MethodType):
+        seen[id(value)] = (len(seen),value)
+        digest.update(b'method')
+        fingerprint(value.__func__,digest,seen,ignore)
+        fingerprint(value.__self__,digest,seen,ignore)
+
+    elif isinstance(value,(type,types.BuiltinFunctionType,types.ModuleType,np.ufunc)):
+        # found by their name, and the object a builtin method is bound to
+        name     = getattr(value,'__qualname__',None) or value.__name__
+        bound_to = getattr(value,'__self__',None)
+        digest.update(('%s.%s' % (getattr(value,'__module__',''),name)).encode())
+        if bound_to is not None and not isinstance(bound_to,types.ModuleType):
+            fingerprint(bound_to,digest,seen,ignore)
+
+    elif hasattr(value,'__dict__'):
+        seen[id(value)] = (len(seen),value)
+        digest.update(type(value).__name__.encode())
+        fingerprint(vars(value),digest,seen,ignore)
+
+    else:
+        # the state the object pickles with
+        seen[id(value)] = (len(seen),value)
+        try:
+            reduced = value.__reduce_ex__(4)
+        except Exception:
+            reduced = None
+        if not isinstance(reduced,tuple) or len(reduced) < 2:
+            raise TypeError('%s can not be fingerprinted' % type(value).__name__)
+        digest.update(type(value).__name__.encode())
+        fingerprint(reduced[1:],digest,seen,ignore)
@@ -1,5 +1,7 @@
 ## @defgroup Input_Output-SUAVE SUAVE
-# Functions needed to save SUAVE data structures in JSON form
+# Functions needed to save SUAVE data structures in JSON form, or in binary form with an index in JSON
 # @ingroup Input_Output
 from .load import load
-from .archive import archive
\ No newline at end of file
+from .archive import archive
+from .load_binary import load_binary
+from .archive_binary import archive_binary
\ No newline at end of file
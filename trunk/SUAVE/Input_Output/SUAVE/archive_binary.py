@@ -0,0 +1,151 @@
+## @ingroup Input_Output-SUAVE
+# archive_binary.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+from SUAVE.Core import Data, DataOrdered
+import numpy as np
+import types
+import json
+import os
+
+# the version of the index
+binary_format  = 'SUAVE binary archive'
+binary_version = 1
+
+# values stored in the index as they are
+basic_types = frozenset([str,bool,int,float,type(None)])
+
+# ----------------------------------------------------------------------
+#  Method
+# ----------------------------------------------------------------------
+
+## @ingroup Input_Output-SUAVE
+def archive_binary(data,dirname):
+    """Saves a SUAVE data structure to a directory holding a JSON index of the
+    structure and one .npy file per numpy array. The arrays are written as they
+    are, and load_binary() can map them from disk instead of reading them.
+
+    Assumptions:
+    Data must be numpy arrays, numpy scalars, strings, booleans, floats, ints,
+    lists, tuples or SUAVE data structures. Functions are ignored and all other
+    data raises an error. Arrays of python objects are not supported.
+    The classes of the data structures are stored by name.
+
+    Source:
+    N/A
+
+    Inputs:
+    data       SUAVE data structure
+    dirname    <string> - directory to be output, created if needed
+
+    Outputs:
+    dirname    Directory with index.json and the arrays as <n>.npy
+
+    Properties Used:
+    N/A
+    """
+
+    if not os.path.isdir(dirname):
+        os.makedirs(dirname)
+
+    # an older archive is overwritten, without its index it doesn't load
+    index_file = os.path.join(dirname,'index.json')
+    if os.path.exists(index_file):
+        os.remove(index_file)
+
+    # Build the index, writing the arrays along the way
+    arrays = dict()
+    index  = dict(format  = binary_format,
+                  version = binary_version,
+                  data    = build_index_r(data,dirname,arrays))
+
+    # remove the arrays of an older archive that are left over
+    for name in os.listdir(dirname):
+        number = name[:-4]
+        if name.endswith('.npy') and number.isdigit() and int(number) >= len(arrays):
+            os.remove(os.path.join(dirname,name))
+
+    # Write the index last, so a partial archive doesn't load
+    index_string = json.dumps(index)
+    f = open(index_file,'w')
+    f.write(index_string)
+    f.close()
+
+## @ingroup Input_Output-SUAVE
+def build_index_r(v,dirname,arrays):
+    """Builds the JSON index of a value in a SUAVE data structure, writing
+    numpy arrays to their own files. This is the recursive step.
+
+    Assumptions:
+    Values of basic python types are stored as they are, everything
+    else is stored as a dictionary with a single key naming its kind.
+
+    Source:
+    N/A
+
+    Inputs:
+    v          value in a data structure
+    dirname    <string> - directory of the archive
+    arrays     dictionary of the arrays written so far, by id
+
+    Outputs:
+    ret        JSON compatible value
+
+    Properties Used:
+    N/A
+    """
+    tv = type(v) # Get value type
+
+    if tv in basic_types:
+        ret = v
+
+    elif isinstance(v,np.ndarray):
+        if v.dtype.hasobject:
+            raise TypeError('Arrays of objects can not be stored in a binary archive')
+        # arrays that appear twice are written once
+        n = arrays.get(id(v))
+        if n is None:
+            n = len(arrays)
+            arrays[id(v)] = n
+            np.save(os.path.join(dirname,'%d.npy' % n),np.asarray(v),allow_pickle=False)
+        ret = {'array' : n}
+
+    elif isinstance(v,np.generic):
+        ret = {'scalar' : v.item(), 'dtype' : v.dtype.str}
+
+    elif tv == list:
+        if all(type(x) in basic_types for x in v):
+            ret = v
+        else:
+            ret = [build_index_r(x,dirname,arrays) for x in v]
+
+    elif tv == tuple:
+        ret = {'tuple' : [build_index_r(x,dirname,arrays) for x in v]}
+
+    elif tv == types.FunctionType: # Functions cannot be stored
+        ret = None
+
+    elif isinstance(v,(Data,DataOrdered,dict)):
+        if isinstance(v,DataOrdered):
+            base = 'DataOrdered'
+        elif isinstance(v,Data):
+            base = 'Data'
+        else:
+            base = 'dict'
+        ret = {'class' : tv.__module__ + '.' + tv.__name__,
+               'base'  : base,
+               'items' : [[str(k),build_index_r(x,dirname,arrays)] for k,x in v.items()]}
+
+    elif callable(v):
+        ret = None
+
+    else:
+        raise TypeError('Unexpected data type in SUAVE data structure')
+
+    return ret
@@ -0,0 +1,158 @@
+## @ingroup Input_Output-SUAVE
+# load_binary.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+from SUAVE.Core import Data, DataOrdered
+from SUAVE.Core.DataOrdered import _reconstructor
+from .archive_binary import binary_format, binary_version
+from importlib import import_module
+import numpy as np
+import json
+import sys
+import os
+
+# ----------------------------------------------------------------------
+#  Method
+# ----------------------------------------------------------------------
+
+## @ingroup Input_Output-SUAVE
+def load_binary(dirname,mmap_mode='r'):
+    """Loads a SUAVE data structure saved by archive_binary(). The arrays are
+    memory mapped by default, so they are only read from disk when used.
+
+    Assumptions:
+    The directory was written by archive_binary().
+    Memory mapped arrays are read only with the default mmap_mode, copy them
+    to change them, or load with mmap_mode='c' to change them only in memory.
+
+    Source:
+    N/A
+
+    Inputs:
+    dirname    <string> - directory to be loaded
+    mmap_mode  <string> - passed to np.load, None reads the arrays into memory
+
+    Outputs:
+    data       SUAVE data structure
+
+    Properties Used:
+    N/A
+    """
+
+    # Get the index
+    f = open(os.path.join(dirname,'index.json'))
+    index = json.load(f)
+    f.close()
+
+    if index.get('format') != binary_format or index.get('version') != binary_version:
+        raise ValueError('%s is not a SUAVE binary archive' % dirname)
+
+    # Convert to SUAVE data structure
+    arrays = dict()
+    data   = build_data_r(index['data'],dirname,mmap_mode,arrays)
+
+    return data
+
+## @ingroup Input_Output-SUAVE
+def build_data_r(v,dirname,mmap_mode,arrays):
+    """Builds a SUAVE data structure from the index of a binary archive. This is
+    the recursive step.
+
+    Assumptions:
+    The index was created by archive_binary().
+
+    Source:
+    N/A
+
+    Inputs:
+    v          value in the index
+    dirname    <string> - directory of the archive
+    mmap_mode  <string> - passed to np.load
+    arrays     dictionary of the arrays loaded so far, by number
+
+    Outputs:
+    ret        value converted to needed format
+
+    Properties Used:
+    N/A
+    """
+    tv = type(v) # Get value type
+
+    if (tv == str) or (tv == bool) or (tv == int) or (tv == float) or (tv == type(None)):
+        ret = v
+
+    elif tv == list:
+        ret = [build_data_r(x,dirname,mmap_mode,arrays) for x in v]
+
+    elif 'array' in v:
+        n   = v['array']
+        ret = arrays.get(n)
+        if ret is None:
+            ret = np.load(os.path.join(dirname,'%d.npy' % n),mmap_mode=mmap_mode,allow_pickle=False)
+            arrays[n] = ret
+
+    elif 'scalar' in v:
+        ret = np.dtype(v['dtype']).type(v['scalar'])
+
+    elif 'tuple' in v:
+        ret = tuple([build_data_r(x,dirname,mmap_mode,arrays) for x in v['tuple']])
+
+    elif 'class' in v:
+        klass = find_class(v['class'],v['base'])
+        items = [(str(k),build_data_r(x,dirname,mmap_mode,arrays)) for k,x in v['items']]
+        if issubclass(klass,DataOrdered):
+            ret = _reconstructor(klass,items)
+        elif issubclass(klass,Data):
+            # no defaults, the keys are all stored
+            ret = dict.__new__(klass)
+            for k,x in items:
+                dict.__setitem__(ret,k,x)
+        else:
+            ret = klass(items)
+
+    else:
+        raise TypeError('Data type not expected in SUAVE binary archive')
+
+    return ret
+
+## @ingroup Input_Output-SUAVE
+def find_class(name,base):
+    """Finds the class of a data structure from its name in a binary archive.
+
+    Assumptions:
+    Only classes from SUAVE or from modules that are already imported are used,
+    others are replaced by their base type.
+
+    Source:
+    N/A
+
+    Inputs:
+    name       <string> - module and name of the class
+    base       <string> - 'Data', 'DataOrdered' or 'dict'
+
+    Outputs:
+    klass      class
+
+    Properties Used:
+    N/A
+    """
+
+    bases = {'Data' : Data, 'DataOrdered' : DataOrdered, 'dict' : dict}
+    base  = bases[base]
+
+    module, _, klass = name.rpartition('.')
+    if module in sys.modules or module.split('.')[0] == 'SUAVE':
+        try:
+            klass = getattr(import_module(module),klass)
+        except (ImportError,AttributeError):
+            klass = None
+        if isinstance(klass,type) and issubclass(klass,base):
+            return klass
+
+    return base
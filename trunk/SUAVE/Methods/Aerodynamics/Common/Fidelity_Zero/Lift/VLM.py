@@ -3,6 +3,7 @@
 # 
 # Created:  Oct 2020, E. Botero
 # Modified: May 2021, E. Botero     
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -11,8 +12,7 @@
 # package imports 
 import numpy as np 
 from SUAVE.Core import Data
-from SUAVE.Methods.Aerodynamics.Common.Fidelity_Zero.Lift.compute_wing_induced_velocity      import compute_wing_induced_velocity
-from SUAVE.Methods.Aerodynamics.Common.Fidelity_Zero.Lift.generate_wing_vortex_distribution  import generate_wing_vortex_distribution, compute_panel_area, compute_unit_normal
+from SUAVE.Methods.Aerodynamics.Common.Fidelity_Zero.Lift.influence_cache                    import cached_vortex_distribution, cached_influence, solve_vortex_strength, number_of_threads
 from SUAVE.Methods.Aerodynamics.Common.Fidelity_Zero.Lift.compute_RHS_matrix                 import compute_RHS_matrix 
 
 # ----------------------------------------------------------------------
@@ -23,7 +23,11 @@ from SUAVE.Methods.Aerodynamics.Common.Fidelity_Zero.Lift.compute_RHS_matrix
 def VLM(conditions,settings,geometry):
     """Uses the vortex lattice method to compute the lift, induced drag and moment coefficients  
 
-    Assumptions: None
+    Assumptions: 
+    The vortex distribution and, within settings.influence_cache_budget, the
+    factored influence matrices are kept, by geometry, discretization and mach
+    number, see influence_cache
+    The mach numbers are shared by settings.number_of_threads threads
 
     Source:
     1. Miranda, Luis R., Robert D. Elliot, and William M. Baker. "A generalized vortex 
@@ -62,6 +66,7 @@ def VLM(conditions,settings,geometry):
        settings.number_chordwise_vortices      [Unitless]
        settings.use_surrogate                  [Unitless]
        settings.propeller_wake_model           [Unitless]
+       settings.number_of_threads              [Unitless], optional
        conditions.aerodynamics.angle_of_attack [radians]
        conditions.freestream.mach_number       [Unitless]
        
@@ -116,41 +121,38 @@ def VLM(conditions,settings,geometry):
     ones = np.atleast_2d(np.ones_like(mach)) 
     len_mach = len(mach)
 
-    # generate vortex distribution 
-    VD   = generate_wing_vortex_distribution(geometry,settings)  
-    n_w  = VD.n_w    
-    n_cp = VD.n_cp  
-
-    # pack vortex distribution 
-    geometry.vortex_distribution = VD
+    # generate vortex distribution, or find it, and pack it
+    lattice = cached_vortex_distribution(geometry,settings)
+    VD      = lattice.vortex_distribution
+    n_w     = VD.n_w    
+    n_cp    = VD.n_cp  
     
     # Compute flow tangency conditions
-    phi   = np.arctan((VD.ZBC - VD.ZAC)/(VD.YBC - VD.YAC))*ones # dihedral angle 
-    delta = np.arctan((VD.ZC - VD.ZCH)/((VD.XC - VD.XCH)*ones)) # mean camber surface angle 
+    phi   = lattice.phi*ones   # dihedral angle 
+    delta = lattice.delta*ones # mean camber surface angle 
 
     # Build the vector 
     RHS  ,Vx_ind_total , Vz_ind_total , V_distribution , dt = compute_RHS_matrix(n_sw,n_cw,delta,phi,conditions,geometry,\
                                                                                  pwm,ito,wdt,nts )    
     
-    # Build induced velocity matrix, C_mn
+    # Build and factor the Aerodynamic Influence Coefficient Matrix, or find it
     # This is not affected by AoA, so we can use unique mach numbers only
     m_unique, inv = np.unique(mach,return_inverse=True)
     m_unique      = np.atleast_2d(m_unique).T
-    C_mn_small, s, CHORD, RFLAG_small, ZETA = compute_wing_induced_velocity(VD,n_sw,n_cw,m_unique)
+    influence     = cached_influence(lattice,settings,m_unique)
+    # s and CHORD are the strip values of one control point, 1 x n_cp, as read-only
+    # broadcast views shared by the cached lattice: they are only read here, copy them to write
+    s             = influence.s
+    CHORD         = influence.CHORD
+    ZETA          = influence.ZETA
     
-    C_mn  = C_mn_small[inv,:,:,:]
-    RFLAG = RFLAG_small[inv,:]
+    RFLAG = influence.RFLAG[inv,:]
 
     # Turn off sonic vortices when Mach>1
     RHS = RHS*RFLAG
-    
-    # Build Aerodynamic Influence Coefficient Matrix
-    A =   np.multiply(C_mn[:,:,:,0],np.atleast_3d(np.sin(delta)*np.cos(phi))) \
-        + np.multiply(C_mn[:,:,:,1],np.atleast_3d(np.cos(delta)*np.sin(phi))) \
-        - np.multiply(C_mn[:,:,:,2],np.atleast_3d(np.cos(phi)*np.cos(delta)))   # validated from book eqn 7.42      
 
     # Compute vortex strength  
-    gamma = np.linalg.solve(A,RHS)
+    gamma = solve_vortex_strength(influence.factors,inv,RHS,number_of_threads(settings))
 
     # ---------------------------------------------------------------------------------------
     # STEP 10: Compute Pressure Coefficient
@@ -14,4 +14,5 @@ from .compute_wing_wake                       import compute_wing_wake
 from .compute_propeller_nonuniform_freestream import compute_propeller_nonuniform_freestream
 from .generate_wing_vortex_distribution       import generate_wing_vortex_distribution, compute_unit_normal 
 from .fuselage_correction                     import fuselage_correction
+from .influence_cache                         import cached_vortex_distribution, cached_influence, release_influence, clear_influence_cache
 from .VLM                                     import VLM
\ No newline at end of file
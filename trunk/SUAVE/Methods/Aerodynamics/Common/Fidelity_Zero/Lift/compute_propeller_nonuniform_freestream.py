@@ -9,6 +9,7 @@
 # ----------------------------------------------------------------------
 import numpy as np
 import scipy as sp
+import scipy.interpolate
 from SUAVE.Methods.Geometry.Three_Dimensional import  orientation_product, orientation_transpose
 
 
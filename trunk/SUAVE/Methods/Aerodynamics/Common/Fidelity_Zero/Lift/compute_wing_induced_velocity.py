@@ -3,6 +3,7 @@
 # 
 # Created:  Dec 2020, E. Botero
 # Modified: May 2021, E. Botero  
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -10,13 +11,17 @@
 
 # package imports 
 import numpy as np 
+from SUAVE.Core import Data
 
 ## @ingroup Methods-Aerodynamics-Common-Fidelity_Zero-Lift
-def compute_wing_induced_velocity(VD,n_sw,n_cw,mach):
-    """ This computes the induced velocities at each control point of the vehicle vortex lattice 
+def compute_wing_induced_velocity(VD,n_sw,n_cw,mach,memory_budget=None):
+    """ This computes the induced velocities at each control point of the vehicle vortex lattice,
+    in tiles of control points that fit in a memory budget
 
     Assumptions: 
     Trailing vortex legs infinity are alligned to freestream
+    The budget bounds the temporaries of a tile, not the induced velocity matrix.
+    A tile has at least one control point.
 
     Source:  
     1. Miranda, Luis R., Robert D. Elliot, and William M. Baker. "A generalized vortex 
@@ -29,12 +34,14 @@ def compute_wing_induced_velocity(VD,n_sw,n_cw,mach):
     n_sw     - number_spanwise_vortices                       [Unitless]
     n_cw     - number_chordwise_vortices                      [Unitless] 
     mach                                                      [Unitless] 
+    memory_budget - bytes of the temporaries of a tile, or
+                    None for all the control points at once   [bytes]
     
     Outputs:                                
     C_mn     - total induced velocity matrix                  [Unitless] 
-    s        - semispan of the horshoe vortex                 [m] 
+    s        - semispan of the horshoe vortex, read-only      [m] 
     t        - tangent of the horshoe vortex                  [-] 
-    CHORD    - chord length for a panel                       [m] 
+    CHORD    - chord length for a panel, read-only            [m] 
     RFLAG    - sonic vortex flag                              [boolean] 
     ZETA     - tangent incidence angle of the chordwise strip [-] 
 
@@ -118,66 +125,25 @@ def compute_wing_induced_velocity(VD,n_sw,n_cw,mach):
     x1bar = (xb - xc)
     y1bar = (yb - yc)*costheta + (zb - zc)*sintheta
     
-    xobar = (xo - xc)
-    yobar = (yo - yc)*costheta + (zo - zc)*sintheta
-    zobar =-(yo - yc)*sintheta + (zo - zc)*costheta
-    
     # COMPUTE COORDINATES OF RECEIVING POINT WITH RESPECT TO END POINTS OF SKEWED LEG.
-    shape   = np.shape(xobar)
-    shape_0 = shape[0]
-    shape_1 = shape[1]
-    s       = np.abs(y1bar)
-    t       = x1bar/y1bar  
-    s       = np.repeat(s,shape_0,axis=0)
-    t       = np.repeat(t,shape_0,axis=0)
-    
-    X1 = xobar + t*s # In a planar case XC-XAH
-    Y1 = yobar + s   # In a planar case YC-YAH
-    X2 = xobar - t*s # In a planar case XC-XBH
-    Y2 = yobar - s   # In a planar case YC-YBH
+    shape_0 = np.shape(xo)[0]
+    shape_1 = np.shape(xa)[1]
+    s_row   = np.abs(y1bar)
+    t_row   = x1bar/y1bar  
     
     # The cutoff hardcoded into vorlax
     CUTOFF = 0.8
     
-    # CALCULATE AXIAL DISTANCE BETWEEN PROJECTION OF RECEIVING POINT ONTO HORSESHOE PLANE AND EXTENSION OF SKEWED LEG.
-    XTY = xobar - t*yobar
-    
     # The notation in this method is flipped from the paper
     B2 = np.atleast_3d(mach**2-1.)
     
-    # SET VALUES OF NUMERICAL TOLERANCE CONSTANTS.
-    TOL    = s /500.0
-    TOLSQ  = TOL *TOL
-    TOLSQ2 = 2500.0 *TOLSQ
-    ZSQ    = zobar *zobar
-    YSQ1   = Y1 *Y1
-    YSQ2   = Y2 *Y2
-    RTV1   = YSQ1 + ZSQ
-    RTV2   = YSQ2 + ZSQ
-    XSQ1   = X1 *X1
-    XSQ2   = X2 *X2
-    
     # Split the vectors into subsonic and supersonic
     sub      = (B2<0)[:,0,0]
+    sup      = (B2>=0)[:,0,0]
     B2_sub   = B2[sub,:,:]
-    RO1_sub  = B2_sub*RTV1
-    RO2_sub  = B2_sub*RTV2
-    
-    # ZERO-OUT PERTURBATION VELOCITY COMPONENTS
-    U = np.zeros((n_mach,shape_0,shape_1),dtype=np.float32)
-    V = np.zeros((n_mach,shape_0,shape_1),dtype=np.float32)
-    W = np.zeros((n_mach,shape_0,shape_1),dtype=np.float32)    
-    
-    if np.sum(sub)>0:
-        # COMPUTATION FOR SUBSONIC HORSESHOE VORTEX
-        U[sub], V[sub], W[sub] = subsonic(zobar,XSQ1,RO1_sub,XSQ2,RO2_sub,XTY,t,B2_sub,ZSQ,TOLSQ,X1,Y1,X2,Y2,RTV1,RTV2)   
+    B2_sup   = B2[sup,:,:]
 
-    
-    # COMPUTATION FOR SUPERSONIC HORSESHOE VORTEX
-    sup         = (B2>=0)[:,0,0]
-    B2_sup      = B2[sup,:,:]
-    RO1_sup     = B2[sup,:,:]*RTV1
-    RO2_sup     = B2[sup,:,:]*RTV2
+    # The chords of the strips
     RNMAX       = n_cw # number of chordwise panels
     LE_A_pts_x  = XA1[:,0::n_cw]
     LE_B_pts_x  = XB1[:,0::n_cw]
@@ -189,20 +155,229 @@ def compute_wing_induced_velocity(VD,n_sw,n_cw,mach):
     TE_Z        = (ZB_TE + ZA_TE)/2
     LE_X        = np.repeat(LE_X,n_cw,axis=1)
     LE_Z        = np.repeat(LE_Z,n_cw,axis=1)    
-    CHORD       = np.sqrt((TE_X-LE_X)**2 + (TE_Z-LE_Z)**2)
-    CHORD       = np.repeat(CHORD,shape_0,axis=0)
+    CHORD_row   = np.sqrt((TE_X-LE_X)**2 + (TE_Z-LE_Z)**2)
     ZETA        = (LE_Z[0,:]-TE_Z[0,:])/(LE_X[0,:]-TE_X[0,:]) # Zeta is the tangent incidence angle of the chordwise strip. LE to TE
     RFLAG       = np.ones((n_mach,shape_1),dtype=np.int8)
     
     if np.sum(sup)>0:
-        U[sup], V[sup], W[sup], RFLAG[sup,:] = supersonic(zobar,XSQ1,RO1_sup,XSQ2,RO2_sup,XTY,t,B2_sup,ZSQ,TOLSQ,TOL,TOLSQ2,\
-                                                    X1,Y1,X2,Y2,RTV1,RTV2,CUTOFF,CHORD,RNMAX,n_cw,n_cp,n_w)
-         
+        RFLAG[sup,:], sonic = sonic_vortices(t_row*t_row,B2_sup,n_cw,shape_0,shape_1)
+    
+    # The control points of a tile
+    if memory_budget is None:
+        n_rows = shape_0
+    else:
+        n_rows = int(memory_budget // (tile_bytes(n_mach,shape_1)))
+        n_rows = min(max(n_rows,1),shape_0)
     
-    # Rotate into the vehicle frame and pack into a velocity matrix
-    C_mn = np.stack([U, V*costheta - W*sintheta, V*sintheta + W*costheta],axis=-1)
+    # ZERO-OUT PERTURBATION VELOCITY COMPONENTS
+    C_mn = np.zeros((n_mach,shape_0,shape_1,3),dtype=np.float32)
+    
+    for start in range(0,shape_0,n_rows):
+        rows = slice(start,min(start+n_rows,shape_0))
+        
+        xobar = (xo[rows] - xc)
+        yobar = (yo[rows] - yc)*costheta + (zo[rows] - zc)*sintheta
+        zobar =-(yo[rows] - yc)*sintheta + (zo[rows] - zc)*costheta
+        
+        shape_r = np.shape(xobar)[0]
+        s       = np.repeat(s_row,shape_r,axis=0)
+        t       = np.repeat(t_row,shape_r,axis=0)
+        
+        X1 = xobar + t*s # In a planar case XC-XAH
+        Y1 = yobar + s   # In a planar case YC-YAH
+        X2 = xobar - t*s # In a planar case XC-XBH
+        Y2 = yobar - s   # In a planar case YC-YBH
+        
+        # CALCULATE AXIAL DISTANCE BETWEEN PROJECTION OF RECEIVING POINT ONTO HORSESHOE PLANE AND EXTENSION OF SKEWED LEG.
+        XTY = xobar - t*yobar
+        
+        # SET VALUES OF NUMERICAL TOLERANCE CONSTANTS.
+        TOL    = s /500.0
+        TOLSQ  = TOL *TOL
+        TOLSQ2 = 2500.0 *TOLSQ
+        ZSQ    = zobar *zobar
+        YSQ1   = Y1 *Y1
+        YSQ2   = Y2 *Y2
+        RTV1   = YSQ1 + ZSQ
+        RTV2   = YSQ2 + ZSQ
+        XSQ1   = X1 *X1
+        XSQ2   = X2 *X2
+        
+        U = np.zeros((n_mach,shape_r,shape_1),dtype=np.float32)
+        V = np.zeros((n_mach,shape_r,shape_1),dtype=np.float32)
+        W = np.zeros((n_mach,shape_r,shape_1),dtype=np.float32)    
+        
+        if np.sum(sub)>0:
+            # COMPUTATION FOR SUBSONIC HORSESHOE VORTEX
+            RO1_sub  = B2_sub*RTV1
+            RO2_sub  = B2_sub*RTV2
+            U[sub], V[sub], W[sub] = subsonic(zobar,XSQ1,RO1_sub,XSQ2,RO2_sub,XTY,t,B2_sub,ZSQ,TOLSQ,X1,Y1,X2,Y2,RTV1,RTV2)   
+            del RO1_sub, RO2_sub
+        
+        if np.sum(sup)>0:
+            # COMPUTATION FOR SUPERSONIC HORSESHOE VORTEX
+            RO1_sup  = B2_sup*RTV1
+            RO2_sup  = B2_sup*RTV2
+            CHORD    = np.repeat(CHORD_row,shape_r,axis=0)
+            eye      = np.eye(shape_r,shape_1,k=start,dtype=np.int8)
+            U_sup, V_sup, W_sup = supersonic(zobar,XSQ1,RO1_sup,XSQ2,RO2_sup,XTY,t,B2_sup,ZSQ,TOLSQ,TOL,TOLSQ2,\
+                                             X1,Y1,X2,Y2,RTV1,RTV2,CUTOFF,CHORD,RNMAX,eye)
+            del RO1_sup, RO2_sup
+            apply_sonic_vortices(W_sup,sonic,rows)
+            U[sup], V[sup], W[sup] = U_sup, V_sup, W_sup
+            del U_sup, V_sup, W_sup
+        
+        # Rotate into the vehicle frame and pack into a velocity matrix
+        C_mn[:,rows,:,0] = U
+        C_mn[:,rows,:,1] = V*costheta - W*sintheta
+        C_mn[:,rows,:,2] = V*sintheta + W*costheta
+        
+    # The strip values are the same for every control point
+    s     = np.broadcast_to(s_row,(shape_0,shape_1))
+    CHORD = np.broadcast_to(CHORD_row,(shape_0,shape_1))
 
     return C_mn, s, CHORD, RFLAG, ZETA
+
+## @ingroup Methods-Aerodynamics-Common-Fidelity_Zero-Lift
+def tile_bytes(n_mach,n_vortices):
+    """ The bytes of the temporaries of compute_wing_induced_velocity for each
+    control point of a tile
+
+    Assumptions: 
+    Measured with tracemalloc, for subsonic and supersonic mach numbers
+
+    Source:  
+    N/A
+
+    Inputs: 
+    n_mach       number of mach numbers                   [Unitless]
+    n_vortices   number of horseshoe vortices             [Unitless]
+    
+    Outputs:           
+    bytes                                                 [bytes]
+
+    Properties Used:
+    N/A
+    """
+    
+    return n_vortices*(80*n_mach + 160)
+
+## @ingroup Methods-Aerodynamics-Common-Fidelity_Zero-Lift
+def sonic_vortices(T2,B2,n_cw,shape_0,shape_1):
+    """ This finds the horseshoe vortices with a sonic transverse leg at each
+    supersonic mach number, and the normalwash coefficients that change for them
+
+    Assumptions: 
+    None
+
+    Source:  
+    1. Miranda, Luis R., Robert D. Elliot, and William M. Baker. "A generalized vortex 
+    lattice method for subsonic and supersonic flow applications." (1977). (NASA CR)
+    
+    2. VORLAX Source Code
+
+    Inputs: 
+    T2      tangent of the horshoe vortex squared        [-]
+    B2      mach^2-1 (-beta2)                            [-] 
+    n_cw    number of chordwise panels                   [-]
+    shape_0 number of control points                     [-]
+    shape_1 number of horseshoe vortices                 [-]
+
+    Outputs:           
+    RFLAG   sonic vortex flag                            [boolean] 
+    sonic.
+      flags    the control points of sonic vortices      [boolean]
+      index    mach, control point and vortex of the 
+               changed coefficients                      [-]
+      values   their coefficients                        [-]
+
+    Properties Used:
+    N/A
+    """
+    
+    # DETERMINE IF TRANSVERSE VORTEX LEG OF HORSESHOE ASSOCIATED TO THE
+    # CONTROL POINT UNDER CONSIDERATION IS SONIC (SWEPT PARALLEL TO MACH
+    # LINE)? IF SO THEN RFLAG = 0.0, OTHERWISE RFLAG = 1.0.
+    size   = shape_1
+    n_mach = np.shape(B2)[0]    
+    T2S = np.atleast_2d(T2[0,:])*np.ones((n_mach,1))
+    T2F = np.zeros((n_mach,size))
+    T2A = np.zeros((n_mach,size))
+    
+    # Setup masks
+    F_mask = np.ones((n_mach,size),dtype=np.bool8)
+    A_mask = np.ones((n_mach,size),dtype=np.bool8)
+    F_mask[:,(n_cw-1)::n_cw] = False
+    A_mask[:,::n_cw]         = False
+    
+    # Apply the mask
+    T2F[A_mask] = T2S[F_mask]
+    T2A[F_mask] = T2S[A_mask]
+    
+    # Zero out terms on the LE and TE
+    T2F[:,(n_cw-1)::n_cw] = 0.
+    T2A[:,0::n_cw]        = 0.
+
+    TRANS = (B2[:,:,0]-T2F)*(B2[:,:,0]-T2A)
+    
+    RFLAG = np.ones((n_mach,size),dtype=np.int8)
+    RFLAG[TRANS<0] = 0.
+    
+    # IF CONTROL POINT BELONGS TO A SONIC HORSESHOE VORTEX, AND THE
+    # SENDING ELEMENT IS SUCH HORSESHOE, THEN MODIFY THE NORMALWASH
+    # COEFFICIENTS IN SUCH A WAY THAT THE STRENGTH OF THE SONIC VORTEX
+    # WILL BE THE AVERAGE OF THE STRENGTHS OF THE HORSESHOES IMMEDIATELY
+    # IN FRONT OF AND BEHIND IT. The self velocity goes to 2, the panels 
+    # before and after go to -1, counted through the whole matrix
+    FLAG_bool     = TRANS<0
+    FLAG_ind      = np.array(np.where(FLAG_bool))
+    FLAG_bool_self = FLAG_ind[0]*shape_0*shape_1 + FLAG_ind[1]*shape_1 + FLAG_ind[1]
+    FLAG_bool_bef = FLAG_bool_self - 1
+    FLAG_bool_aft = FLAG_bool_self + 1
+    
+    flat   = np.concatenate([FLAG_bool_self,FLAG_bool_bef,FLAG_bool_aft]) % (n_mach*shape_0*shape_1)
+    values = np.concatenate([2.*np.ones_like(FLAG_bool_self),-1.*np.ones_like(FLAG_bool_bef),-1.*np.ones_like(FLAG_bool_aft)])
+    
+    sonic = Data()
+    sonic.flags  = FLAG_bool
+    sonic.index  = np.unravel_index(flat,(n_mach,shape_0,shape_1))
+    sonic.values = values
+
+    return RFLAG, sonic
+
+## @ingroup Methods-Aerodynamics-Common-Fidelity_Zero-Lift
+def apply_sonic_vortices(W,sonic,rows):
+    """ This changes the normalwash coefficients of the sonic vortices found
+    by sonic_vortices for a tile of control points
+
+    Assumptions: 
+    None
+
+    Source:  
+    N/A
+
+    Inputs: 
+    W       Z velocity, of the tile                      [unitless]
+    sonic   see sonic_vortices
+    rows    the control points of the tile               [slice]
+
+    Outputs:           
+    W       Z velocity, changed in place                 [unitless]
+
+    Properties Used:
+    N/A
+    """
+    
+    # Zero out the row, default to zero
+    flags = sonic.flags[:,rows]
+    W[np.broadcast_to(flags[:,:,None],np.shape(W))] = 0.
+    
+    # Then the coefficients in the tile, in order
+    mach, point, vortex = sonic.index
+    inside = (point>=rows.start) & (point<rows.stop)
+    W[mach[inside],point[inside]-rows.start,vortex[inside]] = sonic.values[inside]
+    
+    return W
     
 def subsonic(Z,XSQ1,RO1,XSQ2,RO2,XTY,T,B2,ZSQ,TOLSQ,X1,Y1,X2,Y2,RTV1,RTV2):
     """  This computes the induced velocities at each control point 
@@ -274,7 +449,7 @@ def subsonic(Z,XSQ1,RO1,XSQ2,RO2,XTY,T,B2,ZSQ,TOLSQ,X1,Y1,X2,Y2,RTV1,RTV2):
     
     return U, V, W
 
-def supersonic(Z,XSQ1,RO1,XSQ2,RO2,XTY,T,B2,ZSQ,TOLSQ,TOL,TOLSQ2,X1,Y1,X2,Y2,RTV1,RTV2,CUTOFF,CHORD,RNMAX,n_cw,n_cp,n_w):
+def supersonic(Z,XSQ1,RO1,XSQ2,RO2,XTY,T,B2,ZSQ,TOLSQ,TOL,TOLSQ2,X1,Y1,X2,Y2,RTV1,RTV2,CUTOFF,CHORD,RNMAX,eye):
     """  This computes the induced velocities at each control point 
     of the vehicle vortex lattice for supersonic mach numbers
 
@@ -307,16 +482,13 @@ def supersonic(Z,XSQ1,RO1,XSQ2,RO2,XTY,T,B2,ZSQ,TOLSQ,TOL,TOLSQ2,X1,Y1,X2,Y2,RTV
     CUTOFF  coefficient                                  [-]
     CHORD   chord length for a panel                     [m] 
     RNMAX   number of chordwise panels                   [-]
-    n_cw    number of chordwise panels                   [-]
-    n_cp    number of control points                     [-]
-    n_w     number of wings                              [-]
+    eye     the vortex of each control point             [-]
 
     
     Outputs:           
     U       X velocity        [unitless]
     V       Y velocity        [unitless]
     W       Z velocity        [unitless]
-    RFLAG   sonic vortex flag [boolean] 
 
     Properties Used:
     N/A
@@ -407,81 +579,18 @@ def supersonic(Z,XSQ1,RO1,XSQ2,RO2,XTY,T,B2,ZSQ,TOLSQ,TOL,TOLSQ2,X1,Y1,X2,Y2,RTV
     V[in_plane] = 0.
     W[in_plane] = W_in
     
-    # DETERMINE IF TRANSVERSE VORTEX LEG OF HORSESHOE ASSOCIATED TO THE
-    # CONTROL POINT UNDER CONSIDERATION IS SONIC (SWEPT PARALLEL TO MACH
-    # LINE)? IF SO THEN RFLAG = 0.0, OTHERWISE RFLAG = 1.0.
-    size   = shape[1]
-    n_mach = shape[0]    
-    T2S = np.atleast_2d(T2[0,:])*np.ones((n_mach,1))
-    T2F = np.zeros((n_mach,size))
-    T2A = np.zeros((n_mach,size))
-    
-    # Setup masks
-    F_mask = np.ones((n_mach,size),dtype=np.bool8)
-    A_mask = np.ones((n_mach,size),dtype=np.bool8)
-    F_mask[:,(n_cw-1)::n_cw] = False
-    A_mask[:,::n_cw]         = False
-    
-    # Apply the mask
-    T2F[A_mask] = T2S[F_mask]
-    T2A[F_mask] = T2S[A_mask]
-    
-    # Zero out terms on the LE and TE
-    T2F[:,(n_cw-1)::n_cw] = 0.
-    T2A[:,0::n_cw]        = 0.
-
-    TRANS = (B2[:,:,0]-T2F)*(B2[:,:,0]-T2A)
-    
-    RFLAG = np.ones((n_mach,size),dtype=np.int8)
-    RFLAG[TRANS<0] = 0.
-    
-    FLAG_bool          = np.zeros_like(TRANS,dtype=bool)
-    FLAG_bool[TRANS<0] = True
-    FLAG_bool          = np.reshape(FLAG_bool,(n_mach,size,-1))
-    
-
     # COMPUTE THE GENERALIZED PRINCIPAL PART OF THE VORTEX-INDUCED VELOCITY INTEGRAL, WWAVE.
     # FROM LINE 2647 VORLAX, the IR .NE. IRR means that we're looking at vortices that affect themselves
     WWAVE   = np.zeros(shape,dtype=np.float32)
     COX     = CHORD /RNMAX
-    eye     = np.eye(n_cp*n_w,dtype=np.int8)
     T2      = np.broadcast_to(T2,shape)*eye
     B2_full = np.broadcast_to(B2,shape)*eye
     COX     = np.broadcast_to(COX,shape)*eye
     WWAVE[B2_full>T2] = - 0.5 *np.sqrt(B2_full[B2_full>T2] -T2[B2_full>T2] )/COX[B2_full>T2] 
 
     W = W + WWAVE    
-    
-    # IF CONTROL POINT BELONGS TO A SONIC HORSESHOE VORTEX, AND THE
-    # SENDING ELEMENT IS SUCH HORSESHOE, THEN MODIFY THE NORMALWASH
-    # COEFFICIENTS IN SUCH A WAY THAT THE STRENGTH OF THE SONIC VORTEX
-    # WILL BE THE AVERAGE OF THE STRENGTHS OF THE HORSESHOES IMMEDIATELY
-    # IN FRONT OF AND BEHIND IT.
-    
-    # Zero out the row
-    FLAG_bool_rep     = np.broadcast_to(FLAG_bool,shape)
-    W[FLAG_bool_rep]  = 0. # Default to zero
-
-    # The self velocity goes to 2
-    FLAG_bool_split   = np.array(np.split(FLAG_bool.ravel(),n_mach))
-    FLAG_ind          = np.array(np.where(FLAG_bool_split))
-    squares           = np.zeros((size,size,n_mach))
-    squares[FLAG_ind[1],FLAG_ind[1],FLAG_ind[0]] = 1
-    squares           = np.ravel(squares,order='F')
-    
-    FLAG_bool_self    = np.where(squares==1)[0]
-    W                 = W.ravel()
-    W[FLAG_bool_self] = 2. # It's own value, -2
-    
-    # The panels before and after go to -1
-    FLAG_bool_bef = FLAG_bool_self - 1
-    FLAG_bool_aft = FLAG_bool_self + 1
-    W[FLAG_bool_bef] = -1.
-    W[FLAG_bool_aft] = -1.
-    
-    W = np.reshape(W,shape)
 
-    return U, V, W, RFLAG
+    return U, V, W
 
 
 def supersonic_in_plane(RAD1,RAD2,Y1,Y2,TOL,XTY,CPI):
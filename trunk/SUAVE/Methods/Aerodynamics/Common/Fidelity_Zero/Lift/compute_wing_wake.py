@@ -9,7 +9,6 @@
 # ----------------------------------------------------------------------
 import copy
 import numpy as np
-import pylab as plt
 from SUAVE.Core import Data
 from SUAVE.Methods.Aerodynamics.Common.Fidelity_Zero.Lift.VLM import VLM
 from SUAVE.Methods.Aerodynamics.Common.Fidelity_Zero.Lift.compute_wing_induced_velocity import compute_wing_induced_velocity
@@ -124,6 +123,7 @@ def compute_wing_wake(geometry, conditions, x, grid_settings, VLM_settings, visc
     
     # Contour plots of the flow field behind the wing
     if plot_wake:
+        import pylab as plt
         xplot = grid_points.yline/(0.5*span)
         yplot = grid_points.zline
         zplot_w = np.reshape(w, (len(grid_points.yline),len(grid_points.zline))).T
@@ -8,7 +8,6 @@
 #  Imports
 # ----------------------------------------------------------------------
 import numpy as np
-import pylab as plt
 from SUAVE.Core import Data
 
 def generate_propeller_grid(prop, grid_settings, plot_grid=True):
@@ -73,6 +72,7 @@ def generate_propeller_grid(prop, grid_settings, plot_grid=True):
     grid_points.Na     = Na
     
     if plot_grid:
+        import pylab as plt
         
         # plot the grid points
         fig  = plt.figure()
@@ -8,7 +8,6 @@
 #  Imports
 # ----------------------------------------------------------------------
 import numpy as np
-import pylab as plt
 from SUAVE.Core import Data
 
 
@@ -76,6 +75,7 @@ def generate_wing_wake_grid(geometry, H, L, hf, x_plane, Nzo=20, Nzf=35, Nyo=20,
     grid_points.zline = zlocs
     
     if plot_grid:
+        import pylab as plt
         yL = -span/2
         yR = span/2
         
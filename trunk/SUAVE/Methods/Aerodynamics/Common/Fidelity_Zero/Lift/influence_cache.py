@@ -0,0 +1,420 @@
+## @ingroup Methods-Aerodynamics-Common-Fidelity_Zero-Lift
+# influence_cache.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+from SUAVE.Core import Data, fingerprint, fingerprint_ignore
+from SUAVE.Methods.Aerodynamics.Common.Fidelity_Zero.Lift.compute_wing_induced_velocity      import compute_wing_induced_velocity
+from SUAVE.Methods.Aerodynamics.Common.Fidelity_Zero.Lift.generate_wing_vortex_distribution  import generate_wing_vortex_distribution
+
+from concurrent.futures import ThreadPoolExecutor
+from copy import copy
+import numpy as np
+import scipy.linalg
+import threading
+import hashlib
+import os
+
+# the vortex distributions found so far, by geometry and discretization
+_lattices  = {}
+
+# the factored influence matrices, by lattice and mach number, within the bytes of settings.influence_cache_budget
+_factors   = {}
+
+# the most lattices kept, the least recently used are dropped, none are kept with 0
+limits     = Data(lattices = 8)
+
+# held while the lattices, the factors or the statistics are read or written
+_lock      = threading.Lock()
+
+# the pools of threads, by number of threads
+_pools     = {}
+
+# how often the lattices and the factors were found in the cache
+statistics = Data(hits = 0, misses = 0, factor_hits = 0, factor_misses = 0)
+
+# the settings that change the vortex distribution
+_settings  = ['number_spanwise_vortices','number_chordwise_vortices','spanwise_cosine_spacing','model_fuselage']
+
+# ----------------------------------------------------------------------
+#  Cached Vortex Distribution
+# ----------------------------------------------------------------------
+
+## @ingroup Methods-Aerodynamics-Common-Fidelity_Zero-Lift
+def cached_vortex_distribution(geometry,settings):
+    """Returns the vortex distribution of a vehicle, generating it only the
+    first time a geometry and discretization are asked for, with the dihedral
+    and camber angles of its panels
+
+    Assumptions:
+    The distribution only depends on the wings, the fuselages and the
+    discretization settings of the vehicle. Files, like airfoil coordinates,
+    are known by their names. The arrays of the distribution are shared by
+    the calls that find it, they aren't changed by the VLM. The vehicle is
+    given a copy of the distribution, so the items set on it, like the wake
+    of the propellers, aren't kept. A vehicle that can't be fingerprinted is
+    generated each time, and neither its distribution nor its factors are
+    kept. Threads can share the cache.
+
+    Inputs:
+    geometry.wings
+    geometry.fuselages
+    settings.number_spanwise_vortices           [Unitless]
+    settings.number_chordwise_vortices          [Unitless]
+    settings.spanwise_cosine_spacing            [Boolean]
+    settings.model_fuselage                     [Boolean]
+
+    Outputs:
+    lattice.
+      key                                       [string], or None
+      vortex_distribution                       [Data]
+      phi                                       [radians], 1 x n_cp
+      delta                                     [radians], 1 x n_cp
+    geometry.vortex_distribution                [Data]
+
+    Properties Used:
+    N/A
+    """
+
+    key = lattice_key(geometry,settings)
+    with _lock:
+        lattice = _lattices.pop(key,None)
+        if lattice is not None:
+            statistics.hits += 1
+        else:
+            statistics.misses += 1
+
+    if lattice is None:
+        VD      = generate_wing_vortex_distribution(geometry,settings)
+        lattice = Data()
+        lattice.key                 = key
+        lattice.vortex_distribution = VD
+        lattice.phi                 = np.atleast_2d(np.arctan((VD.ZBC - VD.ZAC)/(VD.YBC - VD.YAC))) # dihedral angle
+        lattice.delta               = np.atleast_2d(np.arctan((VD.ZC - VD.ZCH)/(VD.XC - VD.XCH)))   # mean camber surface angle
+
+    # the most recently used are last
+    with _lock:
+        if key is not None:
+            _lattices[key] = lattice
+        while len(_lattices) > limits.lattices:
+            del _lattices[next(iter(_lattices))]
+    geometry.vortex_distribution = copy(lattice.vortex_distribution)
+
+    return lattice
+
+# ----------------------------------------------------------------------
+#  Cached Influence
+# ----------------------------------------------------------------------
+
+## @ingroup Methods-Aerodynamics-Common-Fidelity_Zero-Lift
+def cached_influence(lattice,settings,m_unique):
+    """Returns the LU factorizations of the aerodynamic influence coefficient
+    matrix of a vortex distribution at some mach numbers, building and
+    factoring only those of the mach numbers not asked for before
+
+    Assumptions:
+    The influence matrix doesn't depend on the angle of attack.
+    The factors are shared by the calls that find them, so they are read-only.
+    They are only kept with a cache budget, and the least recently used are
+    dropped until the cache fits in the budget of the call. With more than one
+    thread the mach numbers are split between the threads, each with its share
+    of the memory budget. Threads can share the cache.
+
+    Inputs:
+    lattice                                     [Data], see cached_vortex_distribution
+    settings.number_spanwise_vortices           [Unitless]
+    settings.number_chordwise_vortices          [Unitless]
+    settings.memory_budget                      [bytes], optional, see compute_wing_induced_velocity
+    settings.influence_cache_budget             [bytes], optional, of the factors kept, None keeps none
+    settings.number_of_threads                  [Unitless], optional, 1 by default, None for every cpu
+    m_unique                                    [Unitless], n_mach x 1
+
+    Outputs:
+    influence.
+      factors                                   [list of (lu, piv)], one by mach number
+      RFLAG                                     [Unitless], n_mach x n_cp
+      s                                         [m], 1 x n_cp
+      CHORD                                     [m], 1 x n_cp
+      ZETA                                      [radians], n_cp
+
+    Properties Used:
+    N/A
+    """
+
+    n_sw    = settings.number_spanwise_vortices
+    n_cw    = settings.number_chordwise_vortices
+    budget  = settings.get('memory_budget',None)
+    kept    = settings.get('influence_cache_budget',None)
+    threads = number_of_threads(settings)
+    machs   = [float(m) for m in m_unique[:,0]]
+    with _lock:
+        entries = [_factors.pop((lattice.key,m),None) for m in machs]
+
+        # a lattice generated again, once dropped, gets its chords from factoring its mach numbers again
+        if 'CHORD' not in lattice:
+            entries = [None for m in machs]
+        missing = [i for i,entry in enumerate(entries) if entry is None]
+
+        statistics.factor_hits   += len(machs) - len(missing)
+        statistics.factor_misses += len(missing)
+
+    if missing:
+        # the influence of the mach numbers not found, together or shared by the threads
+        if threads > 1 and len(missing) > 1:
+            groups = [list(group) for group in np.array_split(missing,min(threads,len(missing)))]
+            share  = None if budget is None else budget/len(groups)
+            def factor(group):
+                return factor_influence(lattice,n_sw,n_cw,m_unique[group],share)
+            results = list(thread_pool(len(groups)).map(factor,groups))
+        else:
+            groups  = [missing]
+            results = [factor_influence(lattice,n_sw,n_cw,m_unique[missing],budget)]
+
+        for group,(factored,s,CHORD,ZETA) in zip(groups,results):
+            for i,entry in zip(group,factored):
+                entries[i] = entry
+
+    with _lock:
+        if 'CHORD' not in lattice:
+            lattice.s     = s[:1]
+            lattice.CHORD = CHORD[:1]
+            lattice.ZETA  = ZETA
+
+        # the factors found are put back, the new ones only kept with a budget
+        if lattice.key is not None:
+            for i,(m,entry) in enumerate(zip(machs,entries)):
+                if kept is not None or i not in missing:
+                    _factors[(lattice.key,m)] = entry
+        if kept is not None:
+            size = sum([entry.nbytes for entry in _factors.values()])
+            while size > kept:
+                size -= _factors.pop(next(iter(_factors))).nbytes
+
+    influence = Data()
+    influence.factors = [entry.factor for entry in entries]
+    influence.RFLAG   = np.array([entry.RFLAG for entry in entries])
+    influence.s       = lattice.s
+    influence.CHORD   = lattice.CHORD
+    influence.ZETA    = lattice.ZETA
+
+    return influence
+
+## @ingroup Methods-Aerodynamics-Common-Fidelity_Zero-Lift
+def factor_influence(lattice,n_sw,n_cw,mach,memory_budget):
+    """Builds and factors the aerodynamic influence coefficient matrix of a
+    vortex distribution at some mach numbers
+
+    Assumptions:
+    None
+
+    Inputs:
+    lattice        [Data], see cached_vortex_distribution
+    n_sw           [Unitless]
+    n_cw           [Unitless]
+    mach           [Unitless], n_mach x 1
+    memory_budget  [bytes], see compute_wing_induced_velocity
+
+    Outputs:
+    entries        [list of Data], the factors, the sonic vortex flags and their bytes of each mach number
+    s              [m]
+    CHORD          [m]
+    ZETA           [radians]
+
+    Properties Used:
+    N/A
+    """
+
+    C_mn, s, CHORD, RFLAG, ZETA = compute_wing_induced_velocity(lattice.vortex_distribution,n_sw,n_cw,mach,memory_budget)
+
+    phi   = lattice.phi
+    delta = lattice.delta
+    A     =   np.multiply(C_mn[:,:,:,0],np.atleast_3d(np.sin(delta)*np.cos(phi))) \
+            + np.multiply(C_mn[:,:,:,1],np.atleast_3d(np.cos(delta)*np.sin(phi))) \
+            - np.multiply(C_mn[:,:,:,2],np.atleast_3d(np.cos(phi)*np.cos(delta)))   # validated from book eqn 7.42
+    del C_mn
+
+    entries = []
+    for j in range(len(mach)):
+        lu, piv = scipy.linalg.lu_factor(A[j],check_finite=False)
+        lu.setflags(write=False)
+        piv.setflags(write=False)
+        entries.append(Data(factor = (lu,piv), RFLAG = RFLAG[j], nbytes = lu.nbytes + piv.nbytes + RFLAG[j].nbytes))
+
+    return entries, s, CHORD, ZETA
+
+## @ingroup Methods-Aerodynamics-Common-Fidelity_Zero-Lift
+def solve_vortex_strength(factors,inv,RHS,threads=1):
+    """Solves for the vortex strengths of each control point with the factored
+    influence matrix of its mach number, the control points of one mach
+    number together, and the mach numbers shared by the threads
+
+    Assumptions:
+    None
+
+    Inputs:
+    factors        [list of (lu, piv)], by unique mach number
+    inv            [Unitless], the unique mach number of each control point
+    RHS            [Unitless], n_points x n_cp
+    threads        [Unitless]
+
+    Outputs:
+    gamma          [Unitless], n_points x n_cp
+
+    Properties Used:
+    N/A
+    """
+
+    gamma = np.zeros(np.shape(RHS))
+
+    def solve(j):
+        rows        = np.where(inv == j)[0]
+        gamma[rows] = scipy.linalg.lu_solve(factors[j],RHS[rows].T,check_finite=False).T
+
+    if threads > 1 and len(factors) > 1:
+        list(thread_pool(min(threads,len(factors))).map(solve,range(len(factors))))
+    else:
+        for j in range(len(factors)):
+            solve(j)
+
+    return gamma
+
+## @ingroup Methods-Aerodynamics-Common-Fidelity_Zero-Lift
+def number_of_threads(settings):
+    """The number of threads of the VLM
+
+    Assumptions:
+    None is every cpu
+
+    Inputs:
+    settings.number_of_threads   [Unitless], optional, 1 by default
+
+    Outputs:
+    threads                      [Unitless]
+
+    Properties Used:
+    N/A
+    """
+
+    threads = settings.get('number_of_threads',1)
+    if threads is None:
+        threads = os.cpu_count() or 1
+
+    return max(int(threads),1)
+
+## @ingroup Methods-Aerodynamics-Common-Fidelity_Zero-Lift
+def thread_pool(threads):
+    """A pool of threads, started the first time it is asked for and kept
+
+    Assumptions:
+    None
+
+    Inputs:
+    threads        [Unitless]
+
+    Outputs:
+    pool           [ThreadPoolExecutor]
+
+    Properties Used:
+    N/A
+    """
+
+    pool = _pools.get(threads)
+    if pool is None:
+        pool = ThreadPoolExecutor(max_workers = threads)
+        _pools[threads] = pool
+
+    return pool
+
+## @ingroup Methods-Aerodynamics-Common-Fidelity_Zero-Lift
+def release_influence(geometry,settings):
+    """Drops the factored influence matrices of a vehicle from the cache, like
+    those only needed to sample the training data of a surrogate
+
+    Assumptions:
+    The vortex distribution of the vehicle is kept, it is small.
+
+    Inputs:
+    geometry.wings
+    geometry.fuselages
+    settings                                    see cached_vortex_distribution
+
+    Outputs:
+    None
+
+    Properties Used:
+    N/A
+    """
+
+    key = lattice_key(geometry,settings)
+    if key is None:
+        return
+
+    with _lock:
+        for found in [found for found in _factors if found[0] == key]:
+            del _factors[found]
+
+## @ingroup Methods-Aerodynamics-Common-Fidelity_Zero-Lift
+def clear_influence_cache():
+    """Forgets the vortex distributions and factors kept by the cache and its
+    statistics
+
+    Assumptions:
+    None
+
+    Inputs:
+    None
+
+    Outputs:
+    None
+
+    Properties Used:
+    N/A
+    """
+
+    with _lock:
+        _lattices.clear()
+        _factors.clear()
+        for name in statistics.keys():
+            statistics[name] = 0
+
+# ----------------------------------------------------------------------
+#  Helper Functions
+# ----------------------------------------------------------------------
+
+## @ingroup Methods-Aerodynamics-Common-Fidelity_Zero-Lift
+def lattice_key(geometry,settings):
+    """The key of the vortex distribution of a vehicle in the cache, a hash of
+    its wings, its fuselages and the discretization settings
+
+    Assumptions:
+    There is no key when a value can't be fingerprinted.
+
+    Inputs:
+    geometry.wings
+    geometry.fuselages
+    settings
+
+    Outputs:
+    key            [string], or None
+
+    Properties Used:
+    N/A
+    """
+
+    digest = hashlib.sha1()
+    seen   = {}
+    try:
+        for name in _settings:
+            digest.update(name.encode())
+            fingerprint(settings[name],digest,seen,fingerprint_ignore)
+        fingerprint(geometry.wings,digest,seen,fingerprint_ignore)
+        fingerprint(geometry.fuselages,digest,seen,fingerprint_ignore)
+    except TypeError:
+        return None
+
+    return digest.hexdigest()
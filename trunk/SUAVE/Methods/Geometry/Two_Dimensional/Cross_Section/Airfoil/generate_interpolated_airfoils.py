@@ -9,7 +9,6 @@
 # ----------------------------------------------------------------------
 
 from SUAVE.Methods.Geometry.Two_Dimensional.Cross_Section.Airfoil.import_airfoil_geometry import import_airfoil_geometry 
-from SUAVE.Plots.Geometry_Plots import plot_airfoil
 import numpy as np
 import os
 
@@ -101,6 +100,7 @@ def generate_interpolated_airfoils(a1, a2, nairfoils, save_filename="Transition"
         new_files[file].close()
         
     # plot new and original airfoils:
+    from SUAVE.Plots.Geometry_Plots import plot_airfoil
     airfoil_files.insert(0,a1)
     airfoil_files.append(a2)
     plot_airfoil(airfoil_files,overlay=True)
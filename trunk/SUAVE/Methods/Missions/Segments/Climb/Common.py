@@ -6,12 +6,14 @@
 #           Jul 2017, E. Botero
 #           Mar 2020, M. Clarke
 #           Apr 2020, M. Clarke
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
 # ----------------------------------------------------------------------
 
 import numpy as np
+from SUAVE.Methods.Missions.Segments.Common.Cases import first_rows, last_rows
 
 # ----------------------------------------------------------------------
 #  Unpack Unknowns
@@ -103,22 +105,23 @@ def update_differentials_altitude(segment):
     """
 
     # unpack
-    t = segment.state.numerics.dimensionless.control_points 
-    I = segment.state.numerics.dimensionless.integrate
+    numerics = segment.state.numerics
+    t = numerics.dimensionless.control_points 
+    I = numerics.dimensionless.integrate
     r = segment.state.conditions.frames.inertial.position_vector
     v = segment.state.conditions.frames.inertial.velocity_vector
 
-    dz = r[-1,2] - r[0,2]
+    dz = last_rows(r,numerics)[:,2,None] - first_rows(r,numerics)[:,2,None]
     vz = v[:,2,None] # maintain column array
 
     # get overall time step
-    dt = np.dot( I[-1,:] * dz , 1/ vz[:,0] )
+    dt = last_rows(I.dot( 1/ vz ),numerics) * dz
 
     # rescale operators
     t = t * dt
 
     # pack
-    t_initial = segment.state.conditions.frames.inertial.time[0,0]
-    segment.state.conditions.frames.inertial.time[:,0] = t_initial + t[:,0]
+    t_initial = first_rows(segment.state.conditions.frames.inertial.time,numerics)
+    segment.state.conditions.frames.inertial.time[:,0,None] = t_initial + t
 
     return
\ No newline at end of file
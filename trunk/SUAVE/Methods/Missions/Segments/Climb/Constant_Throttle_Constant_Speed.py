@@ -4,12 +4,14 @@
 # Created:  Jul 2014, SUAVE Team
 # Modified: Jan 2016, E. Botero
 #           Apr 2020, M. Clarke
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
 # ----------------------------------------------------------------------
 
 import numpy as np
+from SUAVE.Methods.Missions.Segments.Common.Cases import first_rows, last_rows, case_values
 
 # ----------------------------------------------------------------------
 #  Unpack Unknowns
@@ -57,8 +59,8 @@ def initialize_conditions(segment):
     N/A
 
     Inputs:
-    segment.air_speed                                   [meters/second]
-    segment.throttle                                    [Unitless]
+    segment.air_speed                                   [meters/second], one value or one per case
+    segment.throttle                                    [Unitless], one value or one per case
     segment.altitude_start                              [meters]
     segment.altitude_end                                [meters]
     segment.state.numerics.dimensionless.control_points [Unitless]
@@ -73,19 +75,20 @@ def initialize_conditions(segment):
     """         
     
     # unpack
-    throttle   = segment.throttle
-    air_speed  = segment.air_speed   
+    numerics   = segment.state.numerics
+    throttle   = case_values(segment.throttle,numerics)
+    air_speed  = case_values(segment.air_speed,numerics)
     alt0       = segment.altitude_start 
     conditions = segment.state.conditions  
 
     # check for initial altitude
     if alt0 is None:
         if not segment.state.initials: raise AttributeError('initial altitude not set')
-        alt0 = -1.0 *segment.state.initials.conditions.frames.inertial.position_vector[-1,2]
+        alt0 = -1.0 *last_rows(segment.state.initials.conditions.frames.inertial.position_vector,numerics)[:,2,None]
 
     # pack conditions  
-    conditions.propulsion.throttle[:,0] = throttle
-    conditions.frames.inertial.velocity_vector[:,0] = air_speed # start up value
+    conditions.propulsion.throttle[:,0,None] = throttle
+    conditions.frames.inertial.velocity_vector[:,0,None] = air_speed # start up value
 
 ## @ingroup Methods-Missions-Segments-Climb
 def update_differentials_altitude(segment):
@@ -100,8 +103,8 @@ def update_differentials_altitude(segment):
     Inputs:
     segment.climb_angle                         [radians]
     state.conditions.frames.inertial.velocity_vector [meter/second]
-    segment.altitude_start                      [meters]
-    segment.altitude_end                        [meters]
+    segment.altitude_start                      [meters], one value or one per case
+    segment.altitude_end                        [meters], one value or one per case
 
     Outputs:
     state.conditions.frames.inertial.time       [seconds]
@@ -113,38 +116,39 @@ def update_differentials_altitude(segment):
     """   
 
     # unpack
-    t = segment.state.numerics.dimensionless.control_points
-    D = segment.state.numerics.dimensionless.differentiate
-    I = segment.state.numerics.dimensionless.integrate
+    numerics = segment.state.numerics
+    t = numerics.dimensionless.control_points
+    D = numerics.dimensionless.differentiate
+    I = numerics.dimensionless.integrate
 
     
     # Unpack segment initials
-    alt0       = segment.altitude_start 
-    altf       = segment.altitude_end    
+    alt0       = case_values(segment.altitude_start,numerics)
+    altf       = case_values(segment.altitude_end,numerics)
     conditions = segment.state.conditions  
     v          = segment.state.conditions.frames.inertial.velocity_vector
     
     # check for initial altitude
     if alt0 is None:
         if not segment.state.initials: raise AttributeError('initial altitude not set')
-        alt0 = -1.0 *segment.state.initials.conditions.frames.inertial.position_vector[-1,2]    
+        alt0 = -1.0 *last_rows(segment.state.initials.conditions.frames.inertial.position_vector,numerics)[:,2,None]
     
     # get overall time step
     vz = -v[:,2,None] # Inertial velocity is z down
     dz = altf- alt0    
-    dt = dz / np.dot(I[-1,:],vz)[-1] # maintain column array
+    dt = dz / last_rows(I.dot(vz),numerics)
     
     # Integrate vz to get altitudes
-    alt = alt0 + np.dot(I*dt,vz)
+    alt = alt0 + I.dot(vz)*dt
 
     # rescale operators
     t = t * dt
 
     # pack
-    t_initial = segment.state.conditions.frames.inertial.time[0,0]
-    segment.state.conditions.frames.inertial.time[:,0] = t_initial + t[:,0]
-    conditions.frames.inertial.position_vector[:,2] = -alt[:,0] # z points down
-    conditions.freestream.altitude[:,0]             =  alt[:,0] # positive altitude in this context    
+    t_initial = first_rows(segment.state.conditions.frames.inertial.time,numerics)
+    segment.state.conditions.frames.inertial.time[:,0,None] = t_initial + t
+    conditions.frames.inertial.position_vector[:,2,None] = -alt # z points down
+    conditions.freestream.altitude[:,0,None]             =  alt # positive altitude in this context    
 
     return
 
@@ -157,7 +161,7 @@ def update_velocity_vector_from_wind_angle(segment):
     
     # unpack
     conditions = segment.state.conditions 
-    v_mag      = segment.air_speed 
+    v_mag      = case_values(segment.air_speed,segment.state.numerics)
     alpha      = segment.state.unknowns.wind_angle[:,0][:,None]
     theta      = segment.state.unknowns.body_angle[:,0][:,None]
     
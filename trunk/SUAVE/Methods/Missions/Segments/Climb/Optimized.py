@@ -111,7 +111,7 @@ def update_differentials(segment):
     vz = -v[:,2,None] # maintain column array
 
     # get overall time step
-    dt = (dz/np.dot(I,vz))[-1]
+    dt = (dz/I.dot(vz))[-1,0]
 
     # rescale operators
     x = x * dt
@@ -119,7 +119,7 @@ def update_differentials(segment):
     I = I * dt
     
     # Calculate the altitudes
-    alt = np.dot(I,vz) + segment.altitude_start
+    alt = I.dot(vz) + segment.altitude_start
     
     # pack
     t_initial                                       = segment.state.conditions.frames.inertial.time[0,0]
@@ -0,0 +1,148 @@
+## @ingroup Methods-Missions-Segments-Common
+# Cases.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+import numpy as np
+
+# ----------------------------------------------------------------------
+#  Rows of the Cases
+# ----------------------------------------------------------------------
+
+## @ingroup Methods-Missions-Segments-Common
+def first_rows(array,numerics):
+    """ The first row of each case stacked in an array, once for each control
+        point of its case in the segment
+
+        Assumptions:
+        The cases are stacked along the rows, the control points of one case
+        after the other. With one case, this is the first row, which broadcasts
+        over the control points.
+
+        Inputs:
+            array                             [array], of the segment or of its initials
+            numerics:
+                number_of_cases               [int]
+                number_control_points         [int]
+
+        Outputs:
+            rows                              [array]
+
+        Properties Used:
+        N/A
+    """
+
+    return case_rows(array,numerics,0)
+
+## @ingroup Methods-Missions-Segments-Common
+def last_rows(array,numerics):
+    """ The last row of each case stacked in an array, once for each control
+        point of its case in the segment
+
+        Assumptions:
+        The cases are stacked along the rows, the control points of one case
+        after the other. With one case, this is the last row, which broadcasts
+        over the control points.
+
+        Inputs:
+            array                             [array], of the segment or of its initials
+            numerics:
+                number_of_cases               [int]
+                number_control_points         [int]
+
+        Outputs:
+            rows                              [array]
+
+        Properties Used:
+        N/A
+    """
+
+    return case_rows(array,numerics,-1)
+
+## @ingroup Methods-Missions-Segments-Common
+def case_rows(array,numerics,row):
+    """ A row of each case stacked in an array, once for each control point of
+        its case in the segment
+
+        Assumptions:
+        The array has the same number of rows for each case, which may differ
+        from the control points of the segment for its initials
+
+        Inputs:
+            array                             [array]
+            row                               [int], 0 or -1
+            numerics:
+                number_of_cases               [int]
+                number_control_points         [int]
+
+        Outputs:
+            rows                              [array]
+
+        Properties Used:
+        N/A
+    """
+
+    rows = array[case_index(array,numerics,row)]
+    if numerics.number_of_cases > 1:
+        rows = np.repeat(rows,numerics.number_control_points,axis=0)
+
+    return rows
+
+## @ingroup Methods-Missions-Segments-Common
+def case_index(array,numerics,row):
+    """ Indexes a row of each case stacked in an array, to write them
+
+        Assumptions:
+        None
+
+        Inputs:
+            array                             [array]
+            row                               [int], 0 or -1
+            numerics.number_of_cases          [int]
+
+        Outputs:
+            index                             [slice]
+
+        Properties Used:
+        N/A
+    """
+
+    n = len(array) // numerics.number_of_cases
+
+    return slice(row % n,None,n)
+
+## @ingroup Methods-Missions-Segments-Common
+def case_values(value,numerics):
+    """ Expands an input of a segment given with one value for each case into
+        a column, once for each control point of its case. Other inputs, the
+        same for all the cases, are returned as they are.
+
+        Assumptions:
+        None
+
+        Inputs:
+            value                             [float or array of one value per case]
+            numerics:
+                number_of_cases               [int]
+                number_control_points         [int]
+
+        Outputs:
+            value                             [float or array]
+
+        Properties Used:
+        N/A
+    """
+
+    if np.ndim(value) != 1:
+        return value
+
+    K = numerics.number_of_cases
+    if len(value) != K:
+        raise ValueError('%d values given for %d cases' % (len(value),K))
+
+    return np.repeat(np.asarray(value,dtype=float),numerics.number_control_points)[:,None]
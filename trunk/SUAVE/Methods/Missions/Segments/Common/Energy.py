@@ -10,6 +10,7 @@
 # ----------------------------------------------------------------------
 
 import numpy as np
+from .Cases import last_rows
 
 # ----------------------------------------------------------------------
 #  Initialize Battery
@@ -38,13 +39,13 @@ def initialize_battery(segment):
     
     
     if segment.state.initials:
-        energy_initial  = segment.state.initials.conditions.propulsion.battery_energy[-1,0]
+        energy_initial  = last_rows(segment.state.initials.conditions.propulsion.battery_energy,segment.state.numerics)
     elif 'battery_energy' in segment:
         energy_initial  = segment.battery_energy
     else:
         energy_initial = 0.0
     
-    segment.state.conditions.propulsion.battery_energy[:,0] = energy_initial
+    segment.state.conditions.propulsion.battery_energy[:,0,None] = energy_initial
 
     return
 
@@ -15,6 +15,7 @@ from SUAVE.Core import Units
 
 from SUAVE.Methods.Geometry.Three_Dimensional \
      import angles_to_dcms, orientation_product, orientation_transpose
+from .Cases import first_rows, last_rows, case_index
 
 # ----------------------------------------------------------------------
 #  Initialize Inertial Position
@@ -43,15 +44,17 @@ def initialize_inertial_position(segment):
     """    
     
     if segment.state.initials:
+        numerics  = segment.state.numerics
         r_initial = segment.state.initials.conditions.frames.inertial.position_vector
         r_current = segment.state.conditions.frames.inertial.position_vector
+        last      = case_index(r_initial,numerics,-1)
         
         if 'altitude' in segment.keys() and segment.altitude:
-            r_initial[-1,None,-1] = -segment.altitude
+            r_initial[last,-1] = -segment.altitude
         elif 'altitude_start' in segment.keys() and segment.altitude_start:
-            r_initial[-1,None,-1] = -segment.altitude_start
+            r_initial[last,-1] = -segment.altitude_start
             
-        segment.state.conditions.frames.inertial.position_vector[:,:] = r_current + (r_initial[-1,None,:] - r_current[0,None,:])
+        segment.state.conditions.frames.inertial.position_vector[:,:] = r_current + (last_rows(r_initial,numerics) - first_rows(r_current,numerics))
         
     return
     
@@ -89,7 +92,9 @@ def initialize_time(segment):
         t_initial = segment.state.initials.conditions.frames.inertial.time
         t_current = segment.state.conditions.frames.inertial.time
         
-        segment.state.conditions.frames.inertial.time[:,:] = t_current + (t_initial[-1,0] - t_current[0,0])
+        numerics  = segment.state.numerics
+        
+        segment.state.conditions.frames.inertial.time[:,:] = t_current + (last_rows(t_initial,numerics) - first_rows(t_current,numerics))
         
     else:
         t_initial = segment.state.conditions.frames.inertial.time[0,0]
@@ -132,8 +137,9 @@ def initialize_planet_position(segment):
     """        
     
     if segment.state.initials:
-        longitude_initial = segment.state.initials.conditions.frames.planet.longitude[-1,0]
-        latitude_initial  = segment.state.initials.conditions.frames.planet.latitude[-1,0] 
+        numerics          = segment.state.numerics
+        longitude_initial = last_rows(segment.state.initials.conditions.frames.planet.longitude,numerics)
+        latitude_initial  = last_rows(segment.state.initials.conditions.frames.planet.latitude,numerics)
     elif 'latitude' in segment:
         longitude_initial = segment.longitude
         latitude_initial  = segment.latitude      
@@ -142,8 +148,8 @@ def initialize_planet_position(segment):
         latitude_initial  = 0.0
 
 
-    segment.state.conditions.frames.planet.longitude[:,0] = longitude_initial
-    segment.state.conditions.frames.planet.latitude[:,0]  = latitude_initial    
+    segment.state.conditions.frames.planet.longitude[:,0,None] = longitude_initial
+    segment.state.conditions.frames.planet.latitude[:,0,None]  = latitude_initial    
 
     return
     
@@ -196,9 +202,9 @@ def update_planet_position(segment):
 
     # Find the velocities and integrate the positions
     lamdadot  = (V/R)*np.cos(gamma)*np.cos(psi)
-    lamda     = np.dot(I,lamdadot) / Units.deg # Latitude
+    lamda     = I.dot(lamdadot) / Units.deg # Latitude
     mudot     = (V/R)*np.cos(gamma)*np.sin(psi)/np.cos(lamda)
-    mu        = np.dot(I,mudot) / Units.deg # Longitude
+    mu        = I.dot(mudot) / Units.deg # Longitude
 
     # Reshape the size of the vectorss
     shape     = np.shape(conditions.freestream.velocity)
@@ -206,8 +212,8 @@ def update_planet_position(segment):
     lamda     = np.reshape(lamda,shape)
 
     # Pack'r up
-    lat = conditions.frames.planet.latitude[0,0]
-    lon = conditions.frames.planet.longitude[0,0]
+    lat = first_rows(conditions.frames.planet.latitude,segment.state.numerics)
+    lon = first_rows(conditions.frames.planet.longitude,segment.state.numerics)
     conditions.frames.planet.latitude  = lat + lamda
     conditions.frames.planet.longitude = lon + mu
 
@@ -400,12 +406,12 @@ def integrate_inertial_horizontal_position(segment):
 
     # unpack
     conditions = segment.state.conditions
-    x0 = conditions.frames.inertial.position_vector[0,None,0:1+1]
+    x0 = first_rows(conditions.frames.inertial.position_vector,segment.state.numerics)[:,0:1+1]
     vx = conditions.frames.inertial.velocity_vector[:,0:1+1]
     I  = segment.state.numerics.time.integrate
     
     # integrate
-    x = np.dot(I,vx) + x0
+    x = I.dot(vx) + x0
     
     # pack
     conditions.frames.inertial.position_vector[:,0:1+1] = x[:,:]
@@ -442,7 +448,7 @@ def update_acceleration(segment):
     D = segment.state.numerics.time.differentiate
     
     # accelerations
-    acc = np.dot(D,v)
+    acc = D.dot(v)
     
     # pack conditions
     segment.state.conditions.frames.inertial.acceleration_vector[:,:] = acc[:,:]   
\ No newline at end of file
@@ -3,12 +3,18 @@
 # 
 # Created:  Jul 2014, SUAVE Team
 # Modified: Jan 2016, E. Botero
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
 # ----------------------------------------------------------------------
 
 from SUAVE.Core.Arrays import atleast_2d_col 
+from SUAVE.Methods.Utilities.Chebyshev import cached_discretization, Trapezoidal_Integral
+from .Cases import first_rows, last_rows
+
+import numpy as np
+import scipy.sparse
 
 # ----------------------------------------------------------------------
 #  Initialize Differentials
@@ -19,11 +25,15 @@ def initialize_differentials_dimensionless(segment):
     """ Discretizes the differential operators
     
         Assumptions:
-        N/A
+        The operators of a method and number of points are computed once and
+        shared by all the segments, read-only, see cached_discretization.
+        Cases solved together are stacked along the control points, with
+        block diagonal operators, which must be dense.
         
         Inputs:
             state.numerics:
                 number_control_points [int]
+                number_of_cases       [int]
                 discretization_method [function]
             
         Outputs:
@@ -44,9 +54,18 @@ def initialize_differentials_dimensionless(segment):
     discretization_method = numerics.discretization_method
     
     # get operators
-    x,D,I = discretization_method(N,**numerics)
+    x,D,I = cached_discretization(discretization_method,N,numerics)
     x = atleast_2d_col(x)
     
+    # stack the cases
+    K = numerics.number_of_cases
+    if K > 1:
+        if not (isinstance(D,np.ndarray) and isinstance(I,np.ndarray)):
+            raise ValueError('cases can only be stacked with dense differential operators')
+        x = np.tile(x,(K,1))
+        D = np.kron(np.eye(K),D)
+        I = np.kron(np.eye(K),I)
+    
     # pack
     numerics.dimensionless.control_points = x
     numerics.dimensionless.differentiate  = D
@@ -63,7 +82,9 @@ def update_differentials_time(segment):
     """ Scales the differential operators (integrate and differentiate) based on mission time
     
         Assumptions:
-        N/A
+        The scaled operators are written over the ones of the last iteration
+        when they have the same size, rather than allocated again. Stacked
+        cases are scaled by the time of each case, row by row.
         
         Inputs:
             numerics.dimensionless:           
@@ -91,17 +112,55 @@ def update_differentials_time(segment):
     
     # rescale time
     time = segment.state.conditions.frames.inertial.time
-    T    = time[-1] - time[0]
-    t    = x * T
-    
-    # rescale operators
-    D = D / T
-    I = I * T
+    if numerics.number_of_cases > 1:
+        T = last_rows(time,numerics) - first_rows(time,numerics)
+    else:
+        T = time[-1] - time[0]
     
-    # pack
-    numerics.time.control_points = t
-    numerics.time.differentiate  = D
-    numerics.time.integrate      = I
+    # rescale operators, in the arrays of the last iteration when they fit
+    scaled = numerics.time
+    scaled.control_points = rescale(x,T,np.multiply,scaled.control_points)
+    scaled.differentiate  = rescale(D,T,np.divide,scaled.differentiate)
+    scaled.integrate      = rescale(I,T,np.multiply,scaled.integrate)
 
     return
-    
\ No newline at end of file
+    
+## @ingroup Methods-Missions-Segments-Common
+def rescale(A,T,operation,out):
+    """ Scales an operator by the time of the segment, in the array of the
+        last iteration when it has the same shape and can be written
+    
+        Assumptions:
+        A sparse operator is scaled in a copy, with the same pattern, and a
+        Trapezoidal_Integral by its spacing
+        
+        Inputs:
+            A          [array, scipy sparse matrix or Trapezoidal_Integral]
+            T          [seconds]
+            operation  <numpy ufunc>
+            out        [array]
+            
+        Outputs:
+            operation(A,T) [array]
+
+        Properties Used:
+        N/A
+                                
+    """     
+    
+    if A is None:
+        return None
+    
+    if isinstance(A,Trapezoidal_Integral):
+        return A.scaled(operation(1.,T))
+    
+    if scipy.sparse.issparse(A):
+        scaled      = A.copy()
+        scaled.data = operation(A.data,T)
+        return scaled
+    
+    if isinstance(out,np.ndarray) and out.shape == A.shape and out.flags.writeable and out is not A \
+       and out.dtype == np.result_type(A,T):
+        return operation(A,T,out=out)
+    
+    return operation(A,T)
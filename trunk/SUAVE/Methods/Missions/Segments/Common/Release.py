@@ -0,0 +1,200 @@
+## @ingroup Methods-Missions-Segments-Common
+# Release.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+from SUAVE.Core import Data
+
+import numpy as np
+import scipy.sparse
+
+# ----------------------------------------------------------------------
+#  Release Sub Segments
+# ----------------------------------------------------------------------
+
+## @ingroup Methods-Missions-Segments-Common
+def release_sub_segments(segment):
+    """ Releases the state of each sub segment of a mission that has a keep list,
+        once the mission is finalized, see release_state
+
+        Assumptions:
+        None
+
+        Inputs:
+        sub_segment.keep   [list of strings], or None to keep everything
+
+        Outputs:
+        N/A
+
+        Properties Used:
+        N/A
+    """
+
+    for tag,sub_segment in segment.segments.items():
+        if sub_segment.get('segments'):
+            release_sub_segments(sub_segment)
+        elif sub_segment.get('keep') is not None:
+            release_state(sub_segment)
+
+    return
+
+## @ingroup Methods-Missions-Segments-Common
+def release_state(segment):
+    """ Keeps the conditions of a solved segment named in its keep list and
+        releases the rest of its state: the other conditions, the residuals,
+        the operators scaled to the time of the segment and the last jacobian
+        of the solver. A released array
+        keeps its first row, so the segment can still be evaluated again, it
+        is expanded like the arrays of a new segment.
+
+        Assumptions:
+        A path names a field or a branch of the conditions, like
+        'weights.total_mass' or 'frames.inertial'.
+        The unknowns are kept, they are the guess of the next evaluation.
+        Conditions kept in one contiguous array aren't anymore, see
+        Conditions.compact().
+
+        Inputs:
+        segment.keep                [list of strings]
+        segment.state               [State]
+
+        Outputs:
+        segment.state.footprint     [Data], the bytes of the state before and after
+
+        Properties Used:
+        N/A
+    """
+
+    state  = segment.state
+    keep   = set(segment.keep)
+    before = state_bytes(state)
+
+    release_rows(state.conditions,keep)
+    release_rows(state.residuals,set())
+    state.conditions._buffer = None
+    state.residuals._buffer  = None
+
+    scaled = state.numerics.time
+    for name in ['control_points','differentiate','integrate']:
+        scaled[name] = np.empty([0,0])
+    state.numerics.jacobian = None
+
+    state.footprint = Data(before = before,
+                           after  = state_bytes(state))
+
+    return
+
+## @ingroup Methods-Missions-Segments-Common
+def release_report(mission):
+    """ A table of the bytes the state of each segment of a mission held before
+        and after it was released
+
+        Assumptions:
+        The segments have a keep list, others are skipped
+
+        Inputs:
+        state.footprint             [Data]
+
+        Outputs:
+        report                      [string]
+
+        Properties Used:
+        N/A
+    """
+
+    width = max([len(tag) for tag in mission.segments.keys()] + [7])
+    lines = ['%-*s %12s %12s' % (width,'segment','before','after')]
+
+    before = 0
+    after  = 0
+    for tag,segment in mission.segments.items():
+        footprint = segment.state.get('footprint')
+        if footprint is None:
+            continue
+        before += footprint.before
+        after  += footprint.after
+        lines.append('%-*s %12d %12d' % (width,tag,footprint.before,footprint.after))
+
+    lines.append('%-*s %12d %12d' % (width,'total',before,after))
+
+    return '\n'.join(lines)
+
+# ----------------------------------------------------------------------
+#  Helper Functions
+# ----------------------------------------------------------------------
+
+## @ingroup Methods-Missions-Segments-Common
+def release_rows(conditions,keep,path=''):
+    """ Cuts the arrays of some conditions down to their first row, but for
+        the paths kept
+
+        Assumptions:
+        None
+
+        Inputs:
+        conditions    [Conditions]
+        keep          [set of strings]
+        path          [string], of the conditions
+
+        Outputs:
+        N/A
+
+        Properties Used:
+        N/A
+    """
+
+    for key,value in conditions.items():
+        name = path + key
+        if name in keep:
+            continue
+        if isinstance(value,Data):
+            release_rows(value,keep,name + '.')
+        elif isinstance(value,np.ndarray) and value.ndim >= 2 and value.shape[0] > 1:
+            conditions[key] = np.array(value[:1])
+
+    return
+
+## @ingroup Methods-Missions-Segments-Common
+def state_bytes(data,seen=None):
+    """ The bytes of the arrays of a state, each counted once, without the
+        segment before it and without the shared operators of the
+        discretization, which can't be written
+
+        Assumptions:
+        None
+
+        Inputs:
+        data          [Data]
+
+        Outputs:
+        bytes         [int]
+
+        Properties Used:
+        N/A
+    """
+
+    if seen is None:
+        seen = set()
+
+    if id(data) in seen:
+        return 0
+    seen.add(id(data))
+
+    total = 0
+    if isinstance(data,dict):
+        for key,value in data.items():
+            if key != 'initials':
+                total += state_bytes(value,seen)
+    elif isinstance(data,np.ndarray):
+        if data.flags.writeable:
+            total += data.nbytes
+    elif scipy.sparse.issparse(data):
+        for name in ['data','indices','indptr']:
+            total += state_bytes(getattr(data,name,None),seen)
+
+    return total
@@ -0,0 +1,120 @@
+## @ingroup Methods-Missions-Segments-Common
+# Stream.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+from SUAVE.Input_Output.SUAVE import archive_binary, load_binary
+
+import os
+
+# ----------------------------------------------------------------------
+#  Spill Conditions
+# ----------------------------------------------------------------------
+
+## @ingroup Methods-Missions-Segments-Common
+def spill_conditions(dirname):
+    """ Makes a step for the stream of a mission that writes the conditions
+        of each segment, once it is solved, to a binary archive and maps them
+        back from disk. The arrays of the segments solved so far are then held
+        by the files rather than in memory.
+
+        Assumptions:
+        Each segment is written to dirname/<tag>, over an older archive.
+        The arrays are mapped copy on write, they can still be changed, in
+        memory, by the steps that come after it.
+
+        Source:
+        N/A
+
+        Inputs:
+        dirname     <string>, created if needed
+
+        Outputs:
+        spill       <function>, spill(segment)
+
+        Properties Used:
+        N/A
+    """
+
+    def spill(segment):
+        path = os.path.join(dirname,segment.tag)
+        archive_binary(segment.state.conditions,path)
+        set_conditions(segment,load_binary(path,mmap_mode='c'))
+
+    return spill
+
+# ----------------------------------------------------------------------
+#  Drop Conditions
+# ----------------------------------------------------------------------
+
+## @ingroup Methods-Missions-Segments-Common
+def drop_conditions(paths):
+    """ Makes a step for the stream of a mission that removes some of the
+        conditions of each segment, once it is solved
+
+        Assumptions:
+        The segment after it starts from the last point of the conditions
+        it keeps, so what it needs, like the frames and the weights, can't
+        be dropped.
+        Paths the segment doesn't have are skipped.
+
+        Source:
+        N/A
+
+        Inputs:
+        paths       [list of strings], like 'aerodynamics.drag_breakdown'
+
+        Outputs:
+        drop        <function>, drop(segment)
+
+        Properties Used:
+        N/A
+    """
+
+    def drop(segment):
+        conditions = segment.state.conditions
+        for path in paths:
+            keys   = path.split('.')
+            parent = conditions
+            for key in keys[:-1]:
+                parent = parent.get(key)
+                if parent is None:
+                    break
+            if parent is not None and keys[-1] in parent:
+                del parent[keys[-1]]
+
+    return drop
+
+# ----------------------------------------------------------------------
+#  Set Conditions
+# ----------------------------------------------------------------------
+
+## @ingroup Methods-Missions-Segments-Common
+def set_conditions(segment,conditions):
+    """ Gives a segment new conditions, in its state and where it points to them
+
+        Assumptions:
+        None
+
+        Source:
+        N/A
+
+        Inputs:
+        segment     [Segment]
+        conditions  [Conditions]
+
+        Outputs:
+        None
+
+        Properties Used:
+        N/A
+    """
+
+    segment.state.conditions = conditions
+    if 'conditions' in segment:
+        segment.conditions = conditions
@@ -5,6 +5,7 @@
 # Modified: Jan 2016, E. Botero
 #           Mar 2016, E. Botero
 #           Jul 2017, E. Botero
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -22,7 +23,8 @@ def expand_sub_segments(segment):
     """ Fills in the segments to a mission with data, sets initials data if necessary
     
         Assumptions:
-        N/A
+        A sub segment without a warm start store, memo or keep list of its own takes
+        those of the mission on every expand, so they follow the mission when it changes.
         
         Inputs:
         N/A
@@ -44,6 +46,13 @@ def expand_sub_segments(segment):
         
         if last_tag:
             sub_segment.state.initials = segment.segments[last_tag].state
+        # the sub segments share the warm start store, memo and keep list of the mission,
+        # unless they were given their own
+        inherited = sub_segment._inherited or {}
+        for name in ['warm_start','memo','keep']:
+            if sub_segment[name] is None or sub_segment[name] is inherited.get(name):
+                sub_segment[name] = segment[name]
+        sub_segment._inherited = dict(warm_start = segment.warm_start, memo = segment.memo, keep = segment.keep)
         last_tag = tag        
         
         sub_segment.process.initialize.expand_state(sub_segment)
@@ -87,10 +96,12 @@ def finalize_sub_segments(segment):
     """ Sets the conditions in each sub segment for a mission
     
         Assumptions:
-        N/A
+        The segments of a mission with a stream were finalized as they were
+        solved, before the steps of the stream dropped or spilled their
+        conditions, and aren't finalized again
         
         Inputs:
-        N/A
+        segment.stream    [Process], optional
             
         Outputs:
         N/A
@@ -100,6 +111,9 @@ def finalize_sub_segments(segment):
                                 
     """           
 
+    if segment.get('stream'):
+        return
+
     for tag,sub_segment in segment.segments.items():
         sub_segment.finalize()
 
@@ -114,7 +128,7 @@ def sequential_sub_segments(segment):
     """ Evaluates all the segments in a mission one by one
     
         Assumptions:
-        N/A
+        See solve_sub_segments
         
         Inputs:
         N/A
@@ -127,8 +141,56 @@ def sequential_sub_segments(segment):
                                 
     """       
 
+    for sub_segment in solve_sub_segments(segment):
+        pass
+
+## @ingroup Methods-Missions-Segments-Common
+def solve_sub_segments(segment):
+    
+    """ Evaluates the segments in a mission one by one, and yields each one as
+        soon as it is solved and finalized, after running the steps of the
+        stream of the mission on it
+    
+        Assumptions:
+        A segment without sub segments that is found in its memo takes the state
+        it converged to instead of being solved again, one that can't be hashed
+        is solved without it. The analyses of the segments are hashed once for
+        the whole evaluation.
+        
+        Inputs:
+        segment.stream    [Process], steps run with each sub segment, optional
+        sub_segment.memo  [Segment_Memo]
+            
+        Outputs:
+        sub_segment       [Segment], one at a time
+
+        Properties Used:
+        N/A
+                                
+    """       
+
+    stream = segment.get('stream')
+
+    # the hashes of the analyses of the segments, for their memos
+    analyses_keys = {}
+
     for tag,sub_segment in segment.segments.items():
-        sub_segment.evaluate()
+        
+        memo = sub_segment.memo
+        if memo is None or sub_segment.get('segments'):
+            sub_segment.evaluate()
+        else:
+            key = memo.key(sub_segment,analyses_keys)
+            if key is None:
+                sub_segment.evaluate()
+            elif not memo.restore(sub_segment,key):
+                sub_segment.evaluate()
+                memo.save(sub_segment,key)
+        
+        if stream is not None:
+            stream(sub_segment)
+        
+        yield sub_segment
 
 
 # ----------------------------------------------------------------------
@@ -9,6 +9,7 @@
 # ----------------------------------------------------------------------
 
 import numpy as np
+from .Cases import first_rows, last_rows, case_index, case_values
 
 # ----------------------------------------------------------------------
 #  Initialize Weights
@@ -26,6 +27,7 @@ def initialize_weights(segment):
                 weights.total_mass     [newtons]
             segment.state.conditions:           
                 weights.total_mass     [newtons]
+            segment.analyses.weights.vehicle.mass_properties.takeoff [kilograms], one value or one per case
             
         Outputs:
             segment.state.conditions:           
@@ -37,15 +39,17 @@ def initialize_weights(segment):
     """    
     
  
+    numerics = segment.state.numerics
+ 
     if segment.state.initials:
-        m_initial = segment.state.initials.conditions.weights.total_mass[-1,0]
+        m_initial = last_rows(segment.state.initials.conditions.weights.total_mass,numerics)
     else:
        
-        m_initial = segment.analyses.weights.vehicle.mass_properties.takeoff
+        m_initial = case_values(segment.analyses.weights.vehicle.mass_properties.takeoff,numerics)
 
     m_current = segment.state.conditions.weights.total_mass
     
-    segment.state.conditions.weights.total_mass[:,:] = m_current + (m_initial - m_current[0,0])
+    segment.state.conditions.weights.total_mass[:,:] = m_current + (m_initial - first_rows(m_current,numerics))
         
     return
     
@@ -116,19 +120,22 @@ def update_weights(segment):
     
     # unpack
     conditions = segment.state.conditions
-    m0         = conditions.weights.total_mass[0,0]
+    numerics   = segment.state.numerics
+    m0         = first_rows(conditions.weights.total_mass,numerics)
     mdot_fuel  = conditions.weights.vehicle_mass_rate
     g          = conditions.freestream.gravity
     I          = segment.state.numerics.time.integrate
 
     # calculate
-    m = m0 + np.dot(I, -mdot_fuel )
+    m = m0 + I.dot( -mdot_fuel )
 
     # weight
     W = m*g
 
     # pack
-    conditions.weights.total_mass[1:,0]                  = m[1:,0] # don't mess with m0
+    first      = case_index(m,numerics,0)
+    m[first]   = m0[first] # don't mess with m0
+    conditions.weights.total_mass[:,0]                   = m[:,0]
     conditions.frames.inertial.gravity_force_vector[:,2] = W[:,0]
 
     return
\ No newline at end of file
@@ -8,4 +8,7 @@ from . import Energy
 from . import Noise 
 from . import Frames
 from . import Numerics
+from . import Cases
 from . import Weights
+from . import Stream
+from . import Release
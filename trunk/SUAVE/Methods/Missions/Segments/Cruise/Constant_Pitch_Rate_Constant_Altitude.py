@@ -105,7 +105,7 @@ def residual_total_forces(segment):
     D  = segment.state.numerics.time.differentiate  
     
     # process and pack
-    acceleration = np.dot(D,v)
+    acceleration = D.dot(v)
     segment.state.conditions.frames.inertial.acceleration_vector = acceleration
     a  = segment.state.conditions.frames.inertial.acceleration_vector
     
@@ -4,6 +4,13 @@
 # Created:  Jul 2014, SUAVE Team
 # Modified: Jan 2016, E. Botero
 #           May 2019, T. MacDonald
+#           Oct 2026, SUAVE Team
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+from SUAVE.Methods.Missions.Segments.Common.Cases import first_rows, last_rows, case_values
 
 # ----------------------------------------------------------------------
 #  Initialize Conditions
@@ -20,9 +27,9 @@ def initialize_conditions(segment):
     N/A
 
     Inputs:
-    segment.altitude                [meters]
-    segment.distance                [meters]
-    segment.speed                   [meters/second]
+    segment.altitude                [meters], one value or one per case
+    segment.distance                [meters], one value or one per case
+    segment.air_speed               [meters/second], one value or one per case
 
     Outputs:
     conditions.frames.inertial.velocity_vector  [meters/second]
@@ -35,24 +42,25 @@ def initialize_conditions(segment):
     """        
     
     # unpack
-    alt        = segment.altitude
-    xf         = segment.distance
-    air_speed  = segment.air_speed       
+    numerics   = segment.state.numerics
+    alt        = case_values(segment.altitude,numerics)
+    xf         = case_values(segment.distance,numerics)
+    air_speed  = case_values(segment.air_speed,numerics)
     conditions = segment.state.conditions 
     
     # check for initial altitude
     if alt is None:
         if not segment.state.initials: raise AttributeError('altitude not set')
-        alt = -1.0 * segment.state.initials.conditions.frames.inertial.position_vector[-1,2]
+        alt = -1.0 * last_rows(segment.state.initials.conditions.frames.inertial.position_vector,numerics)[:,2,None]
     
     # dimensionalize time
-    t_initial = conditions.frames.inertial.time[0,0]
+    t_initial = first_rows(conditions.frames.inertial.time,numerics)
     t_final   = xf / air_speed + t_initial
-    t_nondim  = segment.state.numerics.dimensionless.control_points
+    t_nondim  = numerics.dimensionless.control_points
     time      = t_nondim * (t_final-t_initial) + t_initial
     
     # pack
-    segment.state.conditions.freestream.altitude[:,0]             = alt
-    segment.state.conditions.frames.inertial.position_vector[:,2] = -alt # z points down
-    segment.state.conditions.frames.inertial.velocity_vector[:,0] = air_speed
-    segment.state.conditions.frames.inertial.time[:,0]            = time[:,0]
\ No newline at end of file
+    segment.state.conditions.freestream.altitude[:,0,None]             = alt
+    segment.state.conditions.frames.inertial.position_vector[:,2,None] = -alt # z points down
+    segment.state.conditions.frames.inertial.velocity_vector[:,0,None] = air_speed
+    segment.state.conditions.frames.inertial.time[:,0,None]            = time
\ No newline at end of file
@@ -152,7 +152,7 @@ def solve_residuals(segment):
     m  = conditions.weights.total_mass
 
     # process and pack
-    acceleration = np.dot(D , v)
+    acceleration = D.dot(v)
     conditions.frames.inertial.acceleration_vector = acceleration
     
     a  = segment.state.conditions.frames.inertial.acceleration_vector
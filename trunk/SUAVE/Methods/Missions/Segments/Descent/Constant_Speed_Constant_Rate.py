@@ -3,12 +3,14 @@
 # 
 # Created:  Jul 2014, SUAVE Team
 # Modified: Jan 2016, E. Botero
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
 # ----------------------------------------------------------------------
 
 import numpy as np
+from SUAVE.Methods.Missions.Segments.Common.Cases import last_rows, case_values
 
 # ----------------------------------------------------------------------
 #  Initialize Conditions
@@ -25,10 +27,10 @@ def initialize_conditions(segment):
     N/A
 
     Inputs:
-    segment.descent_rate                                [meters/second]
-    segment.altitude_start                              [meters]
-    segment.altitude_end                                [meters]
-    segment.air_speed                                   [meters/second]
+    segment.descent_rate                                [meters/second], one value or one per case
+    segment.altitude_start                              [meters], one value or one per case
+    segment.altitude_end                                [meters], one value or one per case
+    segment.air_speed                                   [meters/second], one value or one per case
     segment.state.numerics.dimensionless.control_points [array]
 
     Outputs:
@@ -42,17 +44,18 @@ def initialize_conditions(segment):
     """     
     
     # unpack
-    descent_rate = segment.descent_rate
-    air_speed    = segment.air_speed   
-    alt0         = segment.altitude_start 
-    altf         = segment.altitude_end
-    t_nondim     = segment.state.numerics.dimensionless.control_points
+    numerics     = segment.state.numerics
+    descent_rate = case_values(segment.descent_rate,numerics)
+    air_speed    = case_values(segment.air_speed,numerics)
+    alt0         = case_values(segment.altitude_start,numerics)
+    altf         = case_values(segment.altitude_end,numerics)
+    t_nondim     = numerics.dimensionless.control_points
     conditions   = segment.state.conditions  
 
     # check for initial altitude
     if alt0 is None:
         if not segment.state.initials: raise AttributeError('initial altitude not set')
-        alt0 = -1.0 *segment.state.initials.conditions.frames.inertial.position_vector[-1,2]
+        alt0 = -1.0 *last_rows(segment.state.initials.conditions.frames.inertial.position_vector,numerics)[:,2,None]
 
     # discretize on altitude
     alt = t_nondim * (altf-alt0) + alt0
@@ -63,7 +66,7 @@ def initialize_conditions(segment):
     v_x   = np.sqrt( v_mag**2 - v_z**2 )
     
     # pack conditions    
-    conditions.frames.inertial.velocity_vector[:,0] = v_x
-    conditions.frames.inertial.velocity_vector[:,2] = v_z
-    conditions.frames.inertial.position_vector[:,2] = -alt[:,0] # z points down
-    conditions.freestream.altitude[:,0]             =  alt[:,0] # positive altitude in this context
\ No newline at end of file
+    conditions.frames.inertial.velocity_vector[:,0,None] = v_x
+    conditions.frames.inertial.velocity_vector[:,2,None] = v_z
+    conditions.frames.inertial.position_vector[:,2,None] = -alt # z points down
+    conditions.freestream.altitude[:,0,None]             =  alt # positive altitude in this context
\ No newline at end of file
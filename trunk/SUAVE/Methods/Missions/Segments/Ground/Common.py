@@ -256,7 +256,7 @@ def solve_residuals(segment):
     D  = segment.state.numerics.time.differentiate
 
     # process and pack
-    acceleration                                   = np.dot(D , v)
+    acceleration                                   = D.dot(v)
     conditions.frames.inertial.acceleration_vector = acceleration
     
     if vf == 0.0: vf = 0.01
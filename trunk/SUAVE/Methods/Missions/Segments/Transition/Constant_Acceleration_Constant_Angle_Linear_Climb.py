@@ -132,7 +132,7 @@ def residual_total_forces(segment):
     FT      = segment.state.conditions.frames.inertial.total_force_vector
     v       = segment.state.conditions.frames.inertial.velocity_vector
     D       = segment.state.numerics.time.differentiate      
-    a       = np.dot(D,v)
+    a       = D.dot(v)
     segment.state.conditions.frames.inertial.acceleration_vector = a      
     m       = segment.state.conditions.weights.total_mass
 
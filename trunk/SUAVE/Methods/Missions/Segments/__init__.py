@@ -3,6 +3,7 @@
 # @ingroup Methods-Missions
 
 from .converge_root import converge_root
+from .refine_control_points import refine_control_points
 from .expand_state  import expand_state
 from .optimize      import converge_opt
 
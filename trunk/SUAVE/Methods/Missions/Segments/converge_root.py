@@ -3,6 +3,7 @@
 # 
 # Created:  Jul 2014, SUAVE Team
 # Modified: Jan 2016, E. Botero
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -11,15 +12,25 @@
 import scipy.optimize
 import numpy as np
 
+from SUAVE.Core import Data
 from SUAVE.Core.Arrays import array_type
+from .refine_control_points import refine_control_points, check_refinement
 
 # ----------------------------------------------------------------------
 #  Converge Root
 # ----------------------------------------------------------------------
 
 ## @ingroup Methods-Missions-Segments
-def converge_root(segment):
+def converge_root(segment,refine=True):
     """Interfaces the mission to a numerical solver. The solver may be changed by using root_finder.
+    With state.numerics.solver_jacobian set to 'sparse', fsolve gets a jacobian found by
+    finite differences of groups of unknowns that don't share a residual.
+    With a segment.warm_start store, the solve starts from the unknowns and the jacobian
+    the segment converged with last time.
+    With state.numerics.refinement.adaptive, the segment is solved again with more
+    control points until its discretization error is small enough, see refine_control_points.
+    With state.numerics.number_of_cases above one, the cases stacked in the segment are
+    solved together, and the jacobian is found for all the cases at once.
 
     Assumptions:
     N/A
@@ -29,17 +40,39 @@ def converge_root(segment):
 
     Inputs:
     segment                            [Data]
+    refine                             <boolean>
     segment.settings.root_finder       [Data]
+    segment.warm_start                 [Warm_Start]
+    state.numerics.solver_jacobian     [string]
+    state.numerics.number_of_cases     [int]
     state.numerics.tolerance_solution  [Unitless]
+    state.numerics.refinement.adaptive <boolean>
 
     Outputs:
     state.unknowns                     [Any]
     segment.state.numerics.converged   [Unitless]
+    state.numerics.evaluations         [Unitless]
+    state.numerics.jacobian            [array]
 
     Properties Used:
     N/A
     """       
     
+    numerics   = segment.state.numerics
+    warm_start = segment.warm_start
+    
+    # before solving, a discretization that can't be refined
+    if refine and numerics.refinement.adaptive:
+        check_refinement(segment)
+    
+    jacobian   = None
+    if warm_start is not None:
+        entry = warm_start.apply(segment)
+        if entry is not None:
+            jacobian = entry.jacobian
+    
+    numerics.evaluations = 0
+    
     unknowns = segment.state.unknowns.pack_array()
     
     try:
@@ -47,13 +80,34 @@ def converge_root(segment):
     except AttributeError:
         root_finder = scipy.optimize.fsolve 
     
-    unknowns,infodict,ier,msg = root_finder( iterate,
-                                         unknowns,
-                                         args = segment,
-                                         xtol = segment.state.numerics.tolerance_solution,
-                                         maxfev = segment.state.numerics.max_evaluations,
-                                         epsfcn = segment.state.numerics.step_size,
-                                         full_output = 1)
+    # a jacobian that costs a few iterations when the residuals are sparse or
+    # the cases are stacked, or the one the last solve ended with
+    stacked = numerics.number_of_cases > 1
+    if root_finder is scipy.optimize.fsolve and (numerics.solver_jacobian == 'sparse' or stacked or jacobian is not None):
+        guess  = unknowns.copy()
+        fprime = lambda unknowns,segment:finite_difference_jacobian(unknowns,segment,jacobian,guess)
+        unknowns,infodict,ier,msg = root_finder( iterate,
+                                             unknowns,
+                                             args = segment,
+                                             fprime = fprime,
+                                             xtol = numerics.tolerance_solution,
+                                             maxfev = numerics.max_evaluations,
+                                             full_output = 1)
+    else:
+        unknowns,infodict,ier,msg = root_finder( iterate,
+                                             unknowns,
+                                             args = segment,
+                                             xtol = numerics.tolerance_solution,
+                                             maxfev = numerics.max_evaluations,
+                                             epsfcn = numerics.step_size,
+                                             full_output = 1)
+    
+    # the jacobian the solver ended with, from its QR factors
+    if 'fjac' in infodict and 'r' in infodict:
+        n = len(unknowns)
+        r = np.zeros((n,n))
+        r[np.triu_indices(n)] = infodict['r']
+        numerics.jacobian = np.dot(infodict['fjac'].T,r)
     
     if ier!=1:
         print("Segment did not converge. Segment Tag: " + segment.tag)
@@ -63,6 +117,12 @@ def converge_root(segment):
     else:
         segment.state.numerics.converged = True
         segment.converged = True
+        
+    if warm_start is not None:
+        warm_start.save(segment,entry)
+        
+    if refine and numerics.refinement.adaptive:
+        refine_control_points(segment,converge_root)
                             
     return
     
@@ -76,7 +136,7 @@ def iterate(unknowns, segment):
     """Runs one iteration of of all analyses for the mission.
 
     Assumptions:
-    N/A
+    The steps of segment.process.iterate are run from their compiled list, see Process.compile
 
     Source:
     N/A
@@ -87,6 +147,7 @@ def iterate(unknowns, segment):
 
     Outputs:
     residuals                     [Unitless]
+    state.numerics.evaluations    [Unitless]
 
     Properties Used:
     N/A
@@ -96,8 +157,278 @@ def iterate(unknowns, segment):
     else:
         segment.state.unknowns = unknowns
         
-    segment.process.iterate(segment)
+    segment.process.iterate.evaluate_compiled(segment)
+    segment.state.numerics.evaluations += 1
     
     residuals = segment.state.residuals.pack_array()
         
-    return residuals 
\ No newline at end of file
+    return residuals 
+
+## @ingroup Methods-Missions-Segments
+def finite_difference_jacobian(unknowns, segment, first_jacobian=None, first_guess=None):
+    """Finds the jacobian of the residuals of a segment by finite differences,
+    with the same steps as fsolve. At the first guess of a solve, a given
+    jacobian is used instead.
+
+    Assumptions:
+    The residuals stored in the state belong to the unknowns stored in the state.
+
+    Source:
+    N/A
+
+    Inputs:
+    unknowns                            [array]
+    first_jacobian                      [array]
+    first_guess                         [array]
+    state.numerics.solver_jacobian      [string]
+    state.numerics.step_size            [Unitless]
+
+    Outputs:
+    jacobian                            [array]
+
+    Properties Used:
+    N/A
+    """
+    numerics = segment.state.numerics
+
+    # the solver is still at the first guess
+    n = len(unknowns)
+    if np.shape(first_jacobian) == (n,n) and np.array_equal(unknowns,first_guess):
+        return first_jacobian.copy()
+
+    # the residuals at the unknowns, the solver usually just found them
+    if np.array_equal(segment.state.unknowns.pack_array(),unknowns):
+        residuals = segment.state.residuals.pack_array()
+    else:
+        residuals = iterate(unknowns,segment)
+
+    # same steps as the finite differences of fsolve
+    epsilon = np.sqrt(max(numerics.step_size or 0., np.finfo(float).eps))
+    steps   = epsilon*np.abs(unknowns)
+    steps[steps==0.] = epsilon
+
+    if numerics.solver_jacobian == 'sparse':
+        jacobian = sparse_jacobian(unknowns,residuals,steps,segment)
+    else:
+        jacobian = dense_jacobian(unknowns,residuals,steps,segment)
+
+    return jacobian
+
+## @ingroup Methods-Missions-Segments
+def sparse_jacobian(unknowns,residuals,steps,segment):
+    """Finds the jacobian of the residuals of a segment by finite differences,
+    perturbing all the unknowns that don't share a residual at once. The
+    sparsity pattern is found the first time, or can be given.
+
+    Assumptions:
+    The entries of the finite difference jacobian at the first guess that are
+    smaller than jacobian_tolerance times the largest of their row stay small
+    and are left out. The solver corrects the jacobian as it goes, so weak
+    couplings, like the mass burned along the segment, only slow it down a bit.
+
+    Source:
+    Curtis, A. R., Powell, M. J. D., and Reid, J. K., "On the Estimation of
+    Sparse Jacobian Matrices", IMA Journal of Applied Mathematics, 1974
+
+    Inputs:
+    unknowns                            [array]
+    residuals                           [array]
+    steps                               [array]
+    state.numerics.jacobian_sparsity    [array of booleans, residuals by unknowns]
+    state.numerics.jacobian_tolerance   [Unitless]
+
+    Outputs:
+    jacobian                            [array]
+    state.numerics.jacobian_sparsity    [array of booleans]
+    state.numerics.jacobian_colors      [array of ints]
+
+    Properties Used:
+    N/A
+    """
+    numerics = segment.state.numerics
+
+    shape    = (len(residuals),len(unknowns))
+    sparsity = numerics.jacobian_sparsity
+    if sparsity is None or np.shape(sparsity) != shape:
+        jacobian = dense_jacobian(unknowns,residuals,steps,segment)
+        scale    = np.max(np.abs(jacobian),axis=1,keepdims=True)
+        sparsity = np.abs(jacobian) > numerics.jacobian_tolerance*scale
+        sparsity[np.diag_indices(min(shape))] = True
+        numerics.jacobian_sparsity = sparsity
+        numerics.jacobian_colors   = color_columns(sparsity)
+        return jacobian
+
+    colors = numerics.jacobian_colors
+    if colors is None or len(colors) != shape[1]:
+        colors = color_columns(sparsity)
+        numerics.jacobian_colors = colors
+
+    # one evaluation per group of columns
+    jacobian = np.zeros(shape)
+    for color in range(np.max(colors)+1):
+        columns = np.where(colors==color)[0]
+        x = unknowns.copy()
+        x[columns] += steps[columns]
+        delta = iterate(x,segment) - residuals
+        for column in columns:
+            rows = sparsity[:,column]
+            jacobian[rows,column] = delta[rows]/steps[column]
+
+    return jacobian
+
+## @ingroup Methods-Missions-Segments
+def dense_jacobian(unknowns,residuals,steps,segment):
+    """Finds the jacobian of the residuals of a segment by finite differences,
+    one unknown at a time. With stacked cases, the unknown at the same place
+    in each case is changed at once, see stacked_jacobian.
+
+    Assumptions:
+    N/A
+
+    Source:
+    N/A
+
+    Inputs:
+    unknowns                      [array]
+    residuals                     [array]
+    steps                         [array]
+    state.numerics.number_of_cases [int]
+
+    Outputs:
+    jacobian                      [array]
+
+    Properties Used:
+    N/A
+    """
+    if segment.state.numerics.number_of_cases > 1:
+        jacobian = stacked_jacobian(unknowns,residuals,steps,segment)
+        if jacobian is not None:
+            return jacobian
+    
+    jacobian = np.zeros((len(residuals),len(unknowns)))
+    for column in range(len(unknowns)):
+        x = unknowns.copy()
+        x[column] += steps[column]
+        jacobian[:,column] = (iterate(x,segment) - residuals)/steps[column]
+
+    return jacobian
+
+## @ingroup Methods-Missions-Segments
+def stacked_jacobian(unknowns,residuals,steps,segment):
+    """Finds the jacobian of the residuals of a segment with stacked cases by
+    finite differences, changing the unknown at the same place in every case
+    at once. The cases don't depend on each other, so the change of the
+    residuals of a case is due to its own unknown.
+
+    Assumptions:
+    Every unknown and residual belongs to a case, or None is returned
+
+    Source:
+    N/A
+
+    Inputs:
+    unknowns                      [array]
+    residuals                     [array]
+    steps                         [array]
+    state.numerics.number_of_cases [int]
+
+    Outputs:
+    jacobian                      [array]
+
+    Properties Used:
+    N/A
+    """
+    state = segment.state
+    K     = state.numerics.number_of_cases
+    
+    columns_case = case_labels(state.unknowns,K).pack_array()
+    rows_case    = case_labels(state.residuals,K).pack_array()
+    if len(columns_case) != len(unknowns) or len(rows_case) != len(residuals) \
+       or np.any(columns_case < 0) or np.any(rows_case < 0):
+        return None
+    
+    # the unknowns of each case, in the same order
+    groups = np.array([np.where(columns_case==case)[0] for case in range(K)])
+    rows   = [rows_case==case for case in range(K)]
+    
+    jacobian = np.zeros((len(residuals),len(unknowns)))
+    for columns in groups.T:
+        x = unknowns.copy()
+        x[columns] += steps[columns]
+        delta = iterate(x,segment) - residuals
+        for case,column in enumerate(columns):
+            jacobian[rows[case],column] = delta[rows[case]]/steps[column]
+
+    return jacobian
+
+## @ingroup Methods-Missions-Segments
+def case_labels(data,K):
+    """Labels each entry of the arrays of a state with its case, stacked along
+    the rows. Entries that aren't stacked are labeled -1.
+
+    Assumptions:
+    N/A
+
+    Source:
+    N/A
+
+    Inputs:
+    data                          [Data]
+    K                             [int]
+
+    Outputs:
+    labels                        [Data], packs like data
+
+    Properties Used:
+    N/A
+    """
+    labels = Data()
+    for key,value in data.items():
+        if isinstance(value,dict):
+            labels[key] = case_labels(value,K)
+        elif isinstance(value,np.ndarray) and value.ndim in (1,2) and len(value) % K == 0:
+            case = np.repeat(np.arange(K,dtype=float),len(value)//K)
+            labels[key] = np.broadcast_to(case.reshape((-1,)+(1,)*(value.ndim-1)),value.shape)
+        elif isinstance(value,(int,float,np.ndarray)):
+            labels[key] = -np.ones(np.shape(value))
+        else:
+            labels[key] = value
+
+    return labels
+
+## @ingroup Methods-Missions-Segments
+def color_columns(sparsity):
+    """Groups the columns of a sparse matrix so that no two columns of a group
+    have a nonzero in the same row. The columns of a group can be found by
+    finite differences together.
+
+    Assumptions:
+    Greedy coloring, in the order of the columns
+
+    Source:
+    Curtis, A. R., Powell, M. J. D., and Reid, J. K., "On the Estimation of
+    Sparse Jacobian Matrices", IMA Journal of Applied Mathematics, 1974
+
+    Inputs:
+    sparsity                      [array of booleans]
+
+    Outputs:
+    colors                        [array of ints, the group of each column]
+
+    Properties Used:
+    N/A
+    """
+
+    sparsity = np.asarray(sparsity,dtype=float)
+    overlap  = np.dot(sparsity.T,sparsity) > 0.
+    n        = overlap.shape[0]
+    colors   = -np.ones(n,dtype=int)
+
+    for column in range(n):
+        used = colors[overlap[column]]
+        color = 0
+        while color in used:
+            color += 1
+        colors[column] = color
+
+    return colors
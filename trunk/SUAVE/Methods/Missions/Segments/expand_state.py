@@ -3,6 +3,7 @@
 # 
 # Created:  Jul 2014, SUAVE Team
 # Modified: Jan 2016, E. Botero
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Expand State
@@ -21,6 +22,7 @@ def expand_state(segment):
 
     Inputs:
     state.numerics.number_control_points  [Unitless]
+    state.numerics.number_of_cases        [Unitless]
 
     Outputs:
     N/A
@@ -29,7 +31,8 @@ def expand_state(segment):
     N/A
     """       
 
-    n_points = segment.state.numerics.number_control_points
+    numerics = segment.state.numerics
+    n_points = numerics.number_control_points * numerics.number_of_cases
     
     segment.state.expand_rows(n_points)
     
@@ -5,6 +5,7 @@
 # Modified: Jun 2017, E. Botero
 #           Mar 2020, M. Clarke
 #           Apr 2020, M. Clarke
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -120,7 +121,7 @@ def get_objective(unknowns, segment):
         segment.state.unknowns = unknowns
         
     if not np.all(segment.state.inputs_last == segment.state.unknowns):       
-        segment.process.iterate(segment)
+        segment.process.iterate.evaluate_compiled(segment)
         
     objective = segment.state.objective_value
     
@@ -150,7 +151,7 @@ def get_econstraints(unknowns, segment):
         segment.state.unknowns = unknowns
         
     if not np.all(segment.state.inputs_last == segment.state.unknowns):       
-        segment.process.iterate(segment)
+        segment.process.iterate.evaluate_compiled(segment)
 
     constraints = segment.state.constraint_values
     
@@ -223,7 +224,7 @@ def get_ieconstraints(unknowns, segment):
         segment.state.unknowns = unknowns
         
     if not np.all(segment.state.inputs_last == segment.state.unknowns):
-        segment.process.iterate(segment)
+        segment.process.iterate.evaluate_compiled(segment)
     
     # Time goes forward, not backward
     t_final = segment.state.conditions.frames.inertial.time[-1,0]
@@ -273,7 +274,7 @@ def get_problem_pyopt(unknowns, segment):
         segment.state.unknowns = unknowns
         
     if not np.all(segment.state.inputs_last == segment.state.unknowns):
-        segment.process.iterate(segment)
+        segment.process.iterate.evaluate_compiled(segment)
         
     obj      = segment.state.objective_value
     
@@ -0,0 +1,307 @@
+## @ingroup Methods-Missions-Segments
+# refine_control_points.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+from SUAVE.Core import Data
+from SUAVE.Core.Arrays import array_type
+from SUAVE.Methods.Utilities.Chebyshev import chebyshev_data
+
+import numpy as np
+from copy import deepcopy
+from numpy.polynomial import chebyshev
+from scipy.interpolate import BarycentricInterpolator
+
+# ----------------------------------------------------------------------
+#  Refine Control Points
+# ----------------------------------------------------------------------
+
+## @ingroup Methods-Missions-Segments
+def refine_control_points(segment,solve):
+    """Estimates the discretization error of a converged segment and, when it
+    is larger than the tolerance, solves the segment again with more control
+    points, starting from the coarse solution interpolated to the new points.
+    The number of points goes from N to 2N-1, so the cosine spaced points of
+    the coarse solution are kept.
+
+    Assumptions:
+    The error is the size of the last two Chebyshev coefficients of the
+    states, relative to the largest one. A converged, smooth, solution has
+    coefficients that fall quickly, an under resolved one doesn't.
+    The segment keeps the number of points it was refined to.
+    Only segments discretized with chebyshev_data, and a single case, can be
+    refined: the error estimate and the points kept from N to 2N-1 both rely
+    on the Chebyshev points. Other discretizations, like trapezoidal_data,
+    raise a ValueError.
+
+    Source:
+    Trefethen, L. N., "Approximation Theory and Approximation Practice", SIAM, 2013, Ch. 3-4
+
+    Inputs:
+    segment                                     [Data]
+    solve                                       <function>, solves the segment without refining, like converge_root
+    state.numerics.discretization_method        <function>, chebyshev_data
+    state.numerics.number_of_cases              [Unitless], 1
+    state.numerics.number_control_points        [Unitless]
+    state.numerics.refinement.tolerance         [Unitless]
+    state.numerics.refinement.maximum_control_points [Unitless]
+    state.numerics.refinement.states            [list of strings]
+
+    Outputs:
+    state.numerics.number_control_points        [Unitless]
+    state.numerics.refinement.history           [list], N, error and evaluations of each solve
+    state.numerics.evaluations                  [Unitless], of all the solves
+
+    Properties Used:
+    N/A
+    """
+
+    numerics    = segment.state.numerics
+    refinement  = numerics.refinement
+    check_refinement(segment)
+    
+    error       = discretization_error(segment)
+    evaluations = numerics.evaluations
+
+    refinement.history = [refinement_record(segment,error)]
+
+    while numerics.converged and error > refinement.tolerance \
+          and numerics.number_control_points < refinement.maximum_control_points:
+
+        # the coarse solution
+        N        = numerics.number_control_points
+        x        = np.array(numerics.dimensionless.control_points[:,0])
+        unknowns = deepcopy(segment.state.unknowns)
+
+        # more points, the state and the operators follow
+        numerics.number_control_points = min(2*N-1,refinement.maximum_control_points)
+        segment.process.initialize(segment)
+
+        x_new = numerics.dimensionless.control_points[:,0]
+        interpolate_rows(unknowns,segment.state.unknowns,x,x_new)
+
+        # and again
+        solve(segment,refine=False)
+        error        = discretization_error(segment)
+        evaluations += numerics.evaluations
+        refinement.history.append(refinement_record(segment,error))
+
+    numerics.evaluations = evaluations
+
+    return
+
+## @ingroup Methods-Missions-Segments
+def refinement_report(mission):
+    """A table of the number of control points each segment of a mission was
+    solved with, its estimated error and the evaluations it took
+
+    Assumptions:
+    The segments were solved with state.numerics.refinement.adaptive
+
+    Source:
+    N/A
+
+    Inputs:
+    mission.segments                            [Data]
+    state.numerics.refinement.history           [list]
+
+    Outputs:
+    report                                      [string]
+
+    Properties Used:
+    N/A
+    """
+
+    width = max([len(tag) for tag in mission.segments.keys()] + [7])
+    lines = ['%-*s %-16s %10s %12s' % (width,'segment','points','error','evaluations')]
+
+    total = 0
+    for tag,segment in mission.segments.items():
+        history = segment.state.numerics.refinement.history
+        if not history:
+            continue
+        points = ' > '.join(str(record.number_control_points) for record in history)
+        cost   = sum(record.evaluations for record in history)
+        total += cost
+        lines.append('%-*s %-16s %10.2e %12d' % (width,tag,points,history[-1].error,cost))
+
+    lines.append('%-*s %-16s %10s %12d' % (width,'total','','',total))
+
+    return '\n'.join(lines)
+
+# ----------------------------------------------------------------------
+#  Helper Functions
+# ----------------------------------------------------------------------
+
+## @ingroup Methods-Missions-Segments
+def check_refinement(segment):
+    """Checks that a segment is discretized so it can be refined
+
+    Assumptions:
+    The error estimate needs the Chebyshev points of a single case
+
+    Source:
+    N/A
+
+    Inputs:
+    state.numerics.discretization_method        <function>
+    state.numerics.number_of_cases              [Unitless]
+
+    Outputs:
+    N/A
+
+    Properties Used:
+    N/A
+    """
+
+    numerics = segment.state.numerics
+
+    if numerics.discretization_method is not chebyshev_data:
+        raise ValueError('segment %s: the control points can only be refined with chebyshev_data, not %s'
+                         % (segment.tag,getattr(numerics.discretization_method,'__name__',numerics.discretization_method)))
+
+    if numerics.number_of_cases > 1:
+        raise ValueError('segment %s: the control points can not be refined with stacked cases' % segment.tag)
+
+    return
+
+## @ingroup Methods-Missions-Segments
+def discretization_error(segment):
+    """Estimates the discretization error of the states of a segment from the
+    decay of their Chebyshev coefficients.
+
+    Assumptions:
+    Columns that are zero, or constant, have no error. The control points are
+    those of chebyshev_data, see check_refinement.
+
+    Source:
+    Trefethen, L. N., "Approximation Theory and Approximation Practice", SIAM, 2013, Ch. 3-4
+
+    Inputs:
+    state.numerics.dimensionless.control_points [Unitless]
+    state.numerics.refinement.states            [list of strings], paths in the state, like 'conditions.weights.total_mass'
+
+    Outputs:
+    error                                       [Unitless]
+
+    Properties Used:
+    N/A
+    """
+
+    state = segment.state
+    x     = state.numerics.dimensionless.control_points[:,0]
+    N     = len(x)
+
+    if N < 3:
+        return 0.
+
+    error = 0.
+    for path in state.numerics.refinement.states:
+        for values in rows_of(state.deep_get(path),N):
+            coefficients = np.abs(chebyshev.chebfit(2.*x-1.,np.real(values),N-1))
+            scale        = np.max(coefficients,axis=0)
+            tail         = np.max(coefficients[-2:],axis=0)
+            keep         = scale > 0.
+            if np.any(keep):
+                error = max(error,np.max(tail[keep]/scale[keep]))
+
+    return error
+
+## @ingroup Methods-Missions-Segments
+def refinement_record(segment,error):
+    """The number of points, error and cost of the last solve of a segment
+
+    Assumptions:
+    None
+
+    Source:
+    N/A
+
+    Inputs:
+    segment                                     [Data]
+    error                                       [Unitless]
+
+    Outputs:
+    record                                      [Data]
+
+    Properties Used:
+    N/A
+    """
+
+    numerics = segment.state.numerics
+
+    return Data(number_control_points = numerics.number_control_points,
+                error                 = error,
+                evaluations           = numerics.evaluations,
+                converged             = numerics.converged)
+
+## @ingroup Methods-Missions-Segments
+def rows_of(data,N):
+    """The arrays with a row per control point found in an array or a Data,
+    as 2-D arrays
+
+    Assumptions:
+    None
+
+    Source:
+    N/A
+
+    Inputs:
+    data     [array or Data]
+    N        [Unitless]
+
+    Outputs:
+    arrays   [list of arrays]
+
+    Properties Used:
+    N/A
+    """
+
+    if isinstance(data,Data):
+        arrays = []
+        for value in data.values():
+            arrays.extend(rows_of(value,N))
+        return arrays
+
+    if isinstance(data,array_type) and data.ndim == 2 and data.shape[0] == N:
+        return [data]
+
+    return []
+
+## @ingroup Methods-Missions-Segments
+def interpolate_rows(old,new,x,x_new):
+    """Interpolates the arrays of a Data with a row per control point to new
+    control points, in place, with the polynomial through the old points.
+
+    Assumptions:
+    Arrays that don't have a row per point are left as they are.
+
+    Source:
+    Berrut, J.-P. and Trefethen, L. N., "Barycentric Lagrange Interpolation", SIAM Review, 2004
+
+    Inputs:
+    old      [Data]
+    new      [Data], with the same fields as old
+    x        [Unitless], the old points
+    x_new    [Unitless], the new points
+
+    Outputs:
+    new      [Data]
+
+    Properties Used:
+    N/A
+    """
+
+    for key,value in old.items():
+        if isinstance(value,Data):
+            interpolate_rows(value,new[key],x,x_new)
+        elif isinstance(value,array_type) and value.ndim == 2 and value.shape[0] == len(x) \
+             and np.shape(new[key]) == (len(x_new),value.shape[1]):
+            new[key][:] = BarycentricInterpolator(x,value)(x_new)
+
+    return new
@@ -19,7 +19,6 @@ from SUAVE.Methods.Flight_Dynamics.Static_Stability.Approximations import datcom
 
 # package imports
 import numpy as np
-import matplotlib.pyplot as plt
 
 # ----------------------------------------------------------------------
 #  Compute a V-n diagram
@@ -886,6 +885,7 @@ def post_processing(category_tag, Uref_rough, Uref_cruise, Uref_dive, V_n_data,
     #-----------------------------
     # Plotting the V-n diagram
     #-----------------------------
+    import matplotlib.pyplot as plt
     fig, ax = plt.subplots()
     ax.fill(airspeeds_pos, load_factors_pos, c='b', alpha=0.3)
     ax.fill(airspeeds_neg, load_factors_neg, c='b', alpha=0.3)
@@ -14,7 +14,6 @@ from SUAVE.Core import Units, Data
 from SUAVE.Methods.Performance.propeller_single_point import propeller_single_point
 
 import numpy as np
-import matplotlib.pyplot as plt
 
 #------------------------------------------------------------------------------
 # Flight Envelope Function
@@ -156,6 +155,7 @@ def electric_V_h_diagram(vehicle,
     climb_rate  = climb_rate / Units['ft/min']
 
     if display_plot:
+        import matplotlib.pyplot as plt
 
         # Get Speed and Altitude to Agree with Climb Rate Dimensions
 
@@ -2,16 +2,16 @@
 # electric_payload_range.py
 #
 # Created: Jan 2021, J. Smart
-# Modified:
+# Modified: Oct 2026, SUAVE Team
 
 #------------------------------------------------------------------------------
 # Imports
 #------------------------------------------------------------------------------
 
 from SUAVE.Core import Units, Data
+from SUAVE.Analyses.Mission.Segments.Warm_Start import Warm_Start
 
 import numpy as np
-import matplotlib.pyplot as plt
 
 #------------------------------------------------------------------------------
 # Electric Payload Range Function
@@ -36,7 +36,9 @@ def electric_payload_range(vehicle,
 
         Assumptions:
 
-        Assumes use of Battery Propeller Energy Network
+        Assumes use of Battery Propeller Energy Network. The ferry range starts
+        from the unknowns the maximum payload range converged with, unless the
+        mission has a warm start store of its own.
 
         Inputs:
 
@@ -96,11 +98,18 @@ def electric_payload_range(vehicle,
 
     # Calculate Vehicle Range for Max Payload and Ferry Conditions
 
-    for i in range(2):
-        mission.segments[0].analyses.weights.vehicle.mass_properties.takeoff = TOW[i]
-        results = mission.evaluate()
-        segment = results.segments[cruise_segment_tag]
-        R[i]    = segment.conditions.frames.inertial.position_vector[-1,0]
+    warm_start = mission.warm_start
+    if warm_start is None:
+        mission.warm_start = Warm_Start()
+
+    try:
+        for i in range(2):
+            mission.segments[0].analyses.weights.vehicle.mass_properties.takeoff = TOW[i]
+            results = mission.evaluate()
+            segment = results.segments[cruise_segment_tag]
+            R[i]    = segment.conditions.frames.inertial.position_vector[-1,0]
+    finally:
+        mission.warm_start = warm_start
 
     # Insert Starting Point for Diagram Construction
 
@@ -116,6 +125,7 @@ def electric_payload_range(vehicle,
     payload_range.takeoff_weight    = TOW
 
     if display_plot:
+        import matplotlib.pyplot as plt
 
         plt.plot(R, PLD, 'r')
         plt.xlabel('Range (m)')
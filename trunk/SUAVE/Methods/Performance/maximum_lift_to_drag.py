@@ -11,6 +11,7 @@
 from SUAVE.Core import Data
 import numpy as np
 import scipy as sp
+import scipy.optimize
 
 import SUAVE
 
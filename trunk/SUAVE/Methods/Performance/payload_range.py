@@ -3,12 +3,15 @@
 #
 # Created:  Apr 2014, T. Orra
 # Modified: Jan 2016, E. Botero
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
 # ----------------------------------------------------------------------
 
 from SUAVE.Core import Units
+from SUAVE.Analyses.Mission.Segments.Warm_Start import Warm_Start
+from SUAVE.Analyses.Mission.Segments.Segment import stacked_segments
 import time
 import numpy as np
 
@@ -21,7 +24,12 @@ def payload_range(vehicle,mission,cruise_segment_tag,reserves=0.):
     """Calculates a vehicle's payload range diagram. Includes plotting.
 
     Assumptions:
-    Constant altitude cruise
+    Constant altitude cruise. The points are solved together, stacked along the
+    control points of the segments, when the segments of the mission allow it,
+    see Segment.evaluate_cases. Each evaluation of the mission starts from the
+    unknowns the one before converged with, unless the mission has a warm
+    start store of its own. The takeoff weight and cruise distance of the
+    mission are restored once the points are found.
 
     Source:
     N/A
@@ -100,70 +108,35 @@ def payload_range(vehicle,mission,cruise_segment_tag,reserves=0.):
     FUEL    = [ min(TOW[1] - OEW - MaxPLD,MaxFuel) , MaxFuel                , MaxFuel       ]
     PLD     = [ MaxPLD                             , MTOW - MaxFuel - OEW   , 0.            ]
 
-    # allocating Range array
-    R       = [0,0,0]
-
     # evaluate the mission
     if iprint:
         print('\n\n\n .......... PAYLOAD RANGE DIAGRAM CALCULATION ..........\n')
 
-    # loop for each point of Payload Range Diagram
-    for i in range(len(TOW)):
-##    for i in [2]:
-        if iprint:
-            print(('   EVALUATING POINT : ' + str(i+1)))
-
-        # Define takeoff weight
-        mission.segments[0].analyses.weights.vehicle.mass_properties.takeoff = TOW[i]
-
-        # Evaluate mission with current TOW
-        results = mission.evaluate()
-        segment = results.segments[cruise_segment_tag]
-
-        # Distance convergency in order to have total fuel equal to target fuel
-        #
-        # User don't have the option of run a mission for a given fuel. So, we
-        # have to iterate distance in order to have total fuel equal to target fuel
-        #
-
-        maxIter = 10 # maximum iteration limit
-        tol = 1.     # fuel convergency tolerance
-        err = 9999.  # error to be minimized
-        iter = 0     # iteration count
-
-        while abs(err) > tol and iter < maxIter:
-            iter = iter + 1
-
-            # Current total fuel burned in mission
-            TotalFuel  = TOW[i] - results.segments[-1].conditions.weights.total_mass[-1,0]
-
-            # Difference between burned fuel and target fuel
-            missingFuel = FUEL[i] - TotalFuel - reserves
-
-            # Current distance and fuel consuption in the cruise segment
-            CruiseDist = np.diff( segment.conditions.frames.inertial.position_vector[[0,-1],0] )[0]        # Distance [m]
-            CruiseFuel = segment.conditions.weights.total_mass[0,0] - segment.conditions.weights.total_mass[-1,0]    # [kg]
-            # Current specific range (m/kg)
-            CruiseSR    = CruiseDist / CruiseFuel        # [m/kg]
-
-            # Estimated distance that will result in total fuel burn = target fuel
-            DeltaDist  =  CruiseSR *  missingFuel
-            mission.segments[cruise_segment_tag].distance = (CruiseDist + DeltaDist)
-
-            # running mission with new distance
-            results = mission.evaluate()
-            segment = results.segments[cruise_segment_tag]
-
-            # Difference between burned fuel and target fuel
-            err = ( TOW[i] - results.segments[-1].conditions.weights.total_mass[-1,0] ) - FUEL[i] + reserves
-
-            if iprint:
-                print(('     iter: ' +str('%2g' % iter) + ' | Target Fuel: '   \
-                  + str('%8.0F' % FUEL[i]) + ' (kg) | Current Fuel: ' \
-                  + str('%8.0F' % (err+FUEL[i]))+' (kg) | Residual : '+str('%8.0F' % err)))
-
-        # Allocating resulting range in ouput array.
-        R[i] = ( results.segments[-1].conditions.frames.inertial.position_vector[-1,0] ) * Units.m / Units.nautical_mile      #Distance [nm]
+    # the points are solved together, stacked in the mission, when its segments
+    # allow it, and start from the unknowns of the iteration before, see Warm_Start
+    masses_takeoff = mission.segments[0].analyses.weights.vehicle.mass_properties
+    cruise         = mission.segments[cruise_segment_tag]
+    takeoff        = masses_takeoff.takeoff
+    distance       = cruise.distance
+    warm_start     = mission.warm_start
+    if warm_start is None:
+        mission.warm_start = Warm_Start()
+
+    try:
+        stacked_segments(mission)
+        stacked = True
+    except ValueError:
+        stacked = False
+
+    try:
+        if stacked:
+            R = stacked_ranges(mission,cruise_segment_tag,TOW,FUEL,reserves,iprint)
+        else:
+            R = serial_ranges(mission,cruise_segment_tag,TOW,FUEL,reserves,iprint)
+    finally:
+        mission.warm_start     = warm_start
+        masses_takeoff.takeoff = takeoff
+        cruise.distance        = distance
 
     # Inserting point (0,0) in output arrays
     R.insert(0,0)
@@ -225,3 +198,187 @@ def payload_range(vehicle,mission,cruise_segment_tag,reserves=0.):
         plt.show()
 
     return payload_range
+
+
+# ----------------------------------------------------------------------
+#  Ranges of the Payload Range Points
+# ----------------------------------------------------------------------
+
+## @ingroup Methods-Performance
+def stacked_ranges(mission,cruise_segment_tag,TOW,FUEL,reserves,iprint):
+    """Finds the range of the points of a payload range diagram, solved together
+    as cases stacked in the mission. The cruise distance of each point is
+    iterated until the fuel burned matches the fuel of the point.
+
+    Assumptions:
+    The points whose fuel matches keep their cruise distance while the others
+    are iterated
+
+    Source:
+    N/A
+
+    Inputs:
+    mission                               [Mission]
+    cruise_segment_tag                    <string>
+    TOW                                   [kg], of each point
+    FUEL                                  [kg], of each point
+    reserves                              [kg]
+    iprint                                <boolean>
+
+    Outputs:
+    R                                     [nm], of each point
+
+    Properties Used:
+    N/A
+    """
+    
+    K      = len(TOW)
+    TOW    = np.array(TOW,dtype=float)
+    FUEL   = np.array(FUEL,dtype=float)
+    cruise = mission.segments[cruise_segment_tag]
+    
+    if iprint:
+        print(('   EVALUATING POINTS : 1 to ' + str(K)))
+
+    # Define takeoff weights and evaluate the mission with all of them
+    mission.segments[0].analyses.weights.vehicle.mass_properties.takeoff = TOW
+    cruise.distance = np.ones(K) * cruise.distance
+    results = mission.evaluate_cases(K)
+
+    # Distance convergency in order to have total fuel equal to target fuel, see serial_ranges
+    maxIter = 10              # maximum iteration limit
+    tol     = 1.              # fuel convergency tolerance
+    err     = 9999.*np.ones(K) # error to be minimized
+    iters   = np.zeros(K,int) # iteration count
+
+    active = (np.abs(err) > tol) & (iters < maxIter)
+    while np.any(active):
+        iters[active] += 1
+        
+        distance = np.array(cruise.distance,dtype=float)
+        for i in np.where(active)[0]:
+            segment = results[i].segments[cruise_segment_tag]
+
+            # Current total fuel burned in mission
+            TotalFuel  = TOW[i] - results[i].segments[-1].conditions.weights.total_mass[-1,0]
+
+            # Difference between burned fuel and target fuel
+            missingFuel = FUEL[i] - TotalFuel - reserves
+
+            # Current distance and fuel consuption in the cruise segment
+            CruiseDist = np.diff( segment.conditions.frames.inertial.position_vector[[0,-1],0] )[0]        # Distance [m]
+            CruiseFuel = segment.conditions.weights.total_mass[0,0] - segment.conditions.weights.total_mass[-1,0]    # [kg]
+            CruiseSR   = CruiseDist / CruiseFuel        # [m/kg]
+
+            # Estimated distance that will result in total fuel burn = target fuel
+            distance[i] = CruiseDist + CruiseSR * missingFuel
+
+        # running mission with new distances
+        cruise.distance = distance
+        results = mission.evaluate_cases(K)
+
+        for i in np.where(active)[0]:
+            # Difference between burned fuel and target fuel
+            err[i] = ( TOW[i] - results[i].segments[-1].conditions.weights.total_mass[-1,0] ) - FUEL[i] + reserves
+
+            if iprint:
+                print(('     point: ' + str(i+1) + ' | iter: ' +str('%2g' % iters[i]) + ' | Target Fuel: '   \
+                  + str('%8.0F' % FUEL[i]) + ' (kg) | Current Fuel: ' \
+                  + str('%8.0F' % (err[i]+FUEL[i]))+' (kg) | Residual : '+str('%8.0F' % err[i])))
+                
+        active = (np.abs(err) > tol) & (iters < maxIter)
+
+    # resulting range of each point
+    R = [ results[i].segments[-1].conditions.frames.inertial.position_vector[-1,0] * Units.m / Units.nautical_mile for i in range(K) ] #Distance [nm]
+
+    return R
+
+## @ingroup Methods-Performance
+def serial_ranges(mission,cruise_segment_tag,TOW,FUEL,reserves,iprint):
+    """Finds the range of the points of a payload range diagram one at a time.
+    The cruise distance of each point is iterated until the fuel burned matches
+    the fuel of the point.
+
+    Assumptions:
+    N/A
+
+    Source:
+    N/A
+
+    Inputs:
+    mission                               [Mission]
+    cruise_segment_tag                    <string>
+    TOW                                   [kg], of each point
+    FUEL                                  [kg], of each point
+    reserves                              [kg]
+    iprint                                <boolean>
+
+    Outputs:
+    R                                     [nm], of each point
+
+    Properties Used:
+    N/A
+    """
+    
+    # allocating Range array
+    R = [0]*len(TOW)
+
+    # loop for each point of Payload Range Diagram
+    for i in range(len(TOW)):
+##    for i in [2]:
+        if iprint:
+            print(('   EVALUATING POINT : ' + str(i+1)))
+
+        # Define takeoff weight
+        mission.segments[0].analyses.weights.vehicle.mass_properties.takeoff = TOW[i]
+
+        # Evaluate mission with current TOW
+        results = mission.evaluate()
+        segment = results.segments[cruise_segment_tag]
+
+        # Distance convergency in order to have total fuel equal to target fuel
+        #
+        # User don't have the option of run a mission for a given fuel. So, we
+        # have to iterate distance in order to have total fuel equal to target fuel
+        #
+
+        maxIter = 10 # maximum iteration limit
+        tol = 1.     # fuel convergency tolerance
+        err = 9999.  # error to be minimized
+        iter = 0     # iteration count
+
+        while abs(err) > tol and iter < maxIter:
+            iter = iter + 1
+
+            # Current total fuel burned in mission
+            TotalFuel  = TOW[i] - results.segments[-1].conditions.weights.total_mass[-1,0]
+
+            # Difference between burned fuel and target fuel
+            missingFuel = FUEL[i] - TotalFuel - reserves
+
+            # Current distance and fuel consuption in the cruise segment
+            CruiseDist = np.diff( segment.conditions.frames.inertial.position_vector[[0,-1],0] )[0]        # Distance [m]
+            CruiseFuel = segment.conditions.weights.total_mass[0,0] - segment.conditions.weights.total_mass[-1,0]    # [kg]
+            # Current specific range (m/kg)
+            CruiseSR    = CruiseDist / CruiseFuel        # [m/kg]
+
+            # Estimated distance that will result in total fuel burn = target fuel
+            DeltaDist  =  CruiseSR *  missingFuel
+            mission.segments[cruise_segment_tag].distance = (CruiseDist + DeltaDist)
+
+            # running mission with new distance
+            results = mission.evaluate()
+            segment = results.segments[cruise_segment_tag]
+
+            # Difference between burned fuel and target fuel
+            err = ( TOW[i] - results.segments[-1].conditions.weights.total_mass[-1,0] ) - FUEL[i] + reserves
+
+            if iprint:
+                print(('     iter: ' +str('%2g' % iter) + ' | Target Fuel: '   \
+                  + str('%8.0F' % FUEL[i]) + ' (kg) | Current Fuel: ' \
+                  + str('%8.0F' % (err+FUEL[i]))+' (kg) | Residual : '+str('%8.0F' % err)))
+
+        # Allocating resulting range in ouput array.
+        R[i] = ( results.segments[-1].conditions.frames.inertial.position_vector[-1,0] ) * Units.m / Units.nautical_mile      #Distance [nm]
+
+    return R
@@ -58,7 +58,7 @@ def datta_discharge(battery,numerics):
     max_energy = battery.max_energy
     
     #state of charge of the battery
-    initial_discharge_state = np.dot(I,pbat) + battery.current_energy[0]
+    initial_discharge_state = I.dot(pbat) + battery.current_energy[0]
     x = np.divide(initial_discharge_state,battery.max_energy)
 
     # C rate
@@ -83,7 +83,7 @@ def datta_discharge(battery,numerics):
     P = pbat - np.abs(Ploss)
     
     # Possible Energy going into the battery:
-    energy_unmodified = np.dot(I,P)
+    energy_unmodified = I.dot(P)
     
     # Available capacity
     capacity_available = max_energy - battery.current_energy[0]
@@ -93,11 +93,11 @@ def datta_discharge(battery,numerics):
     delta[delta<0.] = 0.
     
     # Power that shouldn't go in
-    ddelta = np.dot(D,delta) 
+    ddelta = D.dot(delta) 
     
     # Power actually going into the battery
     P[P>0.] = P[P>0.] - ddelta[P>0.]
-    ebat = np.dot(I,P)
+    ebat = I.dot(P)
     ebat = np.reshape(ebat,np.shape(battery.current_energy)) #make sure it's consistent
     
     # Add this to the current state
@@ -11,6 +11,7 @@
 # ----------------------------------------------------------------------
 
 import scipy as sp
+import scipy.optimize
 from .find_ragone_properties import find_ragone_properties
 
 # ----------------------------------------------------------------------
@@ -10,6 +10,7 @@
 
 import numpy as np
 import scipy as sp
+import scipy.optimize
 from SUAVE.Core import Units
 from .SOFC_find_voltage import SOFC_find_voltage
 from .SOFC_find_power_diff import SOFC_find_power_diff
@@ -8,6 +8,7 @@
 # ----------------------------------------------------------------------
 
 import scipy as sp
+import scipy.optimize
 import numpy as np
 from SUAVE.Core import Units
 from SUAVE.Methods.Power.Fuel_Cell.Discharge.SOFC_find_power import SOFC_find_power
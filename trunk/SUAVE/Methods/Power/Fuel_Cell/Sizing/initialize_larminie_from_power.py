@@ -10,6 +10,7 @@
 # ----------------------------------------------------------------------
 
 import scipy as sp
+import scipy.optimize
 import numpy as np
 from SUAVE.Core import Units
 from SUAVE.Methods.Power.Fuel_Cell.Discharge.find_power_larminie import find_power_larminie
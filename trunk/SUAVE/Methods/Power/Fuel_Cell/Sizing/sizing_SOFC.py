@@ -9,7 +9,6 @@
 
 import scipy as sp
 import numpy as np
-import matplotlib as plt
 from SUAVE.Core import Units
 
 # ----------------------------------------------------------------------
@@ -30,6 +29,9 @@ def sizing_SOFC(SOFC,conditions,numerics,power):
 
 def plot_sizing_SOFC(SOFC,conditions,numerics):
 
+    import matplotlib.pyplot
+    import matplotlib as plt
+
     SOFC.electrolytex = np.array([0, SOFC.channelwidth + SOFC.interconnectcontactwidth, SOFC.channelwidth + SOFC.interconnectcontactwidth, 0, 0])
     SOFC.electrolytey = np.array([0, 0, SOFC.electrolytethickness, SOFC.electrolytethickness, 0])
     SOFC.anodex = np.array([0, SOFC.channelwidth + SOFC.interconnectcontactwidth, SOFC.channelwidth + SOFC.interconnectcontactwidth, 0, 0])
@@ -14,6 +14,7 @@
 import SUAVE
 import numpy as np
 import scipy as sp
+import scipy.integrate
 from SUAVE.Core import Units , Data
 from scipy.optimize import root
 from SUAVE.Methods.Geometry.Two_Dimensional.Cross_Section.Airfoil.import_airfoil_geometry \
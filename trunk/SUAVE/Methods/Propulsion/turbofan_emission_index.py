@@ -66,10 +66,10 @@ def turbofan_emission_index(turbofan, state):
     NOx = NOx * (Units.g/Units.kg) 
     
     # Integrate them over the entire segment
-    NOx_total = np.dot(I,mdot*NOx)
-    CO2_total = np.dot(I,mdot*CO2)
-    SO2_total = np.dot(I,mdot*SO2)
-    H2O_total = np.dot(I,mdot*H2O)
+    NOx_total = I.dot(mdot*NOx)
+    CO2_total = I.dot(mdot*CO2)
+    SO2_total = I.dot(mdot*SO2)
+    H2O_total = I.dot(mdot*H2O)
 
     emission = Data()
     emission.total = Data()
@@ -2,4 +2,6 @@
 # These functions provide methods for discrete derivative and integral calculations.
 # @ingroup Methods-Utilities
 from .chebyshev_data import chebyshev_data
-from .linear_data import linear_data
\ No newline at end of file
+from .linear_data import linear_data
+from .trapezoidal_data import trapezoidal_data, Trapezoidal_Integral
+from .discretization_cache import cached_discretization, clear_discretization_cache
\ No newline at end of file
@@ -0,0 +1,175 @@
+## @ingroup Methods-Utilities-Chebyshev
+# discretization_cache.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+from SUAVE.Core import Data
+
+import numpy as np
+import scipy.sparse
+import inspect
+
+# the operators found so far, by method, number of points and options
+_operators  = {}
+
+# the options of each method that change its operators
+_parameters = {}
+
+# how often the operators were found in the cache
+statistics = Data(hits = 0, misses = 0)
+
+# ----------------------------------------------------------------------
+#  Method
+# ----------------------------------------------------------------------
+
+## @ingroup Methods-Utilities-Chebyshev
+def cached_discretization(discretization_method, N = 16, options = None):
+    """Returns the control points and operators of a discretization method,
+    like chebyshev_data(), computing them only the first time they are asked
+    for. The arrays are shared by everyone who asks, so they are read-only.
+
+    Assumptions:
+    The operators only depend on N and on the options the method names in its
+    arguments, like integration. Other options, like the rest of the numerics
+    of a segment, are passed to the method but don't change its operators.
+    Operators of options that can't be hashed aren't kept.
+
+    Source:
+    N/A
+
+    Inputs:
+    discretization_method  <function>  like chebyshev_data or linear_data
+    N                      [-]         Number of points
+    options                <dict>      passed on to the method as keywords
+
+    Outputs:
+    x                      [-]         Control points, in range [0,1]
+    D                      [-]         Differentiation operation matrix
+    I                      [-]         Integration operation matrix, or None
+
+    Properties Used:
+    N/A
+    """
+
+    if options is None:
+        options = {}
+
+    key = discretization_key(discretization_method, N, options)
+
+    if key is None:
+        statistics.misses += 1
+        return discretization_method(N, **options)
+
+    operators = _operators.get(key)
+    if operators is not None:
+        statistics.hits += 1
+        return operators
+
+    statistics.misses += 1
+    operators = discretization_method(N, **options)
+    for A in operators:
+        read_only(A)
+    _operators[key] = operators
+
+    return operators
+
+## @ingroup Methods-Utilities-Chebyshev
+def clear_discretization_cache():
+    """Forgets the operators kept by cached_discretization() and its statistics
+
+    Assumptions:
+    None
+
+    Source:
+    N/A
+
+    Inputs:
+    None
+
+    Outputs:
+    None
+
+    Properties Used:
+    N/A
+    """
+
+    _operators.clear()
+    statistics.hits   = 0
+    statistics.misses = 0
+
+## @ingroup Methods-Utilities-Chebyshev
+def read_only(A):
+    """Keeps an operator from being written, a numpy array or the arrays of
+    a scipy sparse matrix. Other operators, like Trapezoidal_Integral, keep
+    no arrays.
+
+    Assumptions:
+    None
+
+    Source:
+    N/A
+
+    Inputs:
+    A                      [-]         array, sparse matrix, other operator or None
+
+    Outputs:
+    None
+
+    Properties Used:
+    N/A
+    """
+
+    if A is None:
+        return
+
+    if scipy.sparse.issparse(A):
+        for name in ('data', 'indices', 'indptr'):
+            array = getattr(A, name, None)
+            if isinstance(array, np.ndarray):
+                array.setflags(write=False)
+    elif isinstance(A, np.ndarray):
+        A.setflags(write=False)
+
+## @ingroup Methods-Utilities-Chebyshev
+def discretization_key(discretization_method, N, options):
+    """The key of the operators of a discretization method in the cache
+
+    Assumptions:
+    None
+
+    Source:
+    N/A
+
+    Inputs:
+    discretization_method  <function>
+    N                      [-]
+    options                <dict>
+
+    Outputs:
+    key                    <tuple>, None when an option can't be hashed
+
+    Properties Used:
+    N/A
+    """
+
+    parameters = _parameters.get(discretization_method)
+    if parameters is None:
+        signature  = inspect.signature(discretization_method)
+        parameters = tuple((name, parameter.default) for name, parameter in list(signature.parameters.items())[1:]
+                           if parameter.kind in (parameter.POSITIONAL_OR_KEYWORD, parameter.KEYWORD_ONLY))
+        _parameters[discretization_method] = parameters
+
+    values = tuple(options.get(name, default) for name, default in parameters)
+    key    = (discretization_method, int(N), values)
+
+    try:
+        hash(key)
+    except TypeError:
+        return None
+
+    return key
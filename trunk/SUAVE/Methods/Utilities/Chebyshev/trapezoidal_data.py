@@ -0,0 +1,216 @@
+## @ingroup Methods-Utilities-Chebyshev
+# trapezoidal_data.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+import numpy as np
+import scipy.sparse
+
+# ----------------------------------------------------------------------
+#  Method
+# ----------------------------------------------------------------------
+
+## @ingroup Methods-Utilities-Chebyshev
+def trapezoidal_data(N = 16, integration = True, sparse = True, **options):
+    """Calculates the differentiation and integration matricies of a low
+    order collocation, based on linearly spaced samples in x. Derivatives
+    are second order finite differences and integrals follow the trapezoidal
+    rule, so the operators are sparse and many points can be used, in long
+    segments, for a small cost.
+
+    D is banded, with the three diagonals of the central differences and
+    one more entry in the first and last rows for the one sided ones.
+    I stands for a lower triangular matrix, the integral at each point takes
+    all the points before it, and is applied as a cumulative sum instead, see
+    Trapezoidal_Integral.
+
+    get derivatives with df_dy = D.dot(f)
+    get integral with    int_f = I.dot(f)
+        where f is either a 1-d vector or 2-d column array
+        and D is a numpy array or a scipy sparse matrix, I a numpy array or
+        a Trapezoidal_Integral
+
+    Assumptions:
+    Second order accurate, the error falls with the square of the spacing
+    rather than spectrally, as it does with chebyshev_data
+
+    Source:
+    Betts, J. T., "Practical Methods for Optimal Control and Estimation
+    Using Nonlinear Programming", SIAM, 2010, Ch. 4
+
+    Inputs:
+    N                      [-]        Number of points
+    integration (optional) <boolean>  Determines if the integration operator is calculated
+    sparse (optional)      <boolean>  Returns a scipy.sparse csr matrix and a Trapezoidal_Integral,
+                                      or numpy arrays if False
+
+    Outputs:
+    x                      [-]        N-number of linearly spaced control points, in range [0,1]
+    D                      [-]        Differentiation operation matrix
+    I                      [-]        Integration operation matrix, or None if integration = False
+
+    Properties Used:
+    N/A
+    """
+
+    # setup
+    N = int(N)
+    if N <= 1: raise RuntimeError("N = %i, must be > 1" % N)
+
+
+    # --- X vector
+
+    # linear spaced in range [0,1]
+    x = np.linspace(0,1,N)
+    h = 1./(N-1)
+
+
+    # --- Differentiation Operator
+
+    if N == 2:
+        # one sided, first order
+        rows    = [0,0,1,1]
+        columns = [0,1,0,1]
+        values  = [-1./h,1./h,-1./h,1./h]
+    else:
+        # central differences inside
+        inside  = np.arange(1,N-1)
+        rows    = np.concatenate([inside,inside])
+        columns = np.concatenate([inside-1,inside+1])
+        values  = np.concatenate([-np.ones(N-2),np.ones(N-2)])/(2.*h)
+
+        # one sided, second order, at the ends
+        rows    = np.concatenate([rows,[0,0,0,N-1,N-1,N-1]])
+        columns = np.concatenate([columns,[0,1,2,N-1,N-2,N-3]])
+        values  = np.concatenate([values,np.array([-3.,4.,-1.,3.,-4.,1.])/(2.*h)])
+
+    D = scipy.sparse.csr_matrix((values,(rows,columns)),shape=(N,N))
+
+
+    # --- Integration operator
+
+    if integration:
+        I = Trapezoidal_Integral(N,h)
+
+    else:
+        I = None
+
+    if not sparse:
+        D = D.toarray()
+        if I is not None:
+            I = I.toarray()
+
+    # done!
+    return x, D, I
+
+# ----------------------------------------------------------------------
+#  Integration Operator
+# ----------------------------------------------------------------------
+
+## @ingroup Methods-Utilities-Chebyshev
+class Trapezoidal_Integral(object):
+    """The integration operator of trapezoidal_data, the trapezoidal rule from
+    the first point to each point. It is applied with a cumulative sum, in
+    O(N), rather than with the lower triangular matrix it stands for.
+
+    Assumptions:
+    Linearly spaced points
+
+    Source:
+    N/A
+    """
+
+    def __init__(self, N, h):
+        """Sets the number of points and their spacing
+
+        Assumptions:
+        None
+
+        Source:
+        N/A
+
+        Inputs:
+        N                      [-]        Number of points
+        h                      [-]        Spacing of the points, a scalar or an array of one value
+
+        Outputs:
+        None
+
+        Properties Used:
+        N/A
+        """
+
+        self.shape = (int(N),int(N))
+        self.h     = np.asarray(h).item()
+
+    def dot(self, f):
+        """The integral of f from the first point to each point
+
+        Assumptions:
+        None
+
+        Source:
+        N/A
+
+        Inputs:
+        f                      [-]        1-d vector or 2-d array of N rows
+
+        Outputs:
+        int_f                  [-]        same shape as f
+
+        Properties Used:
+        N/A
+        """
+
+        f     = np.asarray(f)
+        int_f = np.zeros(f.shape,dtype=np.result_type(f,self.h))
+        np.cumsum((f[1:] + f[:-1])*(self.h/2.),axis=0,out=int_f[1:])
+
+        return int_f
+
+    def scaled(self, factor):
+        """The operator of points spaced factor times as far apart
+
+        Assumptions:
+        None
+
+        Source:
+        N/A
+
+        Inputs:
+        factor                 [-]        a scalar or an array of one value
+
+        Outputs:
+        I                      [-]        Trapezoidal_Integral
+
+        Properties Used:
+        N/A
+        """
+
+        return Trapezoidal_Integral(self.shape[0],np.multiply(self.h,factor))
+
+    def toarray(self):
+        """The lower triangular matrix of the operator
+
+        Assumptions:
+        None
+
+        Source:
+        N/A
+
+        Inputs:
+        None
+
+        Outputs:
+        I                      [-]        N x N numpy array
+
+        Properties Used:
+        N/A
+        """
+
+        return self.dot(np.eye(self.shape[0]))
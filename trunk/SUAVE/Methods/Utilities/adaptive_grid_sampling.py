@@ -0,0 +1,209 @@
+## @ingroup Methods-Utilities
+# adaptive_grid_sampling.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+from SUAVE.Core import Data
+
+import numpy as np
+from scipy.interpolate import RectBivariateSpline
+
+# ----------------------------------------------------------------------
+#   Adaptive Grid Sampling
+# ----------------------------------------------------------------------
+
+## @ingroup Methods-Utilities
+def adaptive_grid_sampling(x,y,sample,tolerance,groups=None,fixed=None,checked=None):
+    """Samples an expensive function on a subset of a rectangular grid, fine
+    enough for the splines through the samples to meet a tolerance. Starts
+    from every other point of the grid and adds the points halfway between the
+    samples where leaving a sample out of the splines misses it by more than
+    the tolerance, until none do or there are no points left to add.
+
+    Assumptions:
+    The grid stays rectangular, so a point added along one axis is sampled at
+    every sample of the other. Leaving a sample out misses it by more than the
+    splines miss between the samples around it, so the tolerance is met with a
+    margin. The splines are cubic where there are enough samples, as are those
+    the samples are used for. Each group of y is a spline of its own, and its
+    ends are always sampled.
+
+    Source:
+    None
+
+    Inputs:
+    x          [-]      candidates of the first axis, n_x, increasing
+    y          [-]      candidates of the second axis, n_y, increasing
+    sample     [-]      function of the x and y of some points, n_points each,
+                        returning their outputs, n_points x n_outputs
+    tolerance  [-]      largest error left out of a sample, relative to the range
+                        of each output
+    groups     [-]      list of the indices of y of each spline, one spline by default
+    fixed      [-]      indices of y always sampled, optional
+    checked    [-]      indices of the outputs the tolerance applies to, all by default
+
+    Outputs:
+    results.
+      x_indices            [-] indices of the sampled x
+      y_indices            [-] indices of the sampled y
+      values               [-] outputs of the samples, n_x_sampled x n_y_sampled x n_outputs
+      number_of_samples    [-] points sampled
+      samples_saved        [-] points of the grid not sampled
+
+    Properties Used:
+    N/A
+    """
+
+    x = np.asarray(x,dtype=float).flatten()
+    y = np.asarray(y,dtype=float).flatten()
+    if groups is None:
+        groups = [np.arange(len(y))]
+    groups = [np.asarray(group,dtype=int) for group in groups if len(group)]
+
+    # every other candidate, the ends and the fixed points to start
+    x_set = set(coarse(np.arange(len(x))))
+    y_set = set()
+    for group in groups:
+        y_set.update(coarse(group))
+    if fixed is not None:
+        y_set.update([int(j) for j in fixed])
+
+    values = {}
+    while True:
+        x_indices = np.array(sorted(x_set))
+        y_indices = np.array(sorted(y_set))
+
+        # sample the points of the grid not sampled yet
+        new = [(i,j) for i in x_indices for j in y_indices if (i,j) not in values]
+        if new:
+            points  = np.array(new)
+            outputs = np.atleast_2d(sample(x[points[:,0]],y[points[:,1]]))
+            for point,output in zip(new,outputs):
+                values[point] = output
+
+        table = np.array([[values[(i,j)] for j in y_indices] for i in x_indices])
+        if checked is not None:
+            checks = table[:,:,checked]
+        else:
+            checks = table
+        scale  = np.ptp(np.reshape(checks,(-1,checks.shape[-1])),axis=0)
+        scale[scale == 0.] = 1.
+
+        # leave each inner sample out of the splines of each group
+        added = False
+        for group in groups:
+            columns = np.where(np.isin(y_indices,group))[0]
+            if len(columns) == 0:
+                continue
+            data = checks[:,columns,:]/scale
+            for axis,indices,candidates,selected in [(0,x_indices,np.arange(len(x)),x_set),
+                                                     (1,y_indices[columns],group,y_set)]:
+                for k in range(1,len(indices)-1):
+                    if leave_one_out(x[x_indices],y[y_indices[columns]],data,axis,k) <= tolerance:
+                        continue
+                    # the points halfway between the sample and its neighbours
+                    for a,b in [(indices[k-1],indices[k]),(indices[k],indices[k+1])]:
+                        between = candidates[(candidates > a) & (candidates < b)]
+                        if len(between):
+                            middle = int(between[(len(between)-1)//2])
+                            if middle not in selected:
+                                selected.add(middle)
+                                added = True
+
+        if not added:
+            break
+
+    results = Data()
+    results.x_indices         = x_indices
+    results.y_indices         = y_indices
+    results.values            = table
+    results.number_of_samples = len(values)
+    results.samples_saved     = len(x)*len(y) - len(values)
+
+    return results
+
+# ----------------------------------------------------------------------
+#   Helper Functions
+# ----------------------------------------------------------------------
+
+## @ingroup Methods-Utilities
+def coarse(indices):
+    """Every other index, with the last one, and at least four if there are
+
+    Assumptions:
+    None
+
+    Source:
+    None
+
+    Inputs:
+    indices    [-]
+
+    Outputs:
+    selected   [-]
+
+    Properties Used:
+    N/A
+    """
+
+    indices = np.asarray(indices,dtype=int)
+    if len(indices) <= 4:
+        return [int(i) for i in indices]
+
+    spacing  = 2 if len(indices) >= 7 else 1
+    selected = set(indices[::spacing])
+    selected.add(indices[-1])
+
+    return [int(i) for i in sorted(selected)]
+
+## @ingroup Methods-Utilities
+def leave_one_out(x,y,data,axis,k):
+    """The largest error of the splines of the samples at their k-th sample
+    along an axis, left out of them
+
+    Assumptions:
+    The splines are cubic where there are enough samples left.
+
+    Source:
+    None
+
+    Inputs:
+    x          [-]      samples of the first axis, n_x
+    y          [-]      samples of the second axis, n_y
+    data       [-]      outputs at the samples, n_x x n_y x n_outputs
+    axis       [-]      0 or 1
+    k          [-]      index of the sample left out along the axis
+
+    Outputs:
+    error      [-]
+
+    Properties Used:
+    N/A
+    """
+
+    keep   = np.arange(data.shape[axis]) != k
+    x_fit  = x[keep] if axis == 0 else x
+    y_fit  = y[keep] if axis == 1 else y
+    left   = np.compress(keep,data,axis=axis)
+    kx     = min(3,len(x_fit)-1)
+    ky     = min(3,len(y_fit)-1)
+    if kx < 1 or ky < 1:
+        return 0.
+
+    error = 0.
+    for n in range(data.shape[-1]):
+        spline = RectBivariateSpline(x_fit,y_fit,left[:,:,n],kx=kx,ky=ky)
+        if axis == 0:
+            estimate = spline(x[k],y)[0,:]
+            actual   = data[k,:,n]
+        else:
+            estimate = spline(x,y[k])[:,0]
+            actual   = data[:,k,n]
+        error = max(error,np.max(np.abs(estimate - actual)))
+
+    return error
@@ -0,0 +1,277 @@
+## @ingroup Optimization
+# Nexus_Pool.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+from SUAVE.Core import Data
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+import multiprocessing
+import traceback
+import pickle
+import numpy as np
+
+# the nexus of each worker process
+_worker_nexus = None
+
+# ----------------------------------------------------------------------
+#  Nexus Pool
+# ----------------------------------------------------------------------
+
+## @ingroup Optimization
+class Nexus_Pool(object):
+    """Evaluates a Nexus at many inputs at once in a pool of worker processes.
+    The nexus is pickled and sent to the workers once, then batches of inputs
+    are evaluated and the objectives, constraints and outputs come back in the
+    order of the inputs.
+
+    Assumptions:
+    The nexus and the functions of its procedure can be pickled, the functions
+    by reference, so the workers can import their modules.
+    Each worker keeps its nexus between evaluations, as an optimizer would, so
+    the missions start from the solution of the last input that worker ran.
+    An input that raises in the procedure, or kills its worker, is retried
+    max_retries times and then reported as failed. The pool is started again
+    after a worker dies.
+
+    Source:
+    N/A
+    """
+
+    def __init__(self,nexus,processes=None,max_retries=1):
+        """Starts the workers and sends them the nexus.
+
+            Assumptions:
+            None
+
+            Source:
+            N/A
+
+            Inputs:
+            nexus        [Nexus()]
+            processes    [int], the number of workers, the number of cpus by default
+            max_retries  [int]
+
+            Outputs:
+            None
+
+            Properties Used:
+            None
+        """
+
+        self.nexus_pickle = pickle.dumps(nexus,pickle.HIGHEST_PROTOCOL)
+        self.processes    = processes or multiprocessing.cpu_count()
+        self.max_retries  = max_retries
+        self.executor     = None
+        self.start()
+
+    def start(self):
+        """Starts the worker processes, each loading the nexus
+
+            Assumptions:
+            None
+
+            Source:
+            N/A
+
+            Inputs:
+            None
+
+            Outputs:
+            None
+
+            Properties Used:
+            None
+        """
+
+        self.executor = ProcessPoolExecutor(max_workers = self.processes,
+                                            initializer = _load_nexus,
+                                            initargs    = (self.nexus_pickle,))
+
+    def close(self):
+        """Stops the worker processes
+
+            Assumptions:
+            None
+
+            Source:
+            N/A
+
+            Inputs:
+            None
+
+            Outputs:
+            None
+
+            Properties Used:
+            None
+        """
+
+        if self.executor is not None:
+            self.executor.shutdown(wait=True)
+            self.executor = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self,*args):
+        self.close()
+
+    def evaluate(self,inputs,outputs=()):
+        """Evaluates the nexus at each of the inputs
+
+            Assumptions:
+            The objective and the constraints are the scaled ones of
+            Nexus.objective() and Nexus.all_constraints().
+
+            Source:
+            N/A
+
+            Inputs:
+            inputs       [array], one scaled input vector per row
+            outputs      [list of str], paths in the nexus to return, like 'summary.total_range'
+
+            Outputs:
+            results.objective    [array]
+            results.constraints  [array], one row per input
+            results.outputs      [list], the values of the outputs for each input
+            results.failed       [array of booleans]
+            results.errors       [list of str], the traceback of the failed inputs
+
+            Properties Used:
+            None
+        """
+
+        inputs  = np.atleast_2d(np.asarray(inputs,dtype=float))
+        outputs = list(outputs)
+        n       = len(inputs)
+
+        values  = [None] * n
+        errors  = [None] * n
+        tries   = np.zeros(n,dtype=int)
+        pending = list(range(n))
+        isolate = False
+
+        while pending:
+
+            # after a worker died, find which input killed it by running them one at a time
+            batch, pending = pending, []
+            groups  = [[i] for i in batch] if isolate else [batch]
+            isolate = False
+
+            for group in groups:
+                if self.executor is None:
+                    self.start()
+
+                futures = [(i,self.executor.submit(_evaluate_nexus,inputs[i],outputs)) for i in group]
+                broken  = False
+
+                for i,future in futures:
+                    try:
+                        value, error = future.result()
+                    except BrokenProcessPool:
+                        value, error = None, 'The worker process evaluating this input died'
+                        broken = True
+                        if len(group) > 1:
+                            # not known to be the one that killed it
+                            pending.append(i)
+                            continue
+                    values[i] = value
+                    errors[i] = error
+                    if error is not None:
+                        tries[i] += 1
+                        if tries[i] <= self.max_retries:
+                            pending.append(i)
+
+                # a dead worker takes the pool down with it, start over
+                if broken:
+                    self.executor.shutdown(wait=True)
+                    self.executor = None
+                    isolate = True
+
+        # the results, in the order of the inputs
+        failed  = np.array([value is None for value in values],dtype=bool)
+        results = Data()
+        results.failed = failed
+        results.errors = [error if value is None else None for value,error in zip(values,errors)]
+
+        good = [value for value in values if value is not None]
+        n_objective   = np.size(good[0][0]) if good else 1
+        n_constraints = np.size(good[0][1]) if good else 0
+
+        results.objective   = np.full((n,n_objective),np.nan)
+        results.constraints = np.full((n,n_constraints),np.nan)
+        results.outputs     = [None] * n
+        for i,value in enumerate(values):
+            if value is None:
+                continue
+            results.objective[i]   = value[0]
+            results.constraints[i] = value[1]
+            results.outputs[i]     = value[2]
+
+        if n_objective == 1:
+            results.objective = results.objective[:,0]
+
+        return results
+
+# ----------------------------------------------------------------------
+#  Worker Functions
+# ----------------------------------------------------------------------
+
+## @ingroup Optimization
+def _load_nexus(nexus_pickle):
+    """Loads the nexus of a worker process
+
+        Assumptions:
+        None
+
+        Source:
+        N/A
+
+        Inputs:
+        nexus_pickle   [bytes]
+
+        Outputs:
+        None
+
+        Properties Used:
+        None
+    """
+    global _worker_nexus
+    _worker_nexus = pickle.loads(nexus_pickle)
+
+## @ingroup Optimization
+def _evaluate_nexus(x,outputs):
+    """Evaluates the nexus of a worker process at one input
+
+        Assumptions:
+        Errors are returned rather than raised, so one input doesn't stop a batch
+
+        Source:
+        N/A
+
+        Inputs:
+        x         [array]
+        outputs   [list of str]
+
+        Outputs:
+        value     (objective, constraints, outputs), None when it failed
+        error     [str], None when it didn't fail
+
+        Properties Used:
+        None
+    """
+    nexus = _worker_nexus
+    try:
+        objective   = np.asarray(nexus.objective(x),dtype=float)
+        constraints = np.asarray(nexus.all_constraints(x),dtype=float)
+        values      = [nexus.deep_get(path) for path in outputs]
+    except Exception:
+        return None, traceback.format_exc()
+
+    return (objective, constraints, values), None
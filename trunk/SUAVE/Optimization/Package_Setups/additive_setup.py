@@ -18,11 +18,8 @@ try:
     import pyOpt.pyALPSO
 except:
     pass
-import sklearn
-from sklearn import gaussian_process
 from SUAVE.Optimization import helper_functions as help_fun
 from SUAVE.Methods.Utilities.latin_hypercube_sampling import latin_hypercube_sampling
-from scipy.stats import norm
 import os
 import sys
 from scipy.optimize import minimize
@@ -109,6 +106,8 @@ class Additive_Solver():
         
         converged = False
         
+        from sklearn import gaussian_process
+        
         for kk in range(max_iterations):
             # Build objective surrogate
             f_diff = f[1,:] - f[0,:]
@@ -445,6 +444,7 @@ class Additive_Solver():
         fail  = np.array(np.isnan(obj.tolist()) or np.isnan(np.array(const).any())).astype(int)
         
         # Get uncertainty information
+        from scipy.stats import norm
         obj_addition, obj_sigma   = obj_surrogate.predict(np.atleast_2d(x),return_std=True)
         cons_addition, cons_sigma = cons_surrogate.predict(np.atleast_2d(x),return_std=True)
         
@@ -511,6 +511,8 @@ class Additive_Solver():
         # To use before global opt:
         # self.expected_improvement_carpet(x_low_bound, x_up_bound, problem, f_additive_surrogate, g_additive_surrogate, fstar)  
     
+        from scipy.stats import norm
+
         problem.fidelity_level = 1
         linspace_num = 40
         
@@ -4,6 +4,7 @@
 # Created:  Feb 2016, M. Vegh 
 # Modified: Feb 2017, M. Vegh
 #           May 2021, E. Botero 
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -11,14 +12,13 @@
  
 from SUAVE.Core import Data
 import numpy as np
-import matplotlib.pyplot as plt
 
 # ----------------------------------------------------------------------
 #  carpet_plot
 # ----------------------------------------------------------------------
 
 ## @ingroup Optimization
-def carpet_plot(problem, number_of_points,  plot_obj=1, plot_const=0, sweep_index_0=0, sweep_index_1=1): 
+def carpet_plot(problem, number_of_points,  plot_obj=1, plot_const=0, sweep_index_0=0, sweep_index_1=1, pool=None): 
     """ Takes in an optimization problem and runs a carpet plot of the first 2 variables
         sweep_index_0, sweep_index_1 is index of variables you want to run carpet plot (i.e. sweep_index_0=0 means you want to sweep first variable, sweep_index_0 = 4 is the 5th variable)
     
@@ -35,6 +35,7 @@ def carpet_plot(problem, number_of_points,  plot_obj=1, plot_const=0, sweep_inde
         plot_const         [int]
         sweep_index_0      [int]
         sweep_index_1      [int]
+        pool               [Nexus_Pool], evaluates the points in parallel
         
         Outputs:
         Beautiful Beautiful Plots!
@@ -47,6 +48,8 @@ def carpet_plot(problem, number_of_points,  plot_obj=1, plot_const=0, sweep_inde
         N/A
     """         
 
+    import matplotlib.pyplot as plt
+
     #unpack
     idx0            = sweep_index_0 # local name
     idx1            = sweep_index_1
@@ -76,14 +79,26 @@ def carpet_plot(problem, number_of_points,  plot_obj=1, plot_const=0, sweep_inde
 
     
     #inputs defined; now run sweep
-    for i in range(0, number_of_points):
-        for j in range(0,number_of_points):
-            #problem.optimization_problem.inputs=base_inputs  #overwrite any previous modification
-            opt_prob.inputs[:,1][idx0]= inputs[0,i]
-            opt_prob.inputs[:,1][idx1]= inputs[1,j]
-
-            obj[j,i]             = problem.objective()*obj_scaling
-            constraint_val[:,j,i]= problem.all_constraints().tolist()
+    if pool is None:
+        for i in range(0, number_of_points):
+            for j in range(0,number_of_points):
+                #problem.optimization_problem.inputs=base_inputs  #overwrite any previous modification
+                opt_prob.inputs[:,1][idx0]= inputs[0,i]
+                opt_prob.inputs[:,1][idx1]= inputs[1,j]
+    
+                obj[j,i]             = problem.objective()*obj_scaling
+                constraint_val[:,j,i]= problem.all_constraints().tolist()
+    else:
+        # all the points at once, as scaled inputs, in the order of the loops above
+        scl = np.array(scl,dtype=float)
+        x   = np.tile(np.array(base_inputs[:,1],dtype=float)/scl,(number_of_points**2,1))
+        x[:,idx0] = np.repeat(inputs[0,:],number_of_points)/scl[idx0]
+        x[:,idx1] = np.tile(inputs[1,:],number_of_points)/scl[idx1]
+        results   = pool.evaluate(x)
+        obj            = np.reshape(results.objective,(number_of_points,number_of_points)).T*obj_scaling
+        constraint_val = np.reshape(results.constraints.T,(constraint_num,number_of_points,number_of_points)).transpose(0,2,1)
+        opt_prob.inputs[:,1][idx0]= inputs[0,-1]
+        opt_prob.inputs[:,1][idx1]= inputs[1,-1]
   
     if plot_obj==1:
         plt.figure(0)
@@ -4,6 +4,7 @@
 # Created:  Oct 2017, M. Vegh 
 # Modified: Nov 2017, M. Vegh
 #           May 2021, E. Botero 
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -11,17 +12,17 @@
  
 from SUAVE.Core import Data
 import numpy as np
-import matplotlib.pyplot as plt
 
 # ----------------------------------------------------------------------
 #  line_plot
 # ----------------------------------------------------------------------
 
 
-def line_plot(problem, number_of_points,  plot_obj=1, plot_const=1, sweep_index=0): 
+def line_plot(problem, number_of_points,  plot_obj=1, plot_const=1, sweep_index=0, pool=None): 
     """
     Takes in an optimization problem and runs a line plot of the first  variable of sweep index
     sweep_index. i.e. sweep_index=0 means you want to sweep the first variable, sweep_index = 4 is the 5th variable)
+    With a Nexus_Pool, the points are evaluated in parallel by its workers
     
         Assumptions:
         N/A
@@ -35,6 +36,7 @@ def line_plot(problem, number_of_points,  plot_obj=1, plot_const=1, sweep_index=
         plot_obj           [int]
         plot_const         [int]
         sweep_index        [int]
+        pool               [Nexus_Pool]
 
         
         Outputs:
@@ -47,6 +49,8 @@ def line_plot(problem, number_of_points,  plot_obj=1, plot_const=1, sweep_index=
         Properties Used:
         N/A
     """         
+
+    import matplotlib.pyplot as plt
     
     
     
@@ -76,11 +80,21 @@ def line_plot(problem, number_of_points,  plot_obj=1, plot_const=1, sweep_index=
  
 
     #inputs defined; now run sweep
-    for i in range(0, number_of_points):
-        opt_prob.inputs[:,1][idx0]= inputs[0,i]
-   
-        obj[i]             = problem.objective()*obj_scaling
-        constraint_val[:,i]= problem.all_constraints().tolist()
+    if pool is None:
+        for i in range(0, number_of_points):
+            opt_prob.inputs[:,1][idx0]= inputs[0,i]
+       
+            obj[i]             = problem.objective()*obj_scaling
+            constraint_val[:,i]= problem.all_constraints().tolist()
+    else:
+        # all the points at once, as scaled inputs
+        scl    = np.array(base_inputs[:,4],dtype=float)
+        x      = np.tile(np.array(base_inputs[:,1],dtype=float)/scl,(number_of_points,1))
+        x[:,idx0] = inputs[0,:]/scl[idx0]
+        results   = pool.evaluate(x)
+        obj            = results.objective*obj_scaling
+        constraint_val = results.constraints.T
+        opt_prob.inputs[:,1][idx0]= inputs[0,-1]
   
     if plot_obj==1:
         plt.figure(0)
@@ -11,7 +11,6 @@
 
 
 from SUAVE.Core import Data
-from sklearn import svm
 from .Surrogate_Problem import Surrogate_Problem
 
 import numpy as np
@@ -47,6 +46,7 @@ def build_svr_models(obj_values, inputs, constraints, kernel = 'rbf', C = 1E5, e
     
     
     #now build surrogates based on these
+    from sklearn import svm
     t1=time.time()
 
     # start a training data object
@@ -93,6 +93,8 @@ def check_svr_accuracy(x, data_inputs, data_outputs, imin = -1): #set up so you
     eps = 10**x[1]
     #prevents negative values
 
+    from sklearn import svm
+
     y = []
     
     #omit one data point (by default the last one
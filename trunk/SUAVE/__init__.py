@@ -1,5 +1,6 @@
 # SUAVE/__init__.py
 #
+# Modified: Oct 2026, SUAVE Team
 
 """ SUAVE Package Setup
 """
@@ -8,19 +9,113 @@
 #  IMPORT!!
 # ----------------------------------------------------------------------
 
-# packages
-from . import Plugins
-from . import Core
-from . import Components
-from . import Analyses
-from . import Methods
-from . import Attributes
-from . import Optimization
-from . import Input_Output
-from . import Plots
-
-# the vehicle class
-from .Vehicle import Vehicle
+import sys
+from importlib import import_module
+from types import ModuleType
+
+# packages, imported the first time they are used
+_packages = ['Plugins',
+             'Core',
+             'Components',
+             'Analyses',
+             'Methods',
+             'Attributes',
+             'Optimization',
+             'Input_Output',
+             'Plots']
+
+# ----------------------------------------------------------------------
+#  Lazy Package
+# ----------------------------------------------------------------------
+
+class _Lazy_Package(ModuleType):
+    """ The SUAVE module. Subpackages are imported on first access, so
+        import SUAVE only pays for the parts of SUAVE that are used.
+
+        Assumptions:
+        SUAVE.Vehicle is always the Vehicle class, not the module of the same name
+
+        Source:
+        N/A
+    """
+
+    def __getattr__(self,name):
+        """ Imports a subpackage, or the Vehicle class, on first access
+
+            Assumptions:
+            N/A
+
+            Source:
+            N/A
+
+            Inputs:
+            name   [str]
+
+            Outputs:
+            module or class
+
+            Properties Used:
+            N/A
+        """
+
+        if name in _packages:
+            return import_module('.' + name, self.__name__)
+
+        # the vehicle class
+        if name == 'Vehicle':
+            import_module('.Components', self.__name__)
+            return import_module('.Vehicle', self.__name__).Vehicle
+
+        raise AttributeError("module '%s' has no attribute '%s'" % (self.__name__,name))
+
+    def __setattr__(self,name,value):
+        """ Keeps the Vehicle class bound when the import system binds the
+            SUAVE.Vehicle module to the package
+
+            Assumptions:
+            N/A
+
+            Source:
+            N/A
+
+            Inputs:
+            name   [str]
+            value  [object]
+
+            Outputs:
+            N/A
+
+            Properties Used:
+            N/A
+        """
+
+        if name == 'Vehicle' and isinstance(value,ModuleType):
+            value = value.Vehicle
+
+        ModuleType.__setattr__(self,name,value)
+
+    def __dir__(self):
+        """ Lists the lazily imported subpackages along with the loaded attributes
+
+            Assumptions:
+            N/A
+
+            Source:
+            N/A
+
+            Inputs:
+            N/A
+
+            Outputs:
+            names  [list]
+
+            Properties Used:
+            N/A
+        """
+
+        return sorted(set(ModuleType.__dir__(self)) | set(_packages) | set(['Vehicle']))
+
+sys.modules[__name__].__class__ = _Lazy_Package
 
 from warnings import simplefilter
 simplefilter('ignore')